@@ -8,9 +8,6 @@ Designed to be a drop-in replacement for synchronous file operations in tools.
 from pathlib import Path
 from typing import Any, Dict, Optional, Union
 
-import aiofiles
-import aiofiles.os
-
 from pythonium.common.exceptions import PythoniumError
 from pythonium.common.logging import get_logger
 
@@ -51,6 +48,9 @@ class AsyncFileService:
         file_path = Path(file_path)
 
         try:
+            import aiofiles
+            import aiofiles.os
+
             # Check file size if limit specified
             if max_size is not None:
                 stat = await aiofiles.os.stat(file_path)
@@ -104,6 +104,9 @@ class AsyncFileService:
         file_path = Path(file_path)
 
         try:
+            import aiofiles
+            import aiofiles.os
+
             # Create parent directories if needed
             if create_dirs and not file_path.parent.exists():
                 await aiofiles.os.makedirs(file_path.parent, exist_ok=True)
@@ -148,6 +151,9 @@ class AsyncFileService:
         file_path = Path(file_path)
 
         try:
+            import aiofiles
+            import aiofiles.os
+
             stat = await aiofiles.os.stat(file_path)
 
             return {
@@ -96,8 +96,8 @@ class BaseComponent(ABC):
         }
 
 
-class Result(BaseModel, Generic[T]):
-    """Generic result container with type safety."""
+class ResultModel(BaseModel, Generic[T]):
+    """Pydantic form of ``Result``, used where results are serialized."""
 
     success: bool = Field(description="Whether the operation was successful")
     data: Optional[T] = Field(default=None, description="Result data")
@@ -111,6 +111,32 @@ class Result(BaseModel, Generic[T]):
 
     model_config = ConfigDict(arbitrary_types_allowed=True)
 
+
+class Result(Generic[T]):
+    """
+    Generic result container with type safety.
+
+    Every tool call creates at least one result, so this is a plain slotted
+    class rather than a pydantic model. ``to_model`` and ``model_dump``
+    convert to ``ResultModel`` where a result leaves the process.
+    """
+
+    __slots__ = ("success", "data", "error", "metadata", "execution_time")
+
+    def __init__(
+        self,
+        success: bool,
+        data: Optional[T] = None,
+        error: Optional[str] = None,
+        metadata: Optional[Dict[str, Any]] = None,
+        execution_time: Optional[float] = None,
+    ):
+        self.success = success
+        self.data = data
+        self.error = error
+        self.metadata: Dict[str, Any] = metadata if metadata is not None else {}
+        self.execution_time = execution_time
+
     @classmethod
     def success_result(
         cls,
@@ -119,12 +145,7 @@ class Result(BaseModel, Generic[T]):
         execution_time: Optional[float] = None,
     ) -> "Result[T]":
         """Create a successful result."""
-        return cls(
-            success=True,
-            data=data,
-            metadata=metadata or {},
-            execution_time=execution_time,
-        )
+        return cls(True, data, None, metadata, execution_time)
 
     @classmethod
     def error_result(
@@ -134,11 +155,17 @@ class Result(BaseModel, Generic[T]):
         execution_time: Optional[float] = None,
     ) -> "Result[T]":
         """Create an error result."""
+        return cls(False, None, error, metadata, execution_time)
+
+    @classmethod
+    def from_model(cls, model: ResultModel[T]) -> "Result[T]":
+        """Create a result from its pydantic form."""
         return cls(
-            success=False,
-            error=error,
-            metadata=metadata or {},
-            execution_time=execution_time,
+            model.success,
+            model.data,
+            model.error,
+            dict(model.metadata),
+            model.execution_time,
         )
 
     def get_data_or_raise(self) -> T:
@@ -148,3 +175,37 @@ class Result(BaseModel, Generic[T]):
         if self.data is None:
             raise RuntimeError("Result success but data is None")
         return self.data
+
+    def to_model(self) -> ResultModel[T]:
+        """Convert to the pydantic form for serialization."""
+        return ResultModel(
+            success=self.success,
+            data=self.data,
+            error=self.error,
+            metadata=self.metadata,
+            execution_time=self.execution_time,
+        )
+
+    def model_dump(self, **kwargs: Any) -> Dict[str, Any]:
+        """Serialize like the pydantic form; accepts ``model_dump`` options."""
+        return self.to_model().model_dump(**kwargs)
+
+    def __eq__(self, other: object) -> bool:
+        if not isinstance(other, Result):
+            return NotImplemented
+        return (
+            self.success == other.success
+            and self.data == other.data
+            and self.error == other.error
+            and self.metadata == other.metadata
+            and self.execution_time == other.execution_time
+        )
+
+    __hash__ = None  # type: ignore[assignment]
+
+    def __repr__(self) -> str:
+        return (
+            f"{type(self).__name__}(success={self.success!r}, data={self.data!r}, "
+            f"error={self.error!r}, metadata={self.metadata!r}, "
+            f"execution_time={self.execution_time!r})"
+        )
@@ -50,6 +50,28 @@ class ServerSettings(BaseSettings):
     )
     version: str = Field(default="0.1.2", description="Server version")
 
+    # OpenMetrics scrape endpoint served alongside the HTTP transports
+    metrics_enabled: bool = Field(
+        default=True, description="Serve OpenMetrics on the HTTP transports"
+    )
+    metrics_path: str = Field(default="/metrics", description="Metrics endpoint path")
+
+    # Tool call tracing, exported as OTLP/JSON lines; disabled when unset
+    trace_file: Optional[str] = Field(
+        default=None, description="File to append trace spans to"
+    )
+
+    # Profiling of slow tool calls; disabled when no threshold is set
+    profile_slow_ms: Optional[float] = Field(
+        default=None, gt=0, description="Profile tool calls taking this long"
+    )
+    profile_dir: Optional[str] = Field(
+        default=None, description="Directory for slow call profiles"
+    )
+    profile_max_count: int = Field(
+        default=20, ge=1, description="Number of recent slow call profiles kept"
+    )
+
     model_config = SettingsConfigDict(
         env_prefix="PYTHONIUM_SERVER_",
         env_file=".env",
@@ -69,6 +91,60 @@ class ToolSettings(BaseSettings):
         default=10 * 1024 * 1024, description="Max tool output size"
     )
 
+    # Admission control (0 disables a limit)
+    max_concurrent_calls: int = Field(
+        default=64, ge=0, description="Max concurrent tool calls across the server"
+    )
+    max_concurrent_calls_per_tool: int = Field(
+        default=16, ge=0, description="Default max concurrent calls per tool"
+    )
+    max_queued_calls: int = Field(
+        default=256, ge=0, description="Max calls waiting for a slot per gate"
+    )
+    queue_timeout: float = Field(
+        default=30.0, gt=0, description="Max seconds a call may wait for a slot"
+    )
+
+    # Result cache and coalescing for tools that opt in through ToolMetadata
+    coalesce_calls: bool = Field(
+        default=True, description="Share one execution between identical calls"
+    )
+    result_cache_enabled: bool = Field(
+        default=True, description="Enable the tool result cache"
+    )
+    result_cache_max_bytes: int = Field(
+        default=32 * 1024 * 1024, ge=0, description="Result cache size budget"
+    )
+
+    # Discovery manifest caching module scan results across restarts
+    discovery_manifest_enabled: bool = Field(
+        default=True, description="Reuse cached discovery results for unchanged modules"
+    )
+    discovery_manifest_path: Optional[str] = Field(
+        default=None,
+        description="Path of the tool discovery manifest; "
+        "the user cache directory when unset",
+    )
+    lazy_tool_imports: bool = Field(
+        default=True,
+        description="Import tool modules listed in the manifest on first call",
+    )
+    discovery_prescreen: bool = Field(
+        default=False,
+        description="Skip importing modules with no class statement deriving from "
+        "a *Tool base; misses tools whose bases are named otherwise",
+    )
+
+    # Hot reload of tool modules while the server runs
+    hot_reload: bool = Field(
+        default=False, description="Reload changed tool modules without restarting"
+    )
+    hot_reload_interval: float = Field(
+        default=1.0,
+        gt=0,
+        description="Seconds between scans when inotify is unavailable",
+    )
+
     model_config = SettingsConfigDict(
         env_prefix="PYTHONIUM_TOOL_",
         env_file=".env",
@@ -10,6 +10,7 @@ across all components. It focuses on the patterns actually used in the codebase:
 
 import asyncio
 import functools
+import inspect
 import traceback
 from typing import Any, Callable, Dict, List, Optional, TypeVar, cast
 
@@ -105,6 +106,64 @@ def _wrap_result_if_needed(result) -> Result:
     return Result.success_result(data=result)
 
 
+def _wrap_async(
+    func: Callable, component: Optional[str], default_error_message: str
+) -> Callable:
+    """Wrap a coroutine function for ``result_handler``."""
+
+    @functools.wraps(func)
+    async def async_wrapper(*args, **kwargs) -> Result:
+        try:
+            result = await func(*args, **kwargs)
+            return _wrap_result_if_needed(result)
+        except Exception as e:
+            return _handle_exception_in_result(
+                e, func.__name__, component, default_error_message
+            )
+
+    return async_wrapper
+
+
+def _wrap_sync(
+    func: Callable, component: Optional[str], default_error_message: str
+) -> Callable:
+    """Wrap a plain function for ``result_handler``."""
+
+    @functools.wraps(func)
+    def sync_wrapper(*args, **kwargs) -> Result:
+        try:
+            result = func(*args, **kwargs)
+            return _wrap_result_if_needed(result)
+        except Exception as e:
+            return _handle_exception_in_result(
+                e, func.__name__, component, default_error_message
+            )
+
+    return sync_wrapper
+
+
+def _wrap_async_gen(
+    func: Callable, component: Optional[str], default_error_message: str
+) -> Callable:
+    """Wrap a streaming tool method; errors become the stream's final Result."""
+
+    @functools.wraps(func)
+    async def async_gen_wrapper(*args, **kwargs):
+        stream = func(*args, **kwargs)
+        try:
+            async for item in stream:
+                yield item
+        except Exception as e:
+            yield _handle_exception_in_result(
+                e, func.__name__, component, default_error_message
+            )
+        finally:
+            # Close the wrapped stream promptly when the consumer stops early
+            await stream.aclose()
+
+    return async_gen_wrapper
+
+
 def result_handler(
     component: Optional[str] = None, default_error_message: str = "Operation failed"
 ) -> Callable[[F], F]:
@@ -121,31 +180,13 @@ def result_handler(
     """
 
     def decorator(func: F) -> F:
-        @functools.wraps(func)
-        async def async_wrapper(*args, **kwargs) -> Result:
-            try:
-                result = await func(*args, **kwargs)
-                return _wrap_result_if_needed(result)
-            except Exception as e:
-                return _handle_exception_in_result(
-                    e, func.__name__, component, default_error_message
-                )
-
-        @functools.wraps(func)
-        def sync_wrapper(*args, **kwargs) -> Result:
-            try:
-                result = func(*args, **kwargs)
-                return _wrap_result_if_needed(result)
-            except Exception as e:
-                return _handle_exception_in_result(
-                    e, func.__name__, component, default_error_message
-                )
-
-        # Return appropriate wrapper based on function type
-        if asyncio.iscoroutinefunction(func):
-            return cast(F, async_wrapper)
+        if inspect.isasyncgenfunction(func):
+            wrap = _wrap_async_gen
+        elif asyncio.iscoroutinefunction(func):
+            wrap = _wrap_async
         else:
-            return cast(F, sync_wrapper)
+            wrap = _wrap_sync
+        return cast(F, wrap(func, component, default_error_message))
 
     return decorator
 
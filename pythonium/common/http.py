@@ -8,13 +8,16 @@ performance, reliability, and a more consistent API.
 
 import asyncio
 import json
+import weakref
 from datetime import datetime
-from typing import Any, Dict, Optional, Union
-
-import httpx
+from typing import TYPE_CHECKING, Any, ClassVar, Dict, Optional, Union
 
 from pythonium.common.base import Result
 from pythonium.common.logging import get_logger
+from pythonium.common.tracing import SPAN_KIND_CLIENT, start_span
+
+if TYPE_CHECKING:
+    import httpx
 
 logger = get_logger(__name__)
 
@@ -22,6 +25,17 @@ logger = get_logger(__name__)
 class HttpService:
     """Unified HTTP service using httpx for better performance and reliability."""
 
+    # Request counters shared by all instances, and the instances that hold
+    # an open client; both are reported by get_pool_stats
+    _request_stats: ClassVar[Dict[str, int]] = {
+        "requests": 0,
+        "request_errors": 0,
+        "retries": 0,
+        "in_flight": 0,
+        "clients_opened": 0,
+    }
+    _open_services: ClassVar["weakref.WeakSet[HttpService]"] = weakref.WeakSet()
+
     def __init__(
         self,
         timeout: float = 30.0,
@@ -48,7 +62,7 @@ class HttpService:
         self.max_redirects = max_redirects
         self.retries = retries
         self.retry_delay = retry_delay
-        self._client: Optional[httpx.AsyncClient] = None
+        self._client: Optional["httpx.AsyncClient"] = None
 
     async def __aenter__(self):
         """Async context manager entry."""
@@ -59,23 +73,52 @@ class HttpService:
         """Async context manager exit."""
         await self.close()
 
-    async def _ensure_client(self) -> httpx.AsyncClient:
+    async def _ensure_client(self) -> "httpx.AsyncClient":
         """Ensure HTTP client is initialized."""
         if self._client is None:
+            import httpx
+
             self._client = httpx.AsyncClient(
                 timeout=httpx.Timeout(self.timeout),
                 verify=self.verify_ssl,
                 follow_redirects=self.follow_redirects,
                 max_redirects=self.max_redirects,
             )
+            self._request_stats["clients_opened"] += 1
+            self._open_services.add(self)
         return self._client
 
     async def close(self) -> None:
         """Close the HTTP client."""
         if self._client:
+            self._open_services.discard(self)
             await self._client.aclose()
             self._client = None
 
+    @classmethod
+    def get_pool_stats(cls) -> Dict[str, int]:
+        """
+        Get request counters and connection pool sizes across all services.
+
+        Connection counts come from the pools of clients that are open now.
+        """
+        connections = idle = 0
+        for service in list(cls._open_services):
+            pool = getattr(getattr(service._client, "_transport", None), "_pool", None)
+            pool_connections = getattr(pool, "connections", None)
+            if pool_connections is None:
+                # Not an httpcore pool, e.g. a custom transport
+                continue
+            states = [connection.is_idle() for connection in pool_connections]
+            connections += len(states)
+            idle += sum(states)
+        return {
+            **cls._request_stats,
+            "open_clients": len(cls._open_services),
+            "connections": connections,
+            "idle_connections": idle,
+        }
+
     def _prepare_request_kwargs(
         self,
         method: str,
@@ -115,12 +158,52 @@ class HttpService:
 
     async def _execute_request_with_retries(
         self,
-        client: httpx.AsyncClient,
+        client: "httpx.AsyncClient",
         request_kwargs: Dict[str, Any],
         method: str,
         url: str,
     ) -> Result[Dict[str, Any]]:
         """Execute HTTP request with retry logic."""
+        stats = self._request_stats
+        stats["requests"] += 1
+        stats["in_flight"] += 1
+        with start_span(
+            f"HTTP {method.upper()}",
+            {"http.request.method": method.upper(), "url.full": url},
+            SPAN_KIND_CLIENT,
+        ) as span:
+            try:
+                result = await self._attempt_request(
+                    client, request_kwargs, method, url
+                )
+            finally:
+                stats["in_flight"] -= 1
+            if span.recording:
+                metadata = result.metadata
+                span.set_attribute(
+                    "http.response.status_code", metadata.get("status_code")
+                )
+                # Failures after retrying record the attempt count as "retries"
+                span.set_attribute(
+                    "pythonium.http.attempts",
+                    metadata.get("attempt") or metadata.get("retries"),
+                )
+                if not result.success:
+                    span.record_error(str(result.error))
+        if not result.success:
+            stats["request_errors"] += 1
+        return result
+
+    async def _attempt_request(
+        self,
+        client: "httpx.AsyncClient",
+        request_kwargs: Dict[str, Any],
+        method: str,
+        url: str,
+    ) -> Result[Dict[str, Any]]:
+        """Send the request, retrying failed attempts."""
+        import httpx
+
         start_time = datetime.utcnow()
         last_error = None
 
@@ -177,6 +260,7 @@ class HttpService:
 
             # Wait before retry (except on last attempt)
             if attempt < self.retries:
+                self._request_stats["retries"] += 1
                 await asyncio.sleep(self.retry_delay * (attempt + 1))
 
         # All retries failed
@@ -232,7 +316,7 @@ class HttpService:
             client, request_kwargs, method, url
         )
 
-    async def _parse_response(self, response: httpx.Response) -> Any:
+    async def _parse_response(self, response: "httpx.Response") -> Any:
         """Parse HTTP response into structured data."""
         # Raise for status to catch HTTP errors
         response.raise_for_status()
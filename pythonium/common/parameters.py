@@ -7,7 +7,8 @@ consistency.
 """
 
 import functools
-from typing import Any, Callable, Dict, Type, TypeVar
+import inspect
+from typing import Any, Callable, Dict, Optional, Type, TypeVar, cast
 
 from pydantic import BaseModel, ConfigDict, ValidationError
 
@@ -29,6 +30,49 @@ class ParameterModel(BaseModel):
     )
 
 
+P = TypeVar("P", bound=BaseModel)
+
+
+@functools.lru_cache(maxsize=None)
+def compile_validator(parameter_model: Type[P]) -> Callable[[Any], P]:
+    """
+    Return the compiled validator for a parameter model.
+
+    Calling the model's core validator directly skips ``BaseModel.__init__``
+    and keyword unpacking, which is measurably cheaper per call than
+    ``parameter_model(**parameters)`` while validating identically.
+    """
+    if not parameter_model.__pydantic_complete__:
+        parameter_model.model_rebuild()
+    validate: Callable[[Any], P] = (
+        parameter_model.__pydantic_validator__.validate_python
+    )
+    return validate
+
+
+def parse_parameters(parameter_model: Type[P], parameters: Any) -> P:
+    """
+    Validate parameters against a model.
+
+    An instance of the model has already been validated and is returned
+    as is, so callers that validate up front (such as the server's
+    dispatch plans) do not pay for validation twice.
+
+    Raises:
+        ValidationError: If the parameters do not match the model
+    """
+    if isinstance(parameters, parameter_model):
+        return parameters
+    # lru_cache erases the model's type variable from the cached validator
+    return cast(P, compile_validator(parameter_model)(parameters))
+
+
+def get_parameter_model(method: Any) -> Optional[Type[ParameterModel]]:
+    """Return the model a ``validate_parameters`` method validates against."""
+    model = getattr(method, "parameter_model", None)
+    return model if isinstance(model, type) else None
+
+
 def validate_parameters(parameter_model: Type[ParameterModel]):
     """
     Decorator to validate tool parameters using a Pydantic model.
@@ -45,11 +89,16 @@ def validate_parameters(parameter_model: Type[ParameterModel]):
     """
 
     def decorator(func: Callable) -> Callable:
+        if inspect.isasyncgenfunction(func):
+            stream_wrapper = _validate_stream_parameters(func, parameter_model)
+            stream_wrapper.parameter_model = parameter_model  # type: ignore[attr-defined]
+            return stream_wrapper
+
         @functools.wraps(func)
         async def wrapper(self, parameters: Dict[str, Any], context, *args, **kwargs):
             try:
                 # Validate parameters using the model
-                validated_params = parameter_model(**parameters)
+                validated_params = parse_parameters(parameter_model, parameters)
 
                 # Call the original function with validated parameters
                 return await func(self, validated_params, context, *args, **kwargs)
@@ -63,6 +112,37 @@ def validate_parameters(parameter_model: Type[ParameterModel]):
                 logger.error(f"Tool {self.__class__.__name__}: {error_msg}")
                 return Result.error_result(error=error_msg)
 
+        wrapper.parameter_model = parameter_model  # type: ignore[attr-defined]
         return wrapper
 
     return decorator
+
+
+def _validate_stream_parameters(
+    func: Callable, parameter_model: Type[ParameterModel]
+) -> Callable:
+    """Validate parameters for a streaming (async generator) tool method."""
+
+    @functools.wraps(func)
+    async def wrapper(self, parameters: Dict[str, Any], context, *args, **kwargs):
+        try:
+            validated_params = parse_parameters(parameter_model, parameters)
+        except ValidationError as e:
+            error_msg = f"Parameter validation failed: {e}"
+            logger.warning(f"Tool {self.__class__.__name__}: {error_msg}")
+            yield Result.error_result(error=error_msg)
+            return
+        except Exception as e:
+            error_msg = f"Unexpected validation error: {e}"
+            logger.error(f"Tool {self.__class__.__name__}: {error_msg}")
+            yield Result.error_result(error=error_msg)
+            return
+
+        stream = func(self, validated_params, context, *args, **kwargs)
+        try:
+            async for item in stream:
+                yield item
+        finally:
+            await stream.aclose()
+
+    return wrapper
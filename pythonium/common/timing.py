@@ -0,0 +1,97 @@
+"""
+Per-phase timing of tool calls.
+
+A ``PhaseTimer`` splits one tool call into phases (parameter validation,
+result cache lookup, queue wait, execution, result wrapping and unwrapping
+for MCP) measured with the monotonic ``perf_counter_ns`` clock. The
+breakdown is attached to the call's ``Result.metadata`` under ``timing_ns``
+and handed to the timing sink, if one is installed, so slow calls can be
+attributed to admission, pydantic, I/O or the tool itself. FastMCP turns
+the unwrapped value into protocol content after the call returns, so that
+conversion is not part of any phase.
+"""
+
+import time
+from typing import Any, Callable, Dict, Optional
+
+from pythonium.common.base import Result
+from pythonium.common.logging import get_logger
+
+logger = get_logger(__name__)
+
+# Result metadata key holding a call's phase breakdown in nanoseconds
+TIMING_METADATA_KEY = "timing_ns"
+
+# Phase names, in the order a call passes through them
+VALIDATION = "validation"
+CACHE = "cache"
+QUEUE_WAIT = "queue_wait"
+EXECUTE = "execute"
+WRAP = "wrap"
+UNWRAP = "unwrap"
+
+# Called with the tool name and its phase durations in nanoseconds
+TimingSink = Callable[[str, Dict[str, int]], None]
+
+_timing_sink: Optional[TimingSink] = None
+
+
+def set_timing_sink(sink: Optional[TimingSink]) -> None:
+    """Install the sink that receives every call's phase breakdown, or None."""
+    global _timing_sink
+    _timing_sink = sink
+
+
+def get_timing_sink() -> Optional[TimingSink]:
+    """Get the installed timing sink, if any."""
+    return _timing_sink
+
+
+class PhaseTimer:
+    """Accumulates the duration of consecutive phases of one tool call."""
+
+    __slots__ = ("tool_name", "phases", "_mark")
+
+    def __init__(self, tool_name: str):
+        self.tool_name = tool_name
+        self.phases: Dict[str, int] = {}
+        self._mark = time.perf_counter_ns()
+
+    def lap(self, phase: str) -> None:
+        """Charge the time since the previous lap to ``phase``."""
+        now = time.perf_counter_ns()
+        self.phases[phase] = self.phases.get(phase, 0) + now - self._mark
+        self._mark = now
+
+    @property
+    def total_ns(self) -> int:
+        """Total time charged to all phases so far."""
+        return sum(self.phases.values())
+
+    def attach(self, result: Any) -> Any:
+        """
+        Return a copy of a result carrying the breakdown so far.
+
+        Cached and coalesced results are shared between calls, so the
+        result and its metadata are copied rather than updated in place.
+        Anything other than a ``Result`` is returned unchanged.
+        """
+        if not isinstance(result, Result):
+            return result
+        return Result(
+            result.success,
+            result.data,
+            result.error,
+            {**result.metadata, TIMING_METADATA_KEY: dict(self.phases)},
+            result.execution_time,
+        )
+
+    def emit(self) -> None:
+        """Hand the breakdown to the timing sink, if one is installed."""
+        sink = _timing_sink
+        if sink is None:
+            return
+        try:
+            sink(self.tool_name, dict(self.phases))
+        except Exception as e:
+            logger.warning(f"Timing sink failed for {self.tool_name}: {e}")
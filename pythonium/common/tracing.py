@@ -0,0 +1,338 @@
+"""
+Lightweight tracing of tool calls.
+
+With tracing enabled the server opens a span for every tool call, and the
+code a call spends its time in (HTTP requests and their retries, the web
+search strategies, subprocesses and directory walks) opens child spans
+under it. The current span is tracked in a context variable, so spans
+nest across ``await`` and tasks and into worker threads started from a
+copied context.
+
+Finished spans are appended to a local file in the OTLP/JSON encoding,
+one ``ExportTraceServiceRequest`` per line as written by the OpenTelemetry
+collector's file exporter, so traces can be loaded into any
+OTLP-compatible viewer. Finished spans are buffered across traces and
+written by a background thread when the buffer fills or the export
+interval passes, so a tool call never waits on the file; shutting the
+tracer down writes whatever is still buffered.
+
+With tracing disabled ``start_span`` returns a shared no-op span, so an
+instrumented block costs a global lookup and an empty ``with``.
+"""
+
+import json
+import random
+import threading
+import time
+from contextvars import ContextVar
+from pathlib import Path
+from typing import Any, Dict, List, Optional, Union
+
+from pythonium.common.logging import get_logger
+
+logger = get_logger(__name__)
+
+# OTLP span kinds
+SPAN_KIND_INTERNAL = 1
+SPAN_KIND_SERVER = 2
+SPAN_KIND_CLIENT = 3
+
+# OTLP status codes
+STATUS_CODE_UNSET = 0
+STATUS_CODE_ERROR = 2
+
+INSTRUMENTATION_SCOPE = "pythonium"
+
+_current_span: ContextVar[Optional["Span"]] = ContextVar(
+    "pythonium_current_span", default=None
+)
+
+
+class NoopSpan:
+    """Span returned while tracing is disabled; records nothing."""
+
+    __slots__ = ()
+
+    recording = False
+
+    def __enter__(self) -> "NoopSpan":
+        return self
+
+    def __exit__(self, exc_type: Any, exc: Any, tb: Any) -> None:
+        return None
+
+    def set_attribute(self, key: str, value: Any) -> None:
+        pass
+
+    def record_error(self, message: str) -> None:
+        pass
+
+
+NOOP_SPAN = NoopSpan()
+
+
+class Span:
+    """
+    A timed operation within a trace.
+
+    Used as a context manager: entering makes the span current, so spans
+    started inside it become its children, and leaving ends it. An
+    exception leaving the block marks the span as failed.
+    """
+
+    __slots__ = (
+        "tracer",
+        "name",
+        "kind",
+        "trace_id",
+        "span_id",
+        "parent_span_id",
+        "attributes",
+        "start_ns",
+        "end_ns",
+        "error",
+        "_token",
+    )
+
+    recording = True
+
+    def __init__(
+        self,
+        tracer: "Tracer",
+        name: str,
+        parent: Optional["Span"] = None,
+        kind: int = SPAN_KIND_INTERNAL,
+        attributes: Optional[Dict[str, Any]] = None,
+    ):
+        self.tracer = tracer
+        self.name = name
+        self.kind = kind
+        self.trace_id: str = (
+            parent.trace_id if parent else f"{random.getrandbits(128):032x}"
+        )
+        self.span_id: str = f"{random.getrandbits(64):016x}"
+        self.parent_span_id: Optional[str] = parent.span_id if parent else None
+        self.attributes: Dict[str, Any] = dict(attributes) if attributes else {}
+        self.start_ns = time.time_ns()
+        self.end_ns: Optional[int] = None
+        self.error: Optional[str] = None
+        self._token: Any = None
+
+    def __enter__(self) -> "Span":
+        self._token = _current_span.set(self)
+        return self
+
+    def __exit__(self, exc_type: Any, exc: Any, tb: Any) -> None:
+        if exc is not None and self.error is None:
+            self.error = f"{exc_type.__name__}: {exc}"
+        try:
+            _current_span.reset(self._token)
+        except ValueError:
+            # Ended in another context, e.g. by an async generator's finalizer
+            pass
+        self.end()
+
+    def set_attribute(self, key: str, value: Any) -> None:
+        """Set an attribute on the span."""
+        self.attributes[key] = value
+
+    def record_error(self, message: str) -> None:
+        """Mark the span as failed with ``message``."""
+        self.error = message
+
+    def end(self) -> None:
+        """End the span and hand it to the tracer; later calls are ignored."""
+        if self.end_ns is None:
+            self.end_ns = time.time_ns()
+            self.tracer.on_end(self)
+
+    def to_otlp(self) -> Dict[str, Any]:
+        """Encode the span as an OTLP/JSON span."""
+        span: Dict[str, Any] = {
+            "traceId": self.trace_id,
+            "spanId": self.span_id,
+            "name": self.name,
+            "kind": self.kind,
+            "startTimeUnixNano": str(self.start_ns),
+            "endTimeUnixNano": str(self.end_ns or self.start_ns),
+            "attributes": encode_attributes(self.attributes),
+            "status": (
+                {"code": STATUS_CODE_ERROR, "message": self.error}
+                if self.error is not None
+                else {"code": STATUS_CODE_UNSET}
+            ),
+        }
+        if self.parent_span_id is not None:
+            span["parentSpanId"] = self.parent_span_id
+        return span
+
+
+def encode_value(value: Any) -> Dict[str, Any]:
+    """Encode an attribute value as an OTLP ``AnyValue``."""
+    if isinstance(value, bool):
+        return {"boolValue": value}
+    if isinstance(value, int):
+        # 64-bit integers are strings in OTLP/JSON
+        return {"intValue": str(value)}
+    if isinstance(value, float):
+        return {"doubleValue": value}
+    return {"stringValue": str(value)}
+
+
+def encode_attributes(attributes: Dict[str, Any]) -> List[Dict[str, Any]]:
+    """Encode attributes as a list of OTLP ``KeyValue`` pairs."""
+    return [
+        {"key": key, "value": encode_value(value)}
+        for key, value in attributes.items()
+        if value is not None
+    ]
+
+
+class JsonFileSpanExporter:
+    """Appends batches of spans to a file as OTLP/JSON lines."""
+
+    def __init__(self, path: Union[str, Path], service_name: str = "pythonium"):
+        self.path = Path(path)
+        self.resource = {
+            "attributes": encode_attributes({"service.name": service_name})
+        }
+        self._lock = threading.Lock()
+
+    def encode(self, spans: List[Span]) -> Dict[str, Any]:
+        """Encode spans as an OTLP ``ExportTraceServiceRequest``."""
+        return {
+            "resourceSpans": [
+                {
+                    "resource": self.resource,
+                    "scopeSpans": [
+                        {
+                            "scope": {"name": INSTRUMENTATION_SCOPE},
+                            "spans": [span.to_otlp() for span in spans],
+                        }
+                    ],
+                }
+            ]
+        }
+
+    def export(self, spans: List[Span]) -> None:
+        """Append spans to the file as one line."""
+        line = json.dumps(self.encode(spans), separators=(",", ":")) + "\n"
+        with self._lock:
+            with open(self.path, "a", encoding="utf-8") as trace_file:
+                trace_file.write(line)
+
+
+class Tracer:
+    """
+    Creates spans and exports finished ones in batches.
+
+    Exports run on a background thread, started with the first finished
+    span, which wakes when ``max_batch_size`` spans are buffered or every
+    ``export_interval`` seconds. ``shutdown`` stops the thread and exports
+    the rest; spans that end after it are exported as they end.
+    """
+
+    def __init__(
+        self, exporter: Any, max_batch_size: int = 512, export_interval: float = 5.0
+    ):
+        self.exporter = exporter
+        self.max_batch_size = max_batch_size
+        self.export_interval = export_interval
+        self._pending: List[Span] = []
+        self._lock = threading.Lock()
+        self._wakeup = threading.Event()
+        self._thread: Optional[threading.Thread] = None
+        self._stopped = False
+
+    def start_span(
+        self,
+        name: str,
+        attributes: Optional[Dict[str, Any]] = None,
+        kind: int = SPAN_KIND_INTERNAL,
+    ) -> Span:
+        """Start a span as a child of the current span."""
+        return Span(self, name, _current_span.get(), kind, attributes)
+
+    def on_end(self, span: Span) -> None:
+        """Buffer a finished span for the export thread."""
+        with self._lock:
+            self._pending.append(span)
+            if self._stopped:
+                batch, self._pending = self._pending, []
+            else:
+                batch = []
+                if self._thread is None or not self._thread.is_alive():
+                    # Also restarts the thread in a forked worker process
+                    self._thread = threading.Thread(
+                        target=self._run, name="pythonium-trace-export", daemon=True
+                    )
+                    self._thread.start()
+                if len(self._pending) >= self.max_batch_size:
+                    self._wakeup.set()
+        if batch:
+            self._export(batch)
+
+    def flush(self) -> None:
+        """Export all buffered spans from the calling thread."""
+        with self._lock:
+            batch, self._pending = self._pending, []
+        if batch:
+            self._export(batch)
+
+    def shutdown(self, timeout: float = 5.0) -> None:
+        """Stop the export thread and export all buffered spans."""
+        with self._lock:
+            self._stopped = True
+            thread = self._thread
+        self._wakeup.set()
+        if thread is not None:
+            thread.join(timeout)
+        self.flush()
+
+    def _run(self) -> None:
+        while not self._stopped:
+            self._wakeup.wait(self.export_interval)
+            self._wakeup.clear()
+            self.flush()
+
+    def _export(self, batch: List[Span]) -> None:
+        try:
+            self.exporter.export(batch)
+        except Exception as e:
+            logger.warning(f"Failed to export {len(batch)} trace spans: {e}")
+
+
+_tracer: Optional[Tracer] = None
+
+
+def set_tracer(tracer: Optional[Tracer]) -> None:
+    """Install the tracer for this process, or None to disable tracing."""
+    global _tracer
+    _tracer = tracer
+
+
+def get_tracer() -> Optional[Tracer]:
+    """Get the installed tracer, if tracing is enabled."""
+    return _tracer
+
+
+def start_span(
+    name: str,
+    attributes: Optional[Dict[str, Any]] = None,
+    kind: int = SPAN_KIND_INTERNAL,
+) -> Union[Span, NoopSpan]:
+    """
+    Start a span as a child of the current span.
+
+    Use as a context manager. Returns the shared no-op span while tracing
+    is disabled.
+    """
+    tracer = _tracer
+    if tracer is None:
+        return NOOP_SPAN
+    return tracer.start_span(name, attributes, kind)
+
+
+def get_current_span() -> Optional[Span]:
+    """Get the span the caller is running in, if any."""
+    return _current_span.get()
@@ -0,0 +1,252 @@
+"""
+Admission control for tool calls in the Pythonium MCP server.
+
+Limits how many calls may run concurrently, both per tool and across the
+whole server. Calls over the limit wait in a bounded queue for at most
+the configured queue timeout; once the queue is full, or the deadline
+passes, calls are rejected straight away instead of piling up.
+
+Calls a tool makes to other tools while it runs, such as the calls of a
+``batch_execute``, are nested: they take a slot of their own tool but not
+of the server-wide gate, whose slot their caller already holds. Waiting
+for a second global slot while holding one could otherwise deadlock once
+the server is at its limit.
+"""
+
+import asyncio
+import time
+from contextvars import ContextVar, Token
+from typing import Any, Dict, Optional
+
+from pythonium.common.config import ToolSettings
+from pythonium.common.exceptions import PythoniumError
+from pythonium.common.logging import get_logger
+
+logger = get_logger(__name__)
+
+# Set while an admitted call runs, so the calls it makes are seen as nested
+_in_admitted_call: ContextVar[bool] = ContextVar(
+    "pythonium_in_admitted_call", default=False
+)
+
+
+def in_admitted_call() -> bool:
+    """Check whether the caller runs inside an admitted tool call."""
+    return _in_admitted_call.get()
+
+
+def enter_admitted_call() -> Token:
+    """Mark the current context as running an admitted call."""
+    return _in_admitted_call.set(True)
+
+
+def exit_admitted_call(token: Token) -> None:
+    """Undo ``enter_admitted_call``."""
+    _in_admitted_call.reset(token)
+
+
+class AdmissionError(PythoniumError):
+    """Raised when a tool call is rejected by admission control."""
+
+    pass
+
+
+class ConcurrencyGate:
+    """Bounded-concurrency gate with a bounded wait queue."""
+
+    def __init__(self, name: str, limit: int, max_queue: int):
+        """
+        Initialize the gate.
+
+        Args:
+            name: Gate name used in errors and stats
+            limit: Maximum concurrent holders (0 for unlimited)
+            max_queue: Maximum number of callers allowed to wait for a slot
+        """
+        self.name = name
+        self.limit = limit
+        self.max_queue = max_queue
+        self._semaphore = asyncio.Semaphore(limit) if limit > 0 else None
+
+        self.in_flight = 0
+        self.peak_in_flight = 0
+        self.waiting = 0
+        self.peak_waiting = 0
+        self.admitted = 0
+        self.rejected = 0
+        self.timed_out = 0
+        self.queued = 0
+        self.total_wait_time = 0.0
+        self.max_wait_time = 0.0
+
+    async def acquire(self, timeout: float) -> float:
+        """
+        Acquire a slot, waiting up to ``timeout`` seconds.
+
+        Returns:
+            Time spent waiting in the queue, in seconds
+        """
+        semaphore = self._semaphore
+        wait_time = 0.0
+
+        if semaphore is not None and semaphore.locked():
+            if self.waiting >= self.max_queue:
+                self.rejected += 1
+                logger.debug(f"Rejecting call for {self.name}: queue full")
+                raise AdmissionError(
+                    f"Too many pending calls for {self.name} "
+                    f"({self.in_flight} running, {self.waiting} queued)",
+                    details={"gate": self.name, "reason": "queue_full"},
+                )
+
+            self.waiting += 1
+            self.queued += 1
+            if self.waiting > self.peak_waiting:
+                self.peak_waiting = self.waiting
+            start = time.perf_counter()
+            try:
+                await asyncio.wait_for(semaphore.acquire(), timeout=timeout)
+            except asyncio.TimeoutError:
+                self.timed_out += 1
+                logger.debug(f"Rejecting call for {self.name}: queue timeout")
+                raise AdmissionError(
+                    f"Timed out after {timeout:.2f}s waiting for {self.name}",
+                    details={"gate": self.name, "reason": "queue_timeout"},
+                )
+            finally:
+                self.waiting -= 1
+            wait_time = time.perf_counter() - start
+            self.total_wait_time += wait_time
+            if wait_time > self.max_wait_time:
+                self.max_wait_time = wait_time
+        elif semaphore is not None:
+            # Uncontended: the semaphore has a free slot, so this never blocks
+            await semaphore.acquire()
+
+        self.admitted += 1
+        self.in_flight += 1
+        if self.in_flight > self.peak_in_flight:
+            self.peak_in_flight = self.in_flight
+        return wait_time
+
+    def release(self) -> None:
+        """Release a previously acquired slot."""
+        self.in_flight -= 1
+        if self._semaphore is not None:
+            self._semaphore.release()
+
+    def get_stats(self) -> Dict[str, Any]:
+        """Get gate statistics."""
+        return {
+            "limit": self.limit,
+            "max_queue": self.max_queue,
+            "in_flight": self.in_flight,
+            "peak_in_flight": self.peak_in_flight,
+            "queue_depth": self.waiting,
+            "peak_queue_depth": self.peak_waiting,
+            "admitted": self.admitted,
+            "queued": self.queued,
+            "rejected": self.rejected,
+            "timed_out": self.timed_out,
+            "total_wait_time": self.total_wait_time,
+            "max_wait_time": self.max_wait_time,
+            "avg_wait_time": (
+                self.total_wait_time / self.queued if self.queued else 0.0
+            ),
+        }
+
+
+class AdmissionController:
+    """Per-tool and global admission control for tool calls."""
+
+    def __init__(
+        self,
+        max_concurrent_calls: int = 0,
+        max_concurrent_calls_per_tool: int = 0,
+        max_queued_calls: int = 0,
+        queue_timeout: float = 30.0,
+    ):
+        self.max_concurrent_calls_per_tool = max_concurrent_calls_per_tool
+        self.max_queued_calls = max_queued_calls
+        self.queue_timeout = queue_timeout
+        self.global_gate = ConcurrencyGate(
+            "server", max_concurrent_calls, max_queued_calls
+        )
+        self._tool_gates: Dict[str, ConcurrencyGate] = {}
+
+    @classmethod
+    def from_settings(cls, settings: ToolSettings) -> "AdmissionController":
+        """Create a controller from tool settings."""
+        return cls(
+            max_concurrent_calls=settings.max_concurrent_calls,
+            max_concurrent_calls_per_tool=settings.max_concurrent_calls_per_tool,
+            max_queued_calls=settings.max_queued_calls,
+            queue_timeout=settings.queue_timeout,
+        )
+
+    def configure_tool(
+        self, tool_name: str, limit: Optional[int] = None
+    ) -> ConcurrencyGate:
+        """
+        Create (or replace) the gate for a tool.
+
+        Args:
+            tool_name: Tool name
+            limit: Tool-specific concurrency limit overriding the server default
+        """
+        gate = ConcurrencyGate(
+            f"tool '{tool_name}'",
+            limit if limit is not None else self.max_concurrent_calls_per_tool,
+            self.max_queued_calls,
+        )
+        self._tool_gates[tool_name] = gate
+        return gate
+
+    def remove_tool(self, tool_name: str) -> None:
+        """Forget the gate for a tool."""
+        self._tool_gates.pop(tool_name, None)
+
+    async def acquire(self, tool_gate: ConcurrencyGate, nested: bool = False) -> float:
+        """
+        Admit a call through a tool gate and the global gate.
+
+        Both slots must be obtained within a single queue timeout.
+
+        Args:
+            tool_gate: Gate of the called tool
+            nested: The call is made from within an admitted call, so it
+                only takes a slot of the tool gate
+
+        Returns:
+            Total time spent queued, in seconds
+
+        Raises:
+            AdmissionError: If the call is rejected or times out in the queue
+        """
+        deadline = time.perf_counter() + self.queue_timeout
+        wait_time = await tool_gate.acquire(self.queue_timeout)
+        if nested:
+            return wait_time
+        try:
+            remaining = max(deadline - time.perf_counter(), 0.0)
+            wait_time += await self.global_gate.acquire(remaining)
+        except BaseException:
+            tool_gate.release()
+            raise
+        return wait_time
+
+    def release(self, tool_gate: ConcurrencyGate, nested: bool = False) -> None:
+        """Release the slots held by a call admitted through a tool gate."""
+        if not nested:
+            self.global_gate.release()
+        tool_gate.release()
+
+    def get_stats(self) -> Dict[str, Any]:
+        """Get admission statistics for the server and every tool."""
+        return {
+            "queue_timeout": self.queue_timeout,
+            "global": self.global_gate.get_stats(),
+            "tools": {
+                name: gate.get_stats() for name, gate in self._tool_gates.items()
+            },
+        }
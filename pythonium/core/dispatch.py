@@ -0,0 +1,529 @@
+"""
+Tool dispatch plans for the Pythonium MCP server.
+
+A dispatch plan is compiled once when a tool is registered and captures
+everything about invoking that tool that does not change between calls:
+the MCP-facing signature, a prebound logger, the defaults map and the
+set of accepted parameter names. The per-call path then only has to
+merge arguments, build a context and await the tool.
+
+Tools that validate with a ``ParameterModel`` are validated once here,
+through the model's cached validator, before admission control; the tool
+receives the validated instance and does not validate it again.
+
+Each call is timed by phase; see ``pythonium.common.timing``. Calls are
+also recorded in the tool registry's usage metrics: call counts, an
+in-flight gauge and a latency histogram per tool. With tracing enabled
+each call runs in a span carrying its phase breakdown; see
+``pythonium.common.tracing``. With slow call profiling enabled each call
+is offered to the profiler; see ``pythonium.core.profiling``.
+
+Streaming tools additionally receive FastMCP's request context. When the
+client supplied a progress token, their partial results are relayed as
+MCP progress notifications while the final result is assembled.
+"""
+
+import inspect
+import json
+import logging
+import time
+from typing import Any, Callable, Dict, FrozenSet, Optional, Tuple
+
+from mcp.server.fastmcp import Context
+from pydantic import ValidationError
+
+from pythonium.common.base import Result
+from pythonium.common.logging import get_logger
+from pythonium.common.parameters import parse_parameters
+from pythonium.common.timing import (
+    CACHE,
+    EXECUTE,
+    QUEUE_WAIT,
+    UNWRAP,
+    VALIDATION,
+    PhaseTimer,
+)
+from pythonium.common.tracing import SPAN_KIND_SERVER, start_span
+from pythonium.core.admission import (
+    AdmissionController,
+    ConcurrencyGate,
+    enter_admitted_call,
+    exit_admitted_call,
+    in_admitted_call,
+)
+from pythonium.core.profiling import get_slow_call_profiler
+from pythonium.core.result_cache import ResultCache
+from pythonium.core.single_flight import SingleFlight
+from pythonium.core.tools.registry import ToolRegistry
+from pythonium.tools.base import BaseTool, ParameterType, ToolContext
+
+logger = get_logger(__name__)
+
+# Keyword argument through which FastMCP hands streaming tools their context
+CONTEXT_KWARG = "mcp_context"
+
+# Mapping of tool parameter types to the Python types exposed to FastMCP
+PARAMETER_TYPE_MAP: Dict[ParameterType, type] = {
+    ParameterType.STRING: str,
+    ParameterType.INTEGER: int,
+    ParameterType.NUMBER: float,
+    ParameterType.BOOLEAN: bool,
+    ParameterType.ARRAY: list,
+    ParameterType.OBJECT: dict,
+    ParameterType.PATH: str,
+    ParameterType.URL: str,
+    ParameterType.EMAIL: str,
+}
+
+
+def map_parameter_type(param_type: ParameterType) -> type:
+    """Map a tool parameter type to a Python type."""
+    return PARAMETER_TYPE_MAP.get(param_type, str)
+
+
+def get_progress_token(mcp_context: Any) -> Optional[Any]:
+    """Return the request's progress token, if the client asked for progress."""
+    try:
+        meta = mcp_context.request_context.meta
+    except (AttributeError, LookupError, ValueError):
+        return None
+    return getattr(meta, "progressToken", None) if meta is not None else None
+
+
+class ToolDispatchPlan:
+    """Precompiled invocation plan for a single registered tool."""
+
+    __slots__ = (
+        "tool",
+        "name",
+        "registry",
+        "dispatcher",
+        "logger",
+        "signature",
+        "annotations",
+        "parameter_names",
+        "required_names",
+        "defaults",
+        "admission",
+        "gate",
+        "cache",
+        "cache_ttl",
+        "single_flight",
+        "streaming",
+        "parameter_model",
+        "tool_id",
+        "span_name",
+        "span_attributes",
+    )
+
+    def __init__(
+        self,
+        tool: BaseTool,
+        registry: Optional[Any] = None,
+        admission: Optional[AdmissionController] = None,
+        cache: Optional[ResultCache] = None,
+        single_flight: Optional[SingleFlight] = None,
+        dispatcher: Optional[Any] = None,
+    ):
+        metadata = tool.metadata
+
+        self.tool = tool
+        self.name = metadata.name
+        self.registry = registry
+        self.dispatcher = dispatcher
+        self.logger = logging.getLogger(f"pythonium.tools.{self.name}")
+        self.admission = admission
+        self.gate: Optional[ConcurrencyGate] = (
+            admission.configure_tool(self.name, metadata.max_concurrency)
+            if admission is not None
+            else None
+        )
+        self.cache = cache if cache is not None and metadata.cacheable else None
+        if self.cache is not None and not self.cache.enabled:
+            self.cache = None
+        self.cache_ttl = metadata.cache_ttl
+        self.streaming = metadata.supports_streaming
+        self.parameter_model = tool.parameter_model
+        self.span_name = f"execute_tool {self.name}"
+        self.span_attributes = {"gen_ai.tool.name": self.name}
+
+        # Calls are recorded in the registry's usage metrics under this ID
+        registration = (
+            registry.get_tool(self.name) if isinstance(registry, ToolRegistry) else None
+        )
+        self.tool_id: Optional[str] = (
+            registration.tool_id if registration is not None else None
+        )
+        self.single_flight = (
+            single_flight
+            if single_flight is not None and (metadata.idempotent or metadata.cacheable)
+            else None
+        )
+
+        parameters = []
+        annotations: Dict[str, type] = {}
+        defaults: Dict[str, Any] = {}
+        required = []
+
+        for param in metadata.parameters:
+            python_type = map_parameter_type(param.type)
+            annotations[param.name] = python_type
+
+            if param.required:
+                required.append(param.name)
+                parameters.append(
+                    inspect.Parameter(
+                        param.name,
+                        inspect.Parameter.POSITIONAL_OR_KEYWORD,
+                        annotation=python_type,
+                    )
+                )
+            else:
+                defaults[param.name] = param.default
+                parameters.append(
+                    inspect.Parameter(
+                        param.name,
+                        inspect.Parameter.POSITIONAL_OR_KEYWORD,
+                        default=param.default,
+                        annotation=python_type,
+                    )
+                )
+
+        self.signature = inspect.Signature(parameters)
+        self.annotations = annotations
+        self.parameter_names: FrozenSet[str] = frozenset(annotations)
+        self.required_names: FrozenSet[str] = frozenset(required)
+        self.defaults = defaults
+
+    def new_context(self) -> ToolContext:
+        """Create a fresh execution context from the prebound template values."""
+        return ToolContext(
+            logger=self.logger, registry=self.registry, dispatcher=self.dispatcher
+        )
+
+    def bind_arguments(
+        self, args: Tuple[Any, ...], kwargs: Dict[str, Any]
+    ) -> Dict[str, Any]:
+        """
+        Merge call arguments with the tool defaults.
+
+        FastMCP always calls tools with keyword arguments only, so the common
+        case is a dictionary merge guarded by two set checks. Positional or
+        malformed calls fall back to full signature binding, which raises the
+        same ``TypeError`` it always has.
+        """
+        if (
+            not args
+            and self.required_names <= kwargs.keys()
+            and kwargs.keys() <= self.parameter_names
+        ):
+            parameters = self.defaults.copy()
+            parameters.update(kwargs)
+            return parameters
+
+        bound_args = self.signature.bind(*args, **kwargs)
+        bound_args.apply_defaults()
+        return dict(bound_args.arguments)
+
+    async def dispatch(
+        self,
+        args: Tuple[Any, ...],
+        kwargs: Dict[str, Any],
+        mcp_context: Optional[Any] = None,
+    ) -> Any:
+        """Execute the tool and convert its result for MCP."""
+        start = time.perf_counter_ns()
+        timer = PhaseTimer(self.name)
+        self.begin_usage()
+        profile = self.begin_profile()
+        success = False
+        with start_span(self.span_name, self.span_attributes, SPAN_KIND_SERVER) as span:
+            try:
+                parameters = self.bind_arguments(args, kwargs)
+
+                if self.streaming and get_progress_token(mcp_context) is not None:
+                    # Partial results are per-client, so streams bypass cache
+                    # and coalescing
+                    result = await self.execute(
+                        parameters, self.progress_relay(mcp_context), timer
+                    )
+                else:
+                    result = await self.invoke(parameters, timer)
+
+                value = self.unwrap_result(result)
+                success = True
+                return value
+            finally:
+                timer.lap(UNWRAP)
+                self.end_profile(profile, start, kwargs)
+                timer.emit()
+                self.end_usage(start, success)
+                if span.recording:
+                    self.annotate_span(span, timer)
+
+    async def call(self, parameters: Dict[str, Any]) -> Any:
+        """
+        Execute the tool for another tool and return its raw result.
+
+        Like ``dispatch``, the call is timed and recorded in the registry's
+        usage metrics, but the result is not converted for MCP.
+        """
+        start = time.perf_counter_ns()
+        timer = PhaseTimer(self.name)
+        self.begin_usage()
+        profile = self.begin_profile()
+        result = None
+        with start_span(self.span_name, self.span_attributes) as span:
+            try:
+                result = await self.invoke(parameters, timer)
+                return result
+            finally:
+                self.end_profile(profile, start, parameters)
+                timer.emit()
+                self.end_usage(start, bool(result and result.success))
+                if span.recording:
+                    if result and not result.success:
+                        span.record_error(str(result.error))
+                    self.annotate_span(span, timer)
+
+    @staticmethod
+    def annotate_span(span: Any, timer: PhaseTimer) -> None:
+        """Record a call's phase breakdown on its span."""
+        for phase, duration_ns in timer.phases.items():
+            span.set_attribute(f"pythonium.phase.{phase}_ns", duration_ns)
+
+    @staticmethod
+    def begin_profile() -> Optional[Any]:
+        """Start profiling the call if slow call profiling is enabled."""
+        profiler = get_slow_call_profiler()
+        return profiler.begin() if profiler is not None else None
+
+    def end_profile(
+        self, profile: Optional[Any], start_ns: int, parameters: Dict[str, Any]
+    ) -> None:
+        """Stop profiling the call; the profiler keeps it if it was slow."""
+        if profile is None:
+            return
+        profiler = get_slow_call_profiler()
+        if profiler is None:
+            profile.disable()
+            return
+        profiler.end(profile, self.name, parameters, time.perf_counter_ns() - start_ns)
+
+    def begin_usage(self) -> None:
+        """Count a call as in flight in the registry's usage metrics."""
+        # A tool ID is only resolved from a ToolRegistry
+        if self.tool_id is not None and self.registry is not None:
+            self.registry.begin_tool_call(self.tool_id)
+
+    def end_usage(self, start_ns: int, success: bool) -> None:
+        """Record a finished call in the registry's usage metrics."""
+        if self.tool_id is not None and self.registry is not None:
+            self.registry.end_tool_call(
+                self.tool_id, time.perf_counter_ns() - start_ns, success
+            )
+
+    async def invoke(
+        self, parameters: Dict[str, Any], timer: Optional[PhaseTimer] = None
+    ) -> Any:
+        """
+        Execute the tool with bound parameters and return its raw result.
+
+        Serves repeated calls from the result cache and coalesces identical
+        in-flight calls when the tool opts in to either. Calls are keyed by
+        their validated parameters; invalid calls and calls whose
+        parameters cannot be canonicalized run uncached. Time spent waiting
+        on a coalesced call counts as queue wait.
+        """
+        if (
+            self.cache is None and self.single_flight is None
+        ) or not self.tool.is_cacheable_call(parameters):
+            return await self.execute(parameters, timer=timer)
+
+        try:
+            parameters = self.validate(parameters)
+            key = ResultCache.make_key(self.name, parameters)
+        except (ValidationError, TypeError):
+            return await self.execute(parameters, timer=timer)
+        finally:
+            if timer is not None:
+                timer.lap(VALIDATION)
+
+        if self.cache is not None:
+            cached = self.cache.get(key)
+            if timer is not None:
+                timer.lap(CACHE)
+            if cached is not None:
+                return timer.attach(cached) if timer is not None else cached
+
+        if self.single_flight is not None:
+            result = await self.single_flight.do(
+                key, lambda: self.execute_and_cache(key, parameters, timer)
+            )
+            if timer is not None:
+                timer.lap(QUEUE_WAIT)
+                return timer.attach(result)
+            return result
+        return await self.execute_and_cache(key, parameters, timer)
+
+    @staticmethod
+    def progress_relay(mcp_context: Any) -> Callable[[Any], Any]:
+        """Build a callback relaying partial results as MCP progress notifications."""
+        sent = 0
+
+        async def relay(partial: Any) -> None:
+            nonlocal sent
+            sent += 1
+            message = (
+                partial
+                if isinstance(partial, str)
+                else json.dumps(partial, default=str)
+            )
+            await mcp_context.report_progress(sent, message=message)
+
+        return relay
+
+    async def execute_and_cache(
+        self,
+        key: Any,
+        parameters: Any,
+        timer: Optional[PhaseTimer] = None,
+    ) -> Any:
+        """Execute the tool and store a successful result in the cache."""
+        result = await self.execute(parameters, timer=timer)
+        if self.cache is not None and result and result.success:
+            self.cache.put(key, result, self.cache_ttl)
+        return result
+
+    async def execute(
+        self,
+        parameters: Any,
+        on_partial: Optional[Callable[[Any], Any]] = None,
+        timer: Optional[PhaseTimer] = None,
+    ) -> Any:
+        """
+        Run the tool under admission control and return its raw result.
+
+        With ``on_partial`` the tool is streamed and each partial result is
+        passed to the callback before the final result is returned. Invalid
+        parameters are rejected before a concurrency slot is taken.
+
+        The call's phase breakdown is attached to the result. Without a
+        caller's ``timer`` a fresh one is started and emitted here.
+        """
+        owned = timer is None
+        if timer is None:
+            timer = PhaseTimer(self.name)
+        try:
+            result = await self.timed_execute(parameters, on_partial, timer)
+            return timer.attach(result)
+        finally:
+            if owned:
+                timer.emit()
+
+    async def timed_execute(
+        self,
+        parameters: Any,
+        on_partial: Optional[Callable[[Any], Any]],
+        timer: PhaseTimer,
+    ) -> Any:
+        """Validate, wait for admission and run the tool, lapping each phase."""
+        try:
+            parameters = self.validate(parameters)
+        except ValidationError as e:
+            error_msg = f"Parameter validation failed: {e}"
+            self.logger.warning(f"Tool {self.name}: {error_msg}")
+            return Result.error_result(error=error_msg)
+        finally:
+            timer.lap(VALIDATION)
+
+        if self.gate is None:
+            try:
+                return await self.run_tool(parameters, on_partial)
+            finally:
+                timer.lap(EXECUTE)
+
+        admission = self.admission
+        nested = in_admitted_call()
+        await admission.acquire(self.gate, nested)  # type: ignore[union-attr]
+        timer.lap(QUEUE_WAIT)
+        token = enter_admitted_call()
+        try:
+            return await self.run_tool(parameters, on_partial)
+        finally:
+            exit_admitted_call(token)
+            timer.lap(EXECUTE)
+            admission.release(self.gate, nested)  # type: ignore[union-attr]
+
+    def validate(self, parameters: Dict[str, Any]) -> Any:
+        """
+        Validate parameters against the tool's parameter model.
+
+        Returns the validated model instance, or the parameters unchanged
+        for tools without a model. Lazily loaded tools report their model
+        only once loaded, so the lookup is retried until it succeeds.
+        """
+        model = self.parameter_model
+        if model is None:
+            model = self.parameter_model = self.tool.parameter_model
+            if model is None:
+                return parameters
+        return parse_parameters(model, parameters)
+
+    async def run_tool(
+        self,
+        parameters: Any,
+        on_partial: Optional[Callable[[Any], Any]] = None,
+    ) -> Any:
+        """Invoke the tool with a fresh context."""
+        if on_partial is None:
+            return await self.tool.execute(parameters, self.new_context())
+        return await self.tool.collect_stream(
+            parameters, self.new_context(), on_partial
+        )
+
+    def unwrap_result(self, result: Any) -> Any:
+        """Return result data for MCP or raise for failed results."""
+        if not result:
+            return ""
+        if result.success:
+            return result.data if result.data is not None else ""
+        # For errors, raise an exception that FastMCP can handle
+        raise Exception(result.error or "Unknown error occurred")
+
+    def build_function(self):
+        """Build the coroutine function registered with FastMCP."""
+        plan = self
+
+        async def tool_function(*args, **kwargs):
+            """Dynamically created tool function."""
+            mcp_context = kwargs.pop(CONTEXT_KWARG, None)
+            try:
+                return await plan.dispatch(args, kwargs, mcp_context)
+            except Exception as e:
+                # Log only a concise error message without full content
+                error_str = str(e)
+                if len(error_str) > 100:
+                    error_str = error_str[:100] + "..."
+                logger.error(f"Error executing tool {plan.name}: {error_str}")
+                raise
+
+        tool_function.__name__ = self.name
+        tool_function.__doc__ = self.tool.metadata.description
+        tool_function.__signature__ = self.signature  # type: ignore
+        tool_function.__annotations__ = dict(self.annotations)
+
+        if self.streaming:
+            # FastMCP injects its request context here and hides it from the schema
+            context_parameter = inspect.Parameter(
+                CONTEXT_KWARG,
+                inspect.Parameter.KEYWORD_ONLY,
+                default=None,
+                annotation=Context,
+            )
+            tool_function.__signature__ = self.signature.replace(  # type: ignore
+                parameters=[*self.signature.parameters.values(), context_parameter]
+            )
+            tool_function.__annotations__[CONTEXT_KWARG] = Context
+
+        return tool_function
@@ -0,0 +1,287 @@
+"""
+OpenMetrics export for the Pythonium MCP server.
+
+When the server runs an HTTP transport it mounts a scrape endpoint that
+renders, in the OpenMetrics text format, the per-tool latency histograms
+and call counters kept by the tool registry, in-flight calls, event bus
+counters, ``HttpService`` request and pool statistics, child process
+counts and event loop lag.
+
+Rendering only reads counters that are already maintained on the call
+path, so a scrape costs a few milliseconds at most and takes no locks a
+tool call could wait on. With multiple workers each process serves its
+own metrics.
+"""
+
+import asyncio
+import sys
+import time
+from typing import TYPE_CHECKING, Any, Dict, Iterable, List, Optional, Tuple
+
+from pythonium.common.events import get_event_manager
+from pythonium.common.http import HttpService
+from pythonium.common.logging import get_logger
+
+if TYPE_CHECKING:
+    from pythonium.core.server import PythoniumMCPServer
+
+logger = get_logger(__name__)
+
+CONTENT_TYPE = "application/openmetrics-text; version=1.0.0; charset=utf-8"
+
+# Histogram bucket bounds exported for tool latencies, in seconds
+LATENCY_BUCKETS_SECONDS: Tuple[float, ...] = (
+    0.001,
+    0.0025,
+    0.005,
+    0.01,
+    0.025,
+    0.05,
+    0.1,
+    0.25,
+    0.5,
+    1.0,
+    2.5,
+    5.0,
+    10.0,
+    30.0,
+    60.0,
+)
+_LATENCY_BUCKETS_NS = [int(bound * 1e9) for bound in LATENCY_BUCKETS_SECONDS]
+
+Labels = Dict[str, str]
+
+
+def _escape(value: str) -> str:
+    """Escape a label value."""
+    return value.replace("\\", "\\\\").replace('"', '\\"').replace("\n", "\\n")
+
+
+def _format_labels(labels: Optional[Labels]) -> str:
+    if not labels:
+        return ""
+    pairs = ",".join(f'{key}="{_escape(value)}"' for key, value in labels.items())
+    return "{" + pairs + "}"
+
+
+class OpenMetricsWriter:
+    """Builds an OpenMetrics text exposition one metric family at a time."""
+
+    def __init__(self, prefix: str = "pythonium"):
+        self.prefix = prefix
+        self.lines: List[str] = []
+
+    def family(self, name: str, metric_type: str, help_text: str) -> str:
+        """Start a metric family and return its full name."""
+        full_name = f"{self.prefix}_{name}"
+        self.lines.append(f"# HELP {full_name} {help_text}")
+        self.lines.append(f"# TYPE {full_name} {metric_type}")
+        return full_name
+
+    def sample(self, name: str, value: float, labels: Optional[Labels] = None) -> None:
+        """Add one sample line."""
+        self.lines.append(f"{name}{_format_labels(labels)} {value}")
+
+    def gauge(
+        self,
+        name: str,
+        help_text: str,
+        samples: Iterable[Tuple[Optional[Labels], float]],
+    ) -> None:
+        """Add a gauge family."""
+        full_name = self.family(name, "gauge", help_text)
+        for labels, value in samples:
+            self.sample(full_name, value, labels)
+
+    def counter(
+        self,
+        name: str,
+        help_text: str,
+        samples: Iterable[Tuple[Optional[Labels], float]],
+    ) -> None:
+        """Add a counter family; sample names get the ``_total`` suffix."""
+        full_name = self.family(name, "counter", help_text)
+        for labels, value in samples:
+            self.sample(f"{full_name}_total", value, labels)
+
+    def render(self) -> str:
+        """Return the exposition, terminated by ``# EOF``."""
+        return "\n".join(self.lines) + "\n# EOF\n"
+
+
+class LoopLagMonitor:
+    """
+    Measures event loop lag by timing a periodic sleep.
+
+    Every ``interval`` seconds the monitor records how much later than
+    requested its sleep returned, which is how long ready callbacks had
+    to wait for the loop.
+    """
+
+    def __init__(self, interval: float = 0.5):
+        self.interval = interval
+        self.last_lag = 0.0
+        self.max_lag = 0.0
+        self._task: Optional["asyncio.Task[None]"] = None
+
+    def start(self) -> None:
+        """Start sampling on the running event loop."""
+        if self._task is None or self._task.done():
+            self._task = asyncio.get_running_loop().create_task(self._run())
+
+    async def stop(self) -> None:
+        """Stop sampling."""
+        if self._task is not None:
+            self._task.cancel()
+            await asyncio.gather(self._task, return_exceptions=True)
+            self._task = None
+
+    async def _run(self) -> None:
+        while True:
+            start = time.perf_counter()
+            await asyncio.sleep(self.interval)
+            lag = max(time.perf_counter() - start - self.interval, 0.0)
+            self.last_lag = lag
+            if lag > self.max_lag:
+                self.max_lag = lag
+
+
+def render_metrics(
+    server: "PythoniumMCPServer", loop_lag: Optional[LoopLagMonitor] = None
+) -> str:
+    """Render the server's metrics in the OpenMetrics text format."""
+    writer = OpenMetricsWriter()
+    _write_tool_metrics(writer, server)
+    _write_event_bus_metrics(writer)
+    _write_http_metrics(writer)
+    _write_subprocess_metrics(writer)
+    if loop_lag is not None:
+        writer.gauge(
+            "event_loop_lag_seconds",
+            "Delay of the last event loop lag probe",
+            [(None, loop_lag.last_lag)],
+        )
+        writer.gauge(
+            "event_loop_lag_max_seconds",
+            "Largest event loop lag observed",
+            [(None, loop_lag.max_lag)],
+        )
+    return writer.render()
+
+
+def _write_tool_metrics(writer: OpenMetricsWriter, server: Any) -> None:
+    registrations = list(server.tool_registry.tools.values())
+
+    histogram = writer.family(
+        "tool_call_duration_seconds", "histogram", "Tool call latency"
+    )
+    for registration in registrations:
+        latency = registration.metrics.latency
+        labels = {"tool": registration.tool_id}
+        if latency.count:
+            cumulative = latency.cumulative_counts(_LATENCY_BUCKETS_NS)
+        else:
+            cumulative = [0] * len(_LATENCY_BUCKETS_NS)
+        for bound, count in zip(LATENCY_BUCKETS_SECONDS, cumulative):
+            writer.sample(f"{histogram}_bucket", count, {**labels, "le": f"{bound}"})
+        writer.sample(f"{histogram}_bucket", latency.count, {**labels, "le": "+Inf"})
+        writer.sample(f"{histogram}_count", latency.count, labels)
+        writer.sample(f"{histogram}_sum", latency.total / 1e9, labels)
+
+    writer.counter(
+        "tool_calls",
+        "Completed tool calls by outcome",
+        [
+            ({"tool": registration.tool_id, "outcome": outcome}, count)
+            for registration in registrations
+            for outcome, count in (
+                ("success", registration.metrics.successes),
+                ("error", registration.metrics.errors),
+            )
+        ],
+    )
+    writer.gauge(
+        "tool_calls_in_flight",
+        "Tool calls currently executing",
+        [
+            ({"tool": registration.tool_id}, registration.metrics.in_flight)
+            for registration in registrations
+        ],
+    )
+
+
+def _write_event_bus_metrics(writer: OpenMetricsWriter) -> None:
+    buses = get_event_manager().get_stats()
+    for stat in ("events_published", "events_handled", "handlers_called", "errors"):
+        writer.counter(
+            f"event_bus_{stat}",
+            f"Event bus {stat.replace('_', ' ')}",
+            [({"bus": name}, bus["stats"].get(stat, 0)) for name, bus in buses.items()],
+        )
+    writer.gauge(
+        "event_bus_subscriptions",
+        "Event bus subscriptions",
+        [({"bus": name}, bus["subscription_count"]) for name, bus in buses.items()],
+    )
+
+
+def _write_http_metrics(writer: OpenMetricsWriter) -> None:
+    stats = HttpService.get_pool_stats()
+    writer.counter(
+        "http_requests", "Outbound HTTP requests", [(None, stats["requests"])]
+    )
+    writer.counter(
+        "http_request_errors",
+        "Outbound HTTP requests that failed after retries",
+        [(None, stats["request_errors"])],
+    )
+    writer.counter(
+        "http_request_retries",
+        "Outbound HTTP request retries",
+        [(None, stats["retries"])],
+    )
+    writer.gauge(
+        "http_requests_in_flight",
+        "Outbound HTTP requests in progress",
+        [(None, stats["in_flight"])],
+    )
+    writer.gauge(
+        "http_pool_connections",
+        "Connections in open HTTP client pools by state",
+        [
+            ({"state": "active"}, stats["connections"] - stats["idle_connections"]),
+            ({"state": "idle"}, stats["idle_connections"]),
+        ],
+    )
+    writer.gauge(
+        "http_open_clients", "Open HTTP clients", [(None, stats["open_clients"])]
+    )
+
+
+def _write_subprocess_metrics(writer: OpenMetricsWriter) -> None:
+    # Only read if command tools were imported; a scrape should not import them
+    execution = sys.modules.get("pythonium.tools.std.execution")
+    stats = execution.get_subprocess_stats() if execution is not None else {}
+    writer.counter(
+        "subprocesses_started",
+        "Child processes started by command tools",
+        [(None, stats.get("started", 0))],
+    )
+    writer.gauge(
+        "subprocesses_running",
+        "Child processes currently running",
+        [(None, stats.get("running", 0))],
+    )
+
+
+def create_metrics_route(
+    server: "PythoniumMCPServer", path: str, loop_lag: Optional[LoopLagMonitor]
+) -> Any:
+    """Create the Starlette route serving the server's metrics."""
+    from starlette.responses import Response
+    from starlette.routing import Route
+
+    async def metrics_endpoint(request: Any) -> Response:
+        return Response(render_metrics(server, loop_lag), media_type=CONTENT_TYPE)
+
+    return Route(path, metrics_endpoint, methods=["GET"])
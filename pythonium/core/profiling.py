@@ -0,0 +1,290 @@
+"""
+On-demand profiling of slow tool calls.
+
+With ``pythonium serve --profile-slow-ms N`` tool calls run under
+``cProfile``, and the profile of any call that took at least N
+milliseconds is written as a pstats file named after the tool and a
+digest of its parameters. The most recent profiles are kept in a bounded
+ring, and older files are deleted as they fall out of it; the
+``slow_call_profiles`` tool lists them and summarises their hottest
+functions.
+
+``cProfile`` profiles a thread, not a task: one call is profiled at a
+time, and its profile also contains whatever else the event loop ran
+meanwhile, such as other tool calls. Calls that start while a profile is
+being taken run unprofiled, and work a tool hands to worker threads is
+not captured.
+
+Profile files are written and deleted in the event loop's default
+executor, so a slow call does not also stall the loop on disk I/O; a
+profile is listed once its file has been written.
+"""
+
+import asyncio
+import cProfile
+import functools
+import hashlib
+import os
+import pstats
+import re
+import tempfile
+import time
+from collections import deque
+from dataclasses import dataclass
+from pathlib import Path
+from typing import Any, Deque, Dict, List, Optional, Set, Union
+
+from pythonium.common.logging import get_logger
+from pythonium.core.result_cache import canonicalize_parameters
+
+logger = get_logger(__name__)
+
+# Default directory for profile files
+DEFAULT_PROFILE_DIR = Path(tempfile.gettempdir()) / "pythonium-profiles"
+
+# Length of the parameter digest in profile file names
+DIGEST_LENGTH = 12
+
+
+def parameter_digest(parameters: Any) -> str:
+    """Digest call parameters so profiles of identical calls share a tag."""
+    if not isinstance(parameters, dict):
+        parameters = {"parameters": parameters}
+    try:
+        encoded = canonicalize_parameters(parameters).encode()
+    except TypeError:
+        encoded = repr(sorted(parameters.items(), key=lambda item: item[0])).encode()
+    return hashlib.sha256(encoded).hexdigest()[:DIGEST_LENGTH]
+
+
+def _delete_files(paths: List[Path]) -> None:
+    for path in paths:
+        path.unlink(missing_ok=True)
+
+
+@dataclass
+class SlowCallProfile:
+    """A stored profile of one slow tool call."""
+
+    profile_id: int
+    tool_name: str
+    parameter_digest: str
+    duration_ms: float
+    captured_at: float
+    path: Path
+
+    def to_dict(self) -> Dict[str, Any]:
+        """Describe the profile as a JSON-serializable dictionary."""
+        return {
+            "profile_id": self.profile_id,
+            "tool_name": self.tool_name,
+            "parameter_digest": self.parameter_digest,
+            "duration_ms": round(self.duration_ms, 3),
+            "captured_at": time.strftime(
+                "%Y-%m-%dT%H:%M:%SZ", time.gmtime(self.captured_at)
+            ),
+            "path": str(self.path),
+        }
+
+    def top_functions(
+        self, limit: int = 20, sort_by: str = "cumulative"
+    ) -> List[Dict[str, Any]]:
+        """Load the pstats file and return its most expensive functions."""
+        stats = pstats.Stats(str(self.path))
+        key = 3 if sort_by == "cumulative" else 2
+        entries = sorted(
+            stats.stats.items(),  # type: ignore[attr-defined]
+            key=lambda item: item[1][key],
+            reverse=True,
+        )
+        return [
+            {
+                # Undocumented, but how pstats itself prints function names
+                "function": pstats.func_std_string(  # type: ignore[attr-defined]
+                    function
+                ),
+                "calls": calls,
+                "primitive_calls": primitive_calls,
+                "self_ms": round(self_time * 1000, 3),
+                "cumulative_ms": round(cumulative_time * 1000, 3),
+            }
+            for function, (
+                primitive_calls,
+                calls,
+                self_time,
+                cumulative_time,
+                _callers,
+            ) in entries[:limit]
+        ]
+
+
+class SlowCallProfiler:
+    """Profiles tool calls and keeps the profiles of slow ones."""
+
+    def __init__(
+        self,
+        threshold_ms: float,
+        directory: Union[str, Path, None] = None,
+        max_profiles: int = 20,
+    ):
+        """
+        Initialize the profiler.
+
+        Args:
+            threshold_ms: Calls taking at least this long are kept
+            directory: Where pstats files are written
+            max_profiles: Number of recent profiles to keep
+        """
+        self.threshold_ns = int(threshold_ms * 1_000_000)
+        self.directory = Path(directory) if directory else DEFAULT_PROFILE_DIR
+        self.max_profiles = max_profiles
+        self._profiles: Deque[SlowCallProfile] = deque()
+        self._active = False
+        self._next_id = 1
+        self._pending: Set["asyncio.Future[Any]"] = set()
+        self.stats = {"profiled": 0, "captured": 0, "skipped": 0}
+
+    def begin(self) -> Optional[cProfile.Profile]:
+        """
+        Start profiling a call.
+
+        Returns None, and the call runs unprofiled, while another call is
+        being profiled or another profiler is active in this thread.
+        """
+        if self._active:
+            self.stats["skipped"] += 1
+            return None
+        profile = cProfile.Profile()
+        try:
+            profile.enable()
+        except ValueError:
+            self.stats["skipped"] += 1
+            return None
+        self._active = True
+        return profile
+
+    def end(
+        self,
+        profile: cProfile.Profile,
+        tool_name: str,
+        parameters: Any,
+        duration_ns: int,
+    ) -> Optional[SlowCallProfile]:
+        """
+        Stop profiling a call and keep the profile if it was slow.
+
+        Called from the event loop, the profile is written in the loop's
+        default executor and kept once the write succeeds; otherwise it is
+        written before returning.
+        """
+        profile.disable()
+        self._active = False
+        self.stats["profiled"] += 1
+        if duration_ns < self.threshold_ns:
+            return None
+
+        digest = parameter_digest(parameters)
+        captured_at = time.time()
+        safe_name = re.sub(r"[^\w.-]", "_", tool_name)
+        record = SlowCallProfile(
+            profile_id=self._next_id,
+            tool_name=tool_name,
+            parameter_digest=digest,
+            duration_ms=duration_ns / 1e6,
+            captured_at=captured_at,
+            path=self.directory
+            / f"{safe_name}-{digest}-{int(captured_at * 1000)}-{os.getpid()}.pstats",
+        )
+        self._next_id += 1
+
+        try:
+            loop = asyncio.get_running_loop()
+        except RuntimeError:
+            if self._dump(profile, record):
+                self._keep(record)
+            return record
+
+        future = self._submit(loop, self._dump, profile, record)
+        future.add_done_callback(functools.partial(self._on_dumped, record))
+        return record
+
+    async def wait_for_writes(self) -> None:
+        """Wait until every pending profile write and deletion has finished."""
+        while self._pending:
+            await asyncio.gather(*self._pending, return_exceptions=True)
+            # Gathering finished futures does not yield, so let their done
+            # callbacks run; keeping a profile can queue a deletion
+            await asyncio.sleep(0)
+
+    def _submit(
+        self, loop: asyncio.AbstractEventLoop, func: Any, *args: Any
+    ) -> "asyncio.Future[Any]":
+        future = loop.run_in_executor(None, func, *args)
+        self._pending.add(future)
+        future.add_done_callback(self._pending.discard)
+        return future
+
+    def _dump(self, profile: cProfile.Profile, record: SlowCallProfile) -> bool:
+        """Write a profile's pstats file; runs in an executor thread."""
+        try:
+            self.directory.mkdir(parents=True, exist_ok=True)
+            profile.dump_stats(str(record.path))
+        except OSError as e:
+            logger.warning(
+                f"Could not write profile of slow {record.tool_name} call: {e}"
+            )
+            return False
+        return True
+
+    def _on_dumped(
+        self, record: SlowCallProfile, future: "asyncio.Future[Any]"
+    ) -> None:
+        if not future.cancelled() and future.exception() is None and future.result():
+            self._keep(record)
+
+    def _keep(self, record: SlowCallProfile) -> None:
+        """Add a written profile to the ring, deleting the files it evicts."""
+        self.stats["captured"] += 1
+        self._profiles.append(record)
+        evicted: List[Path] = []
+        while len(self._profiles) > self.max_profiles:
+            evicted.append(self._profiles.popleft().path)
+        if evicted:
+            try:
+                self._submit(asyncio.get_running_loop(), _delete_files, evicted)
+            except RuntimeError:
+                _delete_files(evicted)
+
+        logger.info(
+            f"Profiled slow {record.tool_name} call "
+            f"({record.duration_ms:.1f} ms): {record.path}"
+        )
+
+    def profiles(self, tool_name: Optional[str] = None) -> List[SlowCallProfile]:
+        """Return the kept profiles, most recent first."""
+        return [
+            record
+            for record in reversed(self._profiles)
+            if tool_name is None or record.tool_name == tool_name
+        ]
+
+    def get_profile(self, profile_id: int) -> Optional[SlowCallProfile]:
+        """Look up a kept profile by ID."""
+        for record in self._profiles:
+            if record.profile_id == profile_id:
+                return record
+        return None
+
+
+_slow_call_profiler: Optional[SlowCallProfiler] = None
+
+
+def set_slow_call_profiler(profiler: Optional[SlowCallProfiler]) -> None:
+    """Install the slow call profiler for this process, or None to disable it."""
+    global _slow_call_profiler
+    _slow_call_profiler = profiler
+
+
+def get_slow_call_profiler() -> Optional[SlowCallProfiler]:
+    """Get the installed slow call profiler, if profiling is enabled."""
+    return _slow_call_profiler
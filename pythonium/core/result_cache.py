@@ -0,0 +1,203 @@
+"""
+Memoizing result cache for idempotent tools.
+
+Tools opt in through ``ToolMetadata.cacheable``. Successful results are
+keyed by tool name and the canonicalized, validated call parameters, so
+calls that differ only in values the parameter model coerces or in
+defaults passed explicitly share an entry. Entries expire after
+the tool's ``cache_ttl`` and are evicted least-recently-used first once
+the cache exceeds its byte budget.
+"""
+
+import json
+import time
+from collections import OrderedDict
+from typing import Any, Dict, NamedTuple, Optional, Set, Tuple
+
+from pydantic import BaseModel
+
+from pythonium.common.config import ToolSettings
+from pythonium.common.logging import get_logger
+
+logger = get_logger(__name__)
+
+CacheKey = Tuple[str, str]
+
+
+class CacheEntry(NamedTuple):
+    """A cached tool result."""
+
+    result: Any
+    expires_at: float
+    size: int
+
+
+def canonicalize_parameters(parameters: Any) -> str:
+    """
+    Serialize parameters so that equal calls produce identical strings.
+
+    Validated parameter models are dumped in JSON mode, which includes
+    their defaults and coerced values.
+
+    Raises:
+        TypeError: If the parameters hold a value JSON cannot represent
+    """
+    if isinstance(parameters, BaseModel):
+        parameters = parameters.model_dump(mode="json")
+    return json.dumps(parameters, sort_keys=True, separators=(",", ":"))
+
+
+def estimate_size(key: CacheKey, result: Any) -> int:
+    """Estimate the memory footprint of a cache entry in bytes."""
+    data = getattr(result, "data", result)
+    try:
+        payload = json.dumps(data, separators=(",", ":"), default=str)
+    except (TypeError, ValueError):
+        payload = repr(data)
+    return len(key[0]) + len(key[1]) + len(payload)
+
+
+class ResultCache:
+    """LRU result cache bounded by an approximate byte budget."""
+
+    def __init__(self, max_bytes: int = 32 * 1024 * 1024, enabled: bool = True):
+        """
+        Initialize the cache.
+
+        Args:
+            max_bytes: Maximum approximate size of all cached results
+            enabled: Whether lookups and stores are performed at all
+        """
+        self.max_bytes = max_bytes
+        self.enabled = enabled and max_bytes > 0
+
+        self._entries: "OrderedDict[CacheKey, CacheEntry]" = OrderedDict()
+        self._keys_by_tool: Dict[str, Set[CacheKey]] = {}
+        self._bytes = 0
+
+        self.hits = 0
+        self.misses = 0
+        self.expirations = 0
+        self.evictions = 0
+        self.invalidations = 0
+
+    @classmethod
+    def from_settings(cls, settings: ToolSettings) -> "ResultCache":
+        """Create a cache from tool settings."""
+        return cls(
+            max_bytes=settings.result_cache_max_bytes,
+            enabled=settings.result_cache_enabled,
+        )
+
+    @staticmethod
+    def make_key(tool_name: str, parameters: Any) -> CacheKey:
+        """
+        Build the cache key for a call from its validated parameters.
+
+        Raises:
+            TypeError: If the parameters cannot be canonicalized
+        """
+        return (tool_name, canonicalize_parameters(parameters))
+
+    def get(self, key: CacheKey) -> Optional[Any]:
+        """
+        Look up a fresh cached result.
+
+        Returns:
+            The cached result, or None on a miss
+        """
+        entry = self._entries.get(key)
+        if entry is None:
+            self.misses += 1
+            return None
+
+        if entry.expires_at <= time.monotonic():
+            self._remove(key)
+            self.expirations += 1
+            self.misses += 1
+            return None
+
+        self._entries.move_to_end(key)
+        self.hits += 1
+        return entry.result
+
+    def put(self, key: CacheKey, result: Any, ttl: float) -> bool:
+        """
+        Store a result for ``ttl`` seconds.
+
+        Returns:
+            True if the result was cached, False if it exceeds the budget
+        """
+        size = estimate_size(key, result)
+        if size > self.max_bytes:
+            logger.debug(f"Not caching {key[0]} result of {size} bytes: over budget")
+            return False
+
+        if key in self._entries:
+            self._remove(key)
+
+        self._entries[key] = CacheEntry(result, time.monotonic() + ttl, size)
+        self._keys_by_tool.setdefault(key[0], set()).add(key)
+        self._bytes += size
+
+        while self._bytes > self.max_bytes:
+            oldest = next(iter(self._entries))
+            self._remove(oldest)
+            self.evictions += 1
+
+        return True
+
+    def invalidate(self, tool_name: Optional[str] = None) -> int:
+        """
+        Drop cached results for one tool, or for all tools.
+
+        Returns:
+            Number of entries removed
+        """
+        if tool_name is None:
+            removed = len(self._entries)
+            self._entries.clear()
+            self._keys_by_tool.clear()
+            self._bytes = 0
+        else:
+            keys = self._keys_by_tool.pop(tool_name, set())
+            for key in keys:
+                entry = self._entries.pop(key)
+                self._bytes -= entry.size
+            removed = len(keys)
+
+        if removed:
+            self.invalidations += removed
+            logger.debug(
+                f"Invalidated {removed} cached results"
+                + (f" for {tool_name}" if tool_name else "")
+            )
+        return removed
+
+    def _remove(self, key: CacheKey) -> None:
+        entry = self._entries.pop(key)
+        self._bytes -= entry.size
+        keys = self._keys_by_tool.get(key[0])
+        if keys is not None:
+            keys.discard(key)
+            if not keys:
+                del self._keys_by_tool[key[0]]
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+    def get_stats(self) -> Dict[str, Any]:
+        """Get cache statistics."""
+        lookups = self.hits + self.misses
+        return {
+            "enabled": self.enabled,
+            "entries": len(self._entries),
+            "bytes": self._bytes,
+            "max_bytes": self.max_bytes,
+            "hits": self.hits,
+            "misses": self.misses,
+            "hit_rate": self.hits / lookups if lookups else 0.0,
+            "expirations": self.expirations,
+            "evictions": self.evictions,
+            "invalidations": self.invalidations,
+        }
@@ -3,18 +3,40 @@ MCP server implementation using the official MCP SDK.
 """
 
 import asyncio
-import logging
 import signal
-from typing import Any, Dict, List, Optional
+import weakref
+from pathlib import Path
+from typing import Any, Dict, Iterable, List, Optional, Union
 
+from mcp import types
 from mcp.server.fastmcp import FastMCP
+from mcp.server.fastmcp.exceptions import ToolError as FastMCPToolError
+from mcp.server.lowlevel.server import NotificationOptions
 
+from pythonium.common.base import Result
 from pythonium.common.config import TransportType
 from pythonium.common.exceptions import PythoniumError
 from pythonium.common.logging import get_logger
+from pythonium.common.tracing import (
+    JsonFileSpanExporter,
+    Tracer,
+    get_tracer,
+    set_tracer,
+)
+from pythonium.core.admission import AdmissionController
 from pythonium.core.config import ConfigurationManager
-from pythonium.core.tools import ToolDiscoveryManager, ToolRegistry
-from pythonium.tools.base import BaseTool, ToolContext
+from pythonium.core.dispatch import ToolDispatchPlan, map_parameter_type
+from pythonium.core.profiling import (
+    SlowCallProfiler,
+    get_slow_call_profiler,
+    set_slow_call_profiler,
+)
+from pythonium.core.result_cache import ResultCache
+from pythonium.core.single_flight import SingleFlight
+from pythonium.core.tools import ToolDiscoveryManager, ToolManifest, ToolRegistry
+from pythonium.core.tools.discovery import ToolChanges
+from pythonium.core.tools.watcher import ToolWatcher
+from pythonium.tools.base import BaseTool
 
 logger = get_logger(__name__)
 
@@ -33,6 +55,9 @@ class PythoniumMCPServer:
     but uses the official MCP SDK's FastMCP class for protocol handling.
     """
 
+    # Seconds an HTTP transport may spend draining connections on shutdown
+    HTTP_SHUTDOWN_TIMEOUT = 5.0
+
     def __init__(
         self,
         config_file: Optional[str] = None,
@@ -49,13 +74,42 @@ class PythoniumMCPServer:
         )
 
         # Tool management
-        self.tool_discovery = ToolDiscoveryManager()
+        self.tool_discovery = ToolDiscoveryManager(
+            manifest=(
+                ToolManifest.load(self.config.tools.discovery_manifest_path)
+                if self.config.tools.discovery_manifest_enabled
+                else None
+            ),
+            lazy_imports=self.config.tools.lazy_tool_imports,
+            prescreen=self.config.tools.discovery_prescreen,
+        )
         self.tool_registry = ToolRegistry()
+        self.admission = AdmissionController.from_settings(self.config.tools)
+        self.result_cache = ResultCache.from_settings(self.config.tools)
+        self.single_flight = (
+            SingleFlight() if self.config.tools.coalesce_calls else None
+        )
+        self._subscribe_cache_invalidation()
+
+        # Hot reload: discovered tool key -> registered tool name, the file
+        # watcher, and client sessions to notify when the tool list changes
+        self._discovered_tool_names: Dict[str, str] = {}
+        self._tool_watcher: Optional[ToolWatcher] = None
+        self._tool_list_sessions: "weakref.WeakSet[Any]" = weakref.WeakSet()
+        self._track_tool_list_sessions()
 
         # State
         self._running = False
         self._shutdown_event = asyncio.Event()
         self._registered_tools: Dict[str, BaseTool] = {}
+        self._dispatch_plans: Dict[str, ToolDispatchPlan] = {}
+        self._installed_signals: List[int] = []
+        self._http_server: Optional[Any] = None
+        self._tracer: Optional[Tracer] = None
+        self._profiler: Optional[SlowCallProfiler] = None
+
+        # Set by multi-process workers so every worker can bind the same port
+        self.reuse_port = False
 
         # Setup logging
         self._setup_logging()
@@ -78,9 +132,17 @@ class PythoniumMCPServer:
             if config_issues:
                 raise ServerError(f"Configuration validation failed: {config_issues}")
 
+            self._start_tracing()
+            self._start_profiling()
+
             # Discover and register tools
             await self._discover_and_register_tools()
 
+            if self.config.tools.hot_reload:
+                await self._start_tool_watcher()
+
+            self._shutdown_event.clear()
+
             # Setup signal handlers
             self._setup_signal_handlers()
 
@@ -99,8 +161,12 @@ class PythoniumMCPServer:
 
         logger.info("Stopping Pythonium MCP server...")
         self._running = False
+        self._remove_signal_handlers()
+        await self._stop_tool_watcher()
 
         await self._cleanup()
+        self._stop_tracing()
+        self._stop_profiling()
 
         # Signal shutdown complete
         self._shutdown_event.set()
@@ -111,38 +177,114 @@ class PythoniumMCPServer:
         """
         Run the server until shutdown.
 
-        This method determines the transport type and runs the server accordingly.
+        This method determines the transport type and serves it natively on
+        the running event loop, so tools, shared clients and the event bus all
+        live on the same loop as the protocol handlers.
         """
         await self.start()
 
         try:
-            # Determine transport type and run accordingly
-            transport_type = self.config.server.transport.value.lower()
-
-            def run_mcp_server(transport_type):
-                """Run MCP server with specified transport."""
-                if transport_type == "stdio":
-                    # For stdio, we use the FastMCP's built-in run method
-                    self.mcp_server.run(transport="stdio")
-                elif transport_type == "http":
-                    # For HTTP, we use streamable-http transport
-                    self.mcp_server.run(transport="streamable-http")
-                elif transport_type == "websocket":
-                    # WebSocket transport (using SSE for now)
-                    self.mcp_server.run(transport="sse")
-                else:
-                    raise ServerError(f"Unsupported transport type: {transport_type}")
+            serve_task = asyncio.create_task(self._serve_transport())
+            shutdown_task = asyncio.create_task(self._shutdown_event.wait())
 
-            # Run the MCP server in the current event loop's thread pool
-            await asyncio.get_event_loop().run_in_executor(
-                None, run_mcp_server, transport_type
-            )
+            try:
+                await asyncio.wait(
+                    {serve_task, shutdown_task},
+                    return_when=asyncio.FIRST_COMPLETED,
+                )
+            finally:
+                await self._stop_serving(serve_task)
+                shutdown_task.cancel()
+                await asyncio.gather(serve_task, shutdown_task, return_exceptions=True)
+
+            # Surface transport errors (such as an unsupported transport)
+            if not serve_task.cancelled():
+                serve_task.result()
 
         except KeyboardInterrupt:
             logger.info("Received keyboard interrupt")
         finally:
             await self.stop()
 
+    async def _serve_transport(self) -> None:
+        """Serve the configured transport using FastMCP's async entry points."""
+        transport_type = self.config.server.transport.value.lower()
+
+        if transport_type == "stdio":
+            await self.mcp_server.run_stdio_async()
+        elif transport_type == "http":
+            # For HTTP, we use streamable-http transport
+            await self._serve_http(self.mcp_server.streamable_http_app())
+        elif transport_type == "websocket":
+            # WebSocket transport (using SSE for now)
+            await self._serve_http(self.mcp_server.sse_app())
+        else:
+            raise ServerError(f"Unsupported transport type: {transport_type}")
+
+    def _mount_metrics(self, app: Any) -> Optional[Any]:
+        """
+        Add the OpenMetrics endpoint to an HTTP transport app.
+
+        Returns:
+            The event loop lag monitor to run while serving, or None when
+            metrics are disabled or the app has no Starlette router
+        """
+        router = getattr(app, "router", None)
+        if not self.config.server.metrics_enabled or router is None:
+            return None
+
+        from pythonium.core.metrics import LoopLagMonitor, create_metrics_route
+
+        loop_lag = LoopLagMonitor()
+        router.routes.append(
+            create_metrics_route(self, self.config.server.metrics_path, loop_lag)
+        )
+        return loop_lag
+
+    async def _serve_http(self, app: Any) -> None:
+        """Serve an ASGI app with uvicorn on the running event loop."""
+        import uvicorn
+
+        loop_lag = self._mount_metrics(app)
+        config = uvicorn.Config(
+            app,
+            host=self.config.server.host,
+            port=self.config.server.port,
+            log_level=self.mcp_server.settings.log_level.lower(),
+        )
+        self._http_server = uvicorn.Server(config)
+
+        sockets = None
+        if self.reuse_port:
+            from pythonium.core.workers import create_reuseport_socket
+
+            sockets = [
+                create_reuseport_socket(
+                    self.config.server.host, self.config.server.port
+                )
+            ]
+
+        if loop_lag is not None:
+            loop_lag.start()
+        try:
+            await self._http_server.serve(sockets=sockets)
+        finally:
+            self._http_server = None
+            if loop_lag is not None:
+                await loop_lag.stop()
+
+    async def _stop_serving(self, serve_task: "asyncio.Task[None]") -> None:
+        """Stop the transport, letting an HTTP server drain before cancelling."""
+        if serve_task.done():
+            return
+
+        if self._http_server is not None:
+            self._http_server.should_exit = True
+            await asyncio.wait({serve_task}, timeout=self.HTTP_SHUTDOWN_TIMEOUT)
+
+        if not serve_task.done():
+            serve_task.cancel()
+
     async def run_forever(self) -> None:
         """Run the server forever (until interrupted)."""
         await self.run()
@@ -154,17 +296,19 @@ class PythoniumMCPServer:
         Args:
             tool: Tool instance to register
         """
-        tool_name = tool.metadata.name
+        metadata = tool.metadata
+        tool_name = metadata.name
 
         # Store the tool instance
         self._registered_tools[tool_name] = tool
 
-        # Register the tool in the registry as well
+        # Register the same instance in the registry
         self.tool_registry.register_tool(
-            tool.__class__,
+            tool,
             name=tool_name,
-            version=tool.metadata.version,
-            tags=tool.metadata.tags,
+            version=metadata.version,
+            tags=metadata.tags,
+            metadata=metadata,
         )
 
         # Create the tool function for FastMCP with proper signature
@@ -177,95 +321,108 @@ class PythoniumMCPServer:
 
     def _create_dynamic_tool_function(self, tool_instance: BaseTool):
         """Create a dynamic tool function with proper parameter signature."""
-        import inspect
-
-        # Build parameter signature dynamically
-        parameters = []
-        annotations = {}
-
-        for param in tool_instance.metadata.parameters:
-            # Map our parameter types to Python types
-            python_type = self._map_parameter_type(param.type)
-            annotations[param.name] = python_type
-
-            # Create parameter with default value if not required
-            if param.required:
-                parameters.append(
-                    inspect.Parameter(
-                        param.name,
-                        inspect.Parameter.POSITIONAL_OR_KEYWORD,
-                        annotation=python_type,
-                    )
-                )
-            else:
-                default_value = param.default if param.default is not None else None
-                parameters.append(
-                    inspect.Parameter(
-                        param.name,
-                        inspect.Parameter.POSITIONAL_OR_KEYWORD,
-                        default=default_value,
-                        annotation=python_type,
-                    )
-                )
+        plan = ToolDispatchPlan(
+            tool_instance,
+            registry=self.tool_registry,
+            admission=self.admission,
+            cache=self.result_cache,
+            single_flight=self.single_flight,
+            dispatcher=self,
+        )
+        self._dispatch_plans[plan.name] = plan
+        return plan.build_function()
+
+    def unregister_tool(self, tool_name: str) -> Optional[BaseTool]:
+        """
+        Remove a tool from the server, the registry and FastMCP.
+
+        Args:
+            tool_name: Name of the registered tool
+
+        Returns:
+            The removed tool instance, or None if it was not registered
+        """
+        tool = self._registered_tools.pop(tool_name, None)
+        if tool is None:
+            return None
+
+        self._dispatch_plans.pop(tool_name, None)
+        self.admission.remove_tool(tool_name)
+        for registration in self.tool_registry.get_tool_versions(tool_name):
+            if registration.instance is tool:
+                self.tool_registry.unregister_tool(registration.tool_id)
 
-        # Create the function signature
-        sig = inspect.Signature(parameters)
+        self._remove_mcp_tool(tool_name)
 
-        # Create the actual function
-        async def tool_function(*args, **kwargs):
-            """Dynamically created tool function."""
+        logger.debug(f"Unregistered tool: {tool_name}")
+        return tool
+
+    def _remove_mcp_tool(self, tool_name: str) -> None:
+        """
+        Drop a tool from FastMCP so a replacement can be registered.
+
+        FastMCP keeps the first of two tools registered under one name. Newer
+        releases have ``remove_tool``; older ones only keep the tools in a
+        private dict, which is used when the public API is missing or
+        unusable.
+
+        Raises:
+            PythoniumError: If neither is available
+        """
+        removed = False
+        remove_tool = getattr(self.mcp_server, "remove_tool", None)
+        if callable(remove_tool):
             try:
-                # Create tool context with proper dataclass fields
-                context = ToolContext(
-                    user_id=None,
-                    session_id=None,
-                    workspace_path=None,
-                    environment={},
-                    permissions={},
-                    logger=logging.getLogger(
-                        f"pythonium.tools.{tool_instance.metadata.name}"
-                    ),
-                    progress_callback=None,
-                    registry=self.tool_registry,
+                remove_tool(tool_name)
+                removed = True
+            except FastMCPToolError:
+                # Not registered with FastMCP
+                removed = True
+            except AttributeError as e:
+                # Its tool manager is missing; treat it like an older release
+                logger.debug(f"FastMCP remove_tool is unusable: {e}")
+
+        if not removed:
+            tool_manager = getattr(self.mcp_server, "_tool_manager", None)
+            mcp_tools = getattr(tool_manager, "_tools", None)
+            if not isinstance(mcp_tools, dict):
+                raise PythoniumError(
+                    f"Cannot remove tool '{tool_name}': this FastMCP version has "
+                    "neither a usable remove_tool nor a tool manager to remove it "
+                    "from"
                 )
+            mcp_tools.pop(tool_name, None)
 
-                # Bind arguments to parameters using the signature
-                bound_args = sig.bind(*args, **kwargs)
-                bound_args.apply_defaults()
-                parameters = dict(bound_args.arguments)
-
-                # Execute the tool with parameters and context
-                result = await tool_instance.execute(parameters, context)
-
-                # Handle Result object properly for MCP
-                if result:
-                    if result.success:
-                        # Return the data for successful results
-                        return result.data if result.data is not None else ""
-                    else:
-                        # For errors, raise an exception that FastMCP can handle
-                        error_msg = result.error or "Unknown error occurred"
-                        raise Exception(error_msg)
-                else:
-                    return ""
+        # The low-level server caches tool definitions for output validation
+        lowlevel_cache = getattr(
+            getattr(self.mcp_server, "_mcp_server", None), "_tool_cache", None
+        )
+        if isinstance(lowlevel_cache, dict):
+            lowlevel_cache.pop(tool_name, None)
 
-            except Exception as e:
-                # Log only a concise error message without full content
-                error_str = str(e)
-                if len(error_str) > 100:
-                    error_str = error_str[:100] + "..."
-                logger.error(
-                    f"Error executing tool {tool_instance.metadata.name}: {error_str}"
-                )
-                raise
+    async def call_tool(self, tool_name: str, parameters: Dict[str, Any]) -> Result:
+        """
+        Call a registered tool through its dispatch plan.
 
-        # Set function attributes
-        tool_function.__name__ = tool_instance.metadata.name
-        tool_function.__doc__ = tool_instance.metadata.description
-        tool_function.__signature__ = sig  # type: ignore
-        tool_function.__annotations__ = annotations
+        Used by meta-tools that invoke other tools, so nested calls get the
+        same admission control, caching and coalescing as direct MCP calls.
 
-        return tool_function
+        Args:
+            tool_name: Name of the registered tool
+            parameters: Call parameters; omitted optional ones use defaults
+
+        Returns:
+            The tool's raw result
+        """
+        plan = self._dispatch_plans.get(tool_name)
+        if plan is None:
+            return Result.error_result(f"Tool '{tool_name}' is not registered")
+        try:
+            bound = plan.bind_arguments((), parameters)
+        except TypeError as e:
+            return Result.error_result(f"Invalid parameters for {tool_name}: {e}")
+        result: Result = await plan.call(bound)
+        return result
 
     def register_tools(self, tools: List[BaseTool]) -> None:
         """
@@ -281,21 +438,7 @@ class PythoniumMCPServer:
 
     def _map_parameter_type(self, param_type) -> type:
         """Map tool parameter types to Python types."""
-        from pythonium.tools.base import ParameterType
-
-        type_mapping = {
-            ParameterType.STRING: str,
-            ParameterType.INTEGER: int,
-            ParameterType.NUMBER: float,
-            ParameterType.BOOLEAN: bool,
-            ParameterType.ARRAY: list,
-            ParameterType.OBJECT: dict,
-            ParameterType.PATH: str,
-            ParameterType.URL: str,
-            ParameterType.EMAIL: str,
-        }
-
-        return type_mapping.get(param_type, str)
+        return map_parameter_type(param_type)
 
     async def _discover_and_register_tools(self) -> None:
         """Discover and register available tools."""
@@ -306,23 +449,173 @@ class PythoniumMCPServer:
             # Register discovered tools
             for tool_name, discovered_tool in discovered_tools_dict.items():
                 try:
-                    tool_instance = discovered_tool.tool_class()
+                    tool_instance = self.tool_discovery.create_tool(discovered_tool)
                     self.register_tool(tool_instance)
+                    self._discovered_tool_names[tool_name] = tool_instance.metadata.name
                 except Exception as e:
-                    logger.warning(
-                        f"Failed to register tool {discovered_tool.tool_class.__name__}: {e}"
-                    )
+                    logger.warning(f"Failed to register tool {tool_name}: {e}")
 
             logger.info(f"Discovered and registered {len(discovered_tools_dict)} tools")
 
         except Exception as e:
             logger.error(f"Tool discovery failed: {e}")
 
+    async def reload_tools(
+        self, changed_files: Iterable[Union[str, Path]]
+    ) -> ToolChanges:
+        """
+        Apply changes to tool module files without a full rediscovery.
+
+        Only the changed modules are re-imported. Tools they no longer
+        define are unregistered, new ones registered and changed ones
+        replaced, after which clients are sent ``tools/list_changed``.
+
+        Args:
+            changed_files: Paths of added, modified or removed module files
+
+        Returns:
+            The discovered tool keys that were added, removed or replaced
+        """
+        loop = asyncio.get_running_loop()
+        changes = await loop.run_in_executor(
+            None, self.tool_discovery.reload_modules, list(changed_files)
+        )
+        if not changes:
+            return changes
+
+        retired: List[BaseTool] = []
+        for key in changes.removed + changes.updated:
+            tool_name = self._discovered_tool_names.pop(key, None)
+            tool = self.unregister_tool(tool_name) if tool_name else None
+            if tool is not None:
+                retired.append(tool)
+
+        for key in changes.added + changes.updated:
+            discovered = self.tool_discovery.get_discovered_tool(key)
+            if discovered is None:
+                continue
+            try:
+                tool = self.tool_discovery.create_tool(discovered)
+                self.register_tool(tool)
+                self._discovered_tool_names[key] = tool.metadata.name
+            except Exception as e:
+                logger.warning(f"Failed to register reloaded tool {key}: {e}")
+
+        for tool in retired:
+            try:
+                await tool.shutdown()
+            except Exception as e:
+                logger.warning(f"Error shutting down replaced tool {tool.name}: {e}")
+
+        await self.notify_tools_changed()
+        return changes
+
+    async def notify_tools_changed(self) -> None:
+        """Send ``tools/list_changed`` to every client that listed tools."""
+        for session in list(self._tool_list_sessions):
+            try:
+                await session.send_tool_list_changed()
+            except Exception as e:
+                # The client went away
+                self._tool_list_sessions.discard(session)
+                logger.debug(f"Could not notify session of tool changes: {e}")
+
+    def _track_tool_list_sessions(self) -> None:
+        """Remember the sessions that list tools so they can be notified."""
+        lowlevel: Any = getattr(self.mcp_server, "_mcp_server", None)
+        handlers = getattr(lowlevel, "request_handlers", None)
+        if not isinstance(handlers, dict) or types.ListToolsRequest not in handlers:
+            return
+        list_tools = handlers[types.ListToolsRequest]
+
+        async def list_tools_tracking_session(request: Any) -> Any:
+            try:
+                self._tool_list_sessions.add(lowlevel.request_context.session)
+            except (LookupError, TypeError):
+                pass
+            return await list_tools(request)
+
+        handlers[types.ListToolsRequest] = list_tools_tracking_session
+
+        if self.config.tools.hot_reload:
+            # Advertise the tools.listChanged capability to clients
+            tools_changed = NotificationOptions(tools_changed=True)
+            create_options = lowlevel.create_initialization_options
+
+            def create_initialization_options(
+                notification_options: Optional[NotificationOptions] = None,
+                experimental_capabilities: Optional[Dict[str, Any]] = None,
+            ) -> Any:
+                if notification_options is None:
+                    notification_options = tools_changed
+                else:
+                    notification_options.tools_changed = True
+                return create_options(notification_options, experimental_capabilities)
+
+            lowlevel.create_initialization_options = create_initialization_options
+
+    async def _start_tool_watcher(self) -> None:
+        """Watch the tool search paths and reload changed modules."""
+        self._tool_watcher = ToolWatcher(
+            self.tool_discovery.search_paths,
+            self.reload_tools,
+            poll_interval=self.config.tools.hot_reload_interval,
+        )
+        await self._tool_watcher.start()
+
+    async def _stop_tool_watcher(self) -> None:
+        if self._tool_watcher is not None:
+            await self._tool_watcher.stop()
+            self._tool_watcher = None
+
+    def _start_tracing(self) -> None:
+        """Trace tool calls to the configured trace file, if any."""
+        trace_file = self.config.server.trace_file
+        if not trace_file or get_tracer() is not None:
+            return
+        self._tracer = Tracer(JsonFileSpanExporter(trace_file))
+        set_tracer(self._tracer)
+        logger.info(f"Tracing tool calls to {trace_file}")
+
+    def _stop_tracing(self) -> None:
+        """Export buffered spans and uninstall this server's tracer."""
+        if self._tracer is None:
+            return
+        self._tracer.shutdown()
+        if get_tracer() is self._tracer:
+            set_tracer(None)
+        self._tracer = None
+
+    def _start_profiling(self) -> None:
+        """Profile slow tool calls if a threshold is configured."""
+        settings = self.config.server
+        if settings.profile_slow_ms is None or get_slow_call_profiler() is not None:
+            return
+        self._profiler = SlowCallProfiler(
+            settings.profile_slow_ms,
+            settings.profile_dir,
+            settings.profile_max_count,
+        )
+        set_slow_call_profiler(self._profiler)
+        logger.info(
+            f"Profiling tool calls slower than {settings.profile_slow_ms:g} ms "
+            f"into {self._profiler.directory}"
+        )
+
+    def _stop_profiling(self) -> None:
+        """Uninstall this server's slow call profiler."""
+        if self._profiler is None:
+            return
+        if get_slow_call_profiler() is self._profiler:
+            set_slow_call_profiler(None)
+        self._profiler = None
+
     async def _cleanup(self) -> None:
         """Clean up server resources."""
         try:
             # Clear registered tools
             self._registered_tools.clear()
+            self._dispatch_plans.clear()
 
         except Exception as e:
             logger.error(f"Error during cleanup: {e}")
@@ -366,10 +659,32 @@ class PythoniumMCPServer:
 
     def _setup_signal_handlers(self) -> None:
         """Set up signal handlers for graceful shutdown."""
-        if hasattr(signal, "SIGTERM"):
-            signal.signal(signal.SIGTERM, self._signal_handler)
-        if hasattr(signal, "SIGINT"):
-            signal.signal(signal.SIGINT, self._signal_handler)
+        loop = asyncio.get_running_loop()
+
+        for name in ("SIGTERM", "SIGINT"):
+            if not hasattr(signal, name):
+                continue
+            signum = getattr(signal, name)
+            try:
+                loop.add_signal_handler(signum, self._signal_handler, signum, None)
+                self._installed_signals.append(signum)
+            except (NotImplementedError, RuntimeError):
+                # Event loop signal handlers are unavailable (e.g. on Windows)
+                signal.signal(signum, self._signal_handler)
+
+    def _remove_signal_handlers(self) -> None:
+        """Remove signal handlers installed on the event loop."""
+        if not self._installed_signals:
+            return
+
+        try:
+            loop = asyncio.get_running_loop()
+        except RuntimeError:
+            return
+
+        for signum in self._installed_signals:
+            loop.remove_signal_handler(signum)
+        self._installed_signals.clear()
 
     def _signal_handler(self, signum, _frame) -> None:
         """Handle shutdown signals."""
@@ -394,6 +709,34 @@ class PythoniumMCPServer:
         """Get currently registered tools."""
         return self._registered_tools.copy()
 
+    def get_admission_stats(self) -> Dict[str, Any]:
+        """Get concurrency, queue depth and queue wait statistics."""
+        return self.admission.get_stats()
+
+    def get_cache_stats(self) -> Dict[str, Any]:
+        """Get result cache statistics."""
+        return self.result_cache.get_stats()
+
+    def get_coalescing_stats(self) -> Dict[str, Any]:
+        """Get single-flight coalescing statistics."""
+        if self.single_flight is None:
+            return {"enabled": False}
+        return {"enabled": True, **self.single_flight.get_stats()}
+
+    def _subscribe_cache_invalidation(self) -> None:
+        """Invalidate cached results when the tool registry changes."""
+
+        def on_registry_changed(data: Dict[str, Any]) -> None:
+            # Registry-derived results (tool listings, descriptions) are stale
+            self.result_cache.invalidate()
+
+        def on_status_changed(data: Dict[str, Any]) -> None:
+            self.result_cache.invalidate(data["registration"].name)
+
+        self.tool_registry.add_event_handler("tool_registered", on_registry_changed)
+        self.tool_registry.add_event_handler("tool_unregistered", on_registry_changed)
+        self.tool_registry.add_event_handler("tool_status_changed", on_status_changed)
+
 
 # Factory functions for different server configurations
 
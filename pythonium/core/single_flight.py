@@ -0,0 +1,96 @@
+"""
+Single-flight coalescing of identical in-flight tool calls.
+
+Concurrent calls that share a key await one shared execution and all
+receive the same result. The shared execution keeps running as long as
+at least one caller is still waiting for it, and is cancelled once the
+last waiter goes away.
+"""
+
+import asyncio
+import functools
+from typing import Any, Awaitable, Callable, Dict, Hashable
+
+from pythonium.common.logging import get_logger
+
+logger = get_logger(__name__)
+
+
+class _Flight:
+    """A shared execution and the number of callers awaiting it."""
+
+    __slots__ = ("task", "waiters")
+
+    def __init__(self, task: "asyncio.Future[Any]"):
+        self.task = task
+        self.waiters = 0
+
+
+class SingleFlight:
+    """Coalesces concurrent calls with identical keys into one execution."""
+
+    def __init__(self) -> None:
+        self._flights: Dict[Hashable, _Flight] = {}
+
+        self.executions = 0
+        self.coalesced = 0
+        self.cancelled = 0
+
+    async def do(self, key: Hashable, factory: Callable[[], Awaitable[Any]]) -> Any:
+        """
+        Run ``factory()`` once for all concurrent callers with the same key.
+
+        Args:
+            key: Identity of the call
+            factory: Creates the awaitable that performs the call
+
+        Returns:
+            The result of the shared execution
+        """
+        flight = self._flights.get(key)
+        if flight is None:
+            flight = _Flight(asyncio.ensure_future(factory()))
+            self._flights[key] = flight
+            self.executions += 1
+            flight.task.add_done_callback(functools.partial(self._finish, key, flight))
+        else:
+            self.coalesced += 1
+
+        flight.waiters += 1
+        try:
+            return await asyncio.shield(flight.task)
+        except asyncio.CancelledError:
+            if flight.waiters == 1 and not flight.task.done():
+                # Nobody else is interested in the result any more. Forget
+                # the flight now rather than once the task has finished
+                # cancelling, so a caller arriving in between starts afresh
+                self._forget(key, flight)
+                flight.task.cancel()
+                self.cancelled += 1
+            raise
+        finally:
+            flight.waiters -= 1
+
+    def _forget(self, key: Hashable, flight: _Flight) -> None:
+        """Stop handing a flight to new callers."""
+        if self._flights.get(key) is flight:
+            del self._flights[key]
+
+    def _finish(
+        self, key: Hashable, flight: _Flight, task: "asyncio.Future[Any]"
+    ) -> None:
+        """Forget a completed flight so later calls execute afresh."""
+        self._forget(key, flight)
+
+        # Retrieve the exception so an abandoned flight never logs as unhandled
+        if not task.cancelled():
+            task.exception()
+
+    def get_stats(self) -> Dict[str, Any]:
+        """Get coalescing statistics."""
+        return {
+            "in_flight": len(self._flights),
+            "executions": self.executions,
+            "coalesced": self.coalesced,
+            "cancelled": self.cancelled,
+        }
@@ -0,0 +1,180 @@
+"""
+Startup import-time profiling.
+
+``profile_startup`` imports the modules a server needs in a fresh
+interpreter under ``python -X importtime`` and summarises where the time
+went. The result is compared against ``STARTUP_BUDGET_MS``, the import
+budget for ``pythonium serve``: everything imported before the server can
+answer its first request. The MCP SDK (and the httpx, starlette and
+pydantic stack beneath it) accounts for most of that budget; Pythonium's
+own modules and the dependencies of individual tools (bs4, aiofiles,
+LangGraph) are imported on first use and must not show up here.
+"""
+
+import subprocess
+import sys
+from dataclasses import dataclass, field
+from typing import Any, Dict, Iterable, List, Optional, Sequence, Tuple
+
+from pythonium.common.exceptions import PythoniumError
+
+# Import budget for ``pythonium serve``, in milliseconds
+STARTUP_BUDGET_MS = 1500.0
+
+# Modules ``pythonium serve`` imports before it starts serving
+STARTUP_MODULES = ("pythonium.main", "pythonium.core.server")
+
+# Dependencies only some tools need; importing them at startup is a regression
+DEFERRED_MODULES = ("aiofiles", "bs4", "langchain_core", "langgraph")
+
+# Written to stderr just before the profiled imports, so interpreter
+# startup imports (encodings, site) are left out of the profile
+_MARKER = "-- pythonium profile-startup --"
+
+_IMPORTTIME_PREFIX = "import time:"
+
+
+@dataclass
+class ImportRecord:
+    """One line of ``-X importtime`` output."""
+
+    module: str
+    self_us: int
+    cumulative_us: int
+    depth: int
+
+
+@dataclass
+class StartupProfile:
+    """Import-time breakdown for a set of modules."""
+
+    modules: Tuple[str, ...]
+    records: List[ImportRecord] = field(default_factory=list)
+    budget_ms: float = STARTUP_BUDGET_MS
+
+    @property
+    def total_ms(self) -> float:
+        """Total time spent importing."""
+        return sum(record.self_us for record in self.records) / 1000
+
+    @property
+    def over_budget(self) -> bool:
+        return self.total_ms > self.budget_ms
+
+    def by_package(self) -> List[Tuple[str, float]]:
+        """Import time per top-level package, slowest first."""
+        totals: Dict[str, int] = {}
+        for record in self.records:
+            package = record.module.split(".", 1)[0]
+            totals[package] = totals.get(package, 0) + record.self_us
+        return sorted(
+            ((package, us / 1000) for package, us in totals.items()),
+            key=lambda item: item[1],
+            reverse=True,
+        )
+
+    def slowest(self, limit: int = 10) -> List[ImportRecord]:
+        """The modules with the highest self time."""
+        return sorted(self.records, key=lambda r: r.self_us, reverse=True)[:limit]
+
+    def deferred_imports(self) -> List[str]:
+        """Deferred dependencies that were nevertheless imported."""
+        imported = {record.module.split(".", 1)[0] for record in self.records}
+        return [module for module in DEFERRED_MODULES if module in imported]
+
+    def to_dict(self, limit: int = 10) -> Dict[str, Any]:
+        return {
+            "modules": list(self.modules),
+            "total_ms": round(self.total_ms, 3),
+            "budget_ms": self.budget_ms,
+            "over_budget": self.over_budget,
+            "packages": [
+                {"package": package, "ms": round(ms, 3)}
+                for package, ms in self.by_package()[:limit]
+            ],
+            "slowest": [
+                {
+                    "module": record.module,
+                    "self_ms": record.self_us / 1000,
+                    "cumulative_ms": record.cumulative_us / 1000,
+                }
+                for record in self.slowest(limit)
+            ],
+            "deferred_imports": self.deferred_imports(),
+        }
+
+
+def parse_importtime(output: str) -> List[ImportRecord]:
+    """
+    Parse ``-X importtime`` output.
+
+    Lines before the profiling marker, if present, are ignored, as are
+    lines that are not import-time records.
+    """
+    lines = output.splitlines()
+    if _MARKER in lines:
+        lines = lines[lines.index(_MARKER) + 1 :]
+
+    records = []
+    for line in lines:
+        if not line.startswith(_IMPORTTIME_PREFIX):
+            continue
+        fields = line[len(_IMPORTTIME_PREFIX) :].split("|", 2)
+        if len(fields) != 3 or not fields[0].strip().isdigit():
+            continue  # The column header
+        name = fields[2].rstrip()
+        module = name.lstrip()
+        records.append(
+            ImportRecord(
+                module=module,
+                self_us=int(fields[0]),
+                cumulative_us=int(fields[1]),
+                depth=(len(name) - len(module) - 1) // 2,
+            )
+        )
+    return records
+
+
+def profile_startup(
+    modules: Sequence[str] = STARTUP_MODULES,
+    budget_ms: float = STARTUP_BUDGET_MS,
+    python: Optional[str] = None,
+    extra_args: Iterable[str] = (),
+) -> StartupProfile:
+    """
+    Import modules in a fresh interpreter and profile the import time.
+
+    Args:
+        modules: Modules to import, in order
+        budget_ms: Budget to compare the total against
+        python: Interpreter to run (default: the current one)
+        extra_args: Additional interpreter options
+
+    Raises:
+        PythoniumError: If the modules cannot be imported
+    """
+    code = "; ".join(
+        [
+            "import sys",
+            f"sys.stderr.write({_MARKER!r} + '\\n')",
+            "sys.stderr.flush()",
+            *(f"import {module}" for module in modules),
+        ]
+    )
+    process = subprocess.run(
+        [python or sys.executable, *extra_args, "-X", "importtime", "-c", code],
+        capture_output=True,
+        text=True,
+    )
+    if process.returncode != 0:
+        error = process.stderr.strip().splitlines()
+        raise PythoniumError(
+            f"Failed to import {', '.join(modules)}: "
+            f"{error[-1] if error else process.returncode}"
+        )
+
+    return StartupProfile(
+        modules=tuple(modules),
+        records=parse_importtime(process.stderr),
+        budget_ms=budget_ms,
+    )
@@ -3,9 +3,13 @@ Tool management package for the Pythonium framework.
 """
 
 from .discovery import ToolDiscoveryManager
+from .lazy import LazyTool
+from .manifest import ToolManifest
 from .registry import ToolRegistry
 
 __all__ = [
+    "LazyTool",
     "ToolDiscoveryManager",
+    "ToolManifest",
     "ToolRegistry",
 ]
@@ -2,44 +2,128 @@
 Tool discovery manager for the Pythonium framework.
 
 Provides automatic discovery and registration of tools from various sources
-including Python modules and external packages.
+including Python modules and external packages. Discovery results can be
+persisted in a ``ToolManifest`` so unchanged modules are not rescanned.
 """
 
-import importlib
 import inspect
 import os
-import sys
-from dataclasses import dataclass
+import re
+import time
+from concurrent.futures import ThreadPoolExecutor
+from dataclasses import dataclass, field
 from datetime import datetime
 from pathlib import Path
-from typing import Any, Callable, Dict, List, Optional, Set, Type, Union
+from typing import (
+    Any,
+    Callable,
+    Dict,
+    Iterable,
+    List,
+    Optional,
+    Set,
+    Tuple,
+    Type,
+    Union,
+    cast,
+)
 
 from pythonium.common.logging import get_logger
 from pythonium.tools.base import BaseTool
 
+from .lazy import LazyTool, import_tool_module
+from .manifest import ManifestTool, ModuleEntry, ToolManifest
+
 logger = get_logger(__name__)
 
+# Discovery methods, in the order their candidates are loaded
+PACKAGE_SCAN = "package_scan"
+MODULE_SCAN = "module_scan"
+
+# Pre-screening reads sources in a thread pool from this many candidates on
+PARALLEL_SCREEN_THRESHOLD = 16
+
+# A class statement whose bases include something named ``...Tool``
+_TOOL_CLASS_PATTERN = re.compile(rb"^[ \t]*class\s+\w+\s*\([^)]*Tool\b", re.MULTILINE)
+
+
+def _may_define_tools(module_file: Path) -> bool:
+    """Cheaply check whether a source file may define a tool class."""
+    try:
+        with open(module_file, "rb") as f:
+            return _TOOL_CLASS_PATTERN.search(f.read()) is not None
+    except OSError:
+        return True  # Let the import report the problem
+
 
 @dataclass
 class DiscoveredTool:
-    """Represents a discovered tool."""
+    """
+    Represents a discovered tool.
+
+    ``tool_class`` is None for tools discovered lazily from the manifest,
+    whose module has not been imported yet.
+    """
 
-    tool_class: Type[BaseTool]
+    tool_class: Optional[Type[BaseTool]]
     module_name: str
     source_path: str
     discovery_method: str
     metadata: Dict[str, Any]
     discovered_at: datetime
+    tool_metadata: Optional[Dict[str, Any]] = None
+    search_path: Optional[str] = None
+
+
+@dataclass
+class ModuleCandidate:
+    """A module found while walking the search paths."""
+
+    module_name: str
+    module_file: Path
+    source_path: str
+    discovery_method: str
+    search_path: Path
+
+
+@dataclass
+class ToolChanges:
+    """Discovered tool keys affected by a reload."""
+
+    added: List[str] = field(default_factory=list)
+    removed: List[str] = field(default_factory=list)
+    updated: List[str] = field(default_factory=list)
+
+    def __bool__(self) -> bool:
+        return bool(self.added or self.removed or self.updated)
+
+
+# (attribute name, tool class, serialized ToolMetadata if known)
+FoundTool = Tuple[str, Type[BaseTool], Optional[Dict[str, Any]]]
 
 
 class ToolDiscoveryManager:
     """Manages automatic discovery of tools from various sources."""
 
-    def __init__(self):
+    def __init__(
+        self,
+        manifest: Optional[ToolManifest] = None,
+        lazy_imports: bool = False,
+        prescreen: bool = False,
+    ):
         self.discovered_tools: Dict[str, DiscoveredTool] = {}
         self.search_paths: List[Path] = []
         self.excluded_modules: Set[str] = set()
         self.tool_filters: List[Callable] = []
+        self.manifest = manifest
+        self.lazy_imports = lazy_imports
+        self.prescreen = prescreen
+        self.module_reports: Dict[str, Dict[str, Any]] = {}
+        self._instances: Dict[Type[BaseTool], BaseTool] = {}
+        self._scanned_files: List[str] = []
+        self._candidates: Optional[List[ModuleCandidate]] = None
+        # Resolved module file -> candidate, for modules loaded so far
+        self._module_files: Dict[str, ModuleCandidate] = {}
 
         # Add default search paths
         self._add_default_search_paths()
@@ -81,160 +165,424 @@ class ToolDiscoveryManager:
         logger.info("Starting tool discovery...")
 
         discovered_count = 0
+        self._scanned_files = []
+        self.module_reports = {}
+        self._candidates = self._collect_candidates()
+
+        try:
+            if scan_packages:
+                discovered_count += self._discover_from_packages()
 
-        if scan_packages:
-            discovered_count += self._discover_from_packages()
+            if scan_modules:
+                discovered_count += self._discover_from_modules()
+        finally:
+            self._candidates = None
 
-        if scan_modules:
-            discovered_count += self._discover_from_modules()
+        if self.manifest is not None:
+            if scan_packages and scan_modules:
+                self.manifest.prune(self._scanned_files)
+            if self.manifest.dirty:
+                self.manifest.save()
+            logger.debug(f"Tool manifest: {self.manifest.get_stats()}")
 
         logger.info(f"Tool discovery completed. Found {discovered_count} new tools.")
         return self.discovered_tools
 
     def _discover_from_packages(self) -> int:
         """Discover tools from Python packages."""
-        discovered = 0
+        return self._load_candidates(PACKAGE_SCAN)
+
+    def _discover_from_modules(self) -> int:
+        """Discover tools from individual Python modules."""
+        return self._load_candidates(MODULE_SCAN)
+
+    def _collect_candidates(self) -> List[ModuleCandidate]:
+        """
+        Walk every search path once and list the modules to consider.
+
+        Candidates are sorted by module name within each search path, so
+        discovery is reproducible. A module name found in an earlier search
+        path shadows later ones, as it would on ``sys.path``.
+        """
+        candidates: List[ModuleCandidate] = []
+        seen: Set[str] = set()
 
         for search_path in self.search_paths:
-            try:
-                # Walk through all Python packages in the search path
-                for root, dirs, files in os.walk(search_path):
-                    # Skip __pycache__ and .pyc files
-                    dirs[:] = [d for d in dirs if not d.startswith("__pycache__")]
-
-                    if "__init__.py" in files:
-                        # This is a Python package
-                        package_path = Path(root)
-                        relative_path = package_path.relative_to(search_path)
-
-                        # Convert path to module name
-                        module_parts = list(relative_path.parts)
-                        if module_parts and package_path != search_path:
-                            module_name = ".".join(module_parts)
-
-                            # Skip excluded modules
-                            if any(
-                                excluded in module_name
-                                for excluded in self.excluded_modules
-                            ):
-                                continue
-
-                            try:
-                                # Add the search path to sys.path temporarily
-                                if str(search_path) not in sys.path:
-                                    sys.path.insert(0, str(search_path))
-
-                                # Import the module
-                                module = importlib.import_module(module_name)
-                                discovered += self._scan_module_for_tools(
-                                    module,
-                                    module_name,
-                                    str(package_path),
-                                    "package_scan",
-                                )
-
-                            except ImportError as e:
-                                logger.debug(
-                                    f"Could not import module {module_name}: {e}"
-                                )
-                            except Exception as e:
-                                logger.warning(
-                                    f"Error scanning module {module_name}: {e}"
-                                )
-                            finally:
-                                # Remove from sys.path if we added it
-                                if str(search_path) in sys.path:
-                                    sys.path.remove(str(search_path))
+            for candidate in self._walk_search_path(search_path):
+                if candidate.module_name in seen:
+                    continue
+                seen.add(candidate.module_name)
+
+                # Skip excluded modules
+                if any(
+                    excluded in candidate.module_name
+                    for excluded in self.excluded_modules
+                ):
+                    continue
 
-            except Exception as e:
-                logger.error(f"Error discovering tools from path {search_path}: {e}")
+                candidates.append(candidate)
 
-        return discovered
+        return candidates
 
-    def _discover_from_modules(self) -> int:
-        """Discover tools from individual Python modules."""
-        discovered = 0
+    def _walk_search_path(self, search_path: Path) -> List[ModuleCandidate]:
+        """List packages and modules under a search path in one scandir pass."""
+        candidates: List[ModuleCandidate] = []
+        pending: List[Tuple[Path, Tuple[str, ...]]] = [(search_path, ())]
 
-        for search_path in self.search_paths:
+        while pending:
+            directory, parts = pending.pop()
             try:
-                # Look for individual .py files
-                for py_file in search_path.glob("**/*.py"):
-                    if py_file.name.startswith("__"):
-                        continue
-
-                    # Convert file path to module name
-                    relative_path = py_file.relative_to(search_path)
-                    module_parts = list(relative_path.with_suffix("").parts)
-                    module_name = ".".join(module_parts)
-
-                    # Skip excluded modules
-                    if any(
-                        excluded in module_name for excluded in self.excluded_modules
-                    ):
-                        continue
-
-                    try:
-                        # Add the search path to sys.path temporarily
-                        if str(search_path) not in sys.path:
-                            sys.path.insert(0, str(search_path))
-
-                        # Import the module
-                        module = importlib.import_module(module_name)
-                        discovered += self._scan_module_for_tools(
-                            module, module_name, str(py_file), "module_scan"
+                with os.scandir(directory) as scan:
+                    entries = sorted(scan, key=lambda entry: entry.name)
+            except OSError as e:
+                logger.error(f"Error discovering tools from path {directory}: {e}")
+                continue
+
+            for entry in entries:
+                if entry.is_dir():
+                    # Skip __pycache__ and hidden directories
+                    if not entry.name.startswith(("__pycache__", ".")):
+                        pending.append((Path(entry.path), parts + (entry.name,)))
+                elif not entry.name.endswith(".py"):
+                    continue
+                elif entry.name == "__init__.py":
+                    # The search path itself is not treated as a package
+                    if parts:
+                        candidates.append(
+                            ModuleCandidate(
+                                module_name=".".join(parts),
+                                module_file=Path(entry.path),
+                                source_path=str(directory),
+                                discovery_method=PACKAGE_SCAN,
+                                search_path=search_path,
+                            )
+                        )
+                elif not entry.name.startswith("__"):
+                    candidates.append(
+                        ModuleCandidate(
+                            module_name=".".join(parts + (entry.name[:-3],)),
+                            module_file=Path(entry.path),
+                            source_path=entry.path,
+                            discovery_method=MODULE_SCAN,
+                            search_path=search_path,
                         )
+                    )
+
+        return sorted(candidates, key=lambda candidate: candidate.module_name)
+
+    def _get_candidates(self) -> List[ModuleCandidate]:
+        """Candidates of the running discovery pass, collecting them if needed."""
+        if self._candidates is None:
+            return self._collect_candidates()
+        return self._candidates
+
+    def _load_candidates(self, discovery_method: str) -> int:
+        """Load every candidate of one discovery method."""
+        candidates = [
+            candidate
+            for candidate in self._get_candidates()
+            if candidate.discovery_method == discovery_method
+        ]
 
-                    except ImportError as e:
-                        logger.debug(f"Could not import module {module_name}: {e}")
-                    except Exception as e:
-                        logger.warning(f"Error scanning module {module_name}: {e}")
-                    finally:
-                        # Remove from sys.path if we added it
-                        if str(search_path) in sys.path:
-                            sys.path.remove(str(search_path))
+        entries = [self._lookup_manifest(candidate) for candidate in candidates]
+        may_define_tools = self._prescreen(
+            [
+                candidate
+                for candidate, entry in zip(candidates, entries)
+                if entry is None
+            ]
+        )
 
-            except Exception as e:
-                logger.error(f"Error discovering modules from path {search_path}: {e}")
+        discovered = 0
+        for candidate, entry in zip(candidates, entries):
+            discovered += self._load_module(
+                candidate,
+                entry,
+                may_define_tools.get(candidate.module_name, True),
+            )
+        return discovered
+
+    def _lookup_manifest(self, candidate: ModuleCandidate) -> Optional[ModuleEntry]:
+        """Return the fresh manifest entry for a candidate, if any."""
+        if self.manifest is None:
+            return None
+        return self.manifest.lookup(
+            candidate.module_file, candidate.module_name, candidate.discovery_method
+        )
+
+    def _prescreen(self, candidates: List[ModuleCandidate]) -> Dict[str, bool]:
+        """
+        Cheaply check which candidates may define tool classes.
+
+        Sources are searched for a class deriving from a ``...Tool`` base,
+        in a thread pool when there are many of them. Candidates that fail
+        the check are not imported. The check misses tools whose bases are
+        named otherwise, so its verdicts are never recorded in the manifest
+        and a later discovery without the prescreen still imports them.
+        """
+        if not self.prescreen or not candidates:
+            return {}
+
+        files = [candidate.module_file for candidate in candidates]
+        if len(files) < PARALLEL_SCREEN_THRESHOLD:
+            results = [_may_define_tools(path) for path in files]
+        else:
+            with ThreadPoolExecutor(
+                max_workers=min(8, len(files)), thread_name_prefix="discovery"
+            ) as pool:
+                results = list(pool.map(_may_define_tools, files))
+
+        return {
+            candidate.module_name: result
+            for candidate, result in zip(candidates, results)
+        }
+
+    def _load_module(
+        self,
+        candidate: ModuleCandidate,
+        entry: Optional[ModuleEntry],
+        may_define_tools: bool = True,
+    ) -> int:
+        """Import a module, or trust its manifest entry, and collect its tools."""
+        module_name = candidate.module_name
+        discovery_method = candidate.discovery_method
+        self._scanned_files.append(str(candidate.module_file))
+        self._module_files[str(candidate.module_file.resolve())] = candidate
+
+        report: Dict[str, Any] = {
+            "module_name": module_name,
+            "source_path": candidate.source_path,
+            "discovery_method": discovery_method,
+            "status": "imported",
+            "import_ms": None,
+            "tools": 0,
+        }
+        self.module_reports[module_name] = report
+
+        if entry is not None and not entry.tools:
+            # Unchanged module known to define no tools: skip the import
+            report["status"] = "manifest"
+            return 0
+
+        if (
+            entry is not None
+            and self.lazy_imports
+            and not self.tool_filters  # Filters need the tool classes
+            and all(tool.metadata is not None for tool in entry.tools)
+        ):
+            report["status"] = "lazy"
+            report["tools"] = len(entry.tools)
+            return self._add_lazy_tools(
+                entry.tools,
+                module_name,
+                candidate.module_file,
+                candidate.source_path,
+                discovery_method,
+                candidate.search_path,
+            )
+
+        if entry is None and not may_define_tools:
+            report["status"] = "skipped"
+            return 0
+
+        start = time.perf_counter()
+        try:
+            module = import_tool_module(module_name, candidate.search_path)
+            report["import_ms"] = round((time.perf_counter() - start) * 1000, 3)
+
+            found = None
+            if entry is not None:
+                report["status"] = "manifest"
+                found = self._resolve_manifest_tools(module, entry.tools)
+            if found is None:
+                report["status"] = "imported"
+                found = self._find_tool_classes(module)
+                if self.manifest is not None:
+                    found = [
+                        (name, obj, self._serialize_metadata(obj))
+                        for name, obj, _ in found
+                    ]
+                    self.manifest.record(
+                        candidate.module_file,
+                        module_name,
+                        discovery_method,
+                        [
+                            ManifestTool(
+                                tool_name=self._tool_key(obj, name),
+                                class_name=name,
+                                metadata=tool_metadata,
+                            )
+                            for name, obj, tool_metadata in found
+                        ],
+                    )
+
+            report["tools"] = len(found)
+            return self._add_discovered_tools(
+                module, module_name, candidate.source_path, discovery_method, found
+            )
+
+        except ImportError as e:
+            report["status"] = "import_error"
+            logger.debug(f"Could not import module {module_name}: {e}")
+        except Exception as e:
+            report["status"] = "error"
+            logger.warning(f"Error scanning module {module_name}: {e}")
+        finally:
+            if report["import_ms"] is None:
+                report["import_ms"] = round((time.perf_counter() - start) * 1000, 3)
+
+        return 0
+
+    def _add_lazy_tools(
+        self,
+        tools: List[ManifestTool],
+        module_name: str,
+        module_file: Path,
+        source_path: str,
+        discovery_method: str,
+        search_path: Path,
+    ) -> int:
+        """Record manifest tools without importing their module."""
+        discovered = 0
+
+        for tool in tools:
+            if tool.tool_name in self.discovered_tools:
+                continue
+
+            self.discovered_tools[tool.tool_name] = DiscoveredTool(
+                tool_class=None,
+                module_name=module_name,
+                source_path=source_path,
+                discovery_method=discovery_method,
+                metadata={
+                    "class_name": tool.class_name,
+                    "module_file": str(module_file),
+                },
+                discovered_at=datetime.now(),
+                tool_metadata=tool.metadata,
+                search_path=str(search_path),
+            )
+            discovered += 1
+            logger.debug(f"Discovered tool: {tool.tool_name} from manifest (lazy)")
 
         return discovered
 
+    def create_tool(self, discovered: DiscoveredTool) -> BaseTool:
+        """
+        Return the instance of a discovered tool.
+
+        Each tool class is instantiated once, and metadata serialization
+        for the manifest reuses the same instance. Tools discovered lazily
+        get a ``LazyTool`` proxy that imports the real tool on first use.
+        """
+        if discovered.tool_class is not None:
+            return self._get_instance(discovered.tool_class)
+        return LazyTool(
+            discovered.tool_metadata or {},
+            discovered.module_name,
+            discovered.metadata["class_name"],
+            discovered.search_path,
+        )
+
+    def _get_instance(self, tool_class: Type[BaseTool]) -> BaseTool:
+        """Instantiate a tool class once and reuse the instance afterwards."""
+        instance = self._instances.get(tool_class)
+        if instance is None:
+            instance = self._instances[tool_class] = tool_class()
+        return instance
+
     def _scan_module_for_tools(
         self, module, module_name: str, source_path: str, discovery_method: str
     ) -> int:
         """Scan a module for tool classes."""
-        discovered = 0
-
         try:
-            for name, obj in inspect.getmembers(module):
-                if self._is_valid_tool_class(obj):
-                    tool_name = getattr(obj, "name", name)
-
-                    # Apply filters
-                    if not self._passes_filters(obj):
-                        continue
-
-                    if tool_name not in self.discovered_tools:
-                        discovered_tool = DiscoveredTool(
-                            tool_class=obj,
-                            module_name=module_name,
-                            source_path=source_path,
-                            discovery_method=discovery_method,
-                            metadata={
-                                "class_name": name,
-                                "module_file": getattr(module, "__file__", None),
-                            },
-                            discovered_at=datetime.now(),
-                        )
+            found = self._find_tool_classes(module)
+        except Exception as e:
+            logger.warning(f"Error scanning module {module_name} for tools: {e}")
+            return 0
+
+        return self._add_discovered_tools(
+            module, module_name, source_path, discovery_method, found
+        )
 
-                        self.discovered_tools[tool_name] = discovered_tool
-                        discovered += 1
-                        logger.debug(f"Discovered tool: {tool_name} from {module_name}")
+    def _find_tool_classes(self, module) -> List[FoundTool]:
+        """Find all tool classes defined in or imported into a module."""
+        return [
+            (name, obj, None)
+            for name, obj in inspect.getmembers(module)
+            if self._is_valid_tool_class(obj)
+        ]
 
+    def _resolve_manifest_tools(
+        self, module, tools: List[ManifestTool]
+    ) -> Optional[List[FoundTool]]:
+        """Look up the tool classes a manifest entry lists, or None if any is gone."""
+        found: List[FoundTool] = []
+        for tool in tools:
+            obj = getattr(module, tool.class_name, None)
+            if not self._is_valid_tool_class(obj):
+                logger.debug(
+                    f"Manifest entry for {module.__name__} is stale: "
+                    f"{tool.class_name} not found"
+                )
+                return None
+            found.append((tool.class_name, cast(Type[BaseTool], obj), tool.metadata))
+        return found
+
+    def _serialize_metadata(
+        self, tool_class: Type[BaseTool]
+    ) -> Optional[Dict[str, Any]]:
+        """Serialize a tool's metadata for the manifest."""
+        try:
+            return self._get_instance(tool_class).metadata.model_dump(mode="json")
         except Exception as e:
-            logger.warning(f"Error scanning module {module_name} for tools: {e}")
+            logger.debug(f"Could not serialize metadata of {tool_class.__name__}: {e}")
+            return None
+
+    def _add_discovered_tools(
+        self,
+        module,
+        module_name: str,
+        source_path: str,
+        discovery_method: str,
+        found: List[FoundTool],
+    ) -> int:
+        """Record found tool classes that pass the filters and are not yet known."""
+        discovered = 0
+
+        for name, obj, tool_metadata in found:
+            tool_name = self._tool_key(obj, name)
+
+            # Apply filters
+            if not self._passes_filters(obj):
+                continue
+
+            if tool_name not in self.discovered_tools:
+                discovered_tool = DiscoveredTool(
+                    tool_class=obj,
+                    module_name=module_name,
+                    source_path=source_path,
+                    discovery_method=discovery_method,
+                    metadata={
+                        "class_name": name,
+                        "module_file": getattr(module, "__file__", None),
+                    },
+                    discovered_at=datetime.now(),
+                    tool_metadata=tool_metadata,
+                )
+
+                self.discovered_tools[tool_name] = discovered_tool
+                discovered += 1
+                logger.debug(f"Discovered tool: {tool_name} from {module_name}")
 
         return discovered
 
+    @staticmethod
+    def _tool_key(tool_class: Type[BaseTool], attribute_name: str) -> str:
+        """Key under which a discovered tool class is recorded."""
+        tool_name = getattr(tool_class, "name", attribute_name)
+        return tool_name if isinstance(tool_name, str) else attribute_name
+
     def _is_valid_tool_class(self, obj) -> bool:
         """Check if an object is a valid tool class."""
         try:
@@ -266,8 +614,12 @@ class ToolDiscoveryManager:
         """Get discovered tools by category."""
         tools = []
         for tool in self.discovered_tools.values():
+            if tool.tool_metadata is not None or tool.tool_class is None:
+                if (tool.tool_metadata or {}).get("category") == category:
+                    tools.append(tool)
+                continue
             try:
-                tool_instance = tool.tool_class()
+                tool_instance = self._get_instance(tool.tool_class)
                 if (
                     hasattr(tool_instance, "metadata")
                     and tool_instance.metadata.category == category
@@ -297,6 +649,122 @@ class ToolDiscoveryManager:
         logger.info(f"Discovery refresh complete: {old_count} -> {new_count} tools")
         return new_tools
 
+    def reload_modules(self, changed_files: Iterable[Union[str, Path]]) -> ToolChanges:
+        """
+        Re-import only the modules whose files changed and diff their tools.
+
+        New files are imported, changed ones reloaded and tools of deleted
+        ones dropped. A module that fails to reload keeps its previous
+        tools, so a half-saved file does not unregister anything.
+
+        Args:
+            changed_files: Paths of added, modified or removed module files
+
+        Returns:
+            The discovered tool keys that were added, removed or replaced
+        """
+        changes = ToolChanges()
+        candidates = {
+            str(candidate.module_file.resolve()): candidate
+            for candidate in self._collect_candidates()
+        }
+
+        for path in sorted({str(Path(p).resolve()) for p in changed_files}):
+            candidate = candidates.get(path)
+            if candidate is not None:
+                self._module_files[path] = candidate
+                self._reload_module(candidate, changes)
+                continue
+
+            previous = self._module_files.pop(path, None)
+            if previous is not None:
+                self._drop_module_tools(previous.module_name, set(), changes)
+                if self.manifest is not None:
+                    self.manifest.discard(path)
+
+        if self.manifest is not None and self.manifest.dirty:
+            self.manifest.save()
+
+        if changes:
+            logger.info(
+                f"Reloaded tools: {len(changes.added)} added, "
+                f"{len(changes.removed)} removed, {len(changes.updated)} updated"
+            )
+        return changes
+
+    def _reload_module(self, candidate: ModuleCandidate, changes: ToolChanges) -> None:
+        """Reload one module and record how its tools changed."""
+        module_name = candidate.module_name
+        try:
+            module = import_tool_module(module_name, candidate.search_path, reload=True)
+            found = [
+                (name, obj)
+                for name, obj, _ in self._find_tool_classes(module)
+                if self._passes_filters(obj)
+            ]
+        except Exception as e:
+            logger.warning(f"Could not reload tool module {module_name}: {e}")
+            return
+
+        current: Dict[str, Tuple[str, Type[BaseTool]]] = {}
+        for name, obj in found:
+            key = self._tool_key(obj, name)
+            owner = self.discovered_tools.get(key)
+            # Tools imported from modules that already provide them stay there
+            if owner is None or owner.module_name == module_name:
+                current[key] = (name, obj)
+
+        self._drop_module_tools(module_name, set(current), changes)
+
+        manifest_tools = []
+        for key, (name, obj) in current.items():
+            tool_metadata = (
+                self._serialize_metadata(obj) if self.manifest is not None else None
+            )
+            manifest_tools.append(
+                ManifestTool(tool_name=key, class_name=name, metadata=tool_metadata)
+            )
+
+            previous = self.discovered_tools.get(key)
+            if previous is not None:
+                if previous.tool_class is obj:
+                    continue
+                if previous.tool_class is not None:
+                    self._instances.pop(previous.tool_class, None)
+
+            self.discovered_tools[key] = DiscoveredTool(
+                tool_class=obj,
+                module_name=module_name,
+                source_path=candidate.source_path,
+                discovery_method=candidate.discovery_method,
+                metadata={
+                    "class_name": name,
+                    "module_file": getattr(module, "__file__", None),
+                },
+                discovered_at=datetime.now(),
+                tool_metadata=tool_metadata,
+            )
+            (changes.updated if previous is not None else changes.added).append(key)
+
+        if self.manifest is not None:
+            self.manifest.record(
+                candidate.module_file,
+                module_name,
+                candidate.discovery_method,
+                manifest_tools,
+            )
+
+    def _drop_module_tools(
+        self, module_name: str, keep: Set[str], changes: ToolChanges
+    ) -> None:
+        """Forget tools a module no longer provides."""
+        for key, tool in list(self.discovered_tools.items()):
+            if tool.module_name == module_name and key not in keep:
+                del self.discovered_tools[key]
+                if tool.tool_class is not None:
+                    self._instances.pop(tool.tool_class, None)
+                changes.removed.append(key)
+
     def export_discovery_report(self) -> Dict[str, Any]:
         """Export a comprehensive discovery report."""
         report: Dict[str, Any] = {
@@ -309,7 +777,11 @@ class ToolDiscoveryManager:
 
         for tool_name, tool in self.discovered_tools.items():
             report["tools"][tool_name] = {
-                "class_name": tool.tool_class.__name__,
+                "class_name": (
+                    tool.tool_class.__name__
+                    if tool.tool_class is not None
+                    else tool.metadata.get("class_name")
+                ),
                 "module_name": tool.module_name,
                 "source_path": tool.source_path,
                 "discovery_method": tool.discovery_method,
@@ -325,4 +797,12 @@ class ToolDiscoveryManager:
                 report["by_discovery_method"][method] = 0
             report["by_discovery_method"][method] += 1
 
+        # Per-module outcome and import time of the last discovery pass
+        report["modules"] = [
+            self.module_reports[name] for name in sorted(self.module_reports)
+        ]
+        report["import_time_ms"] = round(
+            sum(module["import_ms"] or 0 for module in report["modules"]), 3
+        )
+
         return report
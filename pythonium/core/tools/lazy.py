@@ -0,0 +1,183 @@
+"""
+Lazily imported tool proxies.
+
+A ``LazyTool`` is registered from manifest metadata alone. The module that
+defines the real tool is imported, and the tool instantiated, only when
+the tool is first invoked, so servers that use few of their tools never
+pay the import time and memory of the rest.
+"""
+
+import asyncio
+import importlib
+import sys
+import threading
+from pathlib import Path
+from types import ModuleType
+from typing import Any, Callable, Dict, Optional, Type, Union
+
+from pydantic import BaseModel
+
+from pythonium.common.base import Result
+from pythonium.common.logging import get_logger
+from pythonium.tools.base import BaseTool, ToolContext, ToolError, ToolMetadata
+
+logger = get_logger(__name__)
+
+# Serializes imports that temporarily extend sys.path
+_import_lock = threading.RLock()
+
+
+def import_tool_module(
+    module_name: str,
+    search_path: Optional[Union[str, Path]] = None,
+    reload: bool = False,
+) -> ModuleType:
+    """
+    Import a module found under a tool search path.
+
+    Args:
+        module_name: Module name relative to the search path
+        search_path: Directory added to ``sys.path`` for the import
+        reload: Import the module afresh even if it was already imported
+    """
+    path = str(search_path) if search_path is not None else None
+    with _import_lock:
+        added = path is not None and path not in sys.path
+        if added:
+            sys.path.insert(0, path)  # type: ignore[arg-type]
+        try:
+            if not reload:
+                return importlib.import_module(module_name)
+
+            # Import into a fresh namespace so names deleted from the source
+            # disappear, restoring the previous module if the import fails.
+            # New files may be invisible to cached directory listings.
+            importlib.invalidate_caches()
+            previous = sys.modules.pop(module_name, None)
+            try:
+                return importlib.import_module(module_name)
+            except BaseException:
+                if previous is not None:
+                    sys.modules[module_name] = previous
+                raise
+        finally:
+            # Remove from sys.path if we added it
+            if added and path in sys.path:
+                sys.path.remove(path)
+
+
+class LazyTool(BaseTool):
+    """Proxy that imports and instantiates the real tool on first use."""
+
+    # Each proxy carries the metadata of the tool it stands in for
+    shared_metadata = False
+
+    def __init__(
+        self,
+        metadata: Union[ToolMetadata, Dict[str, Any]],
+        module_name: str,
+        class_name: str,
+        search_path: Optional[Union[str, Path]] = None,
+    ):
+        """
+        Initialize the proxy.
+
+        Args:
+            metadata: Metadata of the real tool, e.g. from the discovery manifest
+            module_name: Module defining the tool class
+            class_name: Name of the tool class in that module
+            search_path: Tool search path the module name is relative to
+        """
+        super().__init__(class_name)
+        self._lazy_metadata = (
+            metadata
+            if isinstance(metadata, ToolMetadata)
+            else ToolMetadata.model_validate(metadata)
+        )
+        self.module_name = module_name
+        self.class_name = class_name
+        self.search_path = search_path
+        self._tool: Optional[BaseTool] = None
+        self._load_lock = threading.Lock()
+
+    @property
+    def metadata(self) -> ToolMetadata:
+        return self._lazy_metadata
+
+    @property
+    def loaded(self) -> bool:
+        """Whether the real tool has been imported and instantiated."""
+        return self._tool is not None
+
+    def load(self) -> BaseTool:
+        """Import and instantiate the real tool, once."""
+        with self._load_lock:
+            if self._tool is None:
+                module = import_tool_module(self.module_name, self.search_path)
+                tool_class: Optional[Type[BaseTool]] = getattr(
+                    module, self.class_name, None
+                )
+                if tool_class is None:
+                    raise ToolError(
+                        f"Tool class {self.class_name} not found in {self.module_name}"
+                    )
+                self._tool = tool_class()
+                logger.debug(f"Loaded tool {self.class_name} from {self.module_name}")
+            return self._tool
+
+    async def get_tool(self) -> BaseTool:
+        """
+        Return the real tool, loading it on first use.
+
+        The import runs in a worker thread so it does not stall the event
+        loop; concurrent first calls wait for the same load.
+        """
+        if self._tool is not None:
+            return self._tool
+        loop = asyncio.get_running_loop()
+        return await loop.run_in_executor(None, self.load)
+
+    async def initialize(self) -> None:
+        pass
+
+    async def shutdown(self) -> None:
+        if self._tool is not None:
+            await self._tool.shutdown()
+
+    @property
+    def parameter_model(self) -> Optional[Type[BaseModel]]:
+        # Unknown until loaded; the real tool then validates on its own
+        if self._tool is None:
+            return None
+        return self._tool.parameter_model
+
+    def is_cacheable_call(self, parameters: Dict[str, Any]) -> bool:
+        # Until the real tool is loaded its per-call policy is unknown, and
+        # not caching is always safe
+        if self._tool is None:
+            return False
+        return self._tool.is_cacheable_call(parameters)
+
+    async def execute(
+        self, parameters: Dict[str, Any], context: ToolContext
+    ) -> Result[Any]:
+        tool = await self.get_tool()
+        return await tool.execute(parameters, context)
+
+    async def stream(self, parameters: Dict[str, Any], context: ToolContext):
+        tool = await self.get_tool()
+        stream = tool.stream(parameters, context)
+        try:
+            async for item in stream:
+                yield item
+        finally:
+            await stream.aclose()  # type: ignore[attr-defined]
+
+    async def collect_stream(
+        self,
+        parameters: Dict[str, Any],
+        context: ToolContext,
+        on_partial: Optional[Callable[[Any], Any]] = None,
+    ) -> Result[Any]:
+        tool = await self.get_tool()
+        return await tool.collect_stream(parameters, context, on_partial)
@@ -0,0 +1,263 @@
+"""
+Persistent tool discovery manifest.
+
+Discovery has to import every module under the tool search paths just to
+find ``BaseTool`` subclasses. The manifest records, per module file, its
+size, mtime and content hash together with the tool classes it defines
+and their serialized ``ToolMetadata``. While a module file is unchanged,
+discovery trusts the manifest entry instead of importing and scanning it.
+
+Only the module file itself is checked. A change elsewhere that alters a
+tool's metadata, such as in a helper module the tool imports, is not
+noticed until the module file changes, Pythonium is upgraded (the
+manifest is tied to the Python and Pythonium versions) or the manifest is
+rebuilt with ``pythonium build-manifest``.
+
+By default the manifest lives in the user cache directory, so a server
+shares one manifest whichever directory it is started from.
+"""
+
+import hashlib
+import importlib.metadata
+import json
+import os
+import sys
+import tempfile
+from dataclasses import asdict, dataclass, field
+from pathlib import Path
+from typing import Any, Dict, List, Optional, Union
+
+from pythonium.common.logging import get_logger
+
+logger = get_logger(__name__)
+
+MANIFEST_VERSION = 1
+
+
+def default_manifest_path() -> Path:
+    """Return the manifest path in the user cache directory."""
+    if sys.platform == "win32":
+        base = os.environ.get("LOCALAPPDATA")
+    elif sys.platform == "darwin":
+        base = str(Path.home() / "Library" / "Caches")
+    else:
+        base = os.environ.get("XDG_CACHE_HOME")
+    root = Path(base) if base else Path.home() / ".cache"
+    return root / "pythonium" / "tool_manifest.json"
+
+
+def _fingerprint() -> Dict[str, str]:
+    """Describe the environment a manifest is valid for."""
+    try:
+        pythonium_version = importlib.metadata.version("pythonium")
+    except importlib.metadata.PackageNotFoundError:
+        pythonium_version = "unknown"
+    return {
+        "python": "{}.{}".format(*sys.version_info[:2]),
+        "pythonium": pythonium_version,
+    }
+
+
+def hash_file(path: Union[str, Path]) -> str:
+    """Return the SHA-256 hex digest of a file's contents."""
+    digest = hashlib.sha256()
+    with open(path, "rb") as f:
+        for chunk in iter(lambda: f.read(65536), b""):
+            digest.update(chunk)
+    return digest.hexdigest()
+
+
+@dataclass
+class ManifestTool:
+    """A tool class recorded in the manifest."""
+
+    tool_name: str
+    class_name: str
+    metadata: Optional[Dict[str, Any]] = None
+
+
+@dataclass
+class ModuleEntry:
+    """Discovery results for a single module file."""
+
+    module_name: str
+    discovery_method: str
+    mtime_ns: int
+    size: int
+    sha256: str
+    tools: List[ManifestTool] = field(default_factory=list)
+
+    @classmethod
+    def from_dict(cls, data: Dict[str, Any]) -> "ModuleEntry":
+        tools = [ManifestTool(**tool) for tool in data.get("tools", [])]
+        return cls(**{**data, "tools": tools})
+
+
+class ToolManifest:
+    """On-disk cache of tool discovery results keyed by module file."""
+
+    def __init__(self, path: Union[str, Path, None] = None):
+        self.path = Path(path) if path else default_manifest_path()
+        self.entries: Dict[str, ModuleEntry] = {}
+        self.dirty = False
+
+        self.hits = 0
+        self.misses = 0
+
+    @classmethod
+    def load(cls, path: Union[str, Path, None] = None) -> "ToolManifest":
+        """
+        Load a manifest from disk, by default from the user cache directory.
+
+        A missing, unreadable or incompatible manifest yields an empty one,
+        so discovery falls back to importing every module.
+        """
+        manifest = cls(path)
+        try:
+            with open(manifest.path, encoding="utf-8") as f:
+                data = json.load(f)
+        except FileNotFoundError:
+            return manifest
+        except (OSError, ValueError) as e:
+            logger.warning(f"Ignoring unreadable tool manifest {manifest.path}: {e}")
+            return manifest
+
+        if (
+            data.get("version") != MANIFEST_VERSION
+            or data.get("fingerprint") != _fingerprint()
+        ):
+            logger.info(f"Tool manifest {manifest.path} is outdated, rebuilding")
+            return manifest
+
+        try:
+            manifest.entries = {
+                source: ModuleEntry.from_dict(entry)
+                for source, entry in data.get("modules", {}).items()
+            }
+        except (TypeError, AttributeError) as e:
+            logger.warning(f"Ignoring malformed tool manifest {manifest.path}: {e}")
+            manifest.entries = {}
+        return manifest
+
+    def lookup(
+        self, source_file: Union[str, Path], module_name: str, discovery_method: str
+    ) -> Optional[ModuleEntry]:
+        """
+        Return the entry for a module file if the file is unchanged.
+
+        The size and mtime are checked first. When only the mtime differs
+        (for example after a copy into a container image), the content hash
+        decides and the recorded mtime is refreshed on a match.
+        """
+        key = str(Path(source_file).resolve())
+        entry = self.entries.get(key)
+        if (
+            entry is None
+            or entry.module_name != module_name
+            or entry.discovery_method != discovery_method
+        ):
+            self.misses += 1
+            return None
+
+        try:
+            stat = os.stat(key)
+            if stat.st_size != entry.size:
+                self.misses += 1
+                return None
+            if stat.st_mtime_ns != entry.mtime_ns:
+                if hash_file(key) != entry.sha256:
+                    self.misses += 1
+                    return None
+                entry.mtime_ns = stat.st_mtime_ns
+                self.dirty = True
+        except OSError:
+            self.misses += 1
+            return None
+
+        self.hits += 1
+        return entry
+
+    def record(
+        self,
+        source_file: Union[str, Path],
+        module_name: str,
+        discovery_method: str,
+        tools: List[ManifestTool],
+    ) -> None:
+        """Store fresh discovery results for a module file."""
+        key = str(Path(source_file).resolve())
+        try:
+            stat = os.stat(key)
+            sha256 = hash_file(key)
+        except OSError as e:
+            logger.debug(f"Not recording {key} in tool manifest: {e}")
+            return
+
+        self.entries[key] = ModuleEntry(
+            module_name=module_name,
+            discovery_method=discovery_method,
+            mtime_ns=stat.st_mtime_ns,
+            size=stat.st_size,
+            sha256=sha256,
+            tools=tools,
+        )
+        self.dirty = True
+
+    def discard(self, source_file: Union[str, Path]) -> None:
+        """Drop the entry for a module file."""
+        if self.entries.pop(str(Path(source_file).resolve()), None) is not None:
+            self.dirty = True
+
+    def prune(self, seen: List[str]) -> None:
+        """Drop entries for module files that no longer exist in the search paths."""
+        keep = {str(Path(source).resolve()) for source in seen}
+        stale = [source for source in self.entries if source not in keep]
+        for source in stale:
+            del self.entries[source]
+        if stale:
+            self.dirty = True
+
+    def save(self) -> bool:
+        """
+        Write the manifest atomically.
+
+        Returns:
+            True if the manifest was written
+        """
+        data = {
+            "version": MANIFEST_VERSION,
+            "fingerprint": _fingerprint(),
+            "modules": {
+                source: asdict(entry) for source, entry in sorted(self.entries.items())
+            },
+        }
+        try:
+            self.path.parent.mkdir(parents=True, exist_ok=True)
+            fd, tmp_path = tempfile.mkstemp(
+                dir=self.path.parent, prefix=self.path.name, suffix=".tmp"
+            )
+            try:
+                with os.fdopen(fd, "w", encoding="utf-8") as f:
+                    json.dump(data, f, indent=1)
+                # mkstemp creates owner-only files; servers may run as another user
+                os.chmod(tmp_path, 0o644)
+                os.replace(tmp_path, self.path)
+            except BaseException:
+                os.unlink(tmp_path)
+                raise
+        except OSError as e:
+            logger.warning(f"Could not write tool manifest {self.path}: {e}")
+            return False
+
+        self.dirty = False
+        logger.debug(f"Wrote tool manifest with {len(self.entries)} modules")
+        return True
+
+    def get_stats(self) -> Dict[str, Any]:
+        """Get manifest statistics."""
+        return {
+            "path": str(self.path),
+            "modules": len(self.entries),
+            "hits": self.hits,
+            "misses": self.misses,
+        }
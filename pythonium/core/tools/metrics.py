@@ -0,0 +1,173 @@
+"""
+Per-tool usage metrics for the tool registry.
+
+Latencies are recorded into fixed-memory, HDR-style histograms: values
+are bucketed by power of two and each power of two is split into
+``SUB_BUCKETS`` linear sub-buckets, so every recorded value is known to
+within about 6% no matter how large, and a histogram never grows past
+``BUCKET_COUNT`` counters.
+"""
+
+from typing import Any, Dict, List, Optional, Sequence
+
+# Linear sub-buckets per power of two; bounds the relative error to 1/16
+SUB_BUCKET_BITS = 4
+SUB_BUCKETS = 1 << SUB_BUCKET_BITS
+
+# Largest trackable latency, about 73 minutes in nanoseconds; longer calls
+# are counted in the top bucket
+MAX_TRACKABLE_BITS = 42
+MAX_TRACKABLE_NS = (1 << MAX_TRACKABLE_BITS) - 1
+
+BUCKET_COUNT = (MAX_TRACKABLE_BITS - SUB_BUCKET_BITS) * SUB_BUCKETS + SUB_BUCKETS
+
+# Percentiles reported by ``summary``
+REPORTED_PERCENTILES = (50.0, 95.0, 99.0)
+
+
+def bucket_index(value: int) -> int:
+    """Return the histogram bucket counting ``value``."""
+    if value < SUB_BUCKETS:
+        return value if value > 0 else 0
+    if value > MAX_TRACKABLE_NS:
+        value = MAX_TRACKABLE_NS
+    shift = value.bit_length() - SUB_BUCKET_BITS - 1
+    return (shift + 1) * SUB_BUCKETS + (value >> shift) - SUB_BUCKETS
+
+
+def bucket_upper_bound(index: int) -> int:
+    """Return the largest value counted in bucket ``index``."""
+    if index < SUB_BUCKETS:
+        return index
+    shift = index // SUB_BUCKETS - 1
+    mantissa = index % SUB_BUCKETS + SUB_BUCKETS
+    return ((mantissa + 1) << shift) - 1
+
+
+class LatencyHistogram:
+    """Fixed-memory log-linear histogram of latencies in nanoseconds."""
+
+    __slots__ = ("counts", "count", "total", "min", "max")
+
+    def __init__(self) -> None:
+        self.counts: List[int] = [0] * BUCKET_COUNT
+        self.count = 0
+        self.total = 0
+        self.min: Optional[int] = None
+        self.max = 0
+
+    def record(self, value: int) -> None:
+        """Record one latency in nanoseconds."""
+        self.counts[bucket_index(value)] += 1
+        self.count += 1
+        self.total += value
+        if self.min is None or value < self.min:
+            self.min = value
+        if value > self.max:
+            self.max = value
+
+    def percentile(self, percentile: float) -> int:
+        """
+        Return the latency at ``percentile`` (0-100) in nanoseconds.
+
+        The result is the upper bound of the bucket holding that rank,
+        capped at the largest recorded value; 0 when nothing was recorded.
+        """
+        if self.count == 0:
+            return 0
+        rank = max(1, -(-self.count * percentile // 100))
+        seen = 0
+        for index, bucket_count in enumerate(self.counts):
+            seen += bucket_count
+            if seen >= rank:
+                return min(bucket_upper_bound(index), self.max)
+        return self.max
+
+    def cumulative_counts(self, bounds: Sequence[int]) -> List[int]:
+        """
+        Count the latencies at or below each of the ascending ``bounds``.
+
+        A bucket is counted under a bound only if all of it lies at or below
+        the bound, so the counts never include values above it.
+        """
+        counts = self.counts
+        cumulative: List[int] = []
+        seen = 0
+        index = 0
+        for bound in bounds:
+            limit = bucket_index(bound)
+            if bucket_upper_bound(limit) > bound:
+                limit -= 1
+            while index <= limit:
+                seen += counts[index]
+                index += 1
+            cumulative.append(seen)
+        return cumulative
+
+    def reset(self) -> None:
+        """Forget all recorded latencies."""
+        self.counts = [0] * BUCKET_COUNT
+        self.count = 0
+        self.total = 0
+        self.min = None
+        self.max = 0
+
+    def summary(self) -> Dict[str, float]:
+        """Summarize the histogram in milliseconds."""
+        summary: Dict[str, float] = {
+            f"p{percentile:g}": self.percentile(percentile) / 1e6
+            for percentile in REPORTED_PERCENTILES
+        }
+        summary["min"] = (self.min or 0) / 1e6
+        summary["max"] = self.max / 1e6
+        summary["mean"] = self.total / self.count / 1e6 if self.count else 0.0
+        return summary
+
+
+class ToolMetrics:
+    """Call counters, in-flight gauge and latency histogram for one tool."""
+
+    __slots__ = ("latency", "successes", "errors", "in_flight", "max_in_flight")
+
+    def __init__(self) -> None:
+        self.latency = LatencyHistogram()
+        self.successes = 0
+        self.errors = 0
+        self.in_flight = 0
+        self.max_in_flight = 0
+
+    @property
+    def calls(self) -> int:
+        """Number of completed calls."""
+        return self.successes + self.errors
+
+    def begin(self) -> None:
+        """Count a call as in flight."""
+        self.in_flight += 1
+        if self.in_flight > self.max_in_flight:
+            self.max_in_flight = self.in_flight
+
+    def end(self) -> None:
+        """Stop counting a call as in flight."""
+        if self.in_flight > 0:
+            self.in_flight -= 1
+
+    def record(self, duration_ns: Optional[int], success: bool) -> None:
+        """Record a completed call."""
+        if success:
+            self.successes += 1
+        else:
+            self.errors += 1
+        if duration_ns is not None:
+            self.latency.record(duration_ns)
+
+    def snapshot(self) -> Dict[str, Any]:
+        """Return the metrics as a JSON-serializable dictionary."""
+        return {
+            "calls": self.calls,
+            "successes": self.successes,
+            "errors": self.errors,
+            "in_flight": self.in_flight,
+            "max_in_flight": self.max_in_flight,
+            "latency_ms": self.latency.summary(),
+        }
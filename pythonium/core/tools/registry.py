@@ -5,17 +5,50 @@ Provides centralized registration and management of tools with
 versioning, metadata, and lifecycle support.
 """
 
+import bisect
+import fnmatch
+import re
 from dataclasses import dataclass, field
 from datetime import datetime
 from enum import Enum
-from typing import Any, Callable, Dict, List, Optional, Set, Type
+from functools import lru_cache
+from typing import (
+    Any,
+    Callable,
+    Collection,
+    Dict,
+    List,
+    Optional,
+    Pattern,
+    Set,
+    Tuple,
+    Type,
+    Union,
+)
 
 from pythonium.common.exceptions import ToolError
 from pythonium.common.logging import get_logger
 from pythonium.tools.base import BaseTool, ToolMetadata
 
+from .metrics import ToolMetrics
+from .versions import (
+    VersionKey,
+    is_prerelease,
+    matches_constraint,
+    parse_constraint,
+    version_key,
+)
+
 logger = get_logger(__name__)
 
+_WILDCARD_CHARS = frozenset("*?[")
+
+
+@lru_cache(maxsize=256)
+def _compile_name_pattern(pattern: str) -> Pattern[str]:
+    """Compile a shell-style name pattern once."""
+    return re.compile(fnmatch.translate(pattern))
+
 
 class ToolStatus(Enum):
     """Tool registration status."""
@@ -43,11 +76,19 @@ class ToolRegistration:
     tags: Set[str] = field(default_factory=set)
     dependencies: List[str] = field(default_factory=list)
     config: Dict[str, Any] = field(default_factory=dict)
+    instance: Optional[BaseTool] = None
+    metrics: ToolMetrics = field(default_factory=ToolMetrics)
 
     def __post_init__(self):
         # Ensure tags are in set format - this is already guaranteed by type annotation
         pass
 
+    def get_instance(self) -> BaseTool:
+        """Return the live tool instance, creating it on first use."""
+        if self.instance is None:
+            self.instance = self.tool_class()
+        return self.instance
+
 
 class ToolRegistry:
     """Central registry for tool management."""
@@ -58,6 +99,19 @@ class ToolRegistry:
         self.tools_by_category: Dict[str, List[str]] = {}  # category -> [tool_ids]
         self.tools_by_tags: Dict[str, List[str]] = {}  # tag -> [tool_ids]
         self.aliases: Dict[str, str] = {}  # alias -> tool_id
+        self.tools_by_status: Dict[ToolStatus, Set[str]] = {}  # status -> tool_ids
+
+        # name -> [(version key, tool_id)] in ascending version order, and
+        # name -> tool_id of the highest version
+        self.versions_by_name: Dict[str, List[Tuple[VersionKey, str]]] = {}
+        self._latest_by_name: Dict[str, str] = {}
+        # name -> constraint -> resolved tool_id; dropped when the name changes
+        self._constraint_cache: Dict[str, Dict[str, Optional[str]]] = {}
+
+        # Registrations sorted by (name, version) and each tool's position
+        # in that order; rebuilt lazily after tools are added or removed
+        self._sorted_view: Optional[List[ToolRegistration]] = None
+        self._sort_rank: Dict[str, int] = {}
 
         self._event_handlers: Dict[str, List[Callable]] = {
             "tool_registered": [],
@@ -68,22 +122,44 @@ class ToolRegistry:
 
     def register_tool(
         self,
-        tool_class: Type[BaseTool],
+        tool: Union[Type[BaseTool], BaseTool],
         name: Optional[str] = None,
         version: Optional[str] = None,
         tags: Optional[List[str]] = None,
         dependencies: Optional[List[str]] = None,
         config: Optional[Dict[str, Any]] = None,
         aliases: Optional[List[str]] = None,
+        metadata: Optional[ToolMetadata] = None,
     ) -> str:
-        """Register a tool in the registry."""
+        """
+        Register a tool in the registry.
+
+        The first registered version of a name gets the name as its tool
+        ID; further versions get ``name@version``. Looking a tool up by
+        name returns its highest version.
+
+        ``tool`` may be a tool class or an instance the caller already
+        holds. The registration keeps a reference to the instance, so a
+        tool is built at most once. When a class and ``metadata`` are
+        given, instantiation is deferred until the instance is needed.
+        """
+        if isinstance(tool, BaseTool):
+            tool_class: Type[BaseTool] = type(tool)
+            tool_instance: Optional[BaseTool] = tool
+        else:
+            tool_class = tool
+            tool_instance = None
 
         # Create tool instance to get metadata
-        try:
-            tool_instance = tool_class()
-            metadata = tool_instance.metadata
-        except Exception as e:
-            raise ToolError(f"Failed to instantiate tool {tool_class.__name__}: {e}")
+        if metadata is None:
+            try:
+                if tool_instance is None:
+                    tool_instance = tool_class()
+                metadata = tool_instance.metadata
+            except Exception as e:
+                raise ToolError(
+                    f"Failed to instantiate tool {tool_class.__name__}: {e}"
+                )
 
         # Use provided name or default to tool's name
         tool_name = name or metadata.name
@@ -94,8 +170,10 @@ class ToolRegistry:
         if existing_tool_id:
             raise ToolError(f"Tool {tool_name} v{tool_version} is already registered")
 
-        # Generate stable tool ID (deterministic based on name only, no version)
+        # Generate stable tool ID: the name, or name@version for extra versions
         tool_id = tool_name
+        if tool_id in self.tools:
+            tool_id = f"{tool_name}@{tool_version}"
 
         # Create registration
         registration = ToolRegistration(
@@ -109,13 +187,17 @@ class ToolRegistry:
             tags=set(tags or []),
             dependencies=dependencies or [],
             config=config or {},
+            instance=tool_instance,
         )
 
         # Store in registry
         self.tools[tool_id] = registration
+        self._sorted_view = None
 
         # Update indexes
         self._update_name_index(tool_name, tool_id)
+        self._update_version_index(tool_name, tool_version, tool_id)
+        self._update_status_index(registration.status, tool_id)
         self._update_category_index(metadata.category or "uncategorized", tool_id)
 
         for tag in registration.tags:
@@ -149,6 +231,8 @@ class ToolRegistry:
 
         # Remove from indexes
         self._remove_from_name_index(registration.name, tool_id)
+        self._remove_from_version_index(registration.name, tool_id)
+        self._remove_from_status_index(registration.status, tool_id)
         self._remove_from_category_index(
             registration.metadata.category or "uncategorized", tool_id
         )
@@ -165,6 +249,7 @@ class ToolRegistry:
 
         # Remove from registry
         del self.tools[tool_id]
+        self._sorted_view = None
 
         # Emit event
         self._emit_event(
@@ -182,7 +267,18 @@ class ToolRegistry:
         return True
 
     def get_tool(self, identifier: str) -> Optional[ToolRegistration]:
-        """Get a tool by ID, name, or alias."""
+        """
+        Get a tool by name, ID, alias, or ``name@constraint``.
+
+        A name resolves to the tool's highest registered version; a
+        constraint such as ``read_file@>=1.2,<2`` to the highest version
+        satisfying it.
+        """
+        # Try name lookup (latest version)
+        latest_id = self._latest_by_name.get(identifier)
+        if latest_id is not None:
+            return self.tools[latest_id]
+
         # Try direct ID lookup
         if identifier in self.tools:
             return self.tools[identifier]
@@ -192,24 +288,59 @@ class ToolRegistry:
             tool_id = self.aliases[identifier]
             return self.tools.get(tool_id)
 
-        # Try name lookup (return latest version)
-        if identifier in self.tools_by_name:
-            tool_ids = self.tools_by_name[identifier]
-            if tool_ids:
-                # Return the most recently registered tool with this name
-                latest_registration = None
-                for tool_id in tool_ids:
-                    registration = self.tools[tool_id]
-                    if (
-                        latest_registration is None
-                        or registration.registered_at
-                        > latest_registration.registered_at
-                    ):
-                        latest_registration = registration
-                return latest_registration
+        # Try name@constraint lookup
+        name, sep, constraint = identifier.partition("@")
+        if sep and name in self.versions_by_name:
+            try:
+                return self.resolve_tool(name, constraint)
+            except ToolError:
+                return None
 
         return None
 
+    def resolve_tool(
+        self, name: str, constraint: Optional[str] = None
+    ) -> Optional[ToolRegistration]:
+        """
+        Get the highest version of a tool that satisfies a constraint.
+
+        Args:
+            name: Tool name
+            constraint: Comma-separated version comparisons such as
+                ``>=1.2,<2``; None selects the latest version
+
+        Raises:
+            ToolError: If the constraint is malformed
+        """
+        if not constraint:
+            latest_id = self._latest_by_name.get(name)
+            return self.tools[latest_id] if latest_id is not None else None
+
+        cache = self._constraint_cache.setdefault(name, {})
+        if constraint in cache:
+            tool_id = cache[constraint]
+            return self.tools[tool_id] if tool_id is not None else None
+
+        try:
+            parse_constraint(constraint)
+        except ValueError as e:
+            raise ToolError(str(e))
+
+        tool_id = None
+        for _, candidate_id in reversed(self.versions_by_name.get(name, [])):
+            if matches_constraint(self.tools[candidate_id].version, constraint):
+                tool_id = candidate_id
+                break
+
+        cache[constraint] = tool_id
+        return self.tools[tool_id] if tool_id is not None else None
+
+    def get_tool_versions(self, name: str) -> List[ToolRegistration]:
+        """Get all registered versions of a tool, lowest first."""
+        return [
+            self.tools[tool_id] for _, tool_id in self.versions_by_name.get(name, [])
+        ]
+
     def get_tool_by_name_version(
         self, name: str, version: str
     ) -> Optional[ToolRegistration]:
@@ -224,29 +355,58 @@ class ToolRegistry:
         tags: Optional[List[str]] = None,
         name_pattern: Optional[str] = None,
     ) -> List[ToolRegistration]:
-        """List tools with optional filtering."""
-        tools = list(self.tools.values())
+        """
+        List tools with optional filtering, sorted by name and version.
 
-        # Filter by status
-        if status:
-            tools = [t for t in tools if t.status == status]
+        Filters are answered by intersecting the status, category, tag and
+        (for patterns without wildcards) name indexes, smallest first.
+        Results are ordered by a sorted view that is only rebuilt after
+        tools are registered or unregistered.
+        """
+        self._ensure_sorted_view()
 
-        # Filter by category
+        selections: List[Collection[str]] = []
+        if status:
+            selections.append(self.tools_by_status.get(status, ()))
         if category:
-            tools = [t for t in tools if t.metadata.category == category]
+            selections.append(self.tools_by_category.get(category, ()))
+        # Tool must have all specified tags
+        for tag in set(tags or ()):
+            selections.append(self.tools_by_tags.get(tag, ()))
 
-        # Filter by tags (tool must have all specified tags)
-        if tags:
-            tag_set = set(tags)
-            tools = [t for t in tools if tag_set.issubset(t.tags)]
-
-        # Filter by name pattern
+        pattern: Optional[Pattern[str]] = None
         if name_pattern:
-            import fnmatch
-
-            tools = [t for t in tools if fnmatch.fnmatch(t.name, name_pattern)]
-
-        return sorted(tools, key=lambda t: (t.name, t.version))
+            if _WILDCARD_CHARS.isdisjoint(name_pattern):
+                selections.append(self.tools_by_name.get(name_pattern, ()))
+            else:
+                pattern = _compile_name_pattern(name_pattern)
+
+        if selections:
+            selections.sort(key=len)
+            tool_ids = set(selections[0]).intersection(*selections[1:])
+            tool_ids.intersection_update(self._sort_rank)
+            tools = [
+                self.tools[tool_id]
+                for tool_id in sorted(tool_ids, key=self._sort_rank.__getitem__)
+            ]
+        else:
+            tools = list(self._sorted_view or ())
+
+        if pattern is not None:
+            tools = [t for t in tools if pattern.match(t.name)]
+
+        return tools
+
+    def _ensure_sorted_view(self) -> None:
+        """Rebuild the sorted view of registrations if it is stale."""
+        if self._sorted_view is None:
+            self._sorted_view = sorted(
+                self.tools.values(), key=lambda t: (t.name, version_key(t.version))
+            )
+            self._sort_rank = {
+                registration.tool_id: rank
+                for rank, registration in enumerate(self._sorted_view)
+            }
 
     def get_tools_by_category(self, category: str) -> List[ToolRegistration]:
         """Get all tools in a specific category."""
@@ -265,6 +425,8 @@ class ToolRegistry:
 
         old_status = self.tools[tool_id].status
         self.tools[tool_id].status = status
+        self._remove_from_status_index(old_status, tool_id)
+        self._update_status_index(status, tool_id)
 
         # Emit event
         self._emit_event(
@@ -280,14 +442,31 @@ class ToolRegistry:
         logger.info(f"Tool {tool_id} status changed: {old_status} -> {status}")
         return True
 
-    def record_tool_usage(self, tool_id: str):
-        """Record that a tool was used."""
-        if tool_id in self.tools:
-            registration = self.tools[tool_id]
-            registration.last_used = datetime.now()
-            registration.usage_count += 1
+    def record_tool_usage(
+        self,
+        tool_id: str,
+        duration_ns: Optional[int] = None,
+        success: bool = True,
+    ):
+        """
+        Record that a tool was used.
+
+        Args:
+            tool_id: ID of the tool that was called
+            duration_ns: Call latency in nanoseconds, recorded in the tool's
+                latency histogram when given
+            success: Whether the call succeeded
+        """
+        registration = self.tools.get(tool_id)
+        if registration is None:
+            return
 
-            # Emit event
+        registration.last_used = datetime.now()
+        registration.usage_count += 1
+        registration.metrics.record(duration_ns, success)
+
+        # Emit event
+        if self._event_handlers["tool_used"]:
             self._emit_event(
                 "tool_used",
                 {
@@ -297,6 +476,50 @@ class ToolRegistry:
                 },
             )
 
+    def begin_tool_call(self, tool_id: str) -> None:
+        """Count a call to a tool as in flight."""
+        registration = self.tools.get(tool_id)
+        if registration is not None:
+            registration.metrics.begin()
+
+    def end_tool_call(
+        self, tool_id: str, duration_ns: Optional[int] = None, success: bool = True
+    ) -> None:
+        """Finish an in-flight call started with ``begin_tool_call``."""
+        registration = self.tools.get(tool_id)
+        if registration is not None:
+            registration.metrics.end()
+            self.record_tool_usage(tool_id, duration_ns, success)
+
+    def get_tool_stats(
+        self, identifier: Optional[str] = None
+    ) -> Dict[str, Dict[str, Any]]:
+        """
+        Get call counters and latency percentiles per tool.
+
+        Args:
+            identifier: Tool ID, name or alias; all tools when omitted
+
+        Returns:
+            Mapping of tool ID to its stats, with latencies in milliseconds
+        """
+        if identifier is None:
+            registrations = list(self.tools.values())
+        else:
+            registration = self.get_tool(identifier)
+            registrations = [registration] if registration is not None else []
+
+        stats: Dict[str, Dict[str, Any]] = {}
+        for registration in registrations:
+            entry = registration.metrics.snapshot()
+            entry["name"] = registration.name
+            entry["version"] = registration.version
+            entry["last_used"] = (
+                registration.last_used.isoformat() if registration.last_used else None
+            )
+            stats[registration.tool_id] = entry
+        return stats
+
     def add_alias(self, alias: str, tool_id: str) -> bool:
         """Add an alias for a tool."""
         if alias in self.aliases:
@@ -404,7 +627,12 @@ class ToolRegistry:
         self.tools_by_name.clear()
         self.tools_by_category.clear()
         self.tools_by_tags.clear()
+        self.tools_by_status.clear()
+        self.versions_by_name.clear()
+        self._latest_by_name.clear()
+        self._constraint_cache.clear()
         self.aliases.clear()
+        self._sorted_view = None
 
     def add_event_handler(self, event_type: str, handler: Callable):
         """Add an event handler."""
@@ -429,12 +657,41 @@ class ToolRegistry:
 
     def _find_tool_by_name_version(self, name: str, version: str) -> Optional[str]:
         """Find a tool ID by name and version."""
-        tool_ids = self.tools_by_name.get(name, [])
-        for tool_id in tool_ids:
-            if self.tools[tool_id].version == version:
-                return tool_id
+        versions = self.versions_by_name.get(name)
+        if not versions:
+            return None
+        key = version_key(version)
+        index = bisect.bisect_left(versions, (key,))
+        if index < len(versions) and versions[index][0] == key:
+            return versions[index][1]
         return None
 
+    def _update_version_index(self, name: str, version: str, tool_id: str):
+        """Update the version index and the latest-version pointer."""
+        versions = self.versions_by_name.setdefault(name, [])
+        bisect.insort(versions, (version_key(version), tool_id))
+        self._latest_by_name[name] = self._latest_version_id(versions)
+        self._constraint_cache.pop(name, None)
+
+    @staticmethod
+    def _latest_version_id(versions: List[Tuple[VersionKey, str]]) -> str:
+        """Pick the highest final release, or the highest version if none."""
+        for key, tool_id in reversed(versions):
+            if not is_prerelease(key):
+                return tool_id
+        return versions[-1][1]
+
+    def _remove_from_version_index(self, name: str, tool_id: str):
+        """Remove from version index."""
+        versions = self.versions_by_name.get(name, [])
+        versions[:] = [entry for entry in versions if entry[1] != tool_id]
+        if versions:
+            self._latest_by_name[name] = self._latest_version_id(versions)
+        else:
+            self.versions_by_name.pop(name, None)
+            self._latest_by_name.pop(name, None)
+        self._constraint_cache.pop(name, None)
+
     def _update_name_index(self, name: str, tool_id: str):
         """Update the name index."""
         if name not in self.tools_by_name:
@@ -449,6 +706,18 @@ class ToolRegistry:
             if not self.tools_by_name[name]:
                 del self.tools_by_name[name]
 
+    def _update_status_index(self, status: ToolStatus, tool_id: str):
+        """Update the status index."""
+        self.tools_by_status.setdefault(status, set()).add(tool_id)
+
+    def _remove_from_status_index(self, status: ToolStatus, tool_id: str):
+        """Remove from status index."""
+        tool_ids = self.tools_by_status.get(status)
+        if tool_ids is not None:
+            tool_ids.discard(tool_id)
+            if not tool_ids:
+                del self.tools_by_status[status]
+
     def _update_category_index(self, category: str, tool_id: str):
         """Update the category index."""
         if category not in self.tools_by_category:
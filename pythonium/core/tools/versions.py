@@ -0,0 +1,106 @@
+"""
+Tool version parsing and constraint matching.
+
+Tool versions follow semantic versioning (``MAJOR.MINOR.PATCH`` with an
+optional ``-prerelease`` and ``+build`` suffix); any number of release
+components is accepted and trailing zeros are ignored, so ``2`` equals
+``2.0.0``. Constraints are comma-separated comparisons that must all hold,
+such as ``>=1.2,<2``. As with pip and npm, pre-releases only satisfy
+constraints that themselves name a pre-release, and the latest version
+of a name is its highest final release when it has one.
+"""
+
+import operator
+import re
+from functools import lru_cache
+from typing import Any, Callable, Dict, List, Tuple, Union
+
+# (valid, release, prerelease); invalid versions sort before valid ones
+VersionKey = Tuple[int, Tuple[Union[int, str], ...], Tuple[Tuple[int, object], ...]]
+
+_VERSION_PATTERN = re.compile(
+    r"^v?(?P<release>\d+(?:\.\d+)*)"
+    r"(?:-(?P<pre>[0-9A-Za-z.-]+))?"
+    r"(?:\+[0-9A-Za-z.-]+)?$"
+)
+
+_CONSTRAINT_PATTERN = re.compile(r"^\s*(==|!=|>=|<=|>|<|=)?\s*(\S+?)\s*$")
+
+_OPERATORS: Dict[str, Callable[[Any, Any], bool]] = {
+    "==": operator.eq,
+    "=": operator.eq,
+    "!=": operator.ne,
+    ">=": operator.ge,
+    "<=": operator.le,
+    ">": operator.gt,
+    "<": operator.lt,
+}
+
+
+@lru_cache(maxsize=1024)
+def version_key(version: str) -> VersionKey:
+    """
+    Return a sort key for a version string.
+
+    Pre-releases sort before their release, per semantic versioning.
+    Versions that cannot be parsed sort before all valid versions, in
+    string order.
+    """
+    match = _VERSION_PATTERN.match(version.strip())
+    if match is None:
+        return (0, (version,), ())
+
+    release = [int(part) for part in match.group("release").split(".")]
+    while len(release) > 1 and release[-1] == 0:
+        release.pop()
+
+    pre = match.group("pre")
+    if pre is None:
+        # A final release sorts after all of its pre-releases
+        prerelease: Tuple[Tuple[int, object], ...] = ((2, ""),)
+    else:
+        prerelease = tuple(
+            (0, int(part)) if part.isdigit() else (1, part) for part in pre.split(".")
+        )
+    return (1, tuple(release), prerelease)
+
+
+def is_valid_version(version: str) -> bool:
+    """Check whether a version string can be compared semantically."""
+    return version_key(version)[0] == 1
+
+
+@lru_cache(maxsize=256)
+def parse_constraint(constraint: str) -> Tuple[Tuple[Callable, VersionKey], ...]:
+    """
+    Parse a version constraint such as ``>=1.2,<2``.
+
+    A bare version means an exact match.
+
+    Raises:
+        ValueError: If a clause is malformed or names an invalid version
+    """
+    clauses: List[Tuple[Callable, VersionKey]] = []
+    for clause in constraint.split(","):
+        match = _CONSTRAINT_PATTERN.match(clause)
+        if match is None or not is_valid_version(match.group(2)):
+            raise ValueError(f"Invalid version constraint: {constraint!r}")
+        op = _OPERATORS[match.group(1) or "=="]
+        clauses.append((op, version_key(match.group(2))))
+    return tuple(clauses)
+
+
+def is_prerelease(key: VersionKey) -> bool:
+    """Check whether a version key belongs to a valid pre-release."""
+    return key[0] == 1 and key[2][0][0] != 2
+
+
+def matches_constraint(version: str, constraint: str) -> bool:
+    """Check whether a version satisfies every clause of a constraint."""
+    key = version_key(version)
+    if key[0] == 0:
+        return False
+    clauses = parse_constraint(constraint)
+    if is_prerelease(key) and not any(is_prerelease(bound) for _, bound in clauses):
+        return False
+    return all(op(key, bound) for op, bound in clauses)
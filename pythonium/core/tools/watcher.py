@@ -0,0 +1,266 @@
+"""
+File watching for tool hot reload.
+
+``ToolWatcher`` watches the tool search paths and reports which Python
+files were added, changed or removed. On Linux it sleeps on inotify
+events; elsewhere, or when inotify is unavailable, it polls. Either way
+the changed files are found by diffing a snapshot of file sizes and
+mtimes, so missed or coalesced events (editor renames, queue overflows)
+cannot hide a change.
+"""
+
+import asyncio
+import ctypes
+import ctypes.util
+import os
+import struct
+import sys
+from pathlib import Path
+from typing import (
+    Any,
+    Awaitable,
+    Callable,
+    Dict,
+    Iterable,
+    List,
+    Optional,
+    Set,
+    Tuple,
+)
+
+from pythonium.common.logging import get_logger
+
+logger = get_logger(__name__)
+
+# path -> (mtime_ns, size) of every watched Python file
+Snapshot = Dict[str, Tuple[int, int]]
+
+# inotify(7) constants
+_IN_MODIFY = 0x00000002
+_IN_ATTRIB = 0x00000004
+_IN_CLOSE_WRITE = 0x00000008
+_IN_MOVED_FROM = 0x00000040
+_IN_MOVED_TO = 0x00000080
+_IN_CREATE = 0x00000100
+_IN_DELETE = 0x00000200
+_IN_DELETE_SELF = 0x00000400
+_IN_MOVE_SELF = 0x00000800
+_WATCH_MASK = (
+    _IN_MODIFY
+    | _IN_ATTRIB
+    | _IN_CLOSE_WRITE
+    | _IN_MOVED_FROM
+    | _IN_MOVED_TO
+    | _IN_CREATE
+    | _IN_DELETE
+    | _IN_DELETE_SELF
+    | _IN_MOVE_SELF
+)
+_EVENT_HEADER = struct.Struct("iIII")
+
+
+def _skip_directory(name: str) -> bool:
+    return name.startswith(("__pycache__", "."))
+
+
+def take_snapshot(paths: Iterable[Path]) -> Tuple[Snapshot, List[str]]:
+    """
+    Record the size and mtime of every Python file under the given paths.
+
+    Returns:
+        The snapshot and the list of directories walked
+    """
+    snapshot: Snapshot = {}
+    directories: List[str] = []
+    pending = [str(path) for path in paths]
+
+    while pending:
+        directory = pending.pop()
+        try:
+            with os.scandir(directory) as scan:
+                entries = list(scan)
+        except OSError:
+            continue
+        directories.append(directory)
+
+        for entry in entries:
+            try:
+                if entry.is_dir():
+                    if not _skip_directory(entry.name):
+                        pending.append(entry.path)
+                elif entry.name.endswith(".py"):
+                    stat = entry.stat()
+                    snapshot[entry.path] = (stat.st_mtime_ns, stat.st_size)
+            except OSError:
+                continue  # Removed while scanning; the next snapshot sees it
+
+    return snapshot, directories
+
+
+def diff_snapshots(old: Snapshot, new: Snapshot) -> Set[str]:
+    """Return the files added, removed or modified between two snapshots."""
+    return {path for path in old.keys() | new.keys() if old.get(path) != new.get(path)}
+
+
+class _Inotify:
+    """Minimal non-blocking inotify wrapper over libc via ctypes."""
+
+    def __init__(self) -> None:
+        libc = ctypes.CDLL(ctypes.util.find_library("c"), use_errno=True)
+        self._add_watch = libc.inotify_add_watch
+        self._add_watch.argtypes = [ctypes.c_int, ctypes.c_char_p, ctypes.c_uint32]
+        self.fd = libc.inotify_init1(os.O_NONBLOCK | os.O_CLOEXEC)
+        if self.fd < 0:
+            raise OSError(ctypes.get_errno(), "inotify_init1 failed")
+        self.watched: Set[str] = set()
+
+    def watch(self, directory: str) -> bool:
+        """Watch a directory, returning False if it was already watched."""
+        if directory in self.watched:
+            return False
+        if self._add_watch(self.fd, os.fsencode(directory), _WATCH_MASK) < 0:
+            raise OSError(ctypes.get_errno(), f"inotify_add_watch failed: {directory}")
+        self.watched.add(directory)
+        return True
+
+    def drain(self) -> int:
+        """Discard pending events and return how many were read."""
+        events = 0
+        while True:
+            try:
+                data = os.read(self.fd, 65536)
+            except BlockingIOError:
+                return events
+            if not data:
+                return events
+            offset = 0
+            while offset + _EVENT_HEADER.size <= len(data):
+                _, _, _, name_length = _EVENT_HEADER.unpack_from(data, offset)
+                offset += _EVENT_HEADER.size + name_length
+                events += 1
+
+    def close(self) -> None:
+        os.close(self.fd)
+
+
+class ToolWatcher:
+    """Watch tool search paths and report changed Python files."""
+
+    def __init__(
+        self,
+        paths: Iterable[Path],
+        on_change: Callable[[Set[str]], Awaitable[Any]],
+        poll_interval: float = 1.0,
+        debounce: float = 0.2,
+        use_inotify: bool = True,
+    ):
+        """
+        Initialize the watcher.
+
+        Args:
+            paths: Directories to watch recursively
+            on_change: Awaited with the set of changed file paths
+            poll_interval: Seconds between scans when polling
+            debounce: Seconds to wait after a change so writes can settle
+            use_inotify: Use inotify where available instead of polling
+        """
+        self.paths = list(paths)
+        self.on_change = on_change
+        self.poll_interval = poll_interval
+        self.debounce = debounce
+        self.use_inotify = use_inotify
+        self.backend: Optional[str] = None
+
+        self._inotify: Optional[_Inotify] = None
+        self._wakeup: Optional[asyncio.Event] = None
+        self._task: Optional["asyncio.Task[None]"] = None
+
+    async def start(self) -> None:
+        """Take the initial snapshot and start watching."""
+        if self._task is not None:
+            return
+
+        snapshot, directories = take_snapshot(self.paths)
+        self.backend = "polling"
+        if self.use_inotify and sys.platform.startswith("linux"):
+            try:
+                self._start_inotify(directories)
+                self.backend = "inotify"
+            except (OSError, AttributeError) as e:
+                logger.info(f"inotify unavailable, polling for tool changes: {e}")
+                self._close_inotify()
+
+        self._task = asyncio.create_task(self._run(snapshot))
+        logger.info(
+            f"Watching {len(self.paths)} tool path(s) for changes ({self.backend})"
+        )
+
+    async def stop(self) -> None:
+        """Stop watching."""
+        task, self._task = self._task, None
+        if task is not None:
+            task.cancel()
+            await asyncio.gather(task, return_exceptions=True)
+        self._close_inotify()
+
+    def _start_inotify(self, directories: List[str]) -> None:
+        self._inotify = _Inotify()
+        for directory in directories:
+            self._inotify.watch(directory)
+        self._wakeup = asyncio.Event()
+        asyncio.get_running_loop().add_reader(self._inotify.fd, self._on_readable)
+
+    def _close_inotify(self) -> None:
+        if self._inotify is not None:
+            try:
+                asyncio.get_running_loop().remove_reader(self._inotify.fd)
+            except RuntimeError:
+                pass
+            self._inotify.close()
+            self._inotify = None
+        self._wakeup = None
+
+    def _on_readable(self) -> None:
+        if self._inotify is not None and self._inotify.drain() and self._wakeup:
+            self._wakeup.set()
+
+    async def _wait_for_activity(self) -> None:
+        if self._wakeup is None:
+            await asyncio.sleep(self.poll_interval)
+            return
+        await self._wakeup.wait()
+        self._wakeup.clear()
+
+    def _watch_new(self, directories: List[str]) -> bool:
+        """Watch directories created since the last scan."""
+        added = False
+        for directory in directories:
+            try:
+                added = self._inotify.watch(directory) or added  # type: ignore[union-attr]
+            except OSError as e:
+                logger.debug(f"Not watching {directory}: {e}")
+        return added
+
+    async def _run(self, snapshot: Snapshot) -> None:
+        while True:
+            await self._wait_for_activity()
+            # Let editors and copies finish writing before looking
+            await asyncio.sleep(self.debounce)
+            if self._wakeup is not None:
+                self._wakeup.clear()
+
+            current, directories = take_snapshot(self.paths)
+            if self._inotify is not None and self._watch_new(directories):
+                # Files written into new directories before they were watched
+                current, _ = take_snapshot(self.paths)
+
+            changed = diff_snapshots(snapshot, current)
+            snapshot = current
+            if not changed:
+                continue
+
+            logger.info(f"Detected changes in {len(changed)} tool file(s)")
+            try:
+                await self.on_change(changed)
+            except Exception as e:
+                logger.error(f"Error applying tool changes: {e}")
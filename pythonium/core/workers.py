@@ -0,0 +1,412 @@
+"""
+Multi-process worker mode for the HTTP transports.
+
+The supervisor pre-forks N worker processes. Each worker runs its own
+``PythoniumMCPServer`` and binds the same address with ``SO_REUSEPORT``,
+so the kernel spreads incoming connections across workers. The parent
+restarts workers that exit or stop sending heartbeats, rolls up their
+health and admission metrics, and shuts them all down gracefully.
+
+The rollup is logged every ``stats_interval`` seconds and after each
+restart; sending the supervisor ``SIGUSR1`` logs it per worker.
+"""
+
+import asyncio
+import multiprocessing
+import os
+import queue
+import signal
+import socket
+import time
+from typing import Any, Dict, List, Optional
+
+from pythonium.common.exceptions import PythoniumError
+from pythonium.common.logging import get_logger
+
+logger = get_logger(__name__)
+
+
+class WorkerError(PythoniumError):
+    """Worker supervision error."""
+
+    pass
+
+
+def create_reuseport_socket(host: str, port: int) -> socket.socket:
+    """
+    Create a listening socket that other workers can bind as well.
+
+    Args:
+        host: Address to bind
+        port: Port to bind
+
+    Returns:
+        Bound, non-blocking listening socket
+
+    Raises:
+        WorkerError: If the platform does not support ``SO_REUSEPORT``
+    """
+    if not hasattr(socket, "SO_REUSEPORT"):
+        raise WorkerError("SO_REUSEPORT is not supported on this platform")
+
+    family = socket.AF_INET6 if ":" in host else socket.AF_INET
+    sock = socket.socket(family, socket.SOCK_STREAM)
+    try:
+        sock.setsockopt(socket.SOL_SOCKET, socket.SO_REUSEADDR, 1)
+        sock.setsockopt(socket.SOL_SOCKET, socket.SO_REUSEPORT, 1)
+        sock.bind((host, port))
+        sock.listen(2048)
+        sock.setblocking(False)
+    except OSError:
+        sock.close()
+        raise
+    return sock
+
+
+async def _send_heartbeats(
+    server: Any, worker_id: int, status_queue: Any, interval: float
+) -> None:
+    """Periodically report worker health and metrics to the supervisor."""
+    while True:
+        status_queue.put(
+            {
+                "worker_id": worker_id,
+                "pid": os.getpid(),
+                "timestamp": time.time(),
+                "running": server._running,
+                "tools": len(server.get_registered_tools()),
+                "admission": server.get_admission_stats(),
+            }
+        )
+        await asyncio.sleep(interval)
+
+
+async def _run_worker(
+    worker_id: int,
+    config_file: Optional[str],
+    config_overrides: Dict[str, Any],
+    status_queue: Any,
+    heartbeat_interval: float,
+) -> None:
+    """Run a single worker server until it is told to stop."""
+    from pythonium.core.server import PythoniumMCPServer
+
+    server = PythoniumMCPServer(
+        config_file=config_file, config_overrides=config_overrides
+    )
+    server.reuse_port = True
+
+    heartbeat = asyncio.create_task(
+        _send_heartbeats(server, worker_id, status_queue, heartbeat_interval)
+    )
+    try:
+        await server.run()
+    finally:
+        heartbeat.cancel()
+
+
+def worker_main(
+    worker_id: int,
+    config_file: Optional[str],
+    config_overrides: Dict[str, Any],
+    status_queue: Any,
+    heartbeat_interval: float,
+    log_level: str = "INFO",
+) -> None:
+    """Entry point of a worker process."""
+    from pythonium.common.logging import setup_logging
+
+    setup_logging(level=log_level)
+    # The supervisor owns Ctrl+C; workers are stopped with SIGTERM
+    signal.signal(signal.SIGINT, signal.SIG_IGN)
+
+    try:
+        asyncio.run(
+            _run_worker(
+                worker_id,
+                config_file,
+                config_overrides,
+                status_queue,
+                heartbeat_interval,
+            )
+        )
+    except KeyboardInterrupt:
+        pass
+
+
+class WorkerProcess:
+    """Bookkeeping for one supervised worker slot."""
+
+    def __init__(self, worker_id: int):
+        self.worker_id = worker_id
+        self.process: Optional[multiprocessing.process.BaseProcess] = None
+        self.started_at = 0.0
+        self.restarts = 0
+        self.last_heartbeat: Optional[Dict[str, Any]] = None
+        self.last_heartbeat_at = 0.0
+
+    @property
+    def alive(self) -> bool:
+        return self.process is not None and self.process.is_alive()
+
+    @property
+    def pid(self) -> Optional[int]:
+        return self.process.pid if self.process is not None else None
+
+
+class WorkerSupervisor:
+    """Pre-fork supervisor for multi-process HTTP serving."""
+
+    def __init__(
+        self,
+        workers: int,
+        config_file: Optional[str] = None,
+        config_overrides: Optional[Dict[str, Any]] = None,
+        log_level: str = "INFO",
+        heartbeat_interval: float = 2.0,
+        heartbeat_timeout: float = 30.0,
+        shutdown_timeout: float = 10.0,
+        max_restart_delay: float = 30.0,
+        stats_interval: float = 60.0,
+    ):
+        """
+        Initialize the supervisor.
+
+        Args:
+            workers: Number of worker processes
+            config_file: Configuration file passed to every worker
+            config_overrides: Configuration overrides passed to every worker
+            log_level: Log level for worker processes
+            heartbeat_interval: Seconds between worker heartbeats
+            heartbeat_timeout: Seconds without a heartbeat before a worker is
+                considered hung and restarted
+            shutdown_timeout: Seconds to wait for workers to exit gracefully
+            max_restart_delay: Upper bound of the crash-loop restart backoff
+            stats_interval: Seconds between stats log lines, or 0 to only log
+                them on restarts and ``SIGUSR1``
+        """
+        if workers < 1:
+            raise WorkerError("At least one worker is required")
+
+        self.workers = workers
+        self.config_file = config_file
+        self.config_overrides = config_overrides or {}
+        self.log_level = log_level
+        self.heartbeat_interval = heartbeat_interval
+        self.heartbeat_timeout = heartbeat_timeout
+        self.shutdown_timeout = shutdown_timeout
+        self.max_restart_delay = max_restart_delay
+        self.stats_interval = stats_interval
+
+        self._context = multiprocessing.get_context("spawn")
+        self._status_queue = self._context.Queue()
+        self._slots = [WorkerProcess(i) for i in range(workers)]
+        self._restart_at: Dict[int, float] = {}
+        self._stopping = asyncio.Event()
+        self._next_stats_at = 0.0
+
+    def _spawn(self, slot: WorkerProcess) -> None:
+        """Start (or restart) the worker process for a slot."""
+        process = self._context.Process(
+            target=worker_main,
+            args=(
+                slot.worker_id,
+                self.config_file,
+                self.config_overrides,
+                self._status_queue,
+                self.heartbeat_interval,
+                self.log_level,
+            ),
+            name=f"pythonium-worker-{slot.worker_id}",
+            daemon=False,
+        )
+        process.start()
+        slot.process = process
+        slot.started_at = time.monotonic()
+        slot.last_heartbeat_at = slot.started_at
+        logger.info(f"Started worker {slot.worker_id} (pid {process.pid})")
+
+    def _drain_status_queue(self) -> None:
+        """Record heartbeats reported by workers."""
+        while True:
+            try:
+                status = self._status_queue.get_nowait()
+            except queue.Empty:
+                return
+
+            slot = self._slots[status["worker_id"]]
+            if status["pid"] != slot.pid:
+                continue  # Late heartbeat from a replaced process
+            slot.last_heartbeat = status
+            slot.last_heartbeat_at = time.monotonic()
+
+    def _restart_delay(self, slot: WorkerProcess) -> float:
+        """Back off restarts of a worker that keeps crashing on startup."""
+        uptime = time.monotonic() - slot.started_at
+        if uptime > self.max_restart_delay:
+            return 0.0
+        return min(2.0 ** min(slot.restarts, 5) * 0.5, self.max_restart_delay)
+
+    def _check_workers(self) -> None:
+        """Restart workers that exited or stopped sending heartbeats."""
+        now = time.monotonic()
+
+        for slot in self._slots:
+            if slot.alive:
+                if now - slot.last_heartbeat_at > self.heartbeat_timeout:
+                    logger.warning(
+                        f"Worker {slot.worker_id} (pid {slot.pid}) missed heartbeats, "
+                        "restarting"
+                    )
+                    slot.process.kill()  # type: ignore[union-attr]
+                    slot.process.join(1)  # type: ignore[union-attr]
+                else:
+                    continue
+
+            restart_at = self._restart_at.get(slot.worker_id)
+            if restart_at is None:
+                exitcode = slot.process.exitcode if slot.process else None
+                delay = self._restart_delay(slot)
+                logger.warning(
+                    f"Worker {slot.worker_id} exited with code {exitcode}, "
+                    f"restarting in {delay:.1f}s"
+                )
+                self._restart_at[slot.worker_id] = now + delay
+            elif now >= restart_at:
+                del self._restart_at[slot.worker_id]
+                slot.restarts += 1
+                slot.last_heartbeat = None
+                self._spawn(slot)
+                self.log_stats()
+
+    async def run(self) -> None:
+        """Start the workers and supervise them until shutdown."""
+        loop = asyncio.get_running_loop()
+        for signum in (signal.SIGTERM, signal.SIGINT):
+            try:
+                loop.add_signal_handler(signum, self.request_shutdown)
+            except (NotImplementedError, RuntimeError):
+                signal.signal(signum, lambda *_: self.request_shutdown())
+        if hasattr(signal, "SIGUSR1"):
+            try:
+                loop.add_signal_handler(signal.SIGUSR1, self.log_stats, True)
+            except (NotImplementedError, RuntimeError):
+                pass
+
+        for slot in self._slots:
+            self._spawn(slot)
+
+        try:
+            while not self._stopping.is_set():
+                self._drain_status_queue()
+                self._check_workers()
+                self._log_stats_periodically()
+                try:
+                    await asyncio.wait_for(
+                        self._stopping.wait(), timeout=self.heartbeat_interval / 2
+                    )
+                except asyncio.TimeoutError:
+                    pass
+        finally:
+            await self.shutdown()
+
+    def request_shutdown(self) -> None:
+        """Ask the supervisor to stop all workers."""
+        if not self._stopping.is_set():
+            logger.info("Shutting down workers...")
+        self._stopping.set()
+
+    async def shutdown(self) -> None:
+        """Gracefully stop all workers, killing any that do not exit in time."""
+        self._stopping.set()
+
+        for slot in self._slots:
+            if slot.alive:
+                slot.process.terminate()  # type: ignore[union-attr]
+
+        deadline = time.monotonic() + self.shutdown_timeout
+        while any(slot.alive for slot in self._slots):
+            if time.monotonic() >= deadline:
+                for slot in self._slots:
+                    if slot.alive:
+                        logger.warning(
+                            f"Worker {slot.worker_id} did not stop in time, killing"
+                        )
+                        slot.process.kill()  # type: ignore[union-attr]
+                break
+            await asyncio.sleep(0.1)
+
+        for slot in self._slots:
+            if slot.process is not None:
+                slot.process.join(1)
+
+        self._drain_status_queue()
+        logger.info(f"All workers stopped: {self.get_stats()['totals']}")
+
+    def _log_stats_periodically(self) -> None:
+        """Log the rollup once every ``stats_interval`` seconds."""
+        if self.stats_interval <= 0:
+            return
+        now = time.monotonic()
+        if not self._next_stats_at:
+            self._next_stats_at = now + self.stats_interval
+        elif now >= self._next_stats_at:
+            self._next_stats_at = now + self.stats_interval
+            self.log_stats()
+
+    def log_stats(self, per_worker: bool = False) -> None:
+        """Log the rollup, and optionally one line per worker."""
+        stats = self.get_stats()
+        logger.info(f"Worker stats: {stats['totals']}")
+        if per_worker:
+            for worker in stats["workers"]:
+                logger.info(f"Worker {worker['worker_id']}: {worker}")
+
+    def get_stats(self) -> Dict[str, Any]:
+        """Roll up health and admission metrics across workers."""
+        now = time.monotonic()
+        workers: List[Dict[str, Any]] = []
+        totals = {
+            "workers": self.workers,
+            "alive": 0,
+            "restarts": 0,
+            "tools": 0,
+            "in_flight": 0,
+            "queue_depth": 0,
+            "admitted": 0,
+            "rejected": 0,
+            "timed_out": 0,
+        }
+
+        for slot in self._slots:
+            heartbeat = slot.last_heartbeat or {}
+            admission = heartbeat.get("admission", {}).get("global", {})
+
+            totals["alive"] += int(slot.alive)
+            totals["restarts"] += slot.restarts
+            totals["tools"] = max(totals["tools"], heartbeat.get("tools", 0))
+            for key in (
+                "in_flight",
+                "queue_depth",
+                "admitted",
+                "rejected",
+                "timed_out",
+            ):
+                totals[key] += admission.get(key, 0)
+
+            workers.append(
+                {
+                    "worker_id": slot.worker_id,
+                    "pid": slot.pid,
+                    "alive": slot.alive,
+                    "restarts": slot.restarts,
+                    "uptime": now - slot.started_at if slot.alive else 0.0,
+                    "heartbeat_age": (
+                        now - slot.last_heartbeat_at if slot.last_heartbeat else None
+                    ),
+                    "running": heartbeat.get("running", False),
+                    "admission": heartbeat.get("admission"),
+                }
+            )
+
+        return {"totals": totals, "workers": workers}
@@ -10,20 +10,37 @@ import shutil
 import subprocess
 import sys
 from pathlib import Path
-from typing import Any, Dict, Optional, cast
+from typing import TYPE_CHECKING, Any, Dict, Optional, Tuple, cast
 
 import click
-from rich.console import Console
 
 __version__ = importlib.metadata.version("pythonium")
 
 from .common.logging import get_logger, setup_logging
-from .core.server import PythoniumMCPServer
 
-console = Console()
+if TYPE_CHECKING:
+    from rich.console import Console
+
 logger = get_logger(__name__)
 
 
+def _console() -> "Console":
+    """Return the CLI console, creating it on first use."""
+    console = globals().get("console")
+    if console is None:
+        # rich is only imported once something is printed
+        from rich.console import Console
+
+        console = globals()["console"] = Console()
+    return cast("Console", console)
+
+
+def __getattr__(name: str) -> Any:
+    if name == "console":
+        return _console()
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+
+
 def print_banner():
     """Print the Pythonium banner."""
     banner = f"""
@@ -32,7 +49,7 @@ def print_banner():
 ║      Modular MCP Server for AI        ║
 ╚═══════════════════════════════════════╝
 """
-    console.print(banner, style="bold blue")
+    _console().print(banner, style="bold blue")
 
 
 @click.group()
@@ -76,8 +93,45 @@ def main(ctx, config: Optional[Path], log_level: str, verbose: bool):
     type=click.Choice(["stdio", "http", "websocket"]),
     help="Transport protocol",
 )
+@click.option(
+    "--workers",
+    default=1,
+    type=click.IntRange(min=1),
+    help="Number of worker processes (HTTP and WebSocket transports only)",
+)
+@click.option(
+    "--reload",
+    "hot_reload",
+    is_flag=True,
+    help="Reload changed tool modules without restarting",
+)
+@click.option(
+    "--trace-file",
+    type=click.Path(dir_okay=False),
+    help="Append tool call trace spans to this file as OTLP/JSON lines",
+)
+@click.option(
+    "--profile-slow-ms",
+    type=click.FloatRange(min=0, min_open=True),
+    help="Keep a cProfile of tool calls taking at least this many milliseconds",
+)
+@click.option(
+    "--profile-dir",
+    type=click.Path(file_okay=False),
+    help="Directory for slow call profiles (default: system temp directory)",
+)
 @click.pass_context
-def serve(ctx, host: str, port: int, transport: str):
+def serve(
+    ctx,
+    host: str,
+    port: int,
+    transport: str,
+    workers: int,
+    hot_reload: bool,
+    trace_file: Optional[str],
+    profile_slow_ms: Optional[float],
+    profile_dir: Optional[str],
+):
     """Start the MCP server."""
     config_path = ctx.obj.get("config_path")
     log_level = ctx.obj.get("log_level", "INFO")
@@ -90,12 +144,39 @@ def serve(ctx, host: str, port: int, transport: str):
     logger.info(f"Host: {host}")
     logger.info(f"Port: {port}")
 
+    if workers > 1 and transport == "stdio":
+        raise click.UsageError("--workers requires the http or websocket transport")
+
     try:
         # Create configuration overrides including logging level
         config_overrides = {
             "transport": {"type": transport, "host": host, "port": port},
+            "server": {"transport": transport, "host": host, "port": port},
             "logging": {"level": log_level.lower()},
         }
+        if trace_file:
+            config_overrides["server"]["trace_file"] = trace_file
+        if profile_slow_ms:
+            config_overrides["server"]["profile_slow_ms"] = profile_slow_ms
+        if profile_dir:
+            config_overrides["server"]["profile_dir"] = profile_dir
+        if hot_reload:
+            config_overrides["tools"] = {"hot_reload": True}
+
+        if workers > 1:
+            from .core.workers import WorkerSupervisor
+
+            logger.info(f"Workers: {workers}")
+            supervisor = WorkerSupervisor(
+                workers,
+                config_file=str(config_path) if config_path else None,
+                config_overrides=config_overrides,
+                log_level=log_level,
+            )
+            asyncio.run(supervisor.run())
+            return
+
+        from .core.server import PythoniumMCPServer
 
         # Create and start server with config overrides
         server = PythoniumMCPServer(
@@ -113,6 +194,102 @@ def serve(ctx, host: str, port: int, transport: str):
         sys.exit(1)
 
 
+@main.command("build-manifest")
+@click.option(
+    "--output",
+    "-o",
+    type=click.Path(dir_okay=False, path_type=Path),
+    help="Manifest file path (default: tools.discovery_manifest_path)",
+)
+@click.pass_context
+def build_manifest(ctx, output: Optional[Path]):
+    """Prebuild the tool discovery manifest, e.g. during image builds."""
+    from .core.config import ConfigurationManager
+    from .core.tools import ToolDiscoveryManager, ToolManifest
+
+    config_path = ctx.obj.get("config_path")
+    settings = ConfigurationManager(config_path).get_settings()
+    # Start from an empty manifest so every module is scanned afresh
+    manifest = ToolManifest(output or settings.tools.discovery_manifest_path)
+    manifest_path = manifest.path
+    tools = ToolDiscoveryManager(manifest=manifest).discover_tools()
+
+    if manifest.dirty:
+        _console().print(f"[bold red]Failed to write tool manifest {manifest_path}")
+        sys.exit(1)
+
+    _console().print(
+        f"[bold green]Wrote tool manifest {manifest_path}: "
+        f"{len(tools)} tools in {len(manifest.entries)} modules"
+    )
+
+
+@main.command("profile-startup")
+@click.option(
+    "--module",
+    "-m",
+    "modules",
+    multiple=True,
+    help="Module to import (repeatable; default: the modules serve imports)",
+)
+@click.option(
+    "--budget-ms",
+    type=float,
+    default=None,
+    help="Import-time budget in milliseconds (default: STARTUP_BUDGET_MS)",
+)
+@click.option("--top", default=10, type=click.IntRange(min=1), help="Rows to show")
+@click.option("--json", "as_json", is_flag=True, help="Print the profile as JSON")
+def profile_startup(
+    modules: Tuple[str, ...], budget_ms: Optional[float], top: int, as_json: bool
+):
+    """Report startup import time against the budget.
+
+    Imports the modules in a fresh interpreter under ``-X importtime`` and
+    exits with status 1 if the total exceeds the budget.
+    """
+    from .common.exceptions import PythoniumError
+    from .core.startup import STARTUP_BUDGET_MS, STARTUP_MODULES
+    from .core.startup import profile_startup as run_profile
+
+    try:
+        profile = run_profile(
+            modules or STARTUP_MODULES,
+            budget_ms=STARTUP_BUDGET_MS if budget_ms is None else budget_ms,
+        )
+    except PythoniumError as e:
+        _console().print(f"[bold red]{e}")
+        sys.exit(1)
+
+    if as_json:
+        click.echo(json.dumps(profile.to_dict(limit=top), indent=2))
+    else:
+        console = _console()
+        style = "bold red" if profile.over_budget else "bold green"
+        console.print(
+            f"[{style}]Import time {profile.total_ms:.1f} ms "
+            f"(budget {profile.budget_ms:.0f} ms) for {', '.join(profile.modules)}"
+        )
+        console.print("\n[bold]By package[/bold]")
+        for package, ms in profile.by_package()[:top]:
+            console.print(f"  {ms:10.1f} ms  {package}")
+        console.print("\n[bold]Slowest modules (self / cumulative)[/bold]")
+        for record in profile.slowest(top):
+            console.print(
+                f"  {record.self_us / 1000:10.1f} / {record.cumulative_us / 1000:8.1f} ms"
+                f"  {record.module}"
+            )
+        deferred = profile.deferred_imports()
+        if deferred:
+            console.print(
+                f"\n[bold yellow]Deferred dependencies imported at startup: "
+                f"{', '.join(deferred)}"
+            )
+
+    if profile.over_budget:
+        sys.exit(1)
+
+
 def _auto_detect_python_path(python_path: Optional[str]) -> str:
     """Auto-detect Python path if not provided."""
     if not python_path:
@@ -214,7 +391,7 @@ def _write_aixterm_config(aixterm_config: Path, aixterm_config_data: dict) -> No
         with open(aixterm_config, "w") as f:
             json.dump(aixterm_config_data, f, indent=2)
 
-        console.print("[bold green]Pythonium MCP server configured for aixterm")
+        _console().print("[bold green]Pythonium MCP server configured for aixterm")
 
     except Exception as e:
         logger.error(f"Failed to write configuration: {e}")
@@ -272,11 +449,11 @@ def configure_aixterm(
     )
 
     if dry_run:
-        console.print(
+        _console().print(
             "[bold yellow]DRY RUN - Configuration that would be written:[/bold yellow]"
         )
-        console.print(json.dumps(aixterm_config_data, indent=2))
-        console.print(f"\n[bold blue]Config file path:[/bold blue] {aixterm_config}")
+        _console().print(json.dumps(aixterm_config_data, indent=2))
+        _console().print(f"\n[bold blue]Config file path:[/bold blue] {aixterm_config}")
         return
 
     # Write configuration
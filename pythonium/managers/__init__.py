@@ -1,12 +1,39 @@
 """
 Modular managers for the Pythonium MCP server.
+
+Managers with heavy dependencies (``DevTeamManager`` pulls in LangGraph)
+are imported on first attribute access, so importing this package, or a
+light submodule such as ``devteam_events``, stays cheap.
 """
 
+import importlib
+from typing import TYPE_CHECKING, Any, List
+
 from .base import BaseManager, ManagerPriority
-from .devteam import DevTeamManager
+
+if TYPE_CHECKING:
+    from .devteam import DevTeamManager
+
+# Exported name -> submodule that defines it
+_LAZY_EXPORTS = {
+    "DevTeamManager": ".devteam",
+}
 
 __all__ = [
     "BaseManager",
     "ManagerPriority",
     "DevTeamManager",
 ]
+
+
+def __getattr__(name: str) -> Any:
+    module_name = _LAZY_EXPORTS.get(name)
+    if module_name is None:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    value = getattr(importlib.import_module(module_name, __name__), name)
+    globals()[name] = value
+    return value
+
+
+def __dir__() -> List[str]:
+    return sorted(set(globals()) | set(_LAZY_EXPORTS))
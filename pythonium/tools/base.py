@@ -5,18 +5,43 @@ This module provides the abstract base classes and common interfaces
 for all tools in the Pythonium system.
 """
 
+import asyncio
+import contextvars
+import functools
+import hashlib
+import inspect
+import json
 import logging
+import threading
 from abc import ABC, abstractmethod
 from dataclasses import dataclass, field
-from datetime import datetime
 from enum import Enum
 from pathlib import Path
-from typing import Any, Callable, Dict, List, Optional, Union
-
-from pydantic import BaseModel, Field, field_validator
+from typing import (
+    Any,
+    AsyncIterator,
+    Callable,
+    ClassVar,
+    Dict,
+    List,
+    Optional,
+    Type,
+    Union,
+)
+
+from pydantic import (
+    BaseModel,
+    ConfigDict,
+    Field,
+    PrivateAttr,
+    ValidationError,
+    field_validator,
+)
 
 from pythonium.common.base import BaseComponent, Result
 from pythonium.common.exceptions import PythoniumError
+from pythonium.common.parameters import get_parameter_model, parse_parameters
+from pythonium.common.timing import EXECUTE, VALIDATION, WRAP, PhaseTimer
 
 
 class ToolError(PythoniumError):
@@ -54,6 +79,8 @@ class ParameterType(Enum):
 class ToolParameter(BaseModel):
     """Defines a tool parameter for schema generation."""
 
+    model_config = ConfigDict(frozen=True)
+
     name: str = Field(description="Parameter name")
     type: ParameterType = Field(description="Parameter type")
     description: str = Field(description="Parameter description")
@@ -82,7 +109,14 @@ class ToolParameter(BaseModel):
 
 
 class ToolMetadata(BaseModel):
-    """Metadata for a tool."""
+    """
+    Metadata for a tool.
+
+    Metadata is frozen: tools build it once per class and share it, and
+    derived values such as JSON schemas are cached on the instance.
+    """
+
+    model_config = ConfigDict(frozen=True)
 
     name: str = Field(description="Tool name")
     description: str = Field(description="Tool description")
@@ -107,6 +141,33 @@ class ToolMetadata(BaseModel):
     dangerous: bool = Field(
         default=False, description="Whether tool performs dangerous operations"
     )
+    max_concurrency: Optional[int] = Field(
+        default=None,
+        ge=1,
+        description="Max concurrent executions, overriding the server per-tool limit",
+    )
+
+    # Result caching and coalescing
+    idempotent: bool = Field(
+        default=False,
+        description="Whether identical concurrent calls may share one execution",
+    )
+    cacheable: bool = Field(
+        default=False,
+        description="Whether results for identical parameters may be served from cache",
+    )
+    cache_ttl: float = Field(
+        default=60.0, gt=0, description="Seconds a cached result stays fresh"
+    )
+
+    # Streaming
+    supports_streaming: bool = Field(
+        default=False,
+        description="Whether the tool yields partial results through stream()",
+    )
+
+    # Schemas and their hashes, keyed by kind; see BaseTool.get_schema
+    _schema_cache: Dict[str, Any] = PrivateAttr(default_factory=dict)
 
     @field_validator("parameters")
     @classmethod
@@ -125,7 +186,7 @@ class ToolMetadata(BaseModel):
         """Get description based on preference for brief or detailed."""
         if brief:
             return self.get_brief_description()
-        return self.get_description()
+        return self.description
 
 
 @dataclass
@@ -140,6 +201,7 @@ class ToolContext:
     logger: Optional[logging.Logger] = None
     progress_callback: Optional[Callable[[str], None]] = None
     registry: Optional[Any] = None
+    dispatcher: Optional[Any] = None
 
     def has_permission(self, permission: str) -> bool:
         """Check if context has a specific permission."""
@@ -152,8 +214,95 @@ class ToolContext:
         return self.logger
 
 
+class StreamClosed(ToolError):
+    """Raised inside a stream producer once its consumer has gone away."""
+
+    pass
+
+
+async def iterate_in_thread(producer: Callable[[Callable[[Any], None]], Any]):
+    """
+    Run a blocking producer in a worker thread and yield what it emits.
+
+    ``producer`` is called with an ``emit`` callback for partial results, and
+    its return value is yielded last. When the consumer stops iterating, the
+    next ``emit`` call raises ``StreamClosed`` so the producer stops early.
+    The producer runs in a copy of the caller's context, so it sees the
+    caller's context variables such as the current tracing span.
+    """
+    loop = asyncio.get_running_loop()
+    queue: asyncio.Queue = asyncio.Queue()
+    closed = threading.Event()
+
+    def emit(item: Any) -> None:
+        if closed.is_set():
+            raise StreamClosed("Stream consumer went away")
+        loop.call_soon_threadsafe(queue.put_nowait, item)
+
+    future = loop.run_in_executor(None, contextvars.copy_context().run, producer, emit)
+    getter: Optional[asyncio.Future] = None
+    try:
+        while True:
+            getter = asyncio.ensure_future(queue.get())
+            await asyncio.wait({getter, future}, return_when=asyncio.FIRST_COMPLETED)
+            if getter.done():
+                yield getter.result()
+                continue
+
+            # Items emitted before the producer returned are already queued
+            while not queue.empty():
+                yield queue.get_nowait()
+            yield future.result()
+            return
+    finally:
+        closed.set()
+        if getter is not None and not getter.done():
+            getter.cancel()
+        # An abandoned producer ends with StreamClosed; nobody awaits it
+        future.add_done_callback(lambda f: f.cancelled() or f.exception())
+
+
+def _share_metadata(fget: Callable[[Any], ToolMetadata]) -> property:
+    """Wrap a ``metadata`` getter so it runs once per tool class."""
+    cache: Dict[Type[Any], ToolMetadata] = {}
+    lock = threading.Lock()
+
+    @functools.wraps(fget)
+    def metadata(self) -> ToolMetadata:
+        tool_class = type(self)
+        try:
+            return cache[tool_class]
+        except KeyError:
+            pass
+        with lock:
+            if tool_class not in cache:
+                cache[tool_class] = fget(self)
+            return cache[tool_class]
+
+    return property(metadata)
+
+
 class BaseTool(BaseComponent, ABC):
-    """Abstract base class for all tools."""
+    """
+    Abstract base class for all tools.
+
+    A subclass's ``metadata`` property is evaluated once per class and the
+    result shared by all instances. Tools whose metadata depends on the
+    instance set ``shared_metadata = False``.
+    """
+
+    shared_metadata: ClassVar[bool] = True
+
+    def __init_subclass__(cls, **kwargs: Any) -> None:
+        super().__init_subclass__(**kwargs)
+        prop = cls.__dict__.get("metadata")
+        if (
+            cls.shared_metadata
+            and isinstance(prop, property)
+            and prop.fget is not None
+            and not getattr(prop.fget, "__isabstractmethod__", False)
+        ):
+            cls.metadata = _share_metadata(prop.fget)  # type: ignore[assignment]
 
     def __init__(self, name: Optional[str] = None):
         """Initialize tool."""
@@ -182,49 +331,129 @@ class BaseTool(BaseComponent, ABC):
         """Execute the tool with given parameters and context."""
         pass
 
-    async def run(
+    @property
+    def parameter_model(self) -> Optional[Type[BaseModel]]:
+        """
+        The model ``execute`` validates its parameters against, if any.
+
+        Set for tools whose ``execute`` is decorated with
+        ``validate_parameters``. Dispatch plans validate against it up front
+        and hand the tool the validated instance.
+        """
+        return get_parameter_model(type(self).execute)
+
+    def is_cacheable_call(self, parameters: Dict[str, Any]) -> bool:
+        """
+        Check whether a call may use the result cache and be coalesced.
+
+        Only consulted for tools whose metadata sets ``cacheable`` or
+        ``idempotent``. Tools whose calls are only sometimes side-effect free
+        can override this.
+        """
+        return True
+
+    async def stream(
         self, parameters: Dict[str, Any], context: ToolContext
+    ) -> AsyncIterator[Any]:
+        """
+        Execute the tool, yielding partial results as they become available.
+
+        Partial results may be any JSON-serializable value. The last item is
+        always the complete ``Result``. The default implementation yields the
+        result of ``execute``; tools that set ``supports_streaming`` override it.
+        """
+        yield await self.execute(parameters, context)
+
+    async def collect_stream(
+        self,
+        parameters: Dict[str, Any],
+        context: ToolContext,
+        on_partial: Optional[Callable[[Any], Any]] = None,
     ) -> Result[Any]:
-        """Run the tool with parameter validation and error handling."""
-        start_time = datetime.now()
-
+        """
+        Consume ``stream()`` and return its final result.
+
+        Args:
+            parameters: Tool parameters
+            context: Execution context
+            on_partial: Called (and awaited, if it returns an awaitable) with
+                each partial result. If it raises, the stream is closed early.
+        """
+        stream = self.stream(parameters, context)
         try:
-            validated_params = parameters
+            async for item in stream:
+                if isinstance(item, Result):
+                    return item
+                if on_partial is not None:
+                    outcome = on_partial(item)
+                    if inspect.isawaitable(outcome):
+                        await outcome
+        finally:
+            await stream.aclose()  # type: ignore[attr-defined]
+
+        return Result.error_result(f"Tool {self.name} stream ended without a result")
 
-            # Check permissions if required
-            if self.metadata.requires_auth and not context.has_permission(
-                "tool_execution"
-            ):
-                raise ToolExecutionError(
-                    "Tool requires authentication but context lacks permission"
-                )
-
-            # Execute tool
-            result = await self.execute(validated_params, context)
+    async def run(
+        self,
+        parameters: Dict[str, Any],
+        context: ToolContext,
+        timer: Optional[PhaseTimer] = None,
+    ) -> Result[Any]:
+        """
+        Run the tool with parameter validation and error handling.
 
-            # Set execution time
-            execution_time = (datetime.now() - start_time).total_seconds()
-            if result:
-                result.execution_time = execution_time
+        Each phase of the call is timed; the breakdown is attached to the
+        result's metadata and handed to the timing sink.
 
-            return result
+        Args:
+            parameters: Tool parameters
+            context: Execution context
+            timer: Timer of a caller that already timed earlier phases, such
+                as queue wait; a fresh one is started otherwise
+        """
+        if timer is None:
+            timer = PhaseTimer(self.name)
 
+        try:
+            result = await self._run_phases(parameters, context, timer)
         except ToolValidationError as e:
-            return Result.error_result(
-                error=f"Parameter validation failed: {e}",
-                execution_time=(datetime.now() - start_time).total_seconds(),
-            )
+            result = Result.error_result(error=f"Parameter validation failed: {e}")
         except ToolExecutionError as e:
-            return Result.error_result(
-                error=f"Execution failed: {e}",
-                execution_time=(datetime.now() - start_time).total_seconds(),
-            )
+            result = Result.error_result(error=f"Execution failed: {e}")
         except Exception as e:
             self._logger.exception(f"Unexpected error in tool {self.name}")
-            return Result.error_result(
-                error=f"Unexpected error: {e}",
-                execution_time=(datetime.now() - start_time).total_seconds(),
+            result = Result.error_result(error=f"Unexpected error: {e}")
+
+        if result:
+            result.execution_time = timer.total_ns / 1e9
+        timer.lap(WRAP)
+        timer.emit()
+        timed: Result[Any] = timer.attach(result)
+        return timed
+
+    async def _run_phases(
+        self, parameters: Dict[str, Any], context: ToolContext, timer: PhaseTimer
+    ) -> Result[Any]:
+        """Validate and execute, lapping the timer after each phase."""
+        model = self.parameter_model
+        validated: Any = parameters
+        if model is not None:
+            try:
+                validated = parse_parameters(model, parameters)
+            except ValidationError as e:
+                raise ToolValidationError(str(e)) from e
+
+        # Check permissions if required
+        if self.metadata.requires_auth and not context.has_permission("tool_execution"):
+            raise ToolExecutionError(
+                "Tool requires authentication but context lacks permission"
             )
+        timer.lap(VALIDATION)
+
+        try:
+            return await self.execute(validated, context)
+        finally:
+            timer.lap(EXECUTE)
 
     def _add_numeric_constraints(
         self, prop: Dict[str, Any], param: ToolParameter
@@ -293,19 +522,50 @@ class BaseTool(BaseComponent, ABC):
 
         return prop
 
-    def get_schema(self, brief: bool = False) -> Dict[str, Any]:
-        """Get JSON schema for the tool."""
+    def _build_schema(self, metadata: ToolMetadata, brief: bool) -> Dict[str, Any]:
+        """Build the JSON schema for the tool from its metadata."""
         properties: Dict[str, Dict[str, Any]] = {}
 
-        for param in self.metadata.parameters:
+        for param in metadata.parameters:
             properties[param.name] = self._build_parameter_property(param)
 
         return {
-            "name": self.metadata.name,
-            "description": self.metadata.get_description(brief=brief),
+            "name": metadata.name,
+            "description": metadata.get_description(brief=brief),
             "parameters": {
                 "type": "object",
                 "properties": properties,
-                "required": [p.name for p in self.metadata.parameters if p.required],
+                "required": [p.name for p in metadata.parameters if p.required],
             },
         }
+
+    def get_schema(self, brief: bool = False) -> Dict[str, Any]:
+        """
+        Get JSON schema for the tool.
+
+        The schema is built once per metadata object and cached; callers
+        must not modify the returned dictionary.
+        """
+        metadata = self.metadata
+        key = "brief" if brief else "full"
+        schema = metadata._schema_cache.get(key)
+        if schema is None:
+            schema = metadata._schema_cache[key] = self._build_schema(metadata, brief)
+        return schema
+
+    def get_schema_hash(self, brief: bool = False) -> str:
+        """
+        Get a content hash of the tool's JSON schema.
+
+        The hash changes whenever the schema does, so clients can use it
+        as an ETag to skip re-fetching unchanged tool definitions.
+        """
+        metadata = self.metadata
+        key = "brief_hash" if brief else "full_hash"
+        digest = metadata._schema_cache.get(key)
+        if digest is None:
+            encoded = json.dumps(
+                self.get_schema(brief), sort_keys=True, separators=(",", ":")
+            ).encode("utf-8")
+            digest = metadata._schema_cache[key] = hashlib.sha256(encoded).hexdigest()
+        return digest
@@ -6,16 +6,19 @@ and error handling.
 """
 
 import asyncio
+import codecs
 import logging
 import os
 import shlex
+import weakref
 from datetime import datetime
 from pathlib import Path
-from typing import Callable, Dict, List, Optional, Union
+from typing import Callable, Dict, List, NamedTuple, Optional, Union
 
 from pythonium.common.base import Result
 from pythonium.common.error_handling import handle_tool_error
 from pythonium.common.parameters import validate_parameters
+from pythonium.common.tracing import start_span
 from pythonium.tools.base import (
     BaseTool,
     ParameterType,
@@ -30,6 +33,33 @@ from .parameters import ExecuteCommandParams
 logger = logging.getLogger(__name__)
 
 MAX_OUTPUT_SIZE = 10 * 1024 * 1024  # 10MB
+STREAM_CHUNK_SIZE = 64 * 1024
+
+# Output of a finished subprocess, as handed to _process_result
+ProcessOutput = Dict[str, Union[str, int, float]]
+
+
+class PreparedCommand(NamedTuple):
+    """A validated command, ready to be started as a subprocess."""
+
+    process_id: str
+    cmd: Union[str, List[str]]
+    env: Dict[str, str]
+    cwd: Optional[str]
+
+
+# Live command tools and the number of child processes they have started,
+# reported by get_subprocess_stats
+_live_tools: "weakref.WeakSet[ExecuteCommandTool]" = weakref.WeakSet()
+_processes_started = 0
+
+
+def get_subprocess_stats() -> Dict[str, int]:
+    """Get the number of child processes started and currently running."""
+    return {
+        "started": _processes_started,
+        "running": sum(len(tool._running_processes) for tool in list(_live_tools)),
+    }
 
 
 class ExecuteCommandTool(BaseTool):
@@ -39,6 +69,7 @@ class ExecuteCommandTool(BaseTool):
         super().__init__()
         self._running_processes: Dict[str, asyncio.subprocess.Process] = {}
         self._process_counter = 0
+        _live_tools.add(self)
 
     async def initialize(self) -> None:
         """Initialize the tool."""
@@ -80,6 +111,8 @@ class ExecuteCommandTool(BaseTool):
                 "async",
             ],
             dangerous=True,  # Command execution is inherently dangerous
+            max_concurrency=8,  # Each call holds a child process
+            supports_streaming=True,
             parameters=[
                 ToolParameter(
                     name="command",
@@ -140,33 +173,26 @@ class ExecuteCommandTool(BaseTool):
         """Execute the command with async support."""
         try:
             progress_callback = getattr(context, "progress_callback", None)
-            process_id = f"cmd_{self._process_counter}"
-            self._process_counter += 1
 
             # Validate and prepare execution parameters
-            validation_result = self._validate_parameters(parameters)
-            if not validation_result.success:
-                return validation_result
+            prepared = self._prepare_execution(parameters)
+            if isinstance(prepared, Result):
+                return prepared
 
             if progress_callback:
                 progress_callback(
                     f"🚀 Starting command execution: {parameters.command}"
                 )
 
-            # Prepare command and environment
-            cmd = self._prepare_command(parameters)
-            env = self._prepare_environment(parameters.environment)
-            cwd = self._validate_working_directory(parameters.working_directory)
-
             # Execute command with proper async handling
             start_time = datetime.now()
             try:
                 result = await self._execute_async_subprocess(
-                    cmd, parameters, env, cwd, progress_callback, process_id
+                    prepared, parameters, progress_callback
                 )
             finally:
                 # Cleanup process tracking
-                self._running_processes.pop(process_id, None)
+                self._running_processes.pop(prepared.process_id, None)
 
             # Process and return result
             return self._process_result(
@@ -192,6 +218,105 @@ class ExecuteCommandTool(BaseTool):
             logger.error(error_msg)
             return Result.error_result(error_msg)
 
+    @validate_parameters(ExecuteCommandParams)
+    @handle_tool_error
+    async def stream(self, parameters: ExecuteCommandParams, context: ToolContext):
+        """Execute the command, yielding stdout chunks as they are produced."""
+        if not parameters.capture_output:
+            yield await self.execute(parameters.model_dump(), context)
+            return
+
+        prepared = self._prepare_execution(parameters)
+        if isinstance(prepared, Result):
+            yield prepared
+            return
+
+        loop = asyncio.get_running_loop()
+        start_time = datetime.now()
+        deadline = loop.time() + parameters.timeout
+
+        try:
+            process = await self._create_subprocess(prepared, parameters)
+        except FileNotFoundError:
+            yield Result.error_result(f"Command not found: {parameters.command}")
+            return
+
+        self._running_processes[prepared.process_id] = process
+        stderr_task = asyncio.ensure_future(process.stderr.read())  # type: ignore
+        decoder = codecs.getincrementaldecoder("utf-8")(errors="replace")
+        # Keep at most MAX_OUTPUT_SIZE bytes for the final result; every chunk
+        # is still streamed
+        stdout_buffer = bytearray()
+        stdout_truncated = False
+
+        try:
+            if parameters.stdin and process.stdin:
+                process.stdin.write(parameters.stdin.encode())
+                await process.stdin.drain()
+                process.stdin.close()
+
+            while True:
+                chunk = await asyncio.wait_for(
+                    process.stdout.read(STREAM_CHUNK_SIZE),  # type: ignore
+                    timeout=max(deadline - loop.time(), 0),
+                )
+                if not chunk:
+                    break
+                room = MAX_OUTPUT_SIZE - len(stdout_buffer)
+                stdout_truncated = stdout_truncated or len(chunk) > room
+                stdout_buffer += chunk[:room]
+                text = decoder.decode(chunk)
+                if text:
+                    yield {"stream": "stdout", "data": text}
+
+            stderr_data = await asyncio.wait_for(
+                stderr_task, timeout=max(deadline - loop.time(), 0)
+            )
+            await asyncio.wait_for(
+                process.wait(), timeout=max(deadline - loop.time(), 0)
+            )
+
+        except asyncio.TimeoutError:
+            await self._handle_subprocess_timeout(process, parameters, None)
+            error_msg = f"Command timed out after {parameters.timeout} seconds"
+            logger.error(error_msg)
+            yield Result.error_result(error_msg)
+            return
+
+        finally:
+            if process.returncode is None:
+                # The consumer stopped reading before the command finished.
+                # Grandchildren may keep the pipes open, so bound the wait.
+                process.kill()
+                try:
+                    await asyncio.wait_for(process.wait(), timeout=5.0)
+                except asyncio.TimeoutError:
+                    logger.warning(f"Process {process.pid} pipes still open after kill")
+            stderr_task.cancel()
+            self._running_processes.pop(prepared.process_id, None)
+
+        result = self._captured_output(
+            process, self._capped_output(stdout_buffer, stdout_truncated), stderr_data
+        )
+        yield self._process_result(result, parameters, None, start_time)
+
+    def _prepare_execution(
+        self, parameters: ExecuteCommandParams
+    ) -> Union[Result, PreparedCommand]:
+        """Validate a call and prepare its command, or return the error Result."""
+        validation_result = self._validate_parameters(parameters)
+        if not validation_result.success:
+            return validation_result
+
+        process_id = f"cmd_{self._process_counter}"
+        self._process_counter += 1
+        return PreparedCommand(
+            process_id=process_id,
+            cmd=self._prepare_command(parameters),
+            env=self._prepare_environment(parameters.environment),
+            cwd=self._validate_working_directory(parameters.working_directory),
+        )
+
     def _prepare_command(
         self, parameters: ExecuteCommandParams
     ) -> Union[str, List[str]]:
@@ -225,46 +350,45 @@ class ExecuteCommandTool(BaseTool):
 
     async def _execute_async_subprocess(
         self,
-        cmd: Union[str, List[str]],
+        prepared: PreparedCommand,
         parameters: ExecuteCommandParams,
-        env: Dict[str, str],
-        cwd: Optional[str],
         progress_callback: Optional[Callable[[str], None]],
-        process_id: str,
-    ) -> Dict[str, Union[str, int, float]]:
+    ) -> ProcessOutput:
         """Execute subprocess using asyncio with proper monitoring and cleanup."""
+        with start_span("subprocess", {"process.command": parameters.command}) as span:
+            if progress_callback:
+                progress_callback("🔄 Creating subprocess...")
 
-        if progress_callback:
-            progress_callback("🔄 Creating subprocess...")
-
-        # Create subprocess
-        process = await self._create_subprocess(cmd, parameters, env, cwd)
+            # Create subprocess
+            process = await self._create_subprocess(prepared, parameters)
 
-        # Track the process
-        self._running_processes[process_id] = process
+            # Track the process
+            self._running_processes[prepared.process_id] = process
+            span.set_attribute("process.pid", process.pid)
 
-        if progress_callback:
-            progress_callback(f"Process started (PID: {process.pid})")
+            if progress_callback:
+                progress_callback(f"Process started (PID: {process.pid})")
 
-        try:
-            return await self._handle_subprocess_execution(process, parameters)
+            try:
+                result = await self._handle_subprocess_execution(process, parameters)
+                span.set_attribute("process.exit.code", result["returncode"])
+                return result
 
-        except asyncio.TimeoutError:
-            await self._handle_subprocess_timeout(
-                process, parameters, progress_callback
-            )
-            raise asyncio.TimeoutError(
-                f"Command timed out after {parameters.timeout} seconds"
-            )
+            except asyncio.TimeoutError:
+                await self._handle_subprocess_timeout(
+                    process, parameters, progress_callback
+                )
+                raise asyncio.TimeoutError(
+                    f"Command timed out after {parameters.timeout} seconds"
+                )
 
     async def _create_subprocess(
-        self,
-        cmd: Union[str, List[str]],
-        parameters: ExecuteCommandParams,
-        env: Dict[str, str],
-        cwd: Optional[str],
+        self, prepared: PreparedCommand, parameters: ExecuteCommandParams
     ) -> asyncio.subprocess.Process:
         """Create subprocess based on parameters."""
+        global _processes_started
+        _processes_started += 1
+        cmd, env, cwd = prepared.cmd, prepared.env, prepared.cwd
         if parameters.shell and isinstance(cmd, str):
             return await asyncio.create_subprocess_shell(
                 cmd,
@@ -288,7 +412,7 @@ class ExecuteCommandTool(BaseTool):
 
     async def _handle_subprocess_execution(
         self, process: asyncio.subprocess.Process, parameters: ExecuteCommandParams
-    ) -> Dict[str, Union[str, int, float]]:
+    ) -> ProcessOutput:
         """Handle subprocess execution and output capture."""
         stdin_data = parameters.stdin.encode() if parameters.stdin else None
 
@@ -306,19 +430,28 @@ class ExecuteCommandTool(BaseTool):
         process: asyncio.subprocess.Process,
         parameters: ExecuteCommandParams,
         stdin_data: Optional[bytes],
-    ) -> Dict[str, Union[str, int, float]]:
+    ) -> ProcessOutput:
         """Execute subprocess with output capture."""
         stdout_data, stderr_data = await asyncio.wait_for(
             process.communicate(input=stdin_data), timeout=parameters.timeout
         )
 
+        return self._captured_output(process, stdout_data, stderr_data)
+
+    def _captured_output(
+        self,
+        process: asyncio.subprocess.Process,
+        stdout_data: Optional[bytes],
+        stderr_data: Optional[bytes],
+    ) -> ProcessOutput:
+        """Build the result of a finished process whose output was captured."""
         # Check output size limits
         stdout_data = self._truncate_output_if_needed(stdout_data, "stdout")
         stderr_data = self._truncate_output_if_needed(stderr_data, "stderr")
 
         return {
-            "stdout": stdout_data.decode(errors="replace") if stdout_data else "",
-            "stderr": stderr_data.decode(errors="replace") if stderr_data else "",
+            "stdout": stdout_data.decode(errors="replace"),
+            "stderr": stderr_data.decode(errors="replace"),
             "returncode": process.returncode or 0,
             "pid": process.pid,
         }
@@ -328,7 +461,7 @@ class ExecuteCommandTool(BaseTool):
         process: asyncio.subprocess.Process,
         parameters: ExecuteCommandParams,
         stdin_data: Optional[bytes],
-    ) -> Dict[str, Union[str, int, float]]:
+    ) -> ProcessOutput:
         """Execute subprocess without output capture."""
         if stdin_data and process.stdin:
             process.stdin.write(stdin_data)
@@ -341,6 +474,14 @@ class ExecuteCommandTool(BaseTool):
             "pid": process.pid,
         }
 
+    @staticmethod
+    def _capped_output(buffer: bytearray, truncated: bool) -> bytes:
+        """Finish stdout collected up to the size limit while streaming."""
+        if not truncated:
+            return bytes(buffer)
+        logger.warning(f"stdout output truncated (exceeded {MAX_OUTPUT_SIZE} bytes)")
+        return bytes(buffer) + b"\n[OUTPUT TRUNCATED]"
+
     def _truncate_output_if_needed(
         self, output_data: Optional[bytes], output_type: str
     ) -> bytes:
@@ -373,7 +514,7 @@ class ExecuteCommandTool(BaseTool):
 
     def _process_result(
         self,
-        result: Dict[str, Union[str, int, float]],
+        result: ProcessOutput,
         parameters: ExecuteCommandParams,
         progress_callback: Optional[Callable[[str], None]],
         start_time: datetime,
@@ -2,19 +2,21 @@
 File operation tools for basic file manipulation with async support.
 
 This module provides essential file operations including reading, writing, deleting files,
-finding files based on criteria, and searching file contents.
+finding files based on criteria, and searching file contents. Directory walks
+run in tracing spans recording how much of the tree they covered.
 """
 
 import fnmatch
 import os
 import re
 from pathlib import Path
-from typing import Any, Dict, List, Optional
+from typing import Any, Callable, Dict, List, Optional
 
 from pythonium.common.async_file_ops import AsyncFileError, async_file_service
 from pythonium.common.base import Result
 from pythonium.common.error_handling import handle_tool_error
 from pythonium.common.parameters import validate_parameters
+from pythonium.common.tracing import start_span
 from pythonium.tools.base import (
     BaseTool,
     ParameterType,
@@ -22,6 +24,7 @@ from pythonium.tools.base import (
     ToolExecutionError,
     ToolMetadata,
     ToolParameter,
+    iterate_in_thread,
 )
 
 from .parameters import (
@@ -305,6 +308,8 @@ class FindFilesTool(BaseTool):
                 "pattern",
                 "type",
             ],
+            idempotent=True,
+            supports_streaming=True,
             parameters=[
                 ToolParameter(
                     name="path",
@@ -528,6 +533,9 @@ class FindFilesTool(BaseTool):
         result_item = self._create_result_item(item, current_depth)
         if result_item:
             results.append(result_item)
+            on_result = search_params.get("on_result")
+            if on_result:
+                on_result(result_item)
             if limit is not None and len(results) >= limit:
                 return True
 
@@ -543,6 +551,25 @@ class FindFilesTool(BaseTool):
         self, params: FindFilesParams, context: ToolContext
     ) -> Result[Any]:
         """Execute file finding operation."""
+        return self._find_files(params, getattr(context, "progress_callback", None))
+
+    @validate_parameters(FindFilesParams)
+    @handle_tool_error
+    async def stream(self, params: FindFilesParams, context: ToolContext):
+        """Find files in a worker thread, yielding each match as it is found."""
+        progress_callback = getattr(context, "progress_callback", None)
+        async for item in iterate_in_thread(
+            lambda emit: self._find_files(params, progress_callback, emit)
+        ):
+            yield item
+
+    def _find_files(
+        self,
+        params: FindFilesParams,
+        progress_callback: Optional[Callable[[str], None]],
+        on_result: Optional[Callable[[Dict[str, Any]], None]] = None,
+    ) -> Result[Any]:
+        """Run the file search, passing each match to ``on_result``."""
         root_path = Path(params.path)
         name_pattern = params.name_pattern
         regex_pattern = params.regex_pattern
@@ -554,9 +581,6 @@ class FindFilesTool(BaseTool):
         case_sensitive = params.case_sensitive
         limit = params.limit
 
-        # Get progress callback from context
-        progress_callback = getattr(context, "progress_callback", None)
-
         try:
             if progress_callback:
                 progress_callback(f"Starting file search in: {root_path}")
@@ -586,10 +610,15 @@ class FindFilesTool(BaseTool):
                 "min_size": min_size,
                 "max_size": max_size,
                 "progress_callback": progress_callback,
+                "on_result": on_result,
             }
 
             results: List[Dict[str, Any]] = []
-            self._search_directory(root_path, search_params, results)
+            with start_span(
+                "find_files.walk", {"file.directory": str(root_path)}
+            ) as span:
+                self._search_directory(root_path, search_params, results)
+                span.set_attribute("pythonium.files.matched", len(results))
 
             if progress_callback:
                 progress_callback(f"Search completed. Found {len(results)} matches.")
@@ -647,6 +676,9 @@ class SearchFilesTool(BaseTool):
                 "pattern",
                 "analysis",
             ],
+            max_concurrency=4,  # Content scans are disk and CPU heavy
+            idempotent=True,
+            supports_streaming=True,
             parameters=[
                 ToolParameter(
                     name="path",
@@ -830,6 +862,9 @@ class SearchFilesTool(BaseTool):
                     )
                     file_matches.append(match_data)
                     results.append(match_data)
+                    on_result = search_params.get("on_result")
+                    if on_result:
+                        on_result(match_data)
 
             if file_matches:
                 counters["files_with_matches"] += 1
@@ -903,6 +938,25 @@ class SearchFilesTool(BaseTool):
         self, params: SearchTextParams, context: ToolContext
     ) -> Result[Any]:
         """Execute file content search operation."""
+        return self._search_files(params, getattr(context, "progress_callback", None))
+
+    @validate_parameters(SearchTextParams)
+    @handle_tool_error
+    async def stream(self, params: SearchTextParams, context: ToolContext):
+        """Search file contents in a worker thread, yielding each match."""
+        progress_callback = getattr(context, "progress_callback", None)
+        async for item in iterate_in_thread(
+            lambda emit: self._search_files(params, progress_callback, emit)
+        ):
+            yield item
+
+    def _search_files(
+        self,
+        params: SearchTextParams,
+        progress_callback: Optional[Callable[[str], None]],
+        on_result: Optional[Callable[[Dict[str, Any]], None]] = None,
+    ) -> Result[Any]:
+        """Run the content search, passing each match to ``on_result``."""
         root_path = Path(params.path)
         pattern = params.pattern
         use_regex = params.regex
@@ -914,9 +968,6 @@ class SearchFilesTool(BaseTool):
         context_lines = params.context_lines
         limit = params.limit
 
-        # Get progress callback from context
-        progress_callback = getattr(context, "progress_callback", None)
-
         try:
             if progress_callback:
                 progress_callback(
@@ -949,21 +1000,29 @@ class SearchFilesTool(BaseTool):
                 "context_lines": context_lines,
                 "limit": limit,
                 "progress_callback": progress_callback,
+                "on_result": on_result,
             }
 
             results: List[Dict[str, Any]] = []
             counters = {"files_searched": 0, "files_with_matches": 0}
 
             # Start search
-            if root_path.is_file():
-                if self._should_search_file(root_path, file_pattern, max_file_size):
-                    self._search_single_file(
+            with start_span(
+                "search_files.walk", {"file.directory": str(root_path)}
+            ) as span:
+                if root_path.is_file():
+                    if self._should_search_file(root_path, file_pattern, max_file_size):
+                        self._search_single_file(
+                            root_path, search_params, results, counters
+                        )
+                else:
+                    self._search_directory_for_content(
                         root_path, search_params, results, counters
                     )
-            else:
-                self._search_directory_for_content(
-                    root_path, search_params, results, counters
+                span.set_attribute(
+                    "pythonium.files.searched", counters["files_searched"]
                 )
+                span.set_attribute("pythonium.files.matched", len(results))
 
             if progress_callback:
                 progress_callback(
@@ -130,6 +130,89 @@ class SearchToolsParams(ParameterModel):
         return v
 
 
+class BatchCallSpec(ParameterModel):
+    """A single tool call inside a batch."""
+
+    tool: str = Field(..., description="Name of the tool to call")
+    parameters: Dict[str, Any] = Field(
+        default_factory=dict, description="Parameters for the tool call"
+    )
+
+    @field_validator("tool")
+    @classmethod
+    def validate_tool(cls, v: str) -> str:
+        """Validate tool name."""
+        if not v or not v.strip():
+            raise ValueError("Tool name cannot be empty")
+        return v.strip()
+
+
+class BatchExecuteParams(ParameterModel):
+    """Parameter model for BatchExecuteTool."""
+
+    calls: List[BatchCallSpec] = Field(
+        ..., description="Tool calls to execute", min_length=1, max_length=100
+    )
+    max_concurrency: int = Field(
+        8, description="Maximum number of calls running at once", ge=1, le=32
+    )
+    timeout: float = Field(
+        60.0, description="Deadline for the whole batch in seconds", gt=0, le=600
+    )
+
+
+class ToolStatsParams(ParameterModel):
+    """Parameter model for ToolStatsTool."""
+
+    tool_name: Optional[str] = Field(
+        None, description="Report only this tool; all tools when omitted"
+    )
+    include_unused: bool = Field(
+        False, description="Include tools that have not been called"
+    )
+    sort_by: str = Field(
+        "calls", description="Order tools by this statistic, highest first"
+    )
+    limit: int = Field(50, description="Maximum number of tools", ge=1, le=1000)
+
+    @field_validator("sort_by")
+    @classmethod
+    def validate_sort_by(cls, v: str) -> str:
+        """Validate sort statistic."""
+        allowed = ["calls", "errors", "p50", "p95", "p99"]
+        if v not in allowed:
+            raise ValueError(
+                f"Invalid sort_by '{v}'. Allowed values: {', '.join(allowed)}"
+            )
+        return v
+
+
+class SlowCallProfilesParams(ParameterModel):
+    """Parameter model for SlowCallProfilesTool."""
+
+    tool_name: Optional[str] = Field(
+        None, description="List only profiles of this tool"
+    )
+    profile_id: Optional[int] = Field(
+        None, description="Summarize this profile's hottest functions", ge=1
+    )
+    sort_by: str = Field(
+        "cumulative", description="Rank functions by cumulative or self time"
+    )
+    top: int = Field(20, description="Number of functions to report", ge=1, le=200)
+
+    @field_validator("sort_by")
+    @classmethod
+    def validate_sort_by(cls, v: str) -> str:
+        """Validate sort order."""
+        allowed = ["cumulative", "self"]
+        if v not in allowed:
+            raise ValueError(
+                f"Invalid sort_by '{v}'. Allowed values: {', '.join(allowed)}"
+            )
+        return v
+
+
 # File Operation Parameter Models
 
 
@@ -1,17 +1,21 @@
 """
 Tool operations and meta-tools for the Pythonium framework.
 
-Provides tools for describing other tools, searching tools, and other
-tool-related operations.
+Provides tools for describing other tools, searching tools, executing
+batches of tool calls, reporting tool usage statistics, retrieving
+profiles of slow tool calls, and other tool-related operations.
 """
 
+import asyncio
+import time
 from typing import Any, Dict, List, Optional, cast
 
 from pythonium.common.base import Result
 from pythonium.common.error_handling import handle_tool_error
 from pythonium.common.exceptions import ToolExecutionError
 from pythonium.common.parameters import validate_parameters
-from pythonium.core.tools.registry import ToolRegistry
+from pythonium.core.profiling import get_slow_call_profiler
+from pythonium.core.tools.registry import ToolRegistry, ToolStatus
 from pythonium.tools.base import (
     BaseTool,
     ParameterType,
@@ -20,7 +24,14 @@ from pythonium.tools.base import (
     ToolParameter,
 )
 
-from .parameters import DescribeToolParams, SearchToolsParams
+from .parameters import (
+    BatchCallSpec,
+    BatchExecuteParams,
+    DescribeToolParams,
+    SearchToolsParams,
+    SlowCallProfilesParams,
+    ToolStatsParams,
+)
 
 
 class DescribeToolTool(BaseTool):
@@ -43,6 +54,8 @@ class DescribeToolTool(BaseTool):
                 "parameters",
                 "schema",
             ],
+            cacheable=True,  # Invalidated whenever the registry changes
+            cache_ttl=300.0,
             parameters=[
                 ToolParameter(
                     name="tool_name",
@@ -192,6 +205,53 @@ class DescribeToolTool(BaseTool):
 
         return examples
 
+    def _find_tool_info(self, registry: Any, tool_name: str) -> Dict[str, Any]:
+        """Collect the description of a registered tool."""
+        for registration in registry.list_tools() if registry else []:
+            if registration.tool_id != tool_name:
+                continue
+            metadata = registration.metadata
+            tool_info = {
+                "description": metadata.description,
+                "brief_description": metadata.brief_description,
+                "category": metadata.category,
+                "tags": metadata.tags,
+                "version": metadata.version,
+                "dangerous": metadata.dangerous,
+                "parameters": metadata.parameters,
+            }
+            if isinstance(registration.instance, BaseTool):
+                tool_info["schema_hash"] = registration.instance.get_schema_hash()
+            return tool_info
+        raise ToolExecutionError(f"Tool '{tool_name}' not found")
+
+    @staticmethod
+    def _typed_parameters(tool_info: Dict[str, Any]) -> Optional[List[ToolParameter]]:
+        """Return the tool's parameters if they are ToolParameter definitions."""
+        parameters = tool_info.get("parameters", [])
+        if isinstance(parameters, list) and all(hasattr(p, "type") for p in parameters):
+            return cast(List[ToolParameter], parameters)
+        return None
+
+    def _render_schema(self, tool_info: Dict[str, Any]) -> Dict[str, Any]:
+        """Render the parameter schema and its hash."""
+        rendered: Dict[str, Any] = {}
+        parameters = self._typed_parameters(tool_info)
+        if parameters is not None:
+            rendered["parameter_schema"] = self._generate_parameter_schema(parameters)
+        if "schema_hash" in tool_info:
+            rendered["schema_hash"] = tool_info["schema_hash"]
+        return rendered
+
+    @staticmethod
+    def _render_metadata(tool_info: Dict[str, Any]) -> Dict[str, Any]:
+        """Render the version and safety metadata."""
+        return {
+            "version": tool_info.get("version", "unknown"),
+            "dangerous": tool_info.get("dangerous", False),
+            "full_description": tool_info.get("description", ""),
+        }
+
     @validate_parameters(DescribeToolParams)
     @handle_tool_error
     async def execute(
@@ -204,28 +264,9 @@ class DescribeToolTool(BaseTool):
         include_metadata = params.include_metadata
 
         try:
-            # Try to get tool from registry
-            registry = self._get_tool_registry(context)
-            tool_info = None
-
-            if registry:
-                # Get actual tool registration from registry
-                tool_registrations = registry.list_tools()
-                for registration in tool_registrations:
-                    if registration.tool_id == tool_name:
-                        tool_info = {
-                            "description": registration.metadata.description,
-                            "brief_description": registration.metadata.brief_description,
-                            "category": registration.metadata.category,
-                            "tags": registration.metadata.tags,
-                            "version": registration.metadata.version,
-                            "dangerous": registration.metadata.dangerous,
-                            "parameters": registration.metadata.parameters,
-                        }
-                        break
-
-            if not tool_info:
-                raise ToolExecutionError(f"Tool '{tool_name}' not found")
+            tool_info = self._find_tool_info(
+                self._get_tool_registry(context), tool_name
+            )
 
             result_data: Dict[str, Any] = {
                 "tool_name": tool_name,
@@ -237,34 +278,18 @@ class DescribeToolTool(BaseTool):
 
             # Add parameter schema if requested
             if include_schema:
-                parameters = tool_info.get("parameters", [])
-                if isinstance(parameters, list) and all(
-                    hasattr(p, "type") for p in parameters
-                ):
-                    typed_parameters = cast(List[ToolParameter], parameters)
-                    result_data["parameter_schema"] = self._generate_parameter_schema(
-                        typed_parameters
-                    )
+                result_data.update(self._render_schema(tool_info))
 
             # Add usage examples if requested
-            if include_examples:
-                parameters = tool_info.get("parameters", [])
-                if isinstance(parameters, list) and all(
-                    hasattr(p, "type") for p in parameters
-                ):
-                    typed_parameters = cast(List[ToolParameter], parameters)
-                    result_data["usage_examples"] = self._generate_usage_examples(
-                        tool_name, typed_parameters
-                    )
+            parameters = self._typed_parameters(tool_info)
+            if include_examples and parameters is not None:
+                result_data["usage_examples"] = self._generate_usage_examples(
+                    tool_name, parameters
+                )
 
             # Add metadata if requested
             if include_metadata:
-                metadata_info = {
-                    "version": tool_info.get("version", "unknown"),
-                    "dangerous": tool_info.get("dangerous", False),
-                    "full_description": tool_info.get("description", ""),
-                }
-                result_data["metadata"] = metadata_info
+                result_data["metadata"] = self._render_metadata(tool_info)
 
             return Result[Any].success_result(
                 data=result_data,
@@ -299,6 +324,8 @@ class SearchToolsTool(BaseTool):
                 "exploration",
                 "capabilities",
             ],
+            cacheable=True,  # Invalidated whenever the registry changes
+            cache_ttl=300.0,
             parameters=[
                 ToolParameter(
                     name="query",
@@ -368,11 +395,11 @@ class SearchToolsTool(BaseTool):
             return True
 
         # Check description
-        if query_lower in tool.get("description", "").lower():
+        if query_lower in (tool.get("description") or "").lower():
             return True
 
         # Check brief description
-        if query_lower in tool.get("brief_description", "").lower():
+        if query_lower in (tool.get("brief_description") or "").lower():
             return True
 
         # Check tags
@@ -541,3 +568,350 @@ class SearchToolsTool(BaseTool):
 
         except Exception as e:
             raise ToolExecutionError(f"Error searching tools: {e}")
+
+
+class BatchExecuteTool(BaseTool):
+    """Tool for running many independent tool calls in one request."""
+
+    @property
+    def metadata(self) -> ToolMetadata:
+        return ToolMetadata(
+            name="batch_execute",
+            description="Execute many independent tool calls in a single request instead of one round-trip per call. Calls run concurrently up to a concurrency cap and within a deadline for the whole batch. Results are returned in the order of the calls, each with its own success flag, data or error, and timing. Use it for fan-out work such as reading many files or describing many tools.",
+            brief_description="Execute many independent tool calls concurrently in one request",
+            category="tools",
+            tags=[
+                "batch",
+                "parallel",
+                "concurrent",
+                "bulk",
+                "tools",
+                "execute",
+            ],
+            parameters=[
+                ToolParameter(
+                    name="calls",
+                    type=ParameterType.ARRAY,
+                    description="Tool calls to execute, each an object with 'tool' (tool name) and 'parameters' (object of tool parameters)",
+                    required=True,
+                ),
+                ToolParameter(
+                    name="max_concurrency",
+                    type=ParameterType.INTEGER,
+                    description="Maximum number of calls running at once",
+                    default=8,
+                    min_value=1,
+                    max_value=32,
+                ),
+                ToolParameter(
+                    name="timeout",
+                    type=ParameterType.NUMBER,
+                    description="Deadline for the whole batch in seconds; unfinished calls are cancelled",
+                    default=60.0,
+                    min_value=0.001,
+                    max_value=600,
+                ),
+            ],
+        )
+
+    async def _call_tool(
+        self, call: BatchCallSpec, context: ToolContext
+    ) -> Result[Any]:
+        """Resolve a call through the registry and execute it."""
+        registry = context.registry
+        if registry is None:
+            return Result.error_result("Tool registry not available")
+
+        registration = registry.get_tool(call.tool)
+        if registration is None:
+            return Result.error_result(f"Tool '{call.tool}' not found")
+        if registration.name == self.metadata.name:
+            return Result.error_result(f"{self.metadata.name} calls cannot be nested")
+        if registration.status in (ToolStatus.DISABLED, ToolStatus.ERROR):
+            return Result.error_result(
+                f"Tool '{call.tool}' is {registration.status.value}"
+            )
+
+        # Prefer the server dispatcher so calls share admission control and
+        # caching. It serves each tool's latest version under its name, so
+        # calls pinned to an older version run that version directly.
+        if (
+            context.dispatcher is not None
+            and registry.get_tool(registration.name) is registration
+        ):
+            return cast(
+                Result[Any],
+                await context.dispatcher.call_tool(registration.name, call.parameters),
+            )
+
+        tool: BaseTool = registration.get_instance()
+        return await tool.run(
+            call.parameters, ToolContext(logger=context.logger, registry=registry)
+        )
+
+    def _format_entry(
+        self,
+        index: int,
+        call: BatchCallSpec,
+        result: Optional[Result[Any]],
+        duration: float,
+    ) -> Dict[str, Any]:
+        """Build the per-call entry of the batch result."""
+        entry: Dict[str, Any] = {"index": index, "tool": call.tool}
+        if result is not None and result.success:
+            entry["success"] = True
+            entry["data"] = result.data
+        else:
+            entry["success"] = False
+            entry["error"] = (
+                result.error if result is not None else "Tool returned no result"
+            )
+        entry["duration_ms"] = round(duration * 1000, 3)
+        return entry
+
+    @validate_parameters(BatchExecuteParams)
+    @handle_tool_error
+    async def execute(
+        self, params: BatchExecuteParams, context: ToolContext
+    ) -> Result[Any]:
+        """Execute the batch of tool calls."""
+        calls = params.calls
+        semaphore = asyncio.Semaphore(params.max_concurrency)
+        entries: List[Optional[Dict[str, Any]]] = [None] * len(calls)
+        started_at: List[Optional[float]] = [None] * len(calls)
+        batch_start = time.perf_counter()
+
+        async def run_call(index: int, call: BatchCallSpec) -> None:
+            async with semaphore:
+                started = started_at[index] = time.perf_counter()
+                try:
+                    result = await self._call_tool(call, context)
+                except Exception as e:
+                    result = Result.error_result(f"{type(e).__name__}: {e}")
+                entries[index] = self._format_entry(
+                    index, call, result, time.perf_counter() - started
+                )
+
+        tasks = [
+            asyncio.ensure_future(run_call(index, call))
+            for index, call in enumerate(calls)
+        ]
+        try:
+            await asyncio.wait(tasks, timeout=params.timeout)
+        finally:
+            for task in tasks:
+                if not task.done():
+                    task.cancel()
+            await asyncio.gather(*tasks, return_exceptions=True)
+
+        now = time.perf_counter()
+        timed_out = 0
+        for index, entry in enumerate(entries):
+            if entry is None:
+                timed_out += 1
+                started = started_at[index]
+                entries[index] = self._format_entry(
+                    index,
+                    calls[index],
+                    Result.error_result(
+                        f"Timed out after {params.timeout} seconds"
+                        + ("" if started is not None else " before starting")
+                    ),
+                    now - started if started is not None else 0.0,
+                )
+
+        succeeded = sum(1 for entry in entries if entry and entry["success"])
+        return Result[Any].success_result(
+            data={
+                "results": entries,
+                "total": len(calls),
+                "succeeded": succeeded,
+                "failed": len(calls) - succeeded,
+                "timed_out": timed_out,
+                "duration_ms": round((now - batch_start) * 1000, 3),
+            },
+            metadata={
+                "max_concurrency": params.max_concurrency,
+                "timeout": params.timeout,
+            },
+        )
+
+
+class ToolStatsTool(BaseTool):
+    """Tool for reporting call counts and latency percentiles of tools."""
+
+    @property
+    def metadata(self) -> ToolMetadata:
+        return ToolMetadata(
+            name="tool_stats",
+            description="Report usage statistics for tools served by this server: completed calls, successes and errors, calls currently in flight, and latency percentiles (p50, p95, p99) in milliseconds. Use it to find slow or failing tools and to see which tools are busy.",
+            brief_description="Report call counts and latency percentiles of tools",
+            category="tools",
+            tags=[
+                "stats",
+                "metrics",
+                "latency",
+                "performance",
+                "tools",
+                "monitoring",
+            ],
+            parameters=[
+                ToolParameter(
+                    name="tool_name",
+                    type=ParameterType.STRING,
+                    description="Report only this tool; all tools when omitted",
+                    required=False,
+                ),
+                ToolParameter(
+                    name="include_unused",
+                    type=ParameterType.BOOLEAN,
+                    description="Include tools that have not been called",
+                    default=False,
+                ),
+                ToolParameter(
+                    name="sort_by",
+                    type=ParameterType.STRING,
+                    description="Order tools by this statistic, highest first",
+                    default="calls",
+                    allowed_values=["calls", "errors", "p50", "p95", "p99"],
+                ),
+                ToolParameter(
+                    name="limit",
+                    type=ParameterType.INTEGER,
+                    description="Maximum number of tools to report",
+                    default=50,
+                    min_value=1,
+                    max_value=1000,
+                ),
+            ],
+        )
+
+    @validate_parameters(ToolStatsParams)
+    @handle_tool_error
+    async def execute(
+        self, params: ToolStatsParams, context: ToolContext
+    ) -> Result[Any]:
+        """Collect usage statistics from the registry."""
+        registry = cast(Optional[ToolRegistry], context.registry)
+        if registry is None:
+            raise ToolExecutionError("Tool registry not available")
+
+        stats = registry.get_tool_stats(params.tool_name)
+        if params.tool_name is not None and not stats:
+            raise ToolExecutionError(f"Tool '{params.tool_name}' not found")
+
+        tools = [
+            {"tool_id": tool_id, **entry}
+            for tool_id, entry in stats.items()
+            if params.include_unused
+            or params.tool_name is not None
+            or entry["calls"]
+            or entry["in_flight"]
+        ]
+
+        sort_by = params.sort_by
+        if sort_by in ("calls", "errors"):
+            tools.sort(key=lambda tool: tool[sort_by], reverse=True)
+        else:
+            tools.sort(key=lambda tool: tool["latency_ms"][sort_by], reverse=True)
+
+        return Result[Any].success_result(
+            data={
+                "tools": tools[: params.limit],
+                "total": len(tools),
+                "truncated": len(tools) > params.limit,
+            },
+            metadata={"sort_by": sort_by, "limit": params.limit},
+        )
+
+
+class SlowCallProfilesTool(BaseTool):
+    """Tool for retrieving profiles of slow tool calls."""
+
+    @property
+    def metadata(self) -> ToolMetadata:
+        return ToolMetadata(
+            name="slow_call_profiles",
+            description="List the cProfile profiles the server captured for recent tool calls that exceeded the slow call threshold (set with --profile-slow-ms), newest first, with each call's tool, parameter digest, duration and pstats file. Pass profile_id to get that call's most expensive functions by cumulative or self time.",
+            brief_description="List and summarize profiles of slow tool calls",
+            category="tools",
+            tags=[
+                "profile",
+                "profiling",
+                "slow",
+                "performance",
+                "tools",
+                "diagnostics",
+            ],
+            parameters=[
+                ToolParameter(
+                    name="tool_name",
+                    type=ParameterType.STRING,
+                    description="List only profiles of this tool",
+                    required=False,
+                ),
+                ToolParameter(
+                    name="profile_id",
+                    type=ParameterType.INTEGER,
+                    description="Summarize this profile's hottest functions",
+                    required=False,
+                    min_value=1,
+                ),
+                ToolParameter(
+                    name="sort_by",
+                    type=ParameterType.STRING,
+                    description="Rank functions by cumulative or self time",
+                    default="cumulative",
+                    allowed_values=["cumulative", "self"],
+                ),
+                ToolParameter(
+                    name="top",
+                    type=ParameterType.INTEGER,
+                    description="Number of functions to report",
+                    default=20,
+                    min_value=1,
+                    max_value=200,
+                ),
+            ],
+        )
+
+    @validate_parameters(SlowCallProfilesParams)
+    @handle_tool_error
+    async def execute(
+        self, params: SlowCallProfilesParams, context: ToolContext
+    ) -> Result[Any]:
+        """List captured profiles or summarize one of them."""
+        profiler = get_slow_call_profiler()
+        if profiler is None:
+            raise ToolExecutionError(
+                "Slow call profiling is not enabled; "
+                "start the server with --profile-slow-ms"
+            )
+
+        # Include the profiles of calls that just finished
+        await profiler.wait_for_writes()
+        threshold_ms = profiler.threshold_ns / 1e6
+        if params.profile_id is None:
+            profiles = profiler.profiles(params.tool_name)
+            return Result[Any].success_result(
+                data={
+                    "profiles": [record.to_dict() for record in profiles],
+                    "total": len(profiles),
+                },
+                metadata={"threshold_ms": threshold_ms, **profiler.stats},
+            )
+
+        record = profiler.get_profile(params.profile_id)
+        if record is None:
+            raise ToolExecutionError(
+                f"Profile {params.profile_id} not found; it may have been evicted"
+            )
+        try:
+            functions = record.top_functions(params.top, params.sort_by)
+        except OSError as e:
+            raise ToolExecutionError(f"Could not read profile {record.path}: {e}")
+
+        return Result[Any].success_result(
+            data={**record.to_dict(), "functions": functions},
+            metadata={"threshold_ms": threshold_ms, "sort_by": params.sort_by},
+        )
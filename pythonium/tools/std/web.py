@@ -3,19 +3,21 @@ Web operation tools for web search and internet-related functionality.
 
 This module provides web-based tools including web search using various search engines
 with robust HTML parsing and multiple fallback strategies, and HTTP client functionality.
+
+Each search strategy, the HTML parsing and the result formatting run in
+their own tracing span, so a slow search can be attributed to one of them.
 """
 
 import json
 import re
-from typing import Any, Dict, List, Optional, Union
+from typing import TYPE_CHECKING, Any, Dict, List, Optional, Union
 from urllib.parse import urlparse
 
-from bs4 import BeautifulSoup
-
 from pythonium.common.base import Result
 from pythonium.common.error_handling import handle_tool_error
 from pythonium.common.http import HttpService
 from pythonium.common.parameters import validate_parameters
+from pythonium.common.tracing import start_span
 from pythonium.tools.base import (
     BaseTool,
     ParameterType,
@@ -26,6 +28,9 @@ from pythonium.tools.base import (
 
 from .parameters import HttpRequestParams, WebSearchParams
 
+if TYPE_CHECKING:
+    from bs4 import BeautifulSoup
+
 
 class WebSearchTool(BaseTool):
     """Tool for performing web searches using various search engines."""
@@ -66,6 +71,8 @@ class WebSearchTool(BaseTool):
                 "citations",
                 "results-display",
             ],
+            cacheable=True,
+            cache_ttl=60.0,
             parameters=[
                 ToolParameter(
                     name="query",
@@ -185,9 +192,10 @@ class WebSearchTool(BaseTool):
         ]
 
         if valid_results:
-            formatted_content = self._format_search_results(
-                valid_results, parameters.query
-            )
+            with start_span("web_search.format"):
+                formatted_content = self._format_search_results(
+                    valid_results, parameters.query
+                )
             return Result[Any].success_result(
                 data=formatted_content,
                 metadata=self._create_success_metadata(
@@ -292,13 +300,17 @@ class WebSearchTool(BaseTool):
         errors: List[str],
     ) -> List[Dict[str, Any]]:
         """Try DuckDuckGo Lite search."""
-        try:
-            if context.progress_callback:
-                context.progress_callback("Searching web results")
-            return await self._search_duckduckgo_lite(params)
-        except Exception as e:
-            errors.append(f"Lite search failed: {str(e)}")
-            return []
+        with start_span("web_search.lite") as span:
+            try:
+                if context.progress_callback:
+                    context.progress_callback("Searching web results")
+                results = await self._search_duckduckgo_lite(params)
+                span.set_attribute("pythonium.search.results", len(results))
+                return results
+            except Exception as e:
+                errors.append(f"Lite search failed: {str(e)}")
+                span.record_error(str(e))
+                return []
 
     async def _try_fallback_searches(
         self,
@@ -322,13 +334,17 @@ class WebSearchTool(BaseTool):
         errors: List[str],
     ) -> List[Dict[str, Any]]:
         """Try DuckDuckGo HTML search."""
-        try:
-            if context.progress_callback:
-                context.progress_callback("Searching additional results")
-            return await self._search_duckduckgo_html(params, params.max_results)
-        except Exception as e:
-            errors.append(f"HTML search failed: {str(e)}")
-            return []
+        with start_span("web_search.html") as span:
+            try:
+                if context.progress_callback:
+                    context.progress_callback("Searching additional results")
+                results = await self._search_duckduckgo_html(params, params.max_results)
+                span.set_attribute("pythonium.search.results", len(results))
+                return results
+            except Exception as e:
+                errors.append(f"HTML search failed: {str(e)}")
+                span.record_error(str(e))
+                return []
 
     async def _try_api_search(
         self,
@@ -337,13 +353,17 @@ class WebSearchTool(BaseTool):
         errors: List[str],
     ) -> List[Dict[str, Any]]:
         """Try DuckDuckGo API search."""
-        try:
-            if context.progress_callback:
-                context.progress_callback("Searching for instant answers")
-            return await self._search_duckduckgo_instant(params)
-        except Exception as e:
-            errors.append(f"API search failed: {str(e)}")
-            return []
+        with start_span("web_search.instant_answer") as span:
+            try:
+                if context.progress_callback:
+                    context.progress_callback("Searching for instant answers")
+                results = await self._search_duckduckgo_instant(params)
+                span.set_attribute("pythonium.search.results", len(results))
+                return results
+            except Exception as e:
+                errors.append(f"API search failed: {str(e)}")
+                span.record_error(str(e))
+                return []
 
     def _raise_no_results_error(
         self, params: WebSearchParams, errors: List[str]
@@ -512,8 +532,11 @@ class WebSearchTool(BaseTool):
             if not html_content:
                 return []
 
-            soup = BeautifulSoup(html_content, "html.parser")
-            return self._parse_html_results(soup, params, limit)
+            with start_span("web_search.parse", {"pythonium.search.strategy": "html"}):
+                from bs4 import BeautifulSoup
+
+                soup = BeautifulSoup(html_content, "html.parser")
+                return self._parse_html_results(soup, params, limit)
 
         except Exception:
             return []
@@ -538,7 +561,7 @@ class WebSearchTool(BaseTool):
             return html_data
 
     def _parse_html_results(
-        self, soup: BeautifulSoup, params: WebSearchParams, limit: int
+        self, soup: "BeautifulSoup", params: WebSearchParams, limit: int
     ) -> List[Dict[str, Any]]:
         """Parse HTML soup to extract search results."""
         results: List[Dict[str, Any]] = []
@@ -621,8 +644,11 @@ class WebSearchTool(BaseTool):
             if not html_content:
                 return []
 
-            soup = BeautifulSoup(html_content, "html.parser")
-            return self._parse_lite_results(soup, params)
+            with start_span("web_search.parse", {"pythonium.search.strategy": "lite"}):
+                from bs4 import BeautifulSoup
+
+                soup = BeautifulSoup(html_content, "html.parser")
+                return self._parse_lite_results(soup, params)
 
         except Exception:
             return []
@@ -645,7 +671,7 @@ class WebSearchTool(BaseTool):
             return lite_data
 
     def _parse_lite_results(
-        self, soup: BeautifulSoup, params: WebSearchParams
+        self, soup: "BeautifulSoup", params: WebSearchParams
     ) -> List[Dict[str, Any]]:
         """Parse lite interface results."""
         results: List[Dict[str, Any]] = []
@@ -881,6 +907,8 @@ class HttpClientTool(BaseTool):
             brief_description="Make HTTP requests with enhanced functionality",
             category="network",
             tags=["http", "client", "web", "api", "request", "rest", "json"],
+            cacheable=True,  # GET requests only, see is_cacheable_call
+            cache_ttl=30.0,
             parameters=[
                 ToolParameter(
                     name="url",
@@ -933,6 +961,10 @@ class HttpClientTool(BaseTool):
             ],
         )
 
+    def is_cacheable_call(self, parameters: Dict[str, Any]) -> bool:
+        """Only GET requests are safe to serve from the result cache."""
+        return str(parameters.get("method", "")).upper() == "GET"
+
     def _is_valid_url(self, url: str) -> bool:
         """Validate if a URL is properly formatted and accessible."""
         if not url or len(url) < 7:  # Minimum for "http://"
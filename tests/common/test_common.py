@@ -7,6 +7,7 @@ from unittest.mock import patch
 
 import pytest
 
+from pythonium.common.base import Result, ResultModel
 from pythonium.common.config import PythoniumSettings, ServerSettings
 from pythonium.common.events import EventManager
 
@@ -212,6 +213,39 @@ class TestEventManager:
             await event_manager.shutdown()
 
 
+class TestResult:
+    """Test the slotted result container."""
+
+    def test_constructors_and_accessors(self):
+        ok = Result.success_result(data={"a": 1}, execution_time=0.5)
+        assert ok.success and ok.data == {"a": 1} and ok.metadata == {}
+        assert ok.get_data_or_raise() == {"a": 1}
+        assert ok == Result(success=True, data={"a": 1}, execution_time=0.5)
+
+        failed = Result.error_result("boom", metadata={"code": 2})
+        assert not failed.success and failed.error == "boom"
+        with pytest.raises(RuntimeError, match="boom"):
+            failed.get_data_or_raise()
+        with pytest.raises(RuntimeError, match="data is None"):
+            Result.success_result().get_data_or_raise()
+
+    def test_slots_and_serialization(self):
+        result = Result.success_result(data=[1, 2], metadata={"k": "v"})
+        assert not hasattr(result, "__dict__")
+
+        model = result.to_model()
+        assert isinstance(model, ResultModel)
+        assert result.model_dump() == model.model_dump()
+        assert result.model_dump() == {
+            "success": True,
+            "data": [1, 2],
+            "error": None,
+            "metadata": {"k": "v"},
+            "execution_time": None,
+        }
+        assert Result.from_model(model) == result
+
+
 class TestAsyncUtilities:
     """Test async utility functions."""
 
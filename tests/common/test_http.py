@@ -392,3 +392,36 @@ class TestHttpServiceEdgeCases:
             mock_client_class.assert_called_once()
             client_call = mock_client_class.call_args
             assert client_call.kwargs["verify"] is False
+
+    @pytest.mark.asyncio
+    async def test_pool_stats_count_requests_retries_and_errors(self):
+        """Request counters are shared by all services and exported as pool stats."""
+        service = HttpService(retries=1, retry_delay=0)
+        before = HttpService.get_pool_stats()
+
+        with patch.object(service, "_ensure_client") as mock_ensure_client:
+            mock_client = AsyncMock()
+            mock_client.request = AsyncMock(side_effect=httpx.ConnectError("down"))
+            mock_ensure_client.return_value = mock_client
+
+            result = await service.get("https://api.example.com/data")
+
+        after = HttpService.get_pool_stats()
+        assert not result.success
+        assert after["requests"] - before["requests"] == 1
+        assert after["retries"] - before["retries"] == 1
+        assert after["request_errors"] - before["request_errors"] == 1
+        assert after["in_flight"] == before["in_flight"]
+
+    @pytest.mark.asyncio
+    async def test_pool_stats_track_open_clients(self):
+        """Services with an open client are counted until closed."""
+        service = HttpService()
+        open_before = HttpService.get_pool_stats()["open_clients"]
+
+        await service._ensure_client()
+        assert HttpService.get_pool_stats()["open_clients"] == open_before + 1
+        assert HttpService.get_pool_stats()["connections"] >= 0
+
+        await service.close()
+        assert HttpService.get_pool_stats()["open_clients"] == open_before
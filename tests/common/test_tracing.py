@@ -0,0 +1,203 @@
+"""
+Tests for tool call tracing and the OTLP/JSON file exporter.
+"""
+
+import json
+import threading
+from unittest.mock import AsyncMock, patch
+
+import httpx
+import pytest
+
+from pythonium.common.base import Result
+from pythonium.common.http import HttpService
+from pythonium.common.tracing import (
+    NOOP_SPAN,
+    STATUS_CODE_ERROR,
+    JsonFileSpanExporter,
+    Tracer,
+    get_current_span,
+    get_tracer,
+    set_tracer,
+    start_span,
+)
+from pythonium.core.server import PythoniumMCPServer
+from pythonium.tools.base import BaseTool, ToolMetadata, iterate_in_thread
+
+
+class SpanningTool(BaseTool):
+    """Opens a child span in the event loop and one in a worker thread."""
+
+    @property
+    def metadata(self):
+        return ToolMetadata(name="spanning", description="spanning", category="test")
+
+    async def execute(self, params, context):
+        with start_span("child", {"depth": 1}):
+            pass
+
+        def walk(emit):
+            with start_span("threaded"):
+                emit("partial")
+            return "done"
+
+        items = [item async for item in iterate_in_thread(walk)]
+        return Result.success_result(items[-1])
+
+
+@pytest.fixture
+def trace_file(tmp_path):
+    path = tmp_path / "traces.jsonl"
+    tracer = Tracer(JsonFileSpanExporter(path))
+    set_tracer(tracer)
+    yield path
+    set_tracer(None)
+    tracer.shutdown()
+
+
+def read_spans(path):
+    tracer = get_tracer()
+    if tracer is not None:
+        tracer.flush()
+    spans = []
+    for line in path.read_text().splitlines():
+        request = json.loads(line)
+        for resource_spans in request["resourceSpans"]:
+            for scope_spans in resource_spans["scopeSpans"]:
+                spans.extend(scope_spans["spans"])
+    return {span["name"]: span for span in spans}
+
+
+def attributes(span):
+    return {item["key"]: item["value"] for item in span["attributes"]}
+
+
+def test_disabled_tracing_returns_shared_noop_span():
+    with start_span("anything", {"key": "value"}) as span:
+        span.set_attribute("other", 1)
+        span.record_error("ignored")
+        assert span is NOOP_SPAN
+        assert get_current_span() is None
+
+
+def test_spans_nest_and_export_in_batches(trace_file):
+    with start_span("root") as root:
+        with start_span("child", {"count": 3, "ratio": 0.5, "ok": True}):
+            assert get_current_span().parent_span_id == root.span_id
+        with pytest.raises(ValueError):
+            with start_span("failing"):
+                raise ValueError("boom")
+    assert get_current_span() is None
+    # Buffered across traces until the batch fills or the interval passes
+    assert not trace_file.exists()
+
+    get_tracer().flush()
+    lines = trace_file.read_text().splitlines()
+    assert len(lines) == 1
+    request = json.loads(lines[0])
+    resource = request["resourceSpans"][0]["resource"]
+    assert attributes(resource)["service.name"] == {"stringValue": "pythonium"}
+
+    spans = read_spans(trace_file)
+    assert "parentSpanId" not in spans["root"]
+    assert spans["child"]["parentSpanId"] == spans["root"]["spanId"]
+    assert {span["traceId"] for span in spans.values()} == {root.trace_id}
+    assert attributes(spans["child"]) == {
+        "count": {"intValue": "3"},
+        "ratio": {"doubleValue": 0.5},
+        "ok": {"boolValue": True},
+    }
+    assert spans["failing"]["status"] == {
+        "code": STATUS_CODE_ERROR,
+        "message": "ValueError: boom",
+    }
+    assert int(spans["root"]["endTimeUnixNano"]) >= int(
+        spans["root"]["startTimeUnixNano"]
+    )
+
+
+class RecordingExporter:
+    def __init__(self):
+        self.batches = []
+        self.exported = threading.Event()
+
+    def export(self, spans):
+        self.batches.append(([span.name for span in spans], threading.get_ident()))
+        self.exported.set()
+
+
+def test_full_batches_export_off_the_calling_thread():
+    exporter = RecordingExporter()
+    tracer = Tracer(exporter, max_batch_size=2, export_interval=60)
+    set_tracer(tracer)
+    try:
+        for name in ("first", "second"):
+            with start_span(name):
+                pass
+        assert exporter.exported.wait(5)
+        with start_span("third"):
+            pass
+    finally:
+        set_tracer(None)
+        tracer.shutdown()
+
+    (names, thread_id), *rest = exporter.batches
+    assert names == ["first", "second"]
+    assert thread_id != threading.get_ident()
+    # Shutdown exports what is still buffered
+    assert [names for names, _ in rest] == [["third"]]
+
+    # Spans ending after shutdown are exported as they end
+    tracer.start_span("late").end()
+    assert exporter.batches[-1][0] == ["late"]
+
+
+@pytest.mark.asyncio
+async def test_tool_call_span_parents_spans_in_tool_and_threads(trace_file):
+    server = PythoniumMCPServer()
+    server.register_tool(SpanningTool())
+
+    function = server._dispatch_plans["spanning"].build_function()
+    assert await function() == "done"
+
+    spans = read_spans(trace_file)
+    call = spans["execute_tool spanning"]
+    assert attributes(call)["gen_ai.tool.name"] == {"stringValue": "spanning"}
+    assert "pythonium.phase.execute_ns" in attributes(call)
+    assert spans["child"]["parentSpanId"] == call["spanId"]
+    assert spans["threaded"]["parentSpanId"] == call["spanId"]
+
+
+@pytest.mark.asyncio
+async def test_http_request_span_records_failure(trace_file):
+    service = HttpService(retries=1, retry_delay=0)
+
+    with patch.object(service, "_ensure_client") as mock_ensure_client:
+        mock_client = AsyncMock()
+        mock_client.request = AsyncMock(side_effect=httpx.ConnectError("down"))
+        mock_ensure_client.return_value = mock_client
+
+        result = await service.get("https://api.example.com/data")
+
+    assert not result.success
+    span = read_spans(trace_file)["HTTP GET"]
+    assert span["status"]["code"] == STATUS_CODE_ERROR
+    assert attributes(span)["url.full"] == {
+        "stringValue": "https://api.example.com/data"
+    }
+    assert attributes(span)["pythonium.http.attempts"] == {"intValue": "2"}
+
+
+@pytest.mark.asyncio
+async def test_server_installs_tracer_from_trace_file_setting(tmp_path):
+    path = tmp_path / "server.jsonl"
+    server = PythoniumMCPServer(config_overrides={"server": {"trace_file": str(path)}})
+    server._start_tracing()
+    try:
+        server.register_tool(SpanningTool())
+        await server.call_tool("spanning", {})
+    finally:
+        server._stop_tracing()
+
+    assert start_span("after") is NOOP_SPAN
+    assert "execute_tool spanning" in read_spans(path)
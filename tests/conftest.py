@@ -6,6 +6,7 @@ used across all test modules in the Pythonium project.
 """
 
 import asyncio
+import os
 import tempfile
 from pathlib import Path
 from typing import Any, Dict, Generator, Optional
@@ -15,6 +16,18 @@ import pytest
 from pydantic import BaseModel
 
 
+@pytest.fixture(scope="session", autouse=True)
+def isolated_cache_dir(tmp_path_factory):
+    """Keep tool manifests written by servers under test out of the user cache."""
+    previous = os.environ.get("XDG_CACHE_HOME")
+    os.environ["XDG_CACHE_HOME"] = str(tmp_path_factory.mktemp("cache"))
+    yield
+    if previous is None:
+        os.environ.pop("XDG_CACHE_HOME", None)
+    else:
+        os.environ["XDG_CACHE_HOME"] = previous
+
+
 @pytest.fixture
 def mock_tool_registry():
     """Create a mock tool registry."""
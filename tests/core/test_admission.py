@@ -0,0 +1,146 @@
+import asyncio
+
+import pytest
+
+from pythonium.common.base import Result
+from pythonium.common.config import ToolSettings
+from pythonium.core.admission import (
+    AdmissionController,
+    AdmissionError,
+    ConcurrencyGate,
+)
+from pythonium.core.dispatch import ToolDispatchPlan
+from pythonium.tools.base import BaseTool, ParameterType, ToolMetadata, ToolParameter
+
+
+class BlockingTool(BaseTool):
+    def __init__(self):
+        super().__init__()
+        self.release = asyncio.Event()
+
+    @property
+    def metadata(self):
+        return ToolMetadata(
+            name="blocking",
+            description="blocking",
+            category="test",
+            max_concurrency=1,
+            parameters=[
+                ToolParameter(
+                    name="x", type=ParameterType.INTEGER, description="x", required=True
+                )
+            ],
+        )
+
+    async def execute(self, params, context):
+        await self.release.wait()
+        return Result.success_result(params["x"])
+
+
+@pytest.mark.asyncio
+async def test_gate_limits_concurrency_and_records_wait():
+    gate = ConcurrencyGate("test", limit=1, max_queue=4)
+    await gate.acquire(1.0)
+
+    waiter = asyncio.create_task(gate.acquire(1.0))
+    await asyncio.sleep(0.01)
+    assert gate.get_stats()["queue_depth"] == 1
+
+    gate.release()
+    wait_time = await waiter
+    assert wait_time > 0
+
+    stats = gate.get_stats()
+    assert stats["in_flight"] == 1
+    assert stats["peak_in_flight"] == 1
+    assert stats["queued"] == 1
+    assert stats["queue_depth"] == 0
+    assert stats["max_wait_time"] == wait_time
+    gate.release()
+
+
+@pytest.mark.asyncio
+async def test_gate_rejects_when_queue_full():
+    gate = ConcurrencyGate("test", limit=1, max_queue=0)
+    await gate.acquire(1.0)
+
+    with pytest.raises(AdmissionError) as exc_info:
+        await gate.acquire(1.0)
+
+    assert exc_info.value.details["reason"] == "queue_full"
+    assert gate.get_stats()["rejected"] == 1
+    gate.release()
+
+
+@pytest.mark.asyncio
+async def test_gate_times_out_in_queue():
+    gate = ConcurrencyGate("test", limit=1, max_queue=1)
+    await gate.acquire(1.0)
+
+    with pytest.raises(AdmissionError) as exc_info:
+        await gate.acquire(0.01)
+
+    assert exc_info.value.details["reason"] == "queue_timeout"
+    stats = gate.get_stats()
+    assert stats["timed_out"] == 1
+    assert stats["queue_depth"] == 0
+    gate.release()
+
+
+@pytest.mark.asyncio
+async def test_unlimited_gate_never_queues():
+    gate = ConcurrencyGate("test", limit=0, max_queue=0)
+    for _ in range(10):
+        await gate.acquire(0.01)
+    assert gate.get_stats()["in_flight"] == 10
+
+
+@pytest.mark.asyncio
+async def test_controller_releases_tool_slot_when_global_rejects():
+    controller = AdmissionController(
+        max_concurrent_calls=1,
+        max_concurrent_calls_per_tool=2,
+        max_queued_calls=0,
+    )
+    first = controller.configure_tool("a")
+    second = controller.configure_tool("b")
+
+    await controller.acquire(first)
+    with pytest.raises(AdmissionError):
+        await controller.acquire(second)
+
+    stats = controller.get_stats()
+    assert stats["tools"]["b"]["in_flight"] == 0
+    assert stats["global"]["in_flight"] == 1
+
+    controller.release(first)
+    assert controller.get_stats()["global"]["in_flight"] == 0
+
+
+def test_controller_settings_and_metadata_override():
+    settings = ToolSettings(max_concurrent_calls=10, max_concurrent_calls_per_tool=3)
+    controller = AdmissionController.from_settings(settings)
+
+    assert controller.global_gate.limit == 10
+    assert controller.configure_tool("default").limit == 3
+    assert controller.configure_tool("override", limit=1).limit == 1
+
+
+@pytest.mark.asyncio
+async def test_dispatch_plan_applies_metadata_limit():
+    controller = AdmissionController(
+        max_concurrent_calls_per_tool=8, max_queued_calls=0
+    )
+    tool = BlockingTool()
+    plan = ToolDispatchPlan(tool, admission=controller)
+    assert plan.gate.limit == 1
+
+    running = asyncio.create_task(plan.dispatch((), {"x": 1}))
+    await asyncio.sleep(0.01)
+
+    with pytest.raises(AdmissionError):
+        await plan.dispatch((), {"x": 2})
+
+    tool.release.set()
+    assert await running == 1
+    assert controller.get_stats()["tools"]["blocking"]["in_flight"] == 0
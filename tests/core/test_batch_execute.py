@@ -0,0 +1,217 @@
+"""
+Test the BatchExecuteTool functionality.
+"""
+
+import asyncio
+
+import pytest
+
+from pythonium.common.base import Result
+from pythonium.core.server import PythoniumMCPServer
+from pythonium.core.tools.registry import ToolRegistry, ToolStatus
+from pythonium.tools.base import (
+    BaseTool,
+    ParameterType,
+    ToolContext,
+    ToolMetadata,
+    ToolParameter,
+)
+from pythonium.tools.std.tool_ops import BatchExecuteTool
+
+
+class SleepTool(BaseTool):
+    """Sleeps for the requested time and tracks concurrency."""
+
+    running = 0
+    peak = 0
+
+    @property
+    def metadata(self):
+        return ToolMetadata(
+            name="sleep",
+            description="sleep",
+            category="test",
+            parameters=[
+                ToolParameter(
+                    name="seconds",
+                    type=ParameterType.NUMBER,
+                    description="seconds",
+                    required=True,
+                ),
+                ToolParameter(
+                    name="label",
+                    type=ParameterType.STRING,
+                    description="label",
+                    default="",
+                ),
+            ],
+        )
+
+    async def execute(self, params, context):
+        cls = type(self)
+        cls.running += 1
+        cls.peak = max(cls.peak, cls.running)
+        try:
+            await asyncio.sleep(params["seconds"])
+        finally:
+            cls.running -= 1
+        if params["label"] == "fail":
+            return Result.error_result("asked to fail")
+        return Result.success_result(params["label"])
+
+
+@pytest.fixture
+def server():
+    SleepTool.running = SleepTool.peak = 0
+    server = PythoniumMCPServer()
+    server.register_tools([SleepTool(), BatchExecuteTool()])
+    return server
+
+
+@pytest.fixture
+def context(server):
+    return ToolContext(registry=server.tool_registry, dispatcher=server)
+
+
+def sleep_call(seconds, label=""):
+    return {"tool": "sleep", "parameters": {"seconds": seconds, "label": label}}
+
+
+@pytest.mark.asyncio
+async def test_results_are_returned_in_call_order(context):
+    calls = [sleep_call(0.05 - i * 0.01, f"call-{i}") for i in range(5)]
+    result = await BatchExecuteTool().execute({"calls": calls}, context)
+
+    assert result.success
+    assert [entry["data"] for entry in result.data["results"]] == [
+        f"call-{i}" for i in range(5)
+    ]
+    assert [entry["index"] for entry in result.data["results"]] == list(range(5))
+    assert all(entry["duration_ms"] > 0 for entry in result.data["results"])
+    assert result.data["succeeded"] == 5
+
+
+@pytest.mark.asyncio
+async def test_concurrency_is_capped(context):
+    calls = [sleep_call(0.02) for _ in range(10)]
+    result = await BatchExecuteTool().execute(
+        {"calls": calls, "max_concurrency": 3}, context
+    )
+
+    assert result.data["succeeded"] == 10
+    assert SleepTool.peak == 3
+
+
+@pytest.mark.asyncio
+async def test_errors_are_reported_per_call(context, server):
+    server.tool_registry.update_tool_status("sleep", ToolStatus.DISABLED)
+    disabled = await BatchExecuteTool().execute({"calls": [sleep_call(0)]}, context)
+    assert "disabled" in disabled.data["results"][0]["error"]
+    server.tool_registry.update_tool_status("sleep", ToolStatus.ACTIVE)
+
+    calls = [
+        sleep_call(0, "ok"),
+        sleep_call(0, "fail"),
+        {"tool": "missing"},
+        {"tool": "sleep", "parameters": {"bogus": 1}},
+        {"tool": "batch_execute", "parameters": {"calls": []}},
+    ]
+    result = await BatchExecuteTool().execute({"calls": calls}, context)
+    entries = result.data["results"]
+
+    assert result.success
+    assert entries[0] == {
+        "index": 0,
+        "tool": "sleep",
+        "success": True,
+        "data": "ok",
+        "duration_ms": entries[0]["duration_ms"],
+    }
+    assert entries[1]["error"] == "asked to fail"
+    assert "not found" in entries[2]["error"]
+    assert "Invalid parameters" in entries[3]["error"]
+    assert "cannot be nested" in entries[4]["error"]
+    assert result.data["failed"] == 4
+
+
+@pytest.mark.asyncio
+async def test_deadline_cancels_unfinished_calls(context):
+    calls = [sleep_call(0, "fast"), sleep_call(10), sleep_call(10)]
+    result = await BatchExecuteTool().execute(
+        {"calls": calls, "max_concurrency": 1, "timeout": 0.1}, context
+    )
+    entries = result.data["results"]
+
+    assert entries[0]["success"]
+    assert entries[1]["error"] == "Timed out after 0.1 seconds"
+    assert entries[2]["error"] == "Timed out after 0.1 seconds before starting"
+    assert result.data["timed_out"] == 2
+    assert result.data["duration_ms"] < 5000
+    assert SleepTool.running == 0
+
+
+class SleepToolV2(SleepTool):
+    @property
+    def metadata(self):
+        return super().metadata.model_copy(update={"version": "2.0.0"})
+
+    async def execute(self, params, context):
+        return Result.success_result(f"v2 {params['label']}")
+
+
+@pytest.mark.asyncio
+async def test_calls_resolve_registered_versions(server, context):
+    server.register_tool(SleepToolV2())
+    assert server.tool_registry.get_tool("sleep").tool_id == "sleep@2.0.0"
+
+    result = await BatchExecuteTool().execute(
+        {
+            "calls": [
+                sleep_call(0, "a"),
+                {"tool": "sleep@<2", "parameters": {"seconds": 0, "label": "b"}},
+            ]
+        },
+        context,
+    )
+    assert [entry["data"] for entry in result.data["results"]] == ["v2 a", "b"]
+
+
+@pytest.mark.asyncio
+async def test_runs_tools_from_registry_without_dispatcher():
+    registry = ToolRegistry()
+    registry.register_tool(SleepTool)
+
+    result = await BatchExecuteTool().execute(
+        {"calls": [sleep_call(0, "a"), sleep_call(0, "b")]},
+        ToolContext(registry=registry),
+    )
+    assert [entry["data"] for entry in result.data["results"]] == ["a", "b"]
+
+
+@pytest.mark.asyncio
+async def test_invalid_batch_is_rejected(context):
+    result = await BatchExecuteTool().execute({"calls": []}, context)
+    assert not result.success
+    assert "validation failed" in result.error
+
+
+@pytest.mark.asyncio
+async def test_nested_calls_do_not_wait_for_the_callers_global_slot():
+    server = PythoniumMCPServer(
+        config_overrides={"tools": {"max_concurrent_calls": 1, "queue_timeout": 2}}
+    )
+    server.register_tools([SleepTool(), BatchExecuteTool()])
+
+    result = await asyncio.wait_for(
+        server.call_tool(
+            "batch_execute", {"calls": [sleep_call(0, "a"), sleep_call(0, "b")]}
+        ),
+        timeout=1,
+    )
+
+    assert result.success
+    assert result.data["succeeded"] == 2
+    stats = server.admission.get_stats()
+    assert stats["global"]["admitted"] == 1
+    assert stats["global"]["in_flight"] == 0
+    assert stats["tools"]["sleep"]["admitted"] == 2
@@ -0,0 +1,141 @@
+"""Tests for the single-pass discovery walker."""
+
+import sys
+import uuid
+
+import pytest
+
+from pythonium.core.tools.discovery import (
+    MODULE_SCAN,
+    PACKAGE_SCAN,
+    ToolDiscoveryManager,
+)
+from pythonium.core.tools.manifest import ToolManifest
+
+TOOL_MODULE = """
+from pythonium.common.base import Result
+from pythonium.tools.base import BaseTool, ToolMetadata
+
+
+class {class_name}(BaseTool):
+    @property
+    def metadata(self):
+        return ToolMetadata(name="{tool_name}", description="d", category="test")
+
+    async def execute(self, parameters, context):
+        return Result.success_result("ok")
+"""
+
+
+@pytest.fixture
+def search_paths(tmp_path):
+    """Two search paths whose packages overlap by name."""
+    prefix = f"walk_{uuid.uuid4().hex[:8]}"
+    first = tmp_path / "first"
+    second = tmp_path / "second"
+
+    package = first / prefix
+    (package / "nested").mkdir(parents=True)
+    (package / "__init__.py").write_text("")
+    (package / "nested" / "__init__.py").write_text("")
+    (package / "beta.py").write_text(
+        TOOL_MODULE.format(class_name="BetaTool", tool_name="beta")
+    )
+    (package / "alpha.py").write_text("VALUE = 1\n")
+    (package / "nested" / "gamma.py").write_text(
+        TOOL_MODULE.format(class_name="GammaTool", tool_name="gamma")
+    )
+    (first / ".hidden").mkdir()
+    (first / ".hidden" / "ignored.py").write_text("")
+
+    # Shadowed by the first search path
+    (second / prefix).mkdir(parents=True)
+    (second / prefix / "__init__.py").write_text("")
+    (second / prefix / "beta.py").write_text(
+        TOOL_MODULE.format(class_name="ShadowedTool", tool_name="shadowed")
+    )
+
+    yield [first, second], prefix
+
+    for module_name in list(sys.modules):
+        if module_name.startswith(prefix):
+            sys.modules.pop(module_name)
+
+
+def make_manager(paths, **kwargs):
+    manager = ToolDiscoveryManager(**kwargs)
+    manager.search_paths = list(paths)
+    return manager
+
+
+def test_candidates_are_collected_once_in_order(search_paths):
+    paths, prefix = search_paths
+    candidates = make_manager(paths)._collect_candidates()
+
+    assert [(c.module_name, c.discovery_method) for c in candidates] == [
+        (prefix, PACKAGE_SCAN),
+        (f"{prefix}.alpha", MODULE_SCAN),
+        (f"{prefix}.beta", MODULE_SCAN),
+        (f"{prefix}.nested", PACKAGE_SCAN),
+        (f"{prefix}.nested.gamma", MODULE_SCAN),
+    ]
+    assert all(c.search_path == paths[0] for c in candidates)
+
+
+def test_discovery_is_reproducible(search_paths):
+    paths, prefix = search_paths
+    first = make_manager(paths).discover_tools()
+    second = make_manager(paths).discover_tools()
+
+    assert list(first) == list(second) == ["BetaTool", "GammaTool"]
+    assert "ShadowedTool" not in first
+
+
+def test_prescreen_skips_modules_without_tool_classes(search_paths, tmp_path):
+    paths, prefix = search_paths
+    manifest = ToolManifest(tmp_path / "manifest.json")
+    manager = make_manager(paths, manifest=manifest, prescreen=True)
+    tools = manager.discover_tools()
+
+    assert sorted(tools) == ["BetaTool", "GammaTool"]
+    assert f"{prefix}.alpha" not in sys.modules
+    assert manager.module_reports[f"{prefix}.alpha"]["status"] == "skipped"
+
+    # Prescreen verdicts are not remembered
+    entries = ToolManifest.load(manifest.path).entries
+    assert f"{prefix}.alpha" not in {entry.module_name for entry in entries.values()}
+
+
+def test_prescreen_misses_are_found_without_it(search_paths, tmp_path):
+    paths, prefix = search_paths
+    (paths[0] / prefix / "delta.py").write_text(
+        TOOL_MODULE.format(class_name="Delta", tool_name="delta").replace(
+            "class Delta(BaseTool)", "Base = BaseTool\n\n\nclass Delta(Base)"
+        )
+    )
+    manifest_path = tmp_path / "manifest.json"
+
+    screened = make_manager(
+        paths, manifest=ToolManifest.load(manifest_path), prescreen=True
+    )
+    assert "Delta" not in screened.discover_tools()
+
+    unscreened = make_manager(paths, manifest=ToolManifest.load(manifest_path))
+    assert "Delta" in unscreened.discover_tools()
+
+
+def test_report_includes_module_import_times(search_paths):
+    paths, prefix = search_paths
+    manager = make_manager(paths)
+    manager.exclude_module("nested")
+    manager.discover_tools()
+    report = manager.export_discovery_report()
+
+    modules = {module["module_name"]: module for module in report["modules"]}
+    assert list(modules) == [prefix, f"{prefix}.alpha", f"{prefix}.beta"]
+    assert modules[f"{prefix}.beta"]["status"] == "imported"
+    assert modules[f"{prefix}.beta"]["tools"] == 1
+    assert all(module["import_ms"] >= 0 for module in modules.values())
+    assert report["import_time_ms"] == pytest.approx(
+        sum(module["import_ms"] for module in modules.values()), abs=0.01
+    )
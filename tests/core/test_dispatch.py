@@ -0,0 +1,156 @@
+import inspect
+
+import pytest
+
+from pythonium.common.base import Result
+from pythonium.common.parameters import (
+    ParameterModel,
+    compile_validator,
+    validate_parameters,
+)
+from pythonium.common.timing import TIMING_METADATA_KEY, set_timing_sink
+from pythonium.core.dispatch import ToolDispatchPlan, map_parameter_type
+from pythonium.tools.base import BaseTool, ParameterType, ToolMetadata, ToolParameter
+
+
+class EchoTool(BaseTool):
+    def __init__(self):
+        super().__init__()
+        self.contexts = []
+
+    @property
+    def metadata(self):
+        return ToolMetadata(
+            name="echo",
+            description="echo",
+            category="test",
+            parameters=[
+                ToolParameter(
+                    name="x", type=ParameterType.INTEGER, description="x", required=True
+                ),
+                ToolParameter(
+                    name="y",
+                    type=ParameterType.STRING,
+                    description="y",
+                    default="d",
+                ),
+            ],
+        )
+
+    async def execute(self, params, context):
+        self.contexts.append(context)
+        if params["x"] < 0:
+            return Result.error_result("negative")
+        return Result.success_result(dict(params))
+
+
+def test_plan_precomputes_signature_and_defaults():
+    plan = ToolDispatchPlan(EchoTool())
+    assert list(plan.signature.parameters) == ["x", "y"]
+    assert plan.defaults == {"y": "d"}
+    assert plan.required_names == {"x"}
+    assert plan.annotations == {"x": int, "y": str}
+    assert map_parameter_type(ParameterType.URL) is str
+
+
+def test_bind_arguments_fast_path_and_fallback():
+    plan = ToolDispatchPlan(EchoTool())
+    assert plan.bind_arguments((), {"x": 1}) == {"x": 1, "y": "d"}
+    assert plan.bind_arguments((2,), {}) == {"x": 2, "y": "d"}
+    assert plan.bind_arguments((), {"x": 3, "y": "z"}) == {"x": 3, "y": "z"}
+    with pytest.raises(TypeError):
+        plan.bind_arguments((), {"y": "missing x"})
+    with pytest.raises(TypeError):
+        plan.bind_arguments((), {"x": 1, "unknown": True})
+
+
+@pytest.mark.asyncio
+async def test_built_function_dispatches_with_fresh_context():
+    tool = EchoTool()
+    registry = object()
+    plan = ToolDispatchPlan(tool, registry=registry)
+    func = plan.build_function()
+
+    assert func.__name__ == "echo"
+    assert inspect.signature(func) == plan.signature
+
+    assert await func(x=1) == {"x": 1, "y": "d"}
+    assert await func(x=2) == {"x": 2, "y": "d"}
+    assert tool.contexts[0] is not tool.contexts[1]
+    assert tool.contexts[0].logger is plan.logger
+    assert tool.contexts[0].registry is registry
+
+    with pytest.raises(Exception, match="negative"):
+        await func(x=-1)
+
+
+class EchoParams(ParameterModel):
+    x: int
+    y: str = "d"
+
+
+class ValidatedEchoTool(EchoTool):
+    def __init__(self):
+        super().__init__()
+        self.received = []
+
+    @validate_parameters(EchoParams)
+    async def execute(self, params, context):
+        self.received.append(params)
+        return Result.success_result(params.model_dump())
+
+
+@pytest.mark.asyncio
+async def test_plan_validates_once_and_passes_instance_to_tool(monkeypatch):
+    tool = ValidatedEchoTool()
+    plan = ToolDispatchPlan(tool)
+    assert plan.parameter_model is EchoParams
+
+    calls = []
+    original = EchoParams.__pydantic_validator__
+
+    class CountingValidator:
+        def validate_python(self, value):
+            calls.append(value)
+            return original.validate_python(value)
+
+    monkeypatch.setattr(EchoParams, "__pydantic_validator__", CountingValidator())
+    compile_validator.cache_clear()
+    try:
+        func = plan.build_function()
+        assert await func(x="5") == {"x": 5, "y": "d"}
+    finally:
+        compile_validator.cache_clear()
+
+    assert len(calls) == 1
+    assert isinstance(tool.received[0], EchoParams)
+
+
+@pytest.mark.asyncio
+async def test_plan_rejects_invalid_parameters_before_execute():
+    tool = ValidatedEchoTool()
+    plan = ToolDispatchPlan(tool)
+
+    result = await plan.invoke({"x": "not a number", "y": "d"})
+
+    assert not result.success
+    assert "Parameter validation failed" in result.error
+    assert tool.received == []
+
+
+@pytest.mark.asyncio
+async def test_dispatch_times_each_phase_and_feeds_sink():
+    plan = ToolDispatchPlan(ValidatedEchoTool())
+    recorded = []
+    set_timing_sink(lambda name, phases: recorded.append((name, phases)))
+    try:
+        assert await plan.build_function()(x=1) == {"x": 1, "y": "d"}
+        nested = await plan.invoke({"x": 2, "y": "d"})
+    finally:
+        set_timing_sink(None)
+
+    (name, phases), (_, nested_phases) = recorded
+    assert name == "echo"
+    assert set(phases) == {"validation", "execute", "unwrap"}
+    assert set(nested_phases) == {"validation", "execute"}
+    assert nested.metadata[TIMING_METADATA_KEY] == nested_phases
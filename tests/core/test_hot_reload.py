@@ -0,0 +1,224 @@
+"""Tests for incremental tool hot reload."""
+
+import asyncio
+import sys
+import uuid
+
+import pytest
+
+from pythonium.common.exceptions import PythoniumError
+from pythonium.core.server import PythoniumMCPServer
+from pythonium.core.tools.discovery import ToolDiscoveryManager
+from pythonium.core.tools.watcher import ToolWatcher, diff_snapshots, take_snapshot
+from pythonium.tools.std.tool_ops import DescribeToolTool
+
+TOOL_MODULE = """
+from pythonium.common.base import Result
+from pythonium.tools.base import BaseTool, ToolMetadata
+
+
+class {class_name}(BaseTool):
+    @property
+    def metadata(self):
+        return ToolMetadata(name="{tool_name}", description="{description}", category="hot")
+
+    async def execute(self, parameters, context):
+        return Result.success_result("{description}")
+"""
+
+
+def tool_source(class_name, tool_name, description="v1"):
+    return TOOL_MODULE.format(
+        class_name=class_name, tool_name=tool_name, description=description
+    )
+
+
+@pytest.fixture
+def plugin_dir(tmp_path):
+    """A search path with one plugin module."""
+    module_name = f"hotplugin_{uuid.uuid4().hex[:8]}"
+    plugins = tmp_path / "plugins"
+    plugins.mkdir()
+    (plugins / f"{module_name}.py").write_text(tool_source("AlphaTool", "alpha"))
+
+    yield plugins, module_name
+
+    for name in list(sys.modules):
+        if name.startswith(("hotplugin_", "hotextra_")):
+            sys.modules.pop(name)
+
+
+def make_manager(plugins):
+    manager = ToolDiscoveryManager()
+    manager.search_paths = [plugins]
+    manager.discover_tools()
+    return manager
+
+
+class TestReloadModules:
+    def test_changed_module_is_diffed(self, plugin_dir):
+        plugins, module_name = plugin_dir
+        manager = make_manager(plugins)
+        old_class = manager.discovered_tools["AlphaTool"].tool_class
+
+        (plugins / f"{module_name}.py").write_text(
+            tool_source("AlphaTool", "alpha", "v2")
+            + tool_source("BetaTool", "beta").split("\n\n\n", 1)[1]
+        )
+        changes = manager.reload_modules([plugins / f"{module_name}.py"])
+
+        assert changes.added == ["BetaTool"]
+        assert changes.updated == ["AlphaTool"]
+        assert changes.removed == []
+        assert manager.discovered_tools["AlphaTool"].tool_class is not old_class
+
+    def test_new_and_deleted_files(self, plugin_dir):
+        plugins, module_name = plugin_dir
+        manager = make_manager(plugins)
+
+        extra = plugins / f"hotextra_{uuid.uuid4().hex[:8]}.py"
+        extra.write_text(tool_source("GammaTool", "gamma"))
+        changes = manager.reload_modules([extra])
+        assert changes.added == ["GammaTool"]
+
+        extra.unlink()
+        (plugins / f"{module_name}.py").unlink()
+        changes = manager.reload_modules([extra, plugins / f"{module_name}.py"])
+        assert sorted(changes.removed) == ["AlphaTool", "GammaTool"]
+        assert manager.discovered_tools == {}
+
+    def test_broken_module_keeps_previous_tools(self, plugin_dir):
+        plugins, module_name = plugin_dir
+        manager = make_manager(plugins)
+
+        (plugins / f"{module_name}.py").write_text("class Broken(:\n")
+        changes = manager.reload_modules([plugins / f"{module_name}.py"])
+
+        assert not changes
+        assert "AlphaTool" in manager.discovered_tools
+
+
+class TestToolWatcher:
+    def test_snapshot_diff(self, tmp_path):
+        (tmp_path / "a.py").write_text("A = 1\n")
+        before, _ = take_snapshot([tmp_path])
+        (tmp_path / "a.py").write_text("A = 22\n")
+        (tmp_path / "b.py").write_text("")
+        (tmp_path / "notes.txt").write_text("")
+        after, _ = take_snapshot([tmp_path])
+
+        assert diff_snapshots(before, after) == {
+            str(tmp_path / "a.py"),
+            str(tmp_path / "b.py"),
+        }
+
+    @pytest.mark.asyncio
+    @pytest.mark.parametrize("use_inotify", [True, False])
+    async def test_reports_files_in_new_directories(self, tmp_path, use_inotify):
+        reported = asyncio.Queue()
+
+        async def on_change(paths):
+            await reported.put(paths)
+
+        watcher = ToolWatcher(
+            [tmp_path],
+            on_change,
+            poll_interval=0.05,
+            debounce=0.05,
+            use_inotify=use_inotify,
+        )
+        await watcher.start()
+        try:
+            if not use_inotify or sys.platform != "linux":
+                assert watcher.backend == "polling"
+
+            package = tmp_path / "pkg"
+            package.mkdir()
+            (package / "tool.py").write_text("")
+            paths = await asyncio.wait_for(reported.get(), timeout=5)
+            assert paths == {str(package / "tool.py")}
+
+            # Files in the new directory are watched too
+            (package / "tool.py").write_text("X = 1\n")
+            paths = await asyncio.wait_for(reported.get(), timeout=5)
+            assert paths == {str(package / "tool.py")}
+        finally:
+            await watcher.stop()
+
+
+class NotifiedSession:
+    def __init__(self):
+        self.notifications = 0
+
+    async def send_tool_list_changed(self):
+        self.notifications += 1
+
+
+@pytest.mark.asyncio
+async def test_server_applies_deltas_and_notifies(plugin_dir):
+    plugins, module_name = plugin_dir
+    server = PythoniumMCPServer(config_overrides={"tools": {"hot_reload": True}})
+    server.tool_discovery.search_paths = [plugins]
+    await server._discover_and_register_tools()
+
+    session = NotifiedSession()
+    server._tool_list_sessions.add(session)
+
+    (plugins / f"{module_name}.py").write_text(tool_source("BetaTool", "beta"))
+    changes = await server.reload_tools([plugins / f"{module_name}.py"])
+
+    assert changes.added == ["BetaTool"] and changes.removed == ["AlphaTool"]
+    assert set(server.get_registered_tools()) == {"beta"}
+    assert set(server.admission.get_stats()["tools"]) == {"beta"}
+    assert server.tool_registry.get_tool("alpha") is None
+    assert [tool.name for tool in await server.mcp_server.list_tools()] == ["beta"]
+    assert session.notifications == 1
+
+    result = await server.call_tool("beta", {})
+    assert result.data == "v1"
+
+    # A changed tool with the same name replaces the FastMCP entry
+    (plugins / f"{module_name}.py").write_text(tool_source("BetaTool", "beta", "v2"))
+    await server.reload_tools([plugins / f"{module_name}.py"])
+    assert (await server.call_tool("beta", {})).data == "v2"
+    assert session.notifications == 2
+
+    options = server.mcp_server._mcp_server.create_initialization_options()
+    assert options.capabilities.tools.listChanged
+
+
+def test_list_changed_capability_without_server_notification_options():
+    server = PythoniumMCPServer(config_overrides={"tools": {"hot_reload": True}})
+    lowlevel = server.mcp_server._mcp_server
+    # Newer MCP releases have no notification_options on the server
+    lowlevel.__dict__.pop("notification_options", None)
+
+    options = lowlevel.create_initialization_options()
+    assert options.capabilities.tools.listChanged
+
+
+def test_unregister_fails_loudly_without_a_removal_api(monkeypatch):
+    server = PythoniumMCPServer()
+    server.register_tool(DescribeToolTool())
+    # Neither a public remove_tool nor the private tool dict to fall back on
+    monkeypatch.delattr(type(server.mcp_server), "remove_tool", raising=False)
+    server.mcp_server._tool_manager = None
+
+    with pytest.raises(PythoniumError):
+        server.unregister_tool("describe_tool")
+
+
+def test_unregister_fails_loudly_when_remove_tool_is_unusable():
+    server = PythoniumMCPServer()
+    server.register_tool(DescribeToolTool())
+    mcp_server = server.mcp_server
+
+    # What newer FastMCP releases do, without a tool manager to do it with
+    def remove_tool(name):
+        mcp_server._tool_manager.remove_tool(name)
+
+    mcp_server.remove_tool = remove_tool
+    mcp_server._tool_manager = None
+
+    with pytest.raises(PythoniumError):
+        server.unregister_tool("describe_tool")
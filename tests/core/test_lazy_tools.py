@@ -0,0 +1,136 @@
+"""Tests for lazily imported tool proxies."""
+
+import asyncio
+import importlib
+import sys
+import uuid
+
+import pytest
+
+from pythonium.core.server import PythoniumMCPServer
+from pythonium.core.tools.discovery import ToolDiscoveryManager
+from pythonium.core.tools.lazy import LazyTool
+from pythonium.core.tools.manifest import ToolManifest
+from pythonium.tools.base import ToolContext
+from pythonium.tools.std.file_ops import ReadFileTool
+
+TOOL_MODULE = """
+import asyncio
+
+from pythonium.common.base import Result
+from pythonium.tools.base import BaseTool, ToolMetadata
+
+
+class SlowImportTool(BaseTool):
+    @property
+    def metadata(self):
+        return ToolMetadata(name="slow_import", description="d", category="lazy")
+
+    async def execute(self, parameters, context):
+        await asyncio.sleep(0)
+        return Result.success_result("loaded")
+"""
+
+
+@pytest.fixture
+def tool_module(tmp_path):
+    """A search path with a single tool module and a prebuilt manifest."""
+    module_name = f"lazytools_{uuid.uuid4().hex[:8]}"
+    tools_dir = tmp_path / "tools"
+    tools_dir.mkdir()
+    (tools_dir / f"{module_name}.py").write_text(TOOL_MODULE)
+
+    manifest_path = tmp_path / "manifest.json"
+    manager = ToolDiscoveryManager(manifest=ToolManifest(manifest_path))
+    manager.search_paths = [tools_dir]
+    manager.discover_tools()
+    sys.modules.pop(module_name)
+
+    yield tools_dir, module_name, manifest_path
+
+    sys.modules.pop(module_name, None)
+
+
+def lazy_discovery(tools_dir, manifest_path):
+    manager = ToolDiscoveryManager(
+        manifest=ToolManifest.load(manifest_path), lazy_imports=True
+    )
+    manager.search_paths = [tools_dir]
+    return manager
+
+
+@pytest.mark.asyncio
+async def test_tool_module_is_imported_on_first_call(tool_module):
+    tools_dir, module_name, manifest_path = tool_module
+    manager = lazy_discovery(tools_dir, manifest_path)
+    discovered = manager.discover_tools()["SlowImportTool"]
+
+    assert discovered.tool_class is None
+    assert module_name not in sys.modules
+
+    tool = manager.create_tool(discovered)
+    assert isinstance(tool, LazyTool)
+    assert tool.metadata.name == "slow_import"
+    assert not tool.loaded
+    assert module_name not in sys.modules
+
+    result = await tool.execute({}, ToolContext())
+    assert result.data == "loaded"
+    assert tool.loaded
+    assert module_name in sys.modules
+
+
+@pytest.mark.asyncio
+async def test_concurrent_first_calls_import_once(tool_module, monkeypatch):
+    tools_dir, module_name, manifest_path = tool_module
+    manager = lazy_discovery(tools_dir, manifest_path)
+    tool = manager.create_tool(manager.discover_tools()["SlowImportTool"])
+
+    imports = []
+    real_import = importlib.import_module
+
+    def counting_import(name, *args, **kwargs):
+        imports.append(name)
+        return real_import(name, *args, **kwargs)
+
+    monkeypatch.setattr(
+        "pythonium.core.tools.lazy.importlib.import_module", counting_import
+    )
+
+    results = await asyncio.gather(
+        *(tool.execute({}, ToolContext()) for _ in range(10))
+    )
+    assert all(result.data == "loaded" for result in results)
+    assert imports == [module_name]
+
+
+def test_filters_disable_lazy_discovery(tool_module):
+    tools_dir, module_name, manifest_path = tool_module
+    manager = lazy_discovery(tools_dir, manifest_path)
+    manager.add_tool_filter(lambda tool_class: True)
+
+    discovered = manager.discover_tools()["SlowImportTool"]
+    assert discovered.tool_class is not None
+    assert module_name in sys.modules
+
+
+@pytest.mark.asyncio
+async def test_server_registers_lazy_tools_without_loading(tmp_path):
+    tool = LazyTool(
+        ReadFileTool().metadata, "pythonium.tools.std.file_ops", "ReadFileTool"
+    )
+    assert not tool.is_cacheable_call({"path": "x"})
+
+    server = PythoniumMCPServer()
+    server.register_tool(tool)
+    registration = server.tool_registry.get_tool("read_file")
+    assert registration.metadata.name == "read_file"
+    assert not tool.loaded
+
+    target = tmp_path / "hello.txt"
+    target.write_text("hello")
+    result = await server.call_tool("read_file", {"path": str(target)})
+
+    assert result.success
+    assert result.data["content"] == "hello"
+    assert tool.loaded
@@ -0,0 +1,159 @@
+"""Tests for the persistent tool discovery manifest."""
+
+import json
+import os
+import sys
+import uuid
+
+import pytest
+from click.testing import CliRunner
+
+from pythonium.core.tools.discovery import ToolDiscoveryManager
+from pythonium.core.tools.manifest import (
+    MANIFEST_VERSION,
+    ToolManifest,
+    default_manifest_path,
+)
+from pythonium.main import main
+
+TOOL_MODULE = """
+from pythonium.common.base import Result
+from pythonium.tools.base import BaseTool, ToolMetadata
+
+
+class {class_name}(BaseTool):
+    @property
+    def metadata(self):
+        return ToolMetadata(name="{tool_name}", description="d", category="test")
+
+    async def execute(self, parameters, context):
+        return Result.success_result("ok")
+"""
+
+
+@pytest.fixture
+def tool_tree(tmp_path):
+    """A search path with one tool module and one module without tools."""
+    suffix = uuid.uuid4().hex[:8]
+    tools_dir = tmp_path / "tools"
+    tools_dir.mkdir()
+    names = {"tools": f"mftools_{suffix}", "helpers": f"mfhelpers_{suffix}"}
+    (tools_dir / f"{names['tools']}.py").write_text(
+        TOOL_MODULE.format(class_name="EchoTool", tool_name="echo")
+    )
+    (tools_dir / f"{names['helpers']}.py").write_text("VALUE = 1\n")
+
+    yield tools_dir, names
+
+    for module_name in names.values():
+        sys.modules.pop(module_name, None)
+
+
+def discover(tools_dir, manifest):
+    manager = ToolDiscoveryManager(manifest=manifest)
+    manager.search_paths = [tools_dir]
+    return manager.discover_tools()
+
+
+def test_fresh_manifest_skips_modules_without_tools(tool_tree, tmp_path):
+    tools_dir, names = tool_tree
+    manifest_path = tmp_path / "cache" / "manifest.json"
+
+    first = discover(tools_dir, ToolManifest.load(manifest_path))
+    assert list(first) == ["EchoTool"]
+    assert first["EchoTool"].tool_metadata["name"] == "echo"
+
+    data = json.loads(manifest_path.read_text())
+    assert data["version"] == MANIFEST_VERSION
+    assert len(data["modules"]) == 2
+
+    for module_name in names.values():
+        sys.modules.pop(module_name)
+
+    manifest = ToolManifest.load(manifest_path)
+    second = discover(tools_dir, manifest)
+
+    assert list(second) == ["EchoTool"]
+    assert second["EchoTool"].tool_metadata == first["EchoTool"].tool_metadata
+    assert manifest.get_stats()["hits"] == 2
+    assert names["tools"] in sys.modules
+    assert names["helpers"] not in sys.modules
+
+
+def test_changed_module_is_rescanned(tool_tree, tmp_path):
+    tools_dir, names = tool_tree
+    manifest_path = tmp_path / "manifest.json"
+    discover(tools_dir, ToolManifest.load(manifest_path))
+
+    helper = tools_dir / f"{names['helpers']}.py"
+    helper.write_text(TOOL_MODULE.format(class_name="NewTool", tool_name="new"))
+    sys.modules.pop(names["helpers"])
+
+    manifest = ToolManifest.load(manifest_path)
+    tools = discover(tools_dir, manifest)
+
+    assert sorted(tools) == ["EchoTool", "NewTool"]
+    assert manifest.get_stats()["misses"] == 1
+    assert len(ToolManifest.load(manifest_path).entries) == 2
+
+
+def test_touched_but_unchanged_module_still_hits(tool_tree, tmp_path):
+    tools_dir, names = tool_tree
+    manifest_path = tmp_path / "manifest.json"
+    discover(tools_dir, ToolManifest.load(manifest_path))
+
+    helper = tools_dir / f"{names['helpers']}.py"
+    os.utime(helper, ns=(1, 1))
+
+    manifest = ToolManifest.load(manifest_path)
+    discover(tools_dir, manifest)
+    assert manifest.get_stats()["hits"] == 2
+
+    # The refreshed mtime was written back
+    entry = ToolManifest.load(manifest_path).entries[str(helper.resolve())]
+    assert entry.mtime_ns == 1
+
+
+def test_removed_modules_are_pruned(tool_tree, tmp_path):
+    tools_dir, names = tool_tree
+    manifest_path = tmp_path / "manifest.json"
+    discover(tools_dir, ToolManifest.load(manifest_path))
+
+    (tools_dir / f"{names['helpers']}.py").unlink()
+    discover(tools_dir, ToolManifest.load(manifest_path))
+
+    assert len(ToolManifest.load(manifest_path).entries) == 1
+
+
+@pytest.mark.parametrize(
+    "content",
+    ["not json", json.dumps({"version": MANIFEST_VERSION + 1, "modules": {}})],
+)
+def test_unusable_manifest_is_ignored(tmp_path, content):
+    manifest_path = tmp_path / "manifest.json"
+    manifest_path.write_text(content)
+    assert ToolManifest.load(manifest_path).entries == {}
+
+
+def test_build_manifest_command(tmp_path):
+    output = tmp_path / "manifest.json"
+    result = CliRunner().invoke(main, ["build-manifest", "--output", str(output)])
+
+    assert result.exit_code == 0, result.output
+    modules = json.loads(output.read_text())["modules"]
+    class_names = {
+        tool["class_name"] for entry in modules.values() for tool in entry["tools"]
+    }
+    assert {"ReadFileTool", "ExecuteCommandTool"} <= class_names
+
+
+@pytest.mark.skipif(
+    sys.platform in ("win32", "darwin"), reason="XDG cache directory layout"
+)
+def test_default_manifest_lives_in_the_user_cache(tmp_path, monkeypatch):
+    monkeypatch.setenv("XDG_CACHE_HOME", str(tmp_path))
+    monkeypatch.chdir(tmp_path / "..")
+
+    expected = tmp_path / "pythonium" / "tool_manifest.json"
+    assert default_manifest_path() == expected
+    assert ToolManifest.load().path == expected
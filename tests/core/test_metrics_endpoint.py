@@ -0,0 +1,110 @@
+"""
+Test the OpenMetrics endpoint of the HTTP transports.
+"""
+
+import asyncio
+
+import httpx
+import pytest
+from starlette.applications import Starlette
+
+from pythonium.common.base import Result
+from pythonium.core.metrics import CONTENT_TYPE, LoopLagMonitor, render_metrics
+from pythonium.core.server import PythoniumMCPServer
+from pythonium.core.tools.metrics import LatencyHistogram
+from pythonium.tools.base import BaseTool, ParameterType, ToolMetadata, ToolParameter
+
+
+class FlakyTool(BaseTool):
+    @property
+    def metadata(self):
+        return ToolMetadata(
+            name="flaky",
+            description="flaky",
+            category="test",
+            parameters=[
+                ToolParameter(
+                    name="fail", type=ParameterType.BOOLEAN, description="fail"
+                ),
+            ],
+        )
+
+    async def execute(self, params, context):
+        if params.get("fail"):
+            return Result.error_result("failed")
+        return Result.success_result("ok")
+
+
+def parse_samples(text):
+    samples = {}
+    for line in text.splitlines():
+        if line and not line.startswith("#"):
+            name, value = line.rsplit(" ", 1)
+            samples[name] = float(value)
+    return samples
+
+
+def test_cumulative_counts_never_include_larger_values():
+    histogram = LatencyHistogram()
+    for value in (500_000, 2_000_000, 2_000_000, 40_000_000):
+        histogram.record(value)
+
+    bounds = [1_000_000, 2_000_000, 5_000_000, 50_000_000]
+    assert histogram.cumulative_counts(bounds) == [1, 1, 3, 4]
+
+
+@pytest.mark.asyncio
+async def test_render_metrics_exports_tool_histograms_and_counters():
+    server = PythoniumMCPServer()
+    server.register_tool(FlakyTool())
+    await server.call_tool("flaky", {"fail": False})
+    await server.call_tool("flaky", {"fail": True})
+
+    text = render_metrics(server, LoopLagMonitor())
+    samples = parse_samples(text)
+
+    assert text.endswith("# EOF\n")
+    assert "# TYPE pythonium_tool_call_duration_seconds histogram" in text
+    assert samples['pythonium_tool_call_duration_seconds_count{tool="flaky"}'] == 2
+    assert (
+        samples['pythonium_tool_call_duration_seconds_bucket{tool="flaky",le="+Inf"}']
+        == 2
+    )
+    assert samples['pythonium_tool_calls_total{tool="flaky",outcome="success"}'] == 1
+    assert samples['pythonium_tool_calls_total{tool="flaky",outcome="error"}'] == 1
+    assert samples['pythonium_tool_calls_in_flight{tool="flaky"}'] == 0
+    assert "pythonium_event_bus_events_published_total" in text
+    assert "pythonium_http_requests_total" in samples
+    assert "pythonium_subprocesses_running" in samples
+    assert "pythonium_event_loop_lag_seconds" in samples
+
+
+@pytest.mark.asyncio
+async def test_metrics_route_is_mounted_on_http_apps():
+    server = PythoniumMCPServer()
+    app = Starlette()
+
+    loop_lag = server._mount_metrics(app)
+    loop_lag.interval = 0.01
+    loop_lag.start()
+    try:
+        await asyncio.sleep(0.05)
+        transport = httpx.ASGITransport(app=app)
+        async with httpx.AsyncClient(
+            transport=transport, base_url="http://test"
+        ) as client:
+            response = await client.get("/metrics")
+    finally:
+        await loop_lag.stop()
+
+    assert response.status_code == 200
+    assert response.headers["content-type"] == CONTENT_TYPE
+    assert response.text.endswith("# EOF\n")
+
+
+def test_metrics_can_be_disabled():
+    server = PythoniumMCPServer(config_overrides={"server": {"metrics_enabled": False}})
+    app = Starlette()
+
+    assert server._mount_metrics(app) is None
+    assert app.router.routes == []
@@ -0,0 +1,245 @@
+import time
+
+import pytest
+
+from pythonium.common.base import Result
+from pythonium.common.parameters import ParameterModel, validate_parameters
+from pythonium.common.timing import TIMING_METADATA_KEY, PhaseTimer
+from pythonium.core.dispatch import ToolDispatchPlan
+from pythonium.core.result_cache import ResultCache, canonicalize_parameters
+from pythonium.core.server import PythoniumMCPServer
+from pythonium.core.tools.registry import ToolStatus
+from pythonium.tools.base import BaseTool, ParameterType, ToolMetadata, ToolParameter
+from pythonium.tools.std.web import HttpClientTool
+
+
+class CountingTool(BaseTool):
+    shared_metadata = False  # cacheable is set per instance
+
+    def __init__(self, cacheable=True):
+        super().__init__()
+        self.cacheable = cacheable
+        self.calls = 0
+
+    @property
+    def metadata(self):
+        return ToolMetadata(
+            name="counting",
+            description="counting",
+            category="test",
+            cacheable=self.cacheable,
+            cache_ttl=60.0,
+            parameters=[
+                ToolParameter(
+                    name="query",
+                    type=ParameterType.STRING,
+                    description="query",
+                    required=True,
+                ),
+                ToolParameter(
+                    name="options",
+                    type=ParameterType.OBJECT,
+                    description="options",
+                    default=None,
+                ),
+            ],
+        )
+
+    async def execute(self, params, context):
+        self.calls += 1
+        if params["query"] == "fail":
+            return Result.error_result("failed")
+        return Result.success_result({"query": params["query"], "call": self.calls})
+
+
+class LimitParams(ParameterModel):
+    query: str
+    limit: int = 10
+
+
+class ModelCountingTool(BaseTool):
+    def __init__(self):
+        super().__init__()
+        self.calls = 0
+
+    @property
+    def metadata(self):
+        return ToolMetadata(
+            name="model_counting",
+            description="model counting",
+            category="test",
+            cacheable=True,
+            cache_ttl=60.0,
+            parameters=[
+                ToolParameter(
+                    name="query",
+                    type=ParameterType.STRING,
+                    description="query",
+                    required=True,
+                ),
+                ToolParameter(
+                    name="limit",
+                    type=ParameterType.INTEGER,
+                    description="limit",
+                    default=10,
+                ),
+            ],
+        )
+
+    @validate_parameters(LimitParams)
+    async def execute(self, params, context):
+        self.calls += 1
+        return Result.success_result({"query": params.query, "limit": params.limit})
+
+
+def test_canonical_keys_ignore_ordering():
+    assert canonicalize_parameters({"a": 1, "b": {"y": 2, "x": 1}}) == (
+        canonicalize_parameters({"b": {"x": 1, "y": 2}, "a": 1})
+    )
+
+
+def test_get_put_and_expiry(monkeypatch):
+    cache = ResultCache(max_bytes=1024)
+    key = cache.make_key("tool", {"q": 1})
+
+    assert cache.get(key) is None
+    assert cache.put(key, Result.success_result("value"), ttl=10)
+    assert cache.get(key).data == "value"
+
+    now = time.monotonic()
+    monkeypatch.setattr("pythonium.core.result_cache.time.monotonic", lambda: now + 11)
+    assert cache.get(key) is None
+
+    stats = cache.get_stats()
+    assert stats["hits"] == 1
+    assert stats["misses"] == 2
+    assert stats["expirations"] == 1
+    assert stats["entries"] == 0
+    assert stats["bytes"] == 0
+
+
+def test_lru_eviction_under_byte_budget():
+    cache = ResultCache(max_bytes=150)
+    keys = [cache.make_key("tool", {"i": i}) for i in range(3)]
+
+    cache.put(keys[0], Result.success_result("x" * 50), ttl=60)
+    cache.put(keys[1], Result.success_result("y" * 50), ttl=60)
+    cache.get(keys[0])  # keys[1] is now least recently used
+    cache.put(keys[2], Result.success_result("z" * 50), ttl=60)
+
+    assert cache.get(keys[1]) is None
+    assert cache.get(keys[0]) is not None
+    assert cache.get(keys[2]) is not None
+    assert cache.get_stats()["evictions"] == 1
+    assert cache.get_stats()["bytes"] <= 150
+
+    # Results larger than the whole budget are never cached
+    assert not cache.put(keys[1], Result.success_result("w" * 500), ttl=60)
+
+
+def test_invalidate_by_tool():
+    cache = ResultCache()
+    cache.put(cache.make_key("a", {}), Result.success_result(1), ttl=60)
+    cache.put(cache.make_key("a", {"x": 1}), Result.success_result(2), ttl=60)
+    cache.put(cache.make_key("b", {}), Result.success_result(3), ttl=60)
+
+    assert cache.invalidate("a") == 2
+    assert len(cache) == 1
+    assert cache.invalidate() == 1
+    assert cache.get_stats()["bytes"] == 0
+
+
+@pytest.mark.asyncio
+async def test_dispatch_serves_repeated_calls_from_cache():
+    tool = CountingTool()
+    plan = ToolDispatchPlan(tool, cache=ResultCache())
+
+    first = await plan.dispatch((), {"query": "a", "options": {"x": 1, "y": 2}})
+    second = await plan.dispatch((), {"options": {"y": 2, "x": 1}, "query": "a"})
+    other = await plan.dispatch((), {"query": "b"})
+
+    assert first == second == {"query": "a", "call": 1}
+    assert other["call"] == 2
+    assert tool.calls == 2
+
+    # Failures are never cached
+    for _ in range(2):
+        with pytest.raises(Exception):
+            await plan.dispatch((), {"query": "fail"})
+    assert tool.calls == 4
+
+
+def test_canonical_keys_use_validated_models():
+    assert canonicalize_parameters(LimitParams(query="a")) == (
+        canonicalize_parameters({"limit": 10, "query": "a"})
+    )
+    with pytest.raises(TypeError):
+        canonicalize_parameters({"query": object()})
+
+
+@pytest.mark.asyncio
+async def test_dispatch_keys_cache_on_validated_parameters():
+    tool = ModelCountingTool()
+    plan = ToolDispatchPlan(tool, cache=ResultCache())
+
+    first = await plan.call({"query": "a"})
+    assert first.data == {"query": "a", "limit": 10}
+    await plan.call({"query": "a", "limit": 10})
+    await plan.call({"query": "a", "limit": "10"})
+    assert tool.calls == 1
+
+    await plan.call({"query": "a", "limit": 5})
+    assert tool.calls == 2
+
+    invalid = await plan.call({"query": "a", "limit": "many"})
+    assert not invalid.success
+    assert len(plan.cache) == 2
+
+
+@pytest.mark.asyncio
+async def test_cache_hits_carry_their_own_timing():
+    plan = ToolDispatchPlan(CountingTool(), cache=ResultCache())
+    parameters = {"query": "a", "options": None}
+
+    first = await plan.invoke(parameters, PhaseTimer("counting"))
+    first_phases = dict(first.metadata[TIMING_METADATA_KEY])
+    second = await plan.invoke(parameters, PhaseTimer("counting"))
+
+    assert second.data == first.data
+    assert first.metadata[TIMING_METADATA_KEY] == first_phases
+    assert "execute" in first_phases
+    assert "execute" not in second.metadata[TIMING_METADATA_KEY]
+    assert "cache" in second.metadata[TIMING_METADATA_KEY]
+
+
+@pytest.mark.asyncio
+async def test_dispatch_skips_cache_for_tools_that_do_not_opt_in():
+    tool = CountingTool(cacheable=False)
+    plan = ToolDispatchPlan(tool, cache=ResultCache())
+
+    await plan.dispatch((), {"query": "a"})
+    await plan.dispatch((), {"query": "a"})
+    assert plan.cache is None
+    assert tool.calls == 2
+
+
+def test_http_client_caches_only_get_requests():
+    tool = HttpClientTool()
+    assert tool.metadata.cacheable
+    assert tool.is_cacheable_call({"url": "http://x", "method": "get"})
+    assert not tool.is_cacheable_call({"url": "http://x", "method": "POST"})
+
+
+def test_server_invalidates_cache_on_registry_events():
+    server = PythoniumMCPServer()
+    cache = server.result_cache
+    cache.put(cache.make_key("counting", {}), Result.success_result(1), ttl=60)
+
+    server.tool_registry.register_tool(CountingTool)
+    assert len(cache) == 0
+
+    cache.put(cache.make_key("counting", {}), Result.success_result(1), ttl=60)
+    cache.put(cache.make_key("other", {}), Result.success_result(2), ttl=60)
+    server.tool_registry.update_tool_status("counting", ToolStatus.DISABLED)
+    assert len(cache) == 1
+    assert server.get_cache_stats()["invalidations"] == 2
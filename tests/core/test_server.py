@@ -2,6 +2,7 @@
 Tests for MCP server implementation.
 """
 
+import asyncio
 from unittest.mock import AsyncMock, Mock, patch
 
 import pytest
@@ -126,25 +127,45 @@ class TestPythoniumMCPServer:
         config_overrides = {"transport": {"type": "stdio"}}
         server = PythoniumMCPServer(config_overrides=config_overrides)
 
-        # Mock the start/stop and run methods
+        # Mock the start/stop and the native stdio entry point
         with patch.object(server, "start", new=AsyncMock()), patch.object(
             server, "stop", new=AsyncMock()
-        ), patch.object(server.mcp_server, "run") as mock_run:
+        ), patch.object(
+            server.mcp_server, "run_stdio_async", new=AsyncMock()
+        ) as mock_run:
+            await server.run()
+            mock_run.assert_awaited_once()
+
+            server.start.assert_called_once()
+            server.stop.assert_called_once()
+
+    @pytest.mark.asyncio
+    async def test_server_run_stops_serving_on_shutdown(self):
+        """Test that a shutdown request cancels the transport on the same loop."""
+        server = PythoniumMCPServer()
+        serving = asyncio.Event()
+        cancelled = asyncio.Event()
 
-            # Mock the executor to not actually run
-            with patch("asyncio.get_event_loop") as mock_loop:
-                # Mock run_in_executor to actually call the function so the mock gets triggered
-                async def mock_run_in_executor(_executor, func, *args):
-                    func(*args)
-                    return None
+        async def serve_forever():
+            serving.set()
+            try:
+                await asyncio.Event().wait()
+            except asyncio.CancelledError:
+                cancelled.set()
+                raise
 
-                mock_loop.return_value.run_in_executor = mock_run_in_executor
+        with patch.object(server, "start", new=AsyncMock()), patch.object(
+            server.mcp_server, "run_stdio_async", new=serve_forever
+        ):
+            server._running = True
+            run_task = asyncio.create_task(server.run())
+            await serving.wait()
 
-                # Test that run was called
-                await server.run()
-                mock_run.assert_called_once_with(transport="stdio")
+            await server.stop()
+            await asyncio.wait_for(run_task, timeout=1)
 
-                server.start.assert_called_once()
+        assert cancelled.is_set()
+        assert not server._running
 
 
 class TestServerFactoryFunctions:
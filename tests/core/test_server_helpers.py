@@ -1,3 +1,4 @@
+import asyncio
 import inspect
 import signal
 from unittest.mock import AsyncMock, Mock, patch
@@ -65,25 +66,62 @@ def test_map_parameter_type():
 
 @pytest.mark.asyncio
 async def test_run_http_and_ws():
-    server = PythoniumMCPServer(config_overrides={"server": {"transport": "http"}})
+    server = PythoniumMCPServer(
+        config_overrides={"server": {"transport": "http", "port": 9123}}
+    )
     server.start = AsyncMock()
     server.stop = AsyncMock()
-    server.mcp_server.run = Mock()
+    server._serve_http = AsyncMock()
 
-    async def mock_run_in_executor(_executor, func, *args):
-        func(*args)
-
-    with patch("asyncio.get_event_loop") as mock_loop:
-        mock_loop.return_value.run_in_executor = mock_run_in_executor
+    with patch.object(server.mcp_server, "streamable_http_app") as http_app:
         await server.run()
-        server.mcp_server.run.assert_called_with(transport="streamable-http")
+    server._serve_http.assert_awaited_once_with(http_app.return_value)
 
     server.config.server.transport = TransportType.WEBSOCKET
-    server.mcp_server.run.reset_mock()
-    with patch("asyncio.get_event_loop") as mock_loop:
-        mock_loop.return_value.run_in_executor = mock_run_in_executor
+    with patch.object(server.mcp_server, "sse_app") as sse_app:
         await server.run()
-        server.mcp_server.run.assert_called_with(transport="sse")
+    server._serve_http.assert_awaited_with(sse_app.return_value)
+
+
+@pytest.mark.asyncio
+async def test_serve_http_uses_configured_address_and_drains_on_stop():
+    server = PythoniumMCPServer(
+        config_overrides={"server": {"transport": "http", "port": 9123}}
+    )
+    configs = []
+
+    class FakeUvicornServer:
+        def __init__(self, config):
+            configs.append(config)
+            self.should_exit = False
+
+        async def serve(self):
+            while not self.should_exit:
+                await asyncio.sleep(0.001)
+
+    with patch("uvicorn.Server", FakeUvicornServer):
+        serve_task = asyncio.create_task(server._serve_http(object()))
+        await asyncio.sleep(0.01)
+        await server._stop_serving(serve_task)
+
+    assert serve_task.done() and not serve_task.cancelled()
+    assert configs[0].port == 9123
+    assert server._http_server is None
+
+
+@pytest.mark.asyncio
+async def test_signal_handlers_use_running_loop():
+    server = PythoniumMCPServer()
+    loop = asyncio.get_running_loop()
+
+    with patch.object(loop, "add_signal_handler") as add, patch.object(
+        loop, "remove_signal_handler"
+    ) as remove:
+        server._setup_signal_handlers()
+        assert add.call_count == 2
+        server._running = True
+        await server.stop()
+        assert remove.call_count == 2
 
 
 @pytest.mark.asyncio
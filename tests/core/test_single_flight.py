@@ -0,0 +1,170 @@
+import asyncio
+
+import pytest
+
+from pythonium.common.base import Result
+from pythonium.core.dispatch import ToolDispatchPlan
+from pythonium.core.result_cache import ResultCache
+from pythonium.core.single_flight import SingleFlight
+from pythonium.tools.base import BaseTool, ParameterType, ToolMetadata, ToolParameter
+
+
+class SlowSearchTool(BaseTool):
+    def __init__(self):
+        super().__init__()
+        self.calls = 0
+        self.release = asyncio.Event()
+
+    @property
+    def metadata(self):
+        return ToolMetadata(
+            name="slow_search",
+            description="slow search",
+            category="test",
+            idempotent=True,
+            parameters=[
+                ToolParameter(
+                    name="query",
+                    type=ParameterType.STRING,
+                    description="query",
+                    required=True,
+                )
+            ],
+        )
+
+    async def execute(self, params, context):
+        self.calls += 1
+        await self.release.wait()
+        return Result.success_result([params["query"], self.calls])
+
+
+@pytest.mark.asyncio
+async def test_concurrent_identical_calls_share_one_execution():
+    flight = SingleFlight()
+    calls = 0
+    release = asyncio.Event()
+
+    async def work():
+        nonlocal calls
+        calls += 1
+        await release.wait()
+        return object()
+
+    tasks = [asyncio.create_task(flight.do("k", work)) for _ in range(5)]
+    await asyncio.sleep(0)
+    release.set()
+    results = await asyncio.gather(*tasks)
+
+    assert calls == 1
+    assert all(result is results[0] for result in results)
+    assert flight.get_stats() == {
+        "in_flight": 0,
+        "executions": 1,
+        "coalesced": 4,
+        "cancelled": 0,
+    }
+
+
+@pytest.mark.asyncio
+async def test_cancelling_one_waiter_keeps_shared_execution_running():
+    flight = SingleFlight()
+    release = asyncio.Event()
+
+    async def work():
+        await release.wait()
+        return "done"
+
+    first = asyncio.create_task(flight.do("k", work))
+    second = asyncio.create_task(flight.do("k", work))
+    await asyncio.sleep(0)
+
+    first.cancel()
+    await asyncio.sleep(0)
+    release.set()
+
+    assert await second == "done"
+    assert first.cancelled()
+    assert flight.get_stats()["cancelled"] == 0
+
+
+@pytest.mark.asyncio
+async def test_last_waiter_leaving_cancels_execution():
+    flight = SingleFlight()
+    cancelled = asyncio.Event()
+
+    async def work():
+        try:
+            await asyncio.Event().wait()
+        except asyncio.CancelledError:
+            cancelled.set()
+            raise
+
+    task = asyncio.create_task(flight.do("k", work))
+    await asyncio.sleep(0)
+    task.cancel()
+
+    await asyncio.wait_for(cancelled.wait(), timeout=1)
+    await asyncio.sleep(0)
+    assert flight.get_stats()["cancelled"] == 1
+    assert flight.get_stats()["in_flight"] == 0
+
+
+@pytest.mark.asyncio
+async def test_caller_arriving_while_cancelling_starts_afresh():
+    flight = SingleFlight()
+    calls = 0
+
+    async def work():
+        nonlocal calls
+        calls += 1
+        if calls == 1:
+            await asyncio.Event().wait()
+        return calls
+
+    first = asyncio.create_task(flight.do("k", work))
+    await asyncio.sleep(0)
+    first.cancel()
+    with pytest.raises(asyncio.CancelledError):
+        await first
+
+    # The cancelled execution has not finished unwinding yet
+    assert await flight.do("k", work) == 2
+    assert flight.get_stats()["executions"] == 2
+
+
+@pytest.mark.asyncio
+async def test_exceptions_reach_every_waiter():
+    flight = SingleFlight()
+
+    async def work():
+        await asyncio.sleep(0)
+        raise ValueError("boom")
+
+    tasks = [asyncio.create_task(flight.do("k", work)) for _ in range(3)]
+    results = await asyncio.gather(*tasks, return_exceptions=True)
+    assert all(isinstance(result, ValueError) for result in results)
+
+
+@pytest.mark.asyncio
+async def test_dispatch_coalesces_idempotent_tool_calls():
+    tool = SlowSearchTool()
+    flight = SingleFlight()
+    cache = ResultCache()
+    plan = ToolDispatchPlan(tool, cache=cache, single_flight=flight)
+    assert plan.cache is None  # Idempotent but not cacheable
+
+    tasks = [
+        asyncio.create_task(plan.dispatch((), {"query": "same"})) for _ in range(3)
+    ]
+    other = asyncio.create_task(plan.dispatch((), {"query": "other"}))
+    await asyncio.sleep(0)
+    tool.release.set()
+
+    results = await asyncio.gather(*tasks)
+    assert results == [["same", 1]] * 3
+    assert (await other)[0] == "other"
+    assert tool.calls == 2
+    assert flight.get_stats()["coalesced"] == 2
+
+    # Completed flights are not reused
+    assert await plan.dispatch((), {"query": "same"}) == ["same", 3]
@@ -0,0 +1,163 @@
+"""
+Test slow tool call profiling and the slow_call_profiles meta-tool.
+"""
+
+import cProfile
+import threading
+import time
+
+import pytest
+
+from pythonium.common.base import Result
+from pythonium.core.profiling import (
+    SlowCallProfiler,
+    parameter_digest,
+    set_slow_call_profiler,
+)
+from pythonium.core.server import PythoniumMCPServer
+from pythonium.tools.base import (
+    BaseTool,
+    ParameterType,
+    ToolContext,
+    ToolMetadata,
+    ToolParameter,
+)
+from pythonium.tools.std.tool_ops import SlowCallProfilesTool
+
+
+def burn(milliseconds):
+    deadline = time.perf_counter() + milliseconds / 1000
+    while time.perf_counter() < deadline:
+        pass
+
+
+class BusyTool(BaseTool):
+    """Spins the CPU for the requested time."""
+
+    @property
+    def metadata(self):
+        return ToolMetadata(
+            name="busy",
+            description="busy",
+            category="test",
+            parameters=[
+                ToolParameter(
+                    name="ms", type=ParameterType.INTEGER, description="ms", default=0
+                ),
+            ],
+        )
+
+    async def execute(self, params, context):
+        burn(params["ms"])
+        return Result.success_result("done")
+
+
+@pytest.fixture
+def profiler(tmp_path):
+    profiler = SlowCallProfiler(threshold_ms=20, directory=tmp_path, max_profiles=2)
+    set_slow_call_profiler(profiler)
+    yield profiler
+    set_slow_call_profiler(None)
+
+
+def test_parameter_digest_is_stable_and_order_independent():
+    assert parameter_digest({"a": 1, "b": [2]}) == parameter_digest({"b": [2], "a": 1})
+    assert parameter_digest({"a": 1}) != parameter_digest({"a": 2})
+    assert len(parameter_digest({})) == 12
+
+
+def test_profiler_profiles_one_call_at_a_time(profiler):
+    first = profiler.begin()
+    assert first is not None
+    assert profiler.begin() is None
+
+    assert profiler.end(first, "busy", {"ms": 0}, 1_000) is None
+    assert profiler.stats == {"profiled": 1, "captured": 0, "skipped": 1}
+    assert profiler.profiles() == []
+
+
+@pytest.mark.asyncio
+async def test_slow_calls_are_kept_in_a_bounded_ring(profiler, tmp_path, monkeypatch):
+    server = PythoniumMCPServer()
+    server.register_tool(BusyTool())
+    function = server._dispatch_plans["busy"].build_function()
+
+    writer_threads = []
+    dump_stats = cProfile.Profile.dump_stats
+
+    def recording_dump_stats(profile, path):
+        writer_threads.append(threading.get_ident())
+        dump_stats(profile, path)
+
+    monkeypatch.setattr(cProfile.Profile, "dump_stats", recording_dump_stats)
+
+    assert await function(ms=0) == "done"
+    assert profiler.profiles() == []
+
+    for ms in (30, 31, 32):
+        await function(ms=ms)
+        await profiler.wait_for_writes()
+
+    # Profiles are written off the event loop
+    assert len(writer_threads) == 3
+    assert threading.get_ident() not in writer_threads
+
+    profiles = profiler.profiles()
+    assert [record.profile_id for record in profiles] == [3, 2]
+    assert profiles[0].parameter_digest == parameter_digest({"ms": 32})
+    assert profiles[0].path.name.startswith(f"busy-{profiles[0].parameter_digest}-")
+    assert profiles[0].duration_ms >= 32
+    # The evicted profile's file is deleted with it
+    assert sorted(tmp_path.iterdir()) == sorted(r.path for r in profiles)
+
+    functions = profiles[0].top_functions(limit=50)
+    assert any("burn" in entry["function"] for entry in functions)
+
+
+@pytest.mark.asyncio
+async def test_slow_call_profiles_tool_lists_and_summarizes(profiler):
+    server = PythoniumMCPServer()
+    server.register_tool(BusyTool())
+    await server.call_tool("busy", {"ms": 30})
+
+    tool = SlowCallProfilesTool()
+    listing = await tool.execute({"tool_name": "busy"}, ToolContext())
+    assert listing.success
+    assert listing.metadata["threshold_ms"] == 20
+    (entry,) = listing.data["profiles"]
+    assert entry["tool_name"] == "busy"
+
+    summary = await tool.execute(
+        {"profile_id": entry["profile_id"], "sort_by": "self", "top": 5},
+        ToolContext(),
+    )
+    assert summary.success
+    assert len(summary.data["functions"]) == 5
+    assert summary.data["functions"][0]["self_ms"] >= (
+        summary.data["functions"][-1]["self_ms"]
+    )
+
+    missing = await tool.execute({"profile_id": 99}, ToolContext())
+    assert not missing.success
+
+
+@pytest.mark.asyncio
+async def test_slow_call_profiles_tool_requires_profiling():
+    result = await SlowCallProfilesTool().execute({}, ToolContext())
+    assert not result.success
+    assert "--profile-slow-ms" in result.error
+
+
+def test_server_installs_profiler_from_settings(tmp_path):
+    server = PythoniumMCPServer(
+        config_overrides={
+            "server": {"profile_slow_ms": 250, "profile_dir": str(tmp_path)}
+        }
+    )
+    server._start_profiling()
+    try:
+        assert server._profiler.threshold_ns == 250_000_000
+        assert server._profiler.directory == tmp_path
+    finally:
+        server._stop_profiling()
+    assert server._profiler is None
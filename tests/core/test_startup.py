@@ -0,0 +1,86 @@
+"""Tests for startup import-time profiling."""
+
+import json
+import sys
+
+from click.testing import CliRunner
+
+from pythonium.core.startup import (
+    _MARKER,
+    StartupProfile,
+    parse_importtime,
+    profile_startup,
+)
+from pythonium.main import main
+
+IMPORTTIME_OUTPUT = f"""\
+import time: self [us] | cumulative | imported package
+import time:       100 |        100 | encodings
+{_MARKER}
+import time: self [us] | cumulative | imported package
+import time:      2000 |       2000 |     bs4.element
+import time:      1000 |       3000 |   bs4
+import time:       500 |       3500 | pythonium.tools.std.web
+"""
+
+TOOL_MODULES = [
+    "pythonium.tools.std.devteam",
+    "pythonium.tools.std.execution",
+    "pythonium.tools.std.file_ops",
+    "pythonium.tools.std.tool_ops",
+    "pythonium.tools.std.web",
+]
+
+
+def test_parse_importtime_skips_interpreter_startup():
+    records = parse_importtime(IMPORTTIME_OUTPUT)
+
+    assert [(r.module, r.depth) for r in records] == [
+        ("bs4.element", 2),
+        ("bs4", 1),
+        ("pythonium.tools.std.web", 0),
+    ]
+
+    profile = StartupProfile(modules=("x",), records=records, budget_ms=3)
+    assert profile.total_ms == 3.5
+    assert profile.over_budget
+    assert profile.by_package() == [("bs4", 3.0), ("pythonium", 0.5)]
+    assert profile.slowest(1)[0].module == "bs4.element"
+    assert profile.deferred_imports() == ["bs4"]
+
+
+def test_tool_dependencies_are_not_imported_eagerly():
+    profile = profile_startup(["pythonium.main", "pythonium.managers", *TOOL_MODULES])
+
+    imported = {record.module for record in profile.records}
+    assert profile.deferred_imports() == []
+    assert "pythonium.managers.devteam" not in imported
+    assert "pythonium.core.server" not in imported
+
+
+def test_profile_startup_command():
+    runner = CliRunner()
+    result = runner.invoke(main, ["profile-startup", "-m", "decimal", "--json"])
+
+    assert result.exit_code == 0
+    profile = json.loads(result.output)
+    assert profile["modules"] == ["decimal"]
+    assert profile["over_budget"] is False
+    assert profile["total_ms"] > 0
+
+    result = runner.invoke(
+        main, ["profile-startup", "-m", "decimal", "--budget-ms", "0"]
+    )
+    assert result.exit_code == 1
+
+    result = runner.invoke(main, ["profile-startup", "-m", "no_such_module_xyz"])
+    assert result.exit_code == 1
+    assert "no_such_module_xyz" in result.output
+
+
+def test_managers_package_exports_devteam_manager_lazily():
+    import pythonium.managers as managers
+
+    assert "DevTeamManager" in dir(managers)
+    assert managers.DevTeamManager.__module__ == "pythonium.managers.devteam"
+    assert sys.modules["pythonium.managers.devteam"]
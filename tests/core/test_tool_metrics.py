@@ -0,0 +1,139 @@
+"""
+Test tool usage metrics and the tool_stats meta-tool.
+"""
+
+import asyncio
+import random
+
+import pytest
+
+from pythonium.common.base import Result
+from pythonium.core.server import PythoniumMCPServer
+from pythonium.core.tools.metrics import (
+    BUCKET_COUNT,
+    LatencyHistogram,
+    bucket_index,
+    bucket_upper_bound,
+)
+from pythonium.core.tools.registry import ToolRegistry
+from pythonium.tools.base import (
+    BaseTool,
+    ParameterType,
+    ToolContext,
+    ToolMetadata,
+    ToolParameter,
+)
+from pythonium.tools.std.tool_ops import ToolStatsTool
+
+
+class WaitTool(BaseTool):
+    """Waits on an event so calls can be held in flight."""
+
+    def __init__(self):
+        super().__init__()
+        self.release = asyncio.Event()
+
+    @property
+    def metadata(self):
+        return ToolMetadata(
+            name="wait",
+            description="wait",
+            category="test",
+            parameters=[
+                ToolParameter(
+                    name="fail",
+                    type=ParameterType.BOOLEAN,
+                    description="fail",
+                    default=False,
+                ),
+            ],
+        )
+
+    async def execute(self, params, context):
+        await self.release.wait()
+        if params["fail"]:
+            return Result.error_result("asked to fail")
+        return Result.success_result("ok")
+
+
+def test_buckets_are_contiguous_and_bounded():
+    previous = -1
+    for value in list(range(200)) + [2**20, 2**30, 2**41 + 12345]:
+        index = bucket_index(value)
+        assert index >= previous
+        assert value <= bucket_upper_bound(index) <= value * 1.07 + 1
+        previous = index
+    assert bucket_index(2**60) == BUCKET_COUNT - 1
+
+
+def test_histogram_percentiles_within_relative_error():
+    histogram = LatencyHistogram()
+    values = [random.randint(1_000, 50_000_000) for _ in range(5000)]
+    for value in values:
+        histogram.record(value)
+    values.sort()
+
+    for percentile in (50, 95, 99):
+        exact = values[int(len(values) * percentile / 100) - 1]
+        assert abs(histogram.percentile(percentile) - exact) <= exact * 0.07
+    assert histogram.percentile(100) == values[-1]
+    assert len(histogram.counts) == BUCKET_COUNT
+
+    histogram.reset()
+    assert histogram.percentile(50) == 0
+
+
+def test_registry_records_usage_and_in_flight():
+    registry = ToolRegistry()
+    tool_id = registry.register_tool(WaitTool())
+
+    registry.begin_tool_call(tool_id)
+    registry.begin_tool_call(tool_id)
+    assert registry.get_tool_stats(tool_id)[tool_id]["in_flight"] == 2
+
+    registry.end_tool_call(tool_id, 2_000_000, success=True)
+    registry.end_tool_call(tool_id, 4_000_000, success=False)
+    registry.record_tool_usage(tool_id)
+
+    stats = registry.get_tool_stats("wait")[tool_id]
+    assert stats["calls"] == 3
+    assert stats["successes"] == 2 and stats["errors"] == 1
+    assert stats["in_flight"] == 0 and stats["max_in_flight"] == 2
+    assert 3.7 <= stats["latency_ms"]["p99"] <= 4.0
+    assert registry.get_tool("wait").usage_count == 3
+    assert registry.get_tool_stats("missing") == {}
+
+
+@pytest.mark.asyncio
+async def test_server_dispatch_feeds_registry_and_tool_stats():
+    server = PythoniumMCPServer()
+    wait_tool = WaitTool()
+    server.register_tools([wait_tool, ToolStatsTool()])
+    wait_function = server._dispatch_plans["wait"].build_function()
+
+    pending = asyncio.ensure_future(wait_function())
+    await asyncio.sleep(0)
+    assert server.tool_registry.get_tool_stats("wait")["wait"]["in_flight"] == 1
+
+    wait_tool.release.set()
+    assert await pending == "ok"
+    with pytest.raises(Exception, match="asked to fail"):
+        await wait_function(fail=True)
+    await server.call_tool("wait", {})
+
+    stats_tool = server.get_registered_tools()["tool_stats"]
+    result = await stats_tool.execute(
+        {"sort_by": "p99"}, ToolContext(registry=server.tool_registry)
+    )
+
+    assert result.success
+    (entry,) = result.data["tools"]
+    assert entry["tool_id"] == "wait"
+    assert entry["calls"] == 3 and entry["errors"] == 1
+    assert entry["in_flight"] == 0
+    assert entry["latency_ms"]["p50"] > 0
+
+    missing = await stats_tool.execute(
+        {"tool_name": "missing"}, ToolContext(registry=server.tool_registry)
+    )
+    assert not missing.success
@@ -1,8 +1,10 @@
+import fnmatch
 from datetime import datetime
 from unittest.mock import Mock
 
 import pytest
 
+from pythonium.common.exceptions import ToolError
 from pythonium.core.tools.registry import ToolRegistry, ToolStatus
 from pythonium.tools.base import BaseTool, ToolMetadata
 
@@ -93,3 +95,148 @@ class TestToolRegistry:
         registry.register_tool(AnotherTool, name="another2")
         assert len(events) == 1
         assert registry.has_tool(tid)
+
+    def test_register_instance_keeps_live_instance(self):
+        registry = ToolRegistry()
+        tool = SimpleTool()
+        tid = registry.register_tool(tool)
+
+        registration = registry.get_tool(tid)
+        assert registration.tool_class is SimpleTool
+        assert registration.instance is tool
+        assert registration.get_instance() is tool
+
+    def test_register_with_metadata_defers_instantiation(self):
+        created = []
+
+        class CountingTool(SimpleTool):
+            def __init__(self):
+                super().__init__()
+                created.append(self)
+
+        registry = ToolRegistry()
+        tid = registry.register_tool(CountingTool, metadata=SimpleTool().metadata)
+        assert created == []
+
+        registration = registry.get_tool(tid)
+        assert registration.get_instance() is registration.get_instance()
+        assert len(created) == 1
+
+    def test_indexed_queries_match_full_scan(self):
+        registry = ToolRegistry()
+        for i in range(60):
+            metadata = ToolMetadata(
+                name=f"tool_{i:02d}",
+                description="d",
+                category=f"cat{i % 3}",
+                version=f"1.{i % 4}.0",
+            )
+            registry.register_tool(
+                SimpleTool, metadata=metadata, tags=[f"t{i % 2}", f"u{i % 5}"]
+            )
+        for i in range(0, 60, 7):
+            registry.update_tool_status(f"tool_{i:02d}", ToolStatus.DISABLED)
+        registry.unregister_tool("tool_10")
+
+        def full_scan(status=None, category=None, tags=None, name_pattern=None):
+            return sorted(
+                (
+                    t
+                    for t in registry.tools.values()
+                    if (not status or t.status == status)
+                    and (not category or t.metadata.category == category)
+                    and set(tags or ()).issubset(t.tags)
+                    and (not name_pattern or fnmatch.fnmatch(t.name, name_pattern))
+                ),
+                key=lambda t: (t.name, t.version),
+            )
+
+        queries = [
+            {},
+            {"status": ToolStatus.DISABLED},
+            {"status": ToolStatus.REGISTERED, "category": "cat1"},
+            {"category": "cat2", "tags": ["t0", "u1"]},
+            {"tags": ["t1"], "name_pattern": "tool_1*"},
+            {"name_pattern": "tool_42"},
+            {"name_pattern": "tool_10"},
+            {"category": "missing"},
+        ]
+        for query in queries:
+            assert registry.list_tools(**query) == full_scan(**query), query
+
+    def test_sorted_view_is_rebuilt_only_after_mutation(self):
+        registry = ToolRegistry()
+        registry.register_tool(AnotherTool)
+        registry.list_tools()
+        view = registry._sorted_view
+
+        registry.update_tool_status("another", ToolStatus.ACTIVE)
+        assert registry.list_tools(status=ToolStatus.ACTIVE)[0].name == "another"
+        assert registry._sorted_view is view
+
+        registry.register_tool(SimpleTool)
+        assert [t.name for t in registry.list_tools()] == ["another", "simple"]
+        assert registry._sorted_view is not view
+
+
+def versioned(version):
+    return ToolMetadata(
+        name="plugin", description="d", category="test", version=version
+    )
+
+
+class TestToolVersions:
+    @pytest.fixture
+    def registry(self):
+        registry = ToolRegistry()
+        for version in ["1.2.0", "1.10.0", "2.0.0-beta.1", "1.9.3", "0.9"]:
+            registry.register_tool(SimpleTool, metadata=versioned(version))
+        return registry
+
+    def test_extra_versions_get_versioned_ids(self, registry):
+        ids = [t.tool_id for t in registry.get_tool_versions("plugin")]
+        assert ids == [
+            "plugin@0.9",
+            "plugin",
+            "plugin@1.9.3",
+            "plugin@1.10.0",
+            "plugin@2.0.0-beta.1",
+        ]
+
+    def test_name_resolves_to_highest_version(self, registry):
+        assert registry.get_tool("plugin").version == "1.10.0"
+        registry.register_tool(SimpleTool, metadata=versioned("2.0.0"))
+        assert registry.get_tool("plugin").version == "2.0.0"
+
+        registry.unregister_tool("plugin@2.0.0")
+        assert registry.get_tool("plugin").version == "1.10.0"
+
+    def test_name_resolves_to_prerelease_without_a_final_release(self):
+        registry = ToolRegistry()
+        registry.register_tool(SimpleTool, metadata=versioned("2.0.0-rc1"))
+        registry.register_tool(SimpleTool, metadata=versioned("2.0.0-beta.1"))
+        assert registry.get_tool("plugin").version == "2.0.0-rc1"
+
+        registry.register_tool(SimpleTool, metadata=versioned("1.9.0"))
+        assert registry.get_tool("plugin").version == "1.9.0"
+
+    def test_constraint_lookup(self, registry):
+        assert registry.resolve_tool("plugin", ">=1.2,<2").version == "1.10.0"
+        assert registry.resolve_tool("plugin", "<1.10").version == "1.9.3"
+        assert registry.resolve_tool("plugin", "1.2").tool_id == "plugin"
+        assert registry.resolve_tool("plugin", ">3") is None
+        assert registry.get_tool("plugin@>=1,<1.5").version == "1.2.0"
+        assert registry.get_tool("plugin@0.9").tool_id == "plugin@0.9"
+
+        with pytest.raises(ToolError):
+            registry.resolve_tool("plugin", ">=banana")
+        assert registry.get_tool("plugin@>=banana") is None
+
+    def test_constraint_cache_is_invalidated(self, registry):
+        assert registry.resolve_tool("plugin", "<2").version == "1.10.0"
+        registry.register_tool(SimpleTool, metadata=versioned("1.11"))
+        assert registry.resolve_tool("plugin", "<2").version == "1.11"
+
+    def test_equivalent_versions_are_duplicates(self, registry):
+        with pytest.raises(ToolError):
+            registry.register_tool(SimpleTool, metadata=versioned("1.2"))
@@ -0,0 +1,56 @@
+"""Tests for tool version parsing and constraints."""
+
+import pytest
+
+from pythonium.core.tools.versions import (
+    is_valid_version,
+    matches_constraint,
+    parse_constraint,
+    version_key,
+)
+
+
+def test_versions_sort_semantically():
+    versions = ["1.10.0", "1.2", "2.0.0", "2.0.0-rc.1", "2.0.0-alpha", "1.2.1", "dev"]
+    assert sorted(versions, key=version_key) == [
+        "dev",
+        "1.2",
+        "1.2.1",
+        "1.10.0",
+        "2.0.0-alpha",
+        "2.0.0-rc.1",
+        "2.0.0",
+    ]
+
+
+def test_trailing_zeros_and_build_metadata_are_ignored():
+    assert version_key("2") == version_key("2.0.0") == version_key("v2.0+build.5")
+    assert not is_valid_version("latest")
+
+
+@pytest.mark.parametrize(
+    "version,constraint,expected",
+    [
+        ("1.2.0", ">=1.2,<2", True),
+        ("1.10.0", ">=1.2,<2", True),
+        ("2.0.0", ">=1.2,<2", False),
+        ("1.1.9", ">=1.2,<2", False),
+        ("1.4.0", "1.4", True),
+        ("1.4.0", "!=1.4", False),
+        ("dev", ">=0", False),
+    ],
+)
+def test_matches_constraint(version, constraint, expected):
+    assert matches_constraint(version, constraint) is expected
+
+
+@pytest.mark.parametrize("constraint", ["", ">=", "~1.2", ">=1.2,,<2", ">=x"])
+def test_malformed_constraints_are_rejected(constraint):
+    with pytest.raises(ValueError):
+        parse_constraint(constraint)
+
+
+def test_prereleases_only_match_prerelease_constraints():
+    assert not matches_constraint("2.0.0-beta.1", "<2")
+    assert not matches_constraint("2.0.0-beta.1", ">=1")
+    assert matches_constraint("2.0.0-beta.1", ">=2.0.0-alpha")
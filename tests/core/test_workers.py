@@ -0,0 +1,176 @@
+import socket
+import time
+from unittest.mock import Mock, patch
+
+import pytest
+from click.testing import CliRunner
+
+from pythonium.core.workers import (
+    WorkerError,
+    WorkerSupervisor,
+    create_reuseport_socket,
+)
+from pythonium.main import main
+
+
+class FakeProcess:
+    _next_pid = 1000
+
+    def __init__(self, *args, **kwargs):
+        FakeProcess._next_pid += 1
+        self.pid = FakeProcess._next_pid
+        self.exitcode = None
+        self._alive = False
+        self.killed = False
+        self.terminated = False
+
+    def start(self):
+        self._alive = True
+
+    def is_alive(self):
+        return self._alive
+
+    def terminate(self):
+        self.terminated = True
+        self._alive = False
+        self.exitcode = -15
+
+    def kill(self):
+        self.killed = True
+        self._alive = False
+        self.exitcode = -9
+
+    def join(self, timeout=None):
+        pass
+
+
+@pytest.fixture
+def supervisor():
+    sup = WorkerSupervisor(2, heartbeat_timeout=5.0)
+    sup._context = Mock(Process=FakeProcess)
+    for slot in sup._slots:
+        sup._spawn(slot)
+    return sup
+
+
+@pytest.mark.skipif(
+    not hasattr(socket, "SO_REUSEPORT"), reason="SO_REUSEPORT unavailable"
+)
+def test_reuseport_sockets_share_a_port():
+    first = create_reuseport_socket("127.0.0.1", 0)
+    try:
+        port = first.getsockname()[1]
+        second = create_reuseport_socket("127.0.0.1", port)
+        assert second.getsockname()[1] == port
+        second.close()
+    finally:
+        first.close()
+
+
+def test_supervisor_requires_a_worker():
+    with pytest.raises(WorkerError):
+        WorkerSupervisor(0)
+
+
+def test_dead_worker_is_restarted_after_backoff(supervisor):
+    slot = supervisor._slots[0]
+    old_pid = slot.pid
+    slot.process.kill()
+
+    supervisor._check_workers()
+    assert slot.pid == old_pid  # Restart scheduled, not immediate
+    assert 0 in supervisor._restart_at
+
+    supervisor._restart_at[0] = time.monotonic()
+    supervisor._check_workers()
+    assert slot.alive
+    assert slot.pid != old_pid
+    assert slot.restarts == 1
+
+
+def test_hung_worker_is_killed(supervisor):
+    slot = supervisor._slots[1]
+    process = slot.process
+    slot.last_heartbeat_at = time.monotonic() - 10
+
+    supervisor._check_workers()
+    assert process.killed
+    assert 1 in supervisor._restart_at
+
+
+def test_heartbeats_roll_up_into_stats(supervisor):
+    for slot in supervisor._slots:
+        supervisor._status_queue.put(
+            {
+                "worker_id": slot.worker_id,
+                "pid": slot.pid,
+                "timestamp": time.time(),
+                "running": True,
+                "tools": 13,
+                "admission": {"global": {"admitted": 5, "in_flight": 1}},
+            }
+        )
+    # Heartbeats from a replaced process are ignored
+    supervisor._status_queue.put({"worker_id": 0, "pid": -1, "tools": 99})
+
+    deadline = time.monotonic() + 5
+    while time.monotonic() < deadline and not all(
+        slot.last_heartbeat for slot in supervisor._slots
+    ):
+        supervisor._drain_status_queue()
+        time.sleep(0.01)
+
+    stats = supervisor.get_stats()
+    assert stats["totals"]["alive"] == 2
+    assert stats["totals"]["tools"] == 13
+    assert stats["totals"]["admitted"] == 10
+    assert stats["totals"]["in_flight"] == 2
+    assert all(worker["running"] for worker in stats["workers"])
+
+
+def test_stats_are_logged_periodically_and_on_restart(supervisor):
+    supervisor.stats_interval = 60.0
+    with patch.object(supervisor, "log_stats") as log_stats:
+        supervisor._log_stats_periodically()
+        supervisor._log_stats_periodically()
+        log_stats.assert_not_called()
+
+        supervisor._next_stats_at = time.monotonic() - 1
+        supervisor._log_stats_periodically()
+        assert log_stats.call_count == 1
+        assert supervisor._next_stats_at > time.monotonic()
+
+        supervisor._slots[0].process.kill()
+        supervisor._check_workers()
+        supervisor._restart_at[0] = time.monotonic()
+        supervisor._check_workers()
+        assert log_stats.call_count == 2
+
+
+@pytest.mark.asyncio
+async def test_shutdown_terminates_workers(supervisor):
+    processes = [slot.process for slot in supervisor._slots]
+    await supervisor.shutdown()
+    assert all(process.terminated for process in processes)
+    assert supervisor.get_stats()["totals"]["alive"] == 0
+
+
+def test_serve_workers_cli():
+    runner = CliRunner()
+
+    result = runner.invoke(main, ["serve", "--workers", "2"])
+    assert result.exit_code != 0
+    assert "--workers requires" in result.output
+
+    with patch("pythonium.core.workers.WorkerSupervisor") as mock_supervisor, patch(
+        "pythonium.main.asyncio.run"
+    ) as mock_run:
+        result = runner.invoke(
+            main, ["serve", "--transport", "http", "--workers", "3", "--port", "9001"]
+        )
+
+    assert result.exit_code == 0
+    args, kwargs = mock_supervisor.call_args
+    assert args[0] == 3
+    assert kwargs["config_overrides"]["server"]["port"] == 9001
+    mock_run.assert_called_once()
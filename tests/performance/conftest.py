@@ -0,0 +1,187 @@
+"""
+Benchmark harness and fixtures for the performance suite.
+
+Benchmarks time their body with the ``benchmark`` fixture, which
+discards a warmup round and keeps the best of several more as
+microseconds per operation. When the ``PYTHONIUM_BENCHMARK_RESULTS``
+environment variable names a file, the results of the session are
+written there as JSON for ``tests.performance.regression`` to compare
+against the stored baseline (see ``make benchmark``).
+
+Tools run against synthetic fixtures: a generated file tree and HTTP
+responses replayed from ``fixtures/http`` instead of the network.
+"""
+
+import json
+import os
+import platform
+import sys
+import time
+from pathlib import Path
+from typing import Any, Awaitable, Callable, Dict, List
+
+import httpx
+import pytest
+
+RESULTS_ENV_VAR = "PYTHONIUM_BENCHMARK_RESULTS"
+
+HTTP_FIXTURES = Path(__file__).parent / "fixtures" / "http"
+
+# Shape of the generated file tree: directories per level, levels, files
+# per directory and lines per file
+TREE_FANOUT = 4
+TREE_DEPTH = 3
+TREE_FILES_PER_DIR = 8
+TREE_LINES_PER_FILE = 60
+
+
+class BenchmarkRecorder:
+    """Times benchmark bodies and collects their results."""
+
+    def __init__(self):
+        self.results: Dict[str, Dict[str, Any]] = {}
+
+    def _record(self, name: str, best: float, number: int, rounds: int) -> float:
+        per_op_us = best / number * 1e6
+        self.results[name] = {
+            "value": round(per_op_us, 3),
+            "unit": "us/op",
+            "number": number,
+            "rounds": rounds,
+        }
+        print(f"\n{name}: {per_op_us:.2f}us/op")
+        return per_op_us
+
+    def measure(
+        self, name: str, func: Callable[[], Any], number: int, rounds: int = 5
+    ) -> float:
+        """
+        Time ``number`` calls of ``func``, keeping the best of ``rounds``.
+
+        An extra warmup round runs first and is discarded.
+        """
+        timings = []
+        for _ in range(rounds + 1):
+            start = time.perf_counter()
+            for _ in range(number):
+                func()
+            timings.append(time.perf_counter() - start)
+        return self._record(name, min(timings[1:]), number, rounds)
+
+    async def measure_async(
+        self,
+        name: str,
+        func: Callable[[], Awaitable[Any]],
+        number: int,
+        rounds: int = 5,
+    ) -> float:
+        """Time ``number`` awaited calls of ``func`` like :meth:`measure`."""
+        timings = []
+        for _ in range(rounds + 1):
+            start = time.perf_counter()
+            for _ in range(number):
+                await func()
+            timings.append(time.perf_counter() - start)
+        return self._record(name, min(timings[1:]), number, rounds)
+
+    def to_dict(self) -> Dict[str, Any]:
+        """Return the results with the environment they were measured in."""
+        return {
+            "environment": {
+                "python": platform.python_version(),
+                "implementation": platform.python_implementation(),
+                "platform": sys.platform,
+                "machine": platform.machine(),
+            },
+            "metrics": dict(sorted(self.results.items())),
+        }
+
+
+_recorder = BenchmarkRecorder()
+
+
+@pytest.fixture
+def benchmark() -> BenchmarkRecorder:
+    """The session's benchmark recorder."""
+    return _recorder
+
+
+def pytest_sessionfinish(session, exitstatus):
+    """Write the session's benchmark results if a results file was requested."""
+    path = os.environ.get(RESULTS_ENV_VAR)
+    if path and _recorder.results:
+        Path(path).parent.mkdir(parents=True, exist_ok=True)
+        Path(path).write_text(json.dumps(_recorder.to_dict(), indent=2) + "\n")
+
+
+def _write_tree(directory: Path, depth: int) -> None:
+    directory.mkdir(parents=True, exist_ok=True)
+    for index in range(TREE_FILES_PER_DIR):
+        suffix = (".py", ".md", ".txt", ".json")[index % 4]
+        lines = [
+            (
+                f"def main_{depth}_{index}_{line}(argument):"
+                if line % 15 == 0
+                else f"    value_{line} = compute(argument, {line})  # level {depth}"
+            )
+            for line in range(TREE_LINES_PER_FILE)
+        ]
+        (directory / f"module_{index}{suffix}").write_text("\n".join(lines) + "\n")
+    if depth < TREE_DEPTH:
+        for child in range(TREE_FANOUT):
+            _write_tree(directory / f"package_{child}", depth + 1)
+
+
+@pytest.fixture(scope="session")
+def file_tree(tmp_path_factory) -> Path:
+    """A generated source tree: 21 directories of 8 files each."""
+    root = tmp_path_factory.mktemp("tree")
+    _write_tree(root, 1)
+    return root
+
+
+class RecordedTransport(httpx.AsyncBaseTransport):
+    """Replays recorded HTTP responses; unrecorded requests get a 404."""
+
+    def __init__(self, recordings: List[Dict[str, Any]]):
+        self.recordings = recordings
+        self.bodies = {
+            recording["body"]: (HTTP_FIXTURES / recording["body"]).read_bytes()
+            for recording in recordings
+        }
+        self.requests = 0
+
+    async def handle_async_request(self, request: httpx.Request) -> httpx.Response:
+        self.requests += 1
+        url = str(request.url.copy_with(query=None))
+        params = dict(request.url.params)
+        for recording in self.recordings:
+            if (
+                recording["method"] == request.method
+                and recording["url"] == url
+                and recording["params"].items() <= params.items()
+            ):
+                return httpx.Response(
+                    recording["status"],
+                    headers={"content-type": recording["content_type"]},
+                    content=self.bodies[recording["body"]],
+                    request=request,
+                )
+        return httpx.Response(404, text=f"No recording for {request.url}")
+
+
+@pytest.fixture
+def recorded_http(monkeypatch) -> RecordedTransport:
+    """Serve every ``httpx.AsyncClient`` request from the recordings."""
+    transport = RecordedTransport(
+        json.loads((HTTP_FIXTURES / "recordings.json").read_text())
+    )
+    real_client = httpx.AsyncClient
+
+    class RecordedClient(real_client):  # type: ignore[misc, valid-type]
+        def __init__(self, *args, **kwargs):
+            kwargs["transport"] = transport
+            super().__init__(*args, **kwargs)
+
+    monkeypatch.setattr(httpx, "AsyncClient", RecordedClient)
+    return transport
@@ -0,0 +1,146 @@
+"""
+Compare benchmark results against the stored baseline.
+
+Every metric in the baseline is tracked; a metric regresses when it is
+slower than its baseline value by more than the allowed percentage,
+which is ``--max-regression`` unless the baseline entry sets its own
+``max_regression_pct`` for a noisier benchmark. A tracked metric missing
+from the results fails the comparison too, so benchmarks cannot be
+dropped silently. ``--update`` accepts the results as the new baseline.
+
+Usage::
+
+    python -m tests.performance.regression RESULTS [--baseline PATH]
+        [--max-regression PCT] [--update]
+"""
+
+import argparse
+import json
+import sys
+from dataclasses import dataclass
+from pathlib import Path
+from typing import Any, Dict, List, Optional
+
+DEFAULT_BASELINE = Path(__file__).with_name("baseline.json")
+DEFAULT_MAX_REGRESSION_PCT = 25.0
+
+
+@dataclass
+class Comparison:
+    """A tracked metric compared with its baseline."""
+
+    name: str
+    baseline: float
+    current: Optional[float]
+    limit_pct: float
+
+    @property
+    def change_pct(self) -> Optional[float]:
+        if self.current is None or not self.baseline:
+            return None
+        return (self.current - self.baseline) / self.baseline * 100
+
+    @property
+    def regressed(self) -> bool:
+        change = self.change_pct
+        return self.current is None or (change is not None and change > self.limit_pct)
+
+
+def compare(
+    results: Dict[str, Any],
+    baseline: Dict[str, Any],
+    max_regression_pct: float = DEFAULT_MAX_REGRESSION_PCT,
+) -> List[Comparison]:
+    """Compare every baseline metric with the results."""
+    current = results.get("metrics", {})
+    comparisons = []
+    for name, entry in sorted(baseline.get("metrics", {}).items()):
+        measured = current.get(name)
+        comparisons.append(
+            Comparison(
+                name=name,
+                baseline=entry["value"],
+                current=measured["value"] if measured is not None else None,
+                limit_pct=entry.get("max_regression_pct", max_regression_pct),
+            )
+        )
+    return comparisons
+
+
+def update_baseline(
+    results: Dict[str, Any], baseline: Optional[Dict[str, Any]] = None
+) -> Dict[str, Any]:
+    """Build a baseline from results, keeping per-metric regression limits."""
+    previous = (baseline or {}).get("metrics", {})
+    metrics = {}
+    for name, entry in results.get("metrics", {}).items():
+        metric = {"value": entry["value"], "unit": entry.get("unit", "us/op")}
+        if "max_regression_pct" in previous.get(name, {}):
+            metric["max_regression_pct"] = previous[name]["max_regression_pct"]
+        metrics[name] = metric
+    return {
+        "environment": results.get("environment", {}),
+        "metrics": dict(sorted(metrics.items())),
+    }
+
+
+def format_report(comparisons: List[Comparison]) -> str:
+    """Render comparisons as a table, one metric per line."""
+    width = max((len(c.name) for c in comparisons), default=10)
+    lines = [
+        f"{'metric':<{width}}  {'baseline':>11}  {'current':>11}  {'change':>8}  limit"
+    ]
+    for c in comparisons:
+        current = f"{c.current:11.2f}" if c.current is not None else f"{'missing':>11}"
+        change = f"{c.change_pct:+7.1f}%" if c.change_pct is not None else f"{'':>8}"
+        flag = "  REGRESSED" if c.regressed else ""
+        lines.append(
+            f"{c.name:<{width}}  {c.baseline:11.2f}  {current}  {change}  "
+            f"{c.limit_pct:g}%{flag}"
+        )
+    return "\n".join(lines)
+
+
+def main(argv: Optional[List[str]] = None) -> int:
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument("results", type=Path, help="Benchmark results JSON")
+    parser.add_argument("--baseline", type=Path, default=DEFAULT_BASELINE)
+    parser.add_argument(
+        "--max-regression",
+        type=float,
+        default=DEFAULT_MAX_REGRESSION_PCT,
+        help="Allowed slowdown in percent (default: %(default)s)",
+    )
+    parser.add_argument(
+        "--update", action="store_true", help="Write the results as the baseline"
+    )
+    args = parser.parse_args(argv)
+
+    results = json.loads(args.results.read_text())
+    baseline = json.loads(args.baseline.read_text()) if args.baseline.exists() else None
+
+    if args.update:
+        updated = update_baseline(results, baseline)
+        args.baseline.write_text(json.dumps(updated, indent=2) + "\n")
+        print(f"Wrote {len(updated['metrics'])} metrics to {args.baseline}")
+        return 0
+
+    if baseline is None:
+        print(f"No baseline at {args.baseline}; run make benchmark-baseline")
+        return 1
+
+    comparisons = compare(results, baseline, args.max_regression)
+    print(format_report(comparisons))
+    regressed = [c for c in comparisons if c.regressed]
+    if regressed:
+        print(
+            f"\n{len(regressed)} of {len(comparisons)} metrics regressed: "
+            + ", ".join(c.name for c in regressed)
+        )
+        return 1
+    print(f"\nAll {len(comparisons)} metrics within limits")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,436 @@
+"""
+Benchmarks tracked against ``tests/performance/baseline.json``.
+
+Covers per-call dispatch overhead, every standard tool on synthetic
+fixtures, event bus publish throughput and tool registry queries. Each
+benchmark records microseconds per operation through the ``benchmark``
+fixture; ``make benchmark`` fails when one regresses past the allowed
+percentage. The DevTeam tools are not covered: they front a running
+DevTeam manager rather than doing work of their own.
+"""
+
+import itertools
+import sys
+
+import pytest
+
+from pythonium.common.base import Result
+from pythonium.common.events import EventBus
+from pythonium.core.profiling import SlowCallProfiler, set_slow_call_profiler
+from pythonium.core.server import PythoniumMCPServer
+from pythonium.core.tools.registry import ToolRegistry
+from pythonium.tools.base import BaseTool, ParameterType, ToolMetadata, ToolParameter
+from pythonium.tools.std.execution import ExecuteCommandTool
+from pythonium.tools.std.file_ops import (
+    DeleteFileTool,
+    FindFilesTool,
+    ReadFileTool,
+    SearchFilesTool,
+    WriteFileTool,
+)
+from pythonium.tools.std.tool_ops import (
+    BatchExecuteTool,
+    DescribeToolTool,
+    SearchToolsTool,
+    SlowCallProfilesTool,
+    ToolStatsTool,
+)
+from pythonium.tools.std.web import HttpClientTool, WebSearchTool
+
+# Settings for servers whose tools must do their work on every call
+UNCACHED = {"tools": {"result_cache_enabled": False, "coalesce_calls": False}}
+
+
+class EchoTool(BaseTool):
+    """Returns its parameters; isolates dispatch overhead."""
+
+    shared_metadata = False
+
+    def __init__(self, cacheable: bool = False):
+        super().__init__()
+        self._metadata = ToolMetadata(
+            name="echo_cached" if cacheable else "echo",
+            description="Returns its parameters",
+            category="benchmark",
+            cacheable=cacheable,
+            parameters=[
+                ToolParameter(
+                    name="path",
+                    type=ParameterType.STRING,
+                    description="Path",
+                    required=True,
+                ),
+                ToolParameter(
+                    name="limit",
+                    type=ParameterType.INTEGER,
+                    description="Limit",
+                    default=10,
+                ),
+            ],
+        )
+
+    @property
+    def metadata(self) -> ToolMetadata:
+        return self._metadata
+
+    async def execute(self, parameters, context):
+        return Result.success_result(data=parameters)
+
+
+@pytest.fixture
+def std_server(tmp_path):
+    """A server with every standard tool except the DevTeam ones."""
+    server = PythoniumMCPServer(config_overrides=UNCACHED)
+    server.register_tools(
+        [
+            ReadFileTool(),
+            WriteFileTool(),
+            DeleteFileTool(),
+            FindFilesTool(),
+            SearchFilesTool(),
+            ExecuteCommandTool(),
+            WebSearchTool(),
+            HttpClientTool(),
+            DescribeToolTool(),
+            SearchToolsTool(),
+            BatchExecuteTool(),
+            ToolStatsTool(),
+            SlowCallProfilesTool(),
+            EchoTool(),
+        ]
+    )
+    return server
+
+
+async def measure_tool(benchmark, server, name, metric, parameters, number, rounds=5):
+    """Check that a tool call succeeds, then benchmark it through the server."""
+    result = await server.call_tool(name, parameters)
+    assert result.success, result.error
+    return await benchmark.measure_async(
+        metric, lambda: server.call_tool(name, parameters), number, rounds
+    )
+
+
+@pytest.mark.performance
+class TestDispatchBenchmarks:
+    """Per-call overhead of the dispatch paths."""
+
+    async def test_mcp_function(self, benchmark):
+        server = PythoniumMCPServer(config_overrides=UNCACHED)
+        server.register_tool(EchoTool())
+        function = server._dispatch_plans["echo"].build_function()
+
+        assert await function(path="/tmp/file") == {"path": "/tmp/file", "limit": 10}
+        await benchmark.measure_async(
+            "dispatch.mcp_function", lambda: function(path="/tmp/file"), 5000
+        )
+
+    async def test_call_tool(self, benchmark):
+        server = PythoniumMCPServer(config_overrides=UNCACHED)
+        server.register_tool(EchoTool())
+
+        await measure_tool(
+            benchmark, server, "echo", "dispatch.call_tool", {"path": "/tmp"}, 5000
+        )
+
+    async def test_result_cache_hit(self, benchmark):
+        server = PythoniumMCPServer()
+        server.register_tool(EchoTool(cacheable=True))
+
+        await measure_tool(
+            benchmark,
+            server,
+            "echo_cached",
+            "dispatch.result_cache_hit",
+            {"path": "/tmp"},
+            5000,
+        )
+        assert server.get_cache_stats()["hits"] > 0
+
+
+@pytest.mark.performance
+class TestFileToolBenchmarks:
+    """File tools on a generated source tree."""
+
+    async def test_read_file(self, benchmark, std_server, file_tree):
+        path = str(file_tree / "package_0" / "module_0.py")
+        await measure_tool(
+            benchmark, std_server, "read_file", "tools.read_file", {"path": path}, 300
+        )
+
+    async def test_write_file(self, benchmark, std_server, tmp_path):
+        parameters = {
+            "path": str(tmp_path / "out.txt"),
+            "content": "line of output\n" * 200,
+            "overwrite": True,
+        }
+        await measure_tool(
+            benchmark, std_server, "write_file", "tools.write_file", parameters, 200
+        )
+
+    async def test_delete_file(self, benchmark, std_server, tmp_path):
+        number, rounds = 100, 5
+        paths = []
+        for index in range(number * (rounds + 1) + 1):
+            path = tmp_path / f"victim_{index}.txt"
+            path.write_text("x")
+            paths.append(str(path))
+        victims = iter(paths)
+
+        async def delete():
+            return await std_server.call_tool("delete_file", {"path": next(victims)})
+
+        assert (await delete()).success
+        await benchmark.measure_async("tools.delete_file", delete, number, rounds)
+        assert not any(tmp_path.glob("victim_*"))
+
+    async def test_find_files(self, benchmark, std_server, file_tree):
+        result = await std_server.call_tool(
+            "find_files", {"path": str(file_tree), "name_pattern": "*.py"}
+        )
+        assert result.data["total_found"] == 42
+
+        await measure_tool(
+            benchmark,
+            std_server,
+            "find_files",
+            "tools.find_files",
+            {"path": str(file_tree), "name_pattern": "*.py"},
+            20,
+            rounds=3,
+        )
+
+    async def test_search_files(self, benchmark, std_server, file_tree):
+        parameters = {
+            "path": str(file_tree),
+            "pattern": "def main_3",
+            "file_pattern": "*.py",
+            "limit": 1000,
+        }
+        result = await std_server.call_tool("search_files", parameters)
+        assert result.data["total_matches"] == 16 * 2 * 4
+
+        await measure_tool(
+            benchmark,
+            std_server,
+            "search_files",
+            "tools.search_files",
+            parameters,
+            10,
+            rounds=3,
+        )
+
+
+@pytest.mark.performance
+class TestExecutionBenchmarks:
+    """Command execution, dominated by process startup."""
+
+    async def test_execute_command(self, benchmark, std_server):
+        await measure_tool(
+            benchmark,
+            std_server,
+            "execute_command",
+            "tools.execute_command",
+            {"command": sys.executable, "args": ["-S", "-c", "pass"]},
+            5,
+            rounds=3,
+        )
+
+
+@pytest.mark.performance
+class TestWebToolBenchmarks:
+    """Web tools replaying recorded HTTP responses."""
+
+    async def test_web_search_lite(self, benchmark, std_server, recorded_http):
+        result = await std_server.call_tool(
+            "web_search", {"query": "python asyncio", "max_results": 10}
+        )
+        assert "docs.python.org/3/library/asyncio.html" in result.data
+        assert result.metadata["total_results"] == 10
+
+        await measure_tool(
+            benchmark,
+            std_server,
+            "web_search",
+            "tools.web_search.lite",
+            {"query": "python asyncio", "max_results": 10},
+            20,
+            rounds=3,
+        )
+
+    async def test_web_search_html_fallback(self, benchmark, std_server, recorded_http):
+        parameters = {"query": "pythonium mcp server", "max_results": 10}
+        result = await std_server.call_tool("web_search", parameters)
+        assert "github.com/dwharve/pythonium" in result.data
+        # The HTML parser scans a bounded number of result containers, so it
+        # returns fewer results than the page holds
+        assert 0 < result.metadata["total_results"] <= 8
+
+        await measure_tool(
+            benchmark,
+            std_server,
+            "web_search",
+            "tools.web_search.html_fallback",
+            parameters,
+            20,
+            rounds=3,
+        )
+
+    async def test_http_client_json(self, benchmark, std_server, recorded_http):
+        parameters = {"url": "https://api.example.com/v1/items", "method": "GET"}
+        result = await std_server.call_tool("http_client", parameters)
+        assert result.success, result.error
+
+        await measure_tool(
+            benchmark, std_server, "http_client", "tools.http_client", parameters, 100
+        )
+        assert recorded_http.requests > 100
+
+
+@pytest.mark.performance
+class TestMetaToolBenchmarks:
+    """Meta-tools querying the server's own tools."""
+
+    async def test_describe_tool(self, benchmark, std_server):
+        await measure_tool(
+            benchmark,
+            std_server,
+            "describe_tool",
+            "tools.describe_tool",
+            {"tool_name": "search_files", "include_schema": True},
+            300,
+        )
+
+    async def test_search_tools(self, benchmark, std_server):
+        await measure_tool(
+            benchmark,
+            std_server,
+            "search_tools",
+            "tools.search_tools",
+            {"query": "file"},
+            300,
+        )
+
+    async def test_batch_execute(self, benchmark, std_server):
+        calls = [
+            {"tool": "echo", "parameters": {"path": f"/tmp/{i}"}} for i in range(10)
+        ]
+        await measure_tool(
+            benchmark,
+            std_server,
+            "batch_execute",
+            "tools.batch_execute",
+            {"calls": calls},
+            200,
+        )
+
+    async def test_tool_stats(self, benchmark, std_server):
+        await measure_tool(
+            benchmark,
+            std_server,
+            "tool_stats",
+            "tools.tool_stats",
+            {"include_unused": True},
+            300,
+        )
+
+    async def test_slow_call_profiles(self, benchmark, std_server, tmp_path):
+        set_slow_call_profiler(SlowCallProfiler(60_000, directory=tmp_path))
+        try:
+            await measure_tool(
+                benchmark,
+                std_server,
+                "slow_call_profiles",
+                "tools.slow_call_profiles",
+                {},
+                300,
+            )
+        finally:
+            set_slow_call_profiler(None)
+
+
+@pytest.mark.performance
+class TestEventBusBenchmarks:
+    """Event bus publish throughput, as time per published event."""
+
+    @pytest.mark.parametrize("subscribers", [0, 10])
+    async def test_publish_sync_handlers(self, benchmark, subscribers):
+        bus = EventBus("benchmark")
+        received = []
+        for _ in range(subscribers):
+            bus.subscribe("tool.called", received.append)
+
+        await benchmark.measure_async(
+            f"event_bus.publish.sync_handlers_{subscribers}",
+            lambda: bus.publish("tool.called", {"tool": "echo"}),
+            5000,
+        )
+        assert len(received) == subscribers * 5000 * 6
+
+    async def test_publish_async_handler(self, benchmark):
+        bus = EventBus("benchmark")
+        received = []
+
+        async def handler(event):
+            received.append(event)
+
+        bus.subscribe("tool.called", handler)
+        await benchmark.measure_async(
+            "event_bus.publish.async_handler",
+            lambda: bus.publish("tool.called", {"tool": "echo"}),
+            5000,
+        )
+        assert received
+
+
+@pytest.fixture(scope="module")
+def large_registry():
+    """A registry of 1,000 tools over 10 categories and 20 tags."""
+    registry = ToolRegistry()
+    for index in range(1000):
+        registry.register_tool(
+            EchoTool,
+            metadata=ToolMetadata(
+                name=f"synthetic_{index}",
+                description=f"Synthetic tool {index}",
+                category=f"category_{index % 10}",
+            ),
+            tags=["synthetic", f"tag_{index % 20}"],
+        )
+    return registry
+
+
+@pytest.mark.performance
+class TestRegistryBenchmarks:
+    """Tool registry lookups and filtered listings over 1,000 tools."""
+
+    def test_get_tool(self, benchmark, large_registry):
+        names = itertools.cycle([f"synthetic_{index}" for index in range(0, 1000, 7)])
+        assert large_registry.get_tool("synthetic_500").name == "synthetic_500"
+        benchmark.measure(
+            "registry.get_tool", lambda: large_registry.get_tool(next(names)), 20000
+        )
+
+    @pytest.mark.parametrize(
+        "metric, query, expected",
+        [
+            ("registry.list_tools.all", {}, 1000),
+            ("registry.list_tools.category", {"category": "category_3"}, 100),
+            ("registry.list_tools.tags", {"tags": ["synthetic", "tag_7"]}, 50),
+            (
+                "registry.list_tools.category_and_tag",
+                {"category": "category_3", "tags": ["tag_3"]},
+                50,
+            ),
+            ("registry.list_tools.name_pattern", {"name_pattern": "synthetic_9*"}, 111),
+        ],
+    )
+    def test_list_tools(self, benchmark, large_registry, metric, query, expected):
+        assert len(large_registry.list_tools(**query)) == expected
+        benchmark.measure(metric, lambda: large_registry.list_tools(**query), 200)
+
+    def test_get_tool_stats(self, benchmark, large_registry):
+        assert len(large_registry.get_tool_stats()) == 1000
+        benchmark.measure(
+            "registry.get_tool_stats", large_registry.get_tool_stats, 20, rounds=3
+        )
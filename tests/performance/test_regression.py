@@ -0,0 +1,64 @@
+"""
+Test the benchmark baseline comparison.
+"""
+
+import json
+
+from tests.performance.regression import compare, main, update_baseline
+
+
+def metrics(**values):
+    return {"metrics": {name: {"value": value} for name, value in values.items()}}
+
+
+def test_compare_flags_slowdowns_past_the_limit():
+    baseline = metrics(fast=10.0, steady=10.0, faster=10.0)
+    results = metrics(fast=13.0, steady=12.0, faster=5.0)
+
+    comparisons = {c.name: c for c in compare(results, baseline, 25)}
+
+    assert comparisons["fast"].regressed
+    assert comparisons["fast"].change_pct == 30.0
+    assert not comparisons["steady"].regressed
+    assert not comparisons["faster"].regressed
+
+
+def test_compare_honours_per_metric_limits_and_missing_metrics():
+    baseline = metrics(noisy=10.0, dropped=1.0)
+    baseline["metrics"]["noisy"]["max_regression_pct"] = 100
+
+    comparisons = {c.name: c for c in compare(metrics(noisy=18.0), baseline, 25)}
+
+    assert not comparisons["noisy"].regressed
+    assert comparisons["dropped"].current is None
+    assert comparisons["dropped"].regressed
+
+
+def test_update_baseline_keeps_per_metric_limits():
+    baseline = metrics(noisy=10.0, removed=1.0)
+    baseline["metrics"]["noisy"]["max_regression_pct"] = 100
+
+    updated = update_baseline(metrics(noisy=12.0, added=2.0), baseline)
+
+    assert updated["metrics"] == {
+        "added": {"value": 2.0, "unit": "us/op"},
+        "noisy": {"value": 12.0, "unit": "us/op", "max_regression_pct": 100},
+    }
+
+
+def test_main_exit_status(tmp_path, capsys):
+    results = tmp_path / "results.json"
+    baseline = tmp_path / "baseline.json"
+    results.write_text(json.dumps(metrics(call=10.0)))
+
+    assert main([str(results), "--baseline", str(baseline)]) == 1
+    assert main([str(results), "--baseline", str(baseline), "--update"]) == 0
+    assert json.loads(baseline.read_text())["metrics"]["call"]["value"] == 10.0
+
+    results.write_text(json.dumps(metrics(call=20.0)))
+    assert main([str(results), "--baseline", str(baseline)]) == 1
+    assert "1 of 1 metrics regressed: call" in capsys.readouterr().out
+    assert (
+        main([str(results), "--baseline", str(baseline), "--max-regression", "150"])
+        == 0
+    )
@@ -93,7 +93,7 @@ class TestMainCommand:
         """Test that main function sets up context correctly."""
         runner = CliRunner()
         # Test with serve subcommand to ensure main context is set up
-        with patch("pythonium.main.PythoniumMCPServer") as mock_server, patch(
+        with patch("pythonium.core.server.PythoniumMCPServer") as mock_server, patch(
             "asyncio.run"
         ) as mock_run:
             # Mock server to avoid actual startup
@@ -114,9 +114,9 @@ class TestServeCommand:
 
     def test_serve_command_basic(self):
         """Test basic serve command."""
-        with patch("pythonium.main.PythoniumMCPServer") as mock_server_class, patch(
-            "asyncio.run"
-        ) as mock_asyncio_run:
+        with patch(
+            "pythonium.core.server.PythoniumMCPServer"
+        ) as mock_server_class, patch("asyncio.run") as mock_asyncio_run:
 
             mock_server = Mock()
             mock_server_class.return_value = mock_server
@@ -130,9 +130,9 @@ class TestServeCommand:
 
     def test_serve_command_with_transport(self):
         """Test serve command with different transport."""
-        with patch("pythonium.main.PythoniumMCPServer") as mock_server_class, patch(
-            "asyncio.run"
-        ):
+        with patch(
+            "pythonium.core.server.PythoniumMCPServer"
+        ) as mock_server_class, patch("asyncio.run"):
 
             runner = CliRunner()
             result = runner.invoke(main, ["serve", "--transport", "http"])
@@ -145,9 +145,9 @@ class TestServeCommand:
 
     def test_serve_command_with_host_port(self):
         """Test serve command with custom host and port."""
-        with patch("pythonium.main.PythoniumMCPServer") as mock_server_class, patch(
-            "asyncio.run"
-        ):
+        with patch(
+            "pythonium.core.server.PythoniumMCPServer"
+        ) as mock_server_class, patch("asyncio.run"):
 
             runner = CliRunner()
             result = runner.invoke(
@@ -334,9 +334,9 @@ class TestMainIntegration:
 
     def test_end_to_end_serve(self):
         """Test end-to-end serve command execution."""
-        with patch("pythonium.main.PythoniumMCPServer") as mock_server_class, patch(
-            "asyncio.run"
-        ) as mock_asyncio_run, patch(
+        with patch(
+            "pythonium.core.server.PythoniumMCPServer"
+        ) as mock_server_class, patch("asyncio.run") as mock_asyncio_run, patch(
             "pythonium.main.setup_logging"
         ) as mock_setup_logging:
 
@@ -354,7 +354,7 @@ class TestMainIntegration:
 
     def test_error_handling_in_serve(self):
         """Test error handling in serve command."""
-        with patch("pythonium.main.PythoniumMCPServer") as mock_server_class:
+        with patch("pythonium.core.server.PythoniumMCPServer") as mock_server_class:
             mock_server_class.side_effect = Exception("Server creation failed")
 
             runner = CliRunner()
@@ -368,9 +368,9 @@ class TestMainIntegration:
         config_file = tmp_path / "test_config.json"
         config_file.write_text('{"name": "test_server", "description": "Test"}')
 
-        with patch("pythonium.main.PythoniumMCPServer") as mock_server_class, patch(
-            "asyncio.run"
-        ):
+        with patch(
+            "pythonium.core.server.PythoniumMCPServer"
+        ) as mock_server_class, patch("asyncio.run"):
 
             runner = CliRunner()
             result = runner.invoke(main, ["--config", str(config_file), "serve"])
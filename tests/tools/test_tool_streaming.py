@@ -0,0 +1,224 @@
+"""
+Tests for streaming tool execution.
+"""
+
+import asyncio
+import sys
+import tempfile
+import threading
+from pathlib import Path
+from types import SimpleNamespace
+
+import pytest
+
+from pythonium.common.base import Result
+from pythonium.core.dispatch import CONTEXT_KWARG, ToolDispatchPlan
+from pythonium.tools.base import StreamClosed, ToolContext, iterate_in_thread
+from pythonium.tools.std import execution
+from pythonium.tools.std.execution import ExecuteCommandTool
+from pythonium.tools.std.file_ops import FindFilesTool, SearchFilesTool
+
+
+@pytest.fixture
+def search_tree():
+    with tempfile.TemporaryDirectory() as temp_dir:
+        root = Path(temp_dir)
+        for i in range(10):
+            (root / f"file_{i}.txt").write_text("needle\nhay\nneedle again\n")
+        yield root
+
+
+class TestIterateInThread:
+    @pytest.mark.asyncio
+    async def test_yields_partials_then_result(self):
+        def producer(emit):
+            for i in range(3):
+                emit(i)
+            return "done"
+
+        items = [item async for item in iterate_in_thread(producer)]
+        assert items == [0, 1, 2, "done"]
+
+    @pytest.mark.asyncio
+    async def test_producer_errors_propagate(self):
+        def producer(emit):
+            emit(1)
+            raise ValueError("boom")
+
+        with pytest.raises(ValueError):
+            async for _ in iterate_in_thread(producer):
+                pass
+
+    @pytest.mark.asyncio
+    async def test_closing_stops_the_producer(self):
+        stopped = threading.Event()
+
+        def producer(emit):
+            try:
+                for i in range(10_000):
+                    emit(i)
+                    stopped.wait(0.001)
+            except StreamClosed:
+                stopped.set()
+                raise
+
+        stream = iterate_in_thread(producer)
+        assert await stream.__anext__() == 0
+        await stream.aclose()
+
+        assert await asyncio.get_running_loop().run_in_executor(None, stopped.wait, 5)
+
+
+class TestFileToolStreaming:
+    @pytest.mark.asyncio
+    async def test_search_files_stream_matches_execute(self, search_tree):
+        tool = SearchFilesTool()
+        params = {"path": str(search_tree), "pattern": "needle"}
+
+        partials = []
+        streamed = await tool.collect_stream(params, ToolContext(), partials.append)
+        executed = await tool.execute(params, ToolContext())
+
+        assert streamed.success
+        assert len(partials) == 20
+        assert streamed.data["total_matches"] == executed.data["total_matches"] == 20
+        assert sorted(m["file"] for m in partials) == sorted(
+            m["file"] for m in streamed.data["matches"]
+        )
+
+    @pytest.mark.asyncio
+    async def test_find_files_stream_yields_each_match(self, search_tree):
+        tool = FindFilesTool()
+        items = [
+            item
+            async for item in tool.stream(
+                {"path": str(search_tree), "name_pattern": "*.txt"}, ToolContext()
+            )
+        ]
+
+        assert len(items) == 11
+        assert all(isinstance(item, dict) for item in items[:-1])
+        assert isinstance(items[-1], Result)
+        assert items[-1].data["total_found"] == 10
+
+    @pytest.mark.asyncio
+    async def test_stream_validation_and_errors_become_results(self, search_tree):
+        tool = SearchFilesTool()
+
+        result = await tool.collect_stream({"pattern": "x"}, ToolContext())
+        assert not result.success
+        assert "validation failed" in result.error
+
+        result = await tool.collect_stream(
+            {"path": str(search_tree / "missing"), "pattern": "x"}, ToolContext()
+        )
+        assert not result.success
+        assert "does not exist" in result.error
+
+
+@pytest.mark.skipif(sys.platform == "win32", reason="Uses POSIX shell commands")
+class TestCommandStreaming:
+    @pytest.mark.asyncio
+    async def test_stdout_is_streamed_before_exit(self):
+        tool = ExecuteCommandTool()
+        partials = []
+        result = await tool.collect_stream(
+            {"command": "echo first; sleep 0.1; echo second", "shell": True},
+            ToolContext(),
+            partials.append,
+        )
+
+        assert result.success
+        assert result.data["stdout"].split() == ["first", "second"]
+        assert "".join(p["data"] for p in partials).split() == ["first", "second"]
+
+    @pytest.mark.asyncio
+    async def test_collected_stdout_is_capped_while_streaming(self, monkeypatch):
+        monkeypatch.setattr(execution, "MAX_OUTPUT_SIZE", 10)
+        kept = []
+        capped_output = ExecuteCommandTool._capped_output
+
+        def recording_capped_output(buffer, truncated):
+            kept.append(len(buffer))
+            return capped_output(buffer, truncated)
+
+        monkeypatch.setattr(
+            ExecuteCommandTool, "_capped_output", staticmethod(recording_capped_output)
+        )
+        tool = ExecuteCommandTool()
+        partials = []
+        result = await tool.collect_stream(
+            {
+                "command": sys.executable,
+                "args": ["-c", "print('x' * 100)"],
+            },
+            ToolContext(),
+            partials.append,
+        )
+
+        assert result.success
+        assert "".join(p["data"] for p in partials).strip() == "x" * 100
+        assert result.data["stdout"] == "x" * 10 + "\n[OUTPUT TRUNCATED]"
+        # Only the capped prefix was ever held
+        assert kept == [10]
+
+    @pytest.mark.asyncio
+    async def test_consumer_going_away_kills_the_command(self):
+        tool = ExecuteCommandTool()
+
+        def stop_reading(_partial):
+            raise ConnectionError("client went away")
+
+        with pytest.raises(ConnectionError):
+            await tool.collect_stream(
+                {
+                    "command": sys.executable,
+                    "args": ["-c", "import time; print(1, flush=True); time.sleep(30)"],
+                    "timeout": 60,
+                },
+                ToolContext(),
+                stop_reading,
+            )
+        assert tool._running_processes == {}
+
+
+class TestStreamingDispatch:
+    @pytest.mark.asyncio
+    async def test_partials_are_relayed_as_progress(self, search_tree):
+        plan = ToolDispatchPlan(SearchFilesTool())
+        function = plan.build_function()
+        progress = []
+
+        async def report_progress(progress_value, total=None, message=None):
+            progress.append((progress_value, message))
+
+        mcp_context = SimpleNamespace(
+            request_context=SimpleNamespace(meta=SimpleNamespace(progressToken="t")),
+            report_progress=report_progress,
+        )
+
+        result = await function(
+            path=str(search_tree), pattern="needle", **{CONTEXT_KWARG: mcp_context}
+        )
+        assert result["total_matches"] == 20
+        assert [value for value, _ in progress] == list(range(1, 21))
+        assert '"file"' in progress[0][1]
+
+    @pytest.mark.asyncio
+    async def test_without_progress_token_tool_runs_normally(self, search_tree):
+        plan = ToolDispatchPlan(SearchFilesTool())
+        mcp_context = SimpleNamespace(request_context=SimpleNamespace(meta=None))
+
+        result = await plan.build_function()(
+            path=str(search_tree), pattern="needle", **{CONTEXT_KWARG: mcp_context}
+        )
+        assert result["total_matches"] == 20
+
+    def test_context_parameter_only_added_for_streaming_tools(self):
+        from pythonium.tools.std.file_ops import ReadFileTool
+
+        streaming = ToolDispatchPlan(SearchFilesTool()).build_function()
+        plain = ToolDispatchPlan(ReadFileTool()).build_function()
+
+        assert CONTEXT_KWARG in streaming.__signature__.parameters
+        assert CONTEXT_KWARG not in plain.__signature__.parameters
@@ -9,7 +9,9 @@ from pathlib import Path
 from unittest.mock import AsyncMock, MagicMock, patch
 
 import pytest
+from pydantic import ValidationError
 
+from pythonium.common.timing import TIMING_METADATA_KEY, set_timing_sink
 from pythonium.tools.base import ParameterType, ToolContext, ToolParameter
 from pythonium.tools.std.execution import ExecuteCommandTool
 from pythonium.tools.std.file_ops import (
@@ -96,6 +98,57 @@ class TestBaseTool:
         )
         assert url_param.type.value == "string"
 
+    def test_metadata_is_built_once_per_class_and_frozen(self):
+        """Metadata is shared by all instances of a tool class and immutable."""
+        first, second = ReadFileTool(), ReadFileTool()
+        assert first.metadata is second.metadata
+        assert first.metadata.parameters[0] is second.metadata.parameters[0]
+
+        with pytest.raises(ValidationError):
+            first.metadata.name = "renamed"
+        with pytest.raises(ValidationError):
+            first.metadata.parameters[0].required = False
+
+    def test_schemas_are_cached_with_stable_hash(self):
+        """Full and brief schemas are computed once and hashed for ETags."""
+        tool = ReadFileTool()
+        schema = tool.get_schema()
+
+        assert tool.get_schema() is schema
+        assert ReadFileTool().get_schema() is schema
+        assert schema["description"] == tool.metadata.description
+        assert "path" in schema["parameters"]["required"]
+
+        brief = tool.get_schema(brief=True)
+        assert brief["description"] == tool.metadata.brief_description
+        assert tool.get_schema_hash() == ReadFileTool().get_schema_hash()
+        assert tool.get_schema_hash() != tool.get_schema_hash(brief=True)
+        assert tool.get_schema_hash() != WriteFileTool().get_schema_hash()
+
+    @pytest.mark.asyncio
+    async def test_run_records_phase_timing(self, temp_dir, tool_context):
+        """run() attaches a per-phase breakdown and feeds the timing sink."""
+        test_file = temp_dir / "timed.txt"
+        test_file.write_text("hello")
+        recorded = []
+        set_timing_sink(lambda name, phases: recorded.append((name, phases)))
+        try:
+            result = await ReadFileTool().run({"path": test_file}, tool_context)
+            invalid = await ReadFileTool().run({"path": ""}, tool_context)
+        finally:
+            set_timing_sink(None)
+
+        assert result.success
+        phases = result.metadata[TIMING_METADATA_KEY]
+        assert set(phases) == {"validation", "execute", "wrap"}
+        assert all(isinstance(value, int) and value >= 0 for value in phases.values())
+        assert result.execution_time > 0
+        assert recorded[0] == ("ReadFileTool", phases)
+
+        assert not invalid.success
+        assert "Parameter validation failed" in invalid.error
+        assert "execute" not in invalid.metadata[TIMING_METADATA_KEY]
+
 
 class TestFilesystemTools:
     """Test filesystem tools."""